@@ -20,6 +20,7 @@ from app.services.demo_builder import (
 )
 from app.services.ai_mvp.ai_council import AICouncil, AICouncilConfig
 from app.services.ai_mvp.ai_gym_tracker import AIGymTracker
+from app.services.site_cache import site_cache
 from app.core.config import settings
 
 
@@ -33,6 +34,7 @@ class DemoSiteRequest(BaseModel):
     improvement_plan: Dict[str, Any] = Field(..., description="Improvement plan from analysis")
     framework: Framework = Field(default=Framework.REACT, description="Target framework")
     include_comments: bool = Field(default=True, description="Include explanation comments")
+    parallel: bool = Field(default=False, description="Generate each file as its own AI task")
 
 
 class DemoSiteResponse(BaseModel):
@@ -115,7 +117,7 @@ async def generate_demo_site(
     """
     try:
         # Initialize builder
-        builder = DemoSiteBuilder(ai_council)
+        builder = DemoSiteBuilder(ai_council, site_cache=site_cache)
 
         # Parse inputs
         original_site = OriginalSite(
@@ -135,7 +137,8 @@ async def generate_demo_site(
             improvement_plan=improvement_plan,
             framework=request.framework,
             lead_value=lead_value,
-            include_comments=request.include_comments
+            include_comments=request.include_comments,
+            parallel=request.parallel
         )
 
         # Generate build ID
@@ -248,6 +248,8 @@ async def record_metric(
 
         # Record in database
         metric_id = await tracker.record_execution(db, metrics)
+        if metric_id is None:
+            raise RuntimeError("metric storage is unavailable")
 
         return RecordMetricResponse(
             metric_id=metric_id,
@@ -306,7 +306,8 @@ async def generate_email(
             website_analysis=request.website_analysis,
             our_service_description=request.our_service_description,
             lead_id=request.lead_id,
-            lead_value=request.lead_value
+            lead_value=request.lead_value,
+            hedged=True  # Interactive request: race a backup model if the first is slow
         )
 
         # Parse subject and body
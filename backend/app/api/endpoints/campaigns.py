@@ -19,6 +19,7 @@ from app.schemas.campaigns import (
     CampaignResponse,
     CampaignListResponse,
     AddRecipientsRequest,
+    AddRecipientsResponse,
     CampaignRecipientResponse,
     RecipientListResponse,
     LaunchCampaignRequest,
@@ -296,15 +297,15 @@ async def delete_campaign(
 
 @router.post(
     "/{campaign_id}/recipients",
-    response_model=BulkOperationResponse,
+    response_model=AddRecipientsResponse,
     summary="Add Recipients",
-    description="Add recipients to campaign from lead IDs",
+    description="Add recipients to campaign from lead IDs or a lead filter",
 )
 async def add_recipients(
     campaign_id: int = Path(..., description="Campaign ID"),
     request_data: AddRecipientsRequest = ...,
     db: AsyncSession = Depends(get_db),
-) -> BulkOperationResponse:
+) -> AddRecipientsResponse:
     """
     Add recipients to a campaign.
 
@@ -315,25 +316,41 @@ async def add_recipients(
     }
     ```
 
-    Returns count of successful additions and any errors.
+    Or select every matching lead server-side:
+    ```json
+    {
+        "lead_filter": {"location_id": 3, "status": "qualified"}
+    }
+    ```
+
+    Returns counts of added, duplicate and invalid leads.
     """
     try:
         service = CampaignService(db)
-        successful, errors = await service.add_recipients(
+        counts = await service.add_recipients_bulk(
             campaign_id=campaign_id,
             lead_ids=request_data.lead_ids,
+            lead_filter=request_data.lead_filter,
         )
 
-        failed = len(errors)
-        total = successful + failed
+        errors = []
+        if counts["duplicates"]:
+            errors.append({"message": f"{counts['duplicates']} leads already added to campaign"})
+        if counts["invalid"]:
+            errors.append({"message": f"{counts['invalid']} leads not found or without email address"})
+
+        failed = counts["duplicates"] + counts["invalid"]
 
-        return BulkOperationResponse(
+        return AddRecipientsResponse(
             success=failed == 0,
-            total_processed=total,
-            successful=successful,
+            total_processed=counts["added"] + failed,
+            successful=counts["added"],
             failed=failed,
-            errors=[{"message": err} for err in errors],
-            message=f"Added {successful} recipients to campaign",
+            errors=errors,
+            message=f"Added {counts['added']} recipients to campaign",
+            added=counts["added"],
+            duplicates=counts["duplicates"],
+            invalid=counts["invalid"],
         )
 
     except ValueError as e:
@@ -52,6 +52,7 @@ class GenerateRequest(BaseModel):
     lead_id: Optional[int] = None
     lead_value: Optional[float] = None
     tone_preference: str = "professional"
+    stream_conversation_id: Optional[int] = None  # Push partial replies to conversation:{id}
 
 
 class ImproveRequest(BaseModel):
@@ -276,7 +277,8 @@ async def generate_reply(
             lead_context=request.lead_context,
             lead_id=request.lead_id,
             lead_value=request.lead_value,
-            tone_preference=request.tone_preference
+            tone_preference=request.tone_preference,
+            stream_conversation_id=request.stream_conversation_id
         )
 
         logger.info(
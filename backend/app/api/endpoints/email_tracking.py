@@ -12,19 +12,27 @@ from io import BytesIO
 from app.core.database import get_db
 from app.core.url_validator import URLValidator, URLSecurityError, validate_email_tracking_redirect
 from app.core.rate_limiter import tracking_public_limiter, tracking_unsubscribe_limiter
+from app.core.tracking_tokens import TrackingTokenError, get_tracking_token_signer
 from app.services.email_service import EmailService
+from app.services.tracking_recorder import tracking_recorder
+from app.schemas.campaigns import EmailEventTypeEnum
 from app.models import Lead
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 1x1 transparent GIF
+TRACKING_PIXEL = bytes.fromhex(
+    '474946383961010001008000000000000021f90401000000002c00000000'
+    '010001000002024401003b'
+)
+
 
 @router.get("/open/{tracking_token}")
 @tracking_public_limiter
 async def track_email_open(
     request: Request,
     tracking_token: str,
-    db: Session = Depends(get_db)
 ):
     """
     Track email open event
@@ -33,28 +41,35 @@ async def track_email_open(
     This endpoint is called when the tracking pixel loads in the email client
     """
     try:
-        email_service = EmailService(db=db)
-        pixel_bytes = email_service.track_open(tracking_token)
-
-        return Response(
-            content=pixel_bytes,
-            media_type="image/gif",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
+        # Verified in memory - forged or expired tokens are never recorded
+        claims = get_tracking_token_signer().verify(tracking_token)
+
+        # Write-behind: buffer the event and return the pixel right away
+        tracking_recorder.record(
+            EmailEventTypeEnum.OPEN.value,
+            claims.campaign_id,
+            claims.lead_id,
+            recipient_id=claims.recipient_id,
+            user_agent=request.headers.get("user-agent"),
+            ip_address=request.client.host if request.client else None,
         )
 
+    except TrackingTokenError as e:
+        logger.warning(f"Rejected tracking token on open: {e}")
     except Exception as e:
-        logger.error(f"Error tracking email open: {str(e)}")
         # Still return pixel even if tracking fails
         # Don't break the email experience
-        pixel_bytes = bytes.fromhex(
-            '474946383961010001008000000000000021f90401000000002c00000000'
-            '010001000002024401003b'
-        )
-        return Response(content=pixel_bytes, media_type="image/gif")
+        logger.error(f"Error tracking email open: {str(e)}")
+
+    return Response(
+        content=TRACKING_PIXEL,
+        media_type="image/gif",
+        headers={
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0"
+        }
+    )
 
 
 @router.get("/click/{tracking_token}")
@@ -63,7 +78,6 @@ async def track_email_click(
     request: Request,
     tracking_token: str,
     url: str = Query(..., description="Original URL to redirect to"),
-    db: Session = Depends(get_db)
 ):
     """
     Track email click event and redirect to original URL
@@ -99,24 +113,24 @@ async def track_email_click(
                 detail="Invalid redirect URL. For security reasons, we cannot redirect to this URL."
             )
 
-        # Track click
-        email_service = EmailService(db=db)
-        # Use the validated URL for tracking
-        redirect_url = email_service.track_click(tracking_token, validated_url)
-
-        # Ensure the returned URL is also validated (defense in depth)
+        # Track click (write-behind, never delays the redirect)
         try:
-            final_url = validate_email_tracking_redirect(
-                redirect_url,
-                get_email_redirect_allowed_domains()
+            claims = get_tracking_token_signer().verify(tracking_token)
+            tracking_recorder.record(
+                EmailEventTypeEnum.CLICK.value,
+                claims.campaign_id,
+                claims.lead_id,
+                recipient_id=claims.recipient_id,
+                event_data={"url": validated_url},
+                user_agent=request.headers.get("user-agent"),
+                ip_address=request.client.host if request.client else None,
             )
-        except URLSecurityError:
-            # If the service returns an invalid URL, use the validated original
-            final_url = validated_url
+        except TrackingTokenError as e:
+            logger.warning(f"Rejected tracking token on click: {e}")
 
         # Redirect to validated URL
         return RedirectResponse(
-            url=final_url,
+            url=validated_url,
             status_code=302
         )
 
@@ -2,6 +2,7 @@
 API endpoints for schedule management.
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -440,7 +441,7 @@ async def cancel_execution(execution_id: int, db: AsyncSession = Depends(get_db)
     schedule_id = execution.schedule_id
     if schedule_id in scheduler_service.running_schedules:
         task = scheduler_service.running_schedules[schedule_id]
-        task.cancel()
+        await asyncio.to_thread(task.cancel)
         
         # Update execution status
         execution.status = "cancelled"
@@ -754,13 +755,19 @@ async def validate_cron_expression(cron_expression: str):
 @router.get("/status/running")
 async def get_running_schedules():
     """Get currently running schedules."""
+    runs = list(scheduler_service.running_schedules.items())
+    # Status checks query the Celery result backend, keep them off the event loop
+    statuses = await asyncio.to_thread(
+        lambda: [(schedule_id, task.status()) for schedule_id, task in runs]
+    )
+
     running_schedules = []
     
-    for schedule_id, task in scheduler_service.running_schedules.items():
+    for schedule_id, status in statuses:
         running_schedules.append({
             "schedule_id": schedule_id,
-            "is_done": task.done(),
-            "is_cancelled": task.cancelled()
+            "is_done": status["done"],
+            "is_cancelled": status["cancelled"]
         })
     
     return {
@@ -14,6 +14,7 @@ from datetime import datetime
 from app.core.database import get_db
 from app.core.config import settings
 from app.models.locations import Location
+from app.services.scrape_job_store import scrape_job_store, FINISHED_STATUSES
 import logging
 
 logger = logging.getLogger(__name__)
@@ -119,68 +120,6 @@ def redis_setex(key: str, seconds: int, value: str) -> bool:
         return False
 
 
-def redis_hset(name: str, mapping: dict) -> bool:
-    """Safe Redis HSET - returns False if Redis unavailable."""
-    rc = get_redis_client()
-    if rc is None:
-        return False
-    try:
-        rc.hset(name, mapping=mapping)
-        return True
-    except Exception as e:
-        logger.error(f"Redis HSET error for '{name}': {e}")
-        return False
-
-
-def redis_hget(name: str, key: str) -> Optional[str]:
-    """Safe Redis HGET - returns None if Redis unavailable."""
-    rc = get_redis_client()
-    if rc is None:
-        return None
-    try:
-        return rc.hget(name, key)
-    except Exception as e:
-        logger.error(f"Redis HGET error for '{name}':'{key}': {e}")
-        return None
-
-
-def redis_lpush(name: str, *values) -> bool:
-    """Safe Redis LPUSH - returns False if Redis unavailable."""
-    rc = get_redis_client()
-    if rc is None:
-        return False
-    try:
-        rc.lpush(name, *values)
-        return True
-    except Exception as e:
-        logger.error(f"Redis LPUSH error for '{name}': {e}")
-        return False
-
-
-def redis_llen(name: str) -> int:
-    """Safe Redis LLEN - returns 0 if Redis unavailable."""
-    rc = get_redis_client()
-    if rc is None:
-        return 0
-    try:
-        return rc.llen(name)
-    except Exception as e:
-        logger.error(f"Redis LLEN error for '{name}': {e}")
-        return 0
-
-
-def redis_keys(pattern: str) -> List[str]:
-    """Safe Redis KEYS - returns empty list if Redis unavailable."""
-    rc = get_redis_client()
-    if rc is None:
-        return []
-    try:
-        return rc.keys(pattern)
-    except Exception as e:
-        logger.error(f"Redis KEYS error for pattern '{pattern}': {e}")
-        return []
-
-
 @router.get("/categories")
 async def get_categories(
     location_id: Optional[int] = Query(None),
@@ -369,14 +308,8 @@ async def create_scrape_job(
         "errors": []
     }
     
-    # Store job in Redis
-    redis_hset(f"scrape_job:{job_id}", mapping={
-        "data": json.dumps(job_info, default=str)
-    })
-    
-    # Add to job queue (priority queue based on priority)
-    queue_name = f"scrape_queue:{job_data.priority}"
-    redis_lpush(queue_name, job_id)
+    # Store job, index it and add it to its priority queue
+    await scrape_job_store.create(job_info)
     
     # Start background processing (in a real implementation, this would be handled by Celery or RQ)
     # Pass a copy of job_data with resolved location_ids
@@ -399,21 +332,11 @@ async def create_scrape_job(
 @router.get("/jobs/{job_id}", response_model=ScrapeJobStatus)
 async def get_scrape_job_status(job_id: str):
     """Get status of a specific scraping job."""
-    job_data = redis_hget(f"scrape_job:{job_id}", "data")
+    job_info = await scrape_job_store.get(job_id)
     
-    if not job_data:
+    if not job_info:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job_info = json.loads(job_data)
-    # Ensure all required fields are present with defaults
-    job_info.setdefault('errors', [])
-    job_info.setdefault('started_at', None)
-    job_info.setdefault('completed_at', None)
-    job_info.setdefault('emails_extracted', 0)
-    job_info.setdefault('captcha_cost', 0.0)
-    job_info.setdefault('progress', 0)
-    job_info.setdefault('total_items', 0)
-    job_info.setdefault('processed_items', 0)
     return ScrapeJobStatus(**job_info)
 
 
@@ -422,51 +345,24 @@ async def get_scrape_jobs(
     status: Optional[str] = None,
     limit: int = 50
 ):
-    """Get list of scraping jobs."""
-    # Get all job keys
-    job_keys = redis_keys("scrape_job:*")
-    jobs = []
-    
-    for key in job_keys[:limit]:
-        job_data = redis_hget(key, "data")
-        if job_data:
-            job_info = json.loads(job_data)
-            if status is None or job_info.get("status") == status:
-                # Ensure all required fields are present with defaults
-                job_info.setdefault('errors', [])
-                job_info.setdefault('started_at', None)
-                job_info.setdefault('completed_at', None)
-                job_info.setdefault('emails_extracted', 0)
-                job_info.setdefault('captcha_cost', 0.0)
-                job_info.setdefault('progress', 0)
-                job_info.setdefault('total_items', 0)
-                job_info.setdefault('processed_items', 0)
-                jobs.append(ScrapeJobStatus(**job_info))
-    
-    # Sort by created_at descending
-    jobs.sort(key=lambda x: x.created_at if hasattr(x, 'created_at') else datetime.min, reverse=True)
-    
-    return jobs
+    """Get list of scraping jobs, newest first."""
+    jobs = await scrape_job_store.list(status=status, limit=limit)
+    return [ScrapeJobStatus(**job_info) for job_info in jobs]
 
 
 @router.delete("/jobs/{job_id}")
 async def cancel_scrape_job(job_id: str):
     """Cancel a scraping job."""
-    job_data = redis_hget(f"scrape_job:{job_id}", "data")
+    job_info = await scrape_job_store.get(job_id)
     
-    if not job_data:
+    if not job_info:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job_info = json.loads(job_data)
-    
-    if job_info.get("status") in ["completed", "failed", "cancelled"]:
+    if job_info.get("status") in FINISHED_STATUSES:
         raise HTTPException(status_code=400, detail="Cannot cancel job in current status")
     
     # Update job status
-    job_info["status"] = "cancelled"
-    redis_hset(f"scrape_job:{job_id}", mapping={
-        "data": json.dumps(job_info, default=str)
-    })
+    await scrape_job_store.set_status(job_id, "cancelled")
     
     return {"message": "Job cancelled successfully"}
 
@@ -474,24 +370,8 @@ async def cancel_scrape_job(job_id: str):
 @router.get("/queue/status")
 async def get_queue_status():
     """Get status of scraping queues."""
-    queues = ["high", "normal", "low"]
-    status = {}
-    
-    for queue in queues:
-        queue_name = f"scrape_queue:{queue}"
-        length = redis_llen(queue_name)
-        status[queue] = length
-    
-    # Get active jobs
-    active_jobs = redis_keys("scrape_job:*")
-    active_count = 0
-    
-    for key in active_jobs:
-        job_data = redis_hget(key, "data")
-        if job_data:
-            job_info = json.loads(job_data)
-            if job_info.get("status") == "running":
-                active_count += 1
+    status = await scrape_job_store.queue_lengths(["high", "normal", "low"])
+    active_count = await scrape_job_store.count("running")
     
     return {
         "queues": status,
@@ -510,35 +390,14 @@ async def process_scrape_job(job_id: str, job_data: ScrapeJobCreate):
 
     async with AsyncSessionLocal() as db:
         try:
-            # Load existing job_info from Redis to preserve all fields
-            existing_job_data = redis_hget(f"scrape_job:{job_id}", "data")
-            if existing_job_data:
-                job_info = json.loads(existing_job_data)
-            else:
-                # Fallback if not found - reconstruct from job_data
-                job_info = {
-                    "job_id": job_id,
-                    "location_ids": job_data.location_ids,
-                    "categories": job_data.categories,
-                    "keywords": job_data.keywords,
-                    "max_pages": job_data.max_pages,
-                    "enable_email_extraction": job_data.enable_email_extraction,
-                    "captcha_api_key": job_data.captcha_api_key,
-                    "errors": [],
-                    "total_items": 0,
-                    "processed_items": 0,
-                    "emails_extracted": 0,
-                    "captcha_cost": 0.0
-                }
-
-            # Update status fields only (preserve all other fields)
-            job_info["status"] = "running"
-            job_info["started_at"] = datetime.now().isoformat()
-            job_info["progress"] = 0
-
-            redis_hset(f"scrape_job:{job_id}", mapping={
-                "data": json.dumps(job_info, default=str)
-            })
+            # Only the fields that change are written; the rest of the job stays as stored
+            job_info = await scrape_job_store.get(job_id) or {}
+            await scrape_job_store.set_status(
+                job_id,
+                "running",
+                started_at=datetime.now().isoformat(),
+                progress=0
+            )
 
             # Implement actual scraping logic
             from app.scrapers.craigslist_scraper import CraigslistScraper
@@ -556,7 +415,9 @@ async def process_scrape_job(job_id: str, job_data: ScrapeJobCreate):
             captcha_cost = 0.0
 
             # Initialize scraper with email extraction if enabled
-            captcha_api_key = job_info.get("captcha_api_key") if job_data.enable_email_extraction else None
+            captcha_api_key = (
+                job_info.get("captcha_api_key") or job_data.captcha_api_key
+            ) if job_data.enable_email_extraction else None
 
             async with CraigslistScraper(
                 captcha_api_key=captcha_api_key,
@@ -569,10 +430,11 @@ async def process_scrape_job(job_id: str, job_data: ScrapeJobCreate):
 
                         # Update progress
                         progress = int((i / len(locations)) * 90)  # Reserve 10% for final processing
-                        job_info["progress"] = progress
-                        redis_hset(f"scrape_job:{job_id}", mapping={
-                            "data": json.dumps(job_info, default=str)
-                        })
+                        await scrape_job_store.update_progress(
+                            job_id, progress, current=i, total=len(locations), leads_found=total_leads
+                        )
+                        leads_before = total_leads
+                        emails_before = emails_extracted
 
                         # Scrape location with optional email extraction
                         leads_data = await scraper.scrape_location_with_emails(
@@ -644,60 +506,45 @@ async def process_scrape_job(job_id: str, job_data: ScrapeJobCreate):
 
                             except Exception as e:
                                 logger.error(f"Error saving lead {lead_data.get('craigslist_id')}: {str(e)}")
-                                job_info["errors"].append(f"Error saving lead: {str(e)}")
+                                await scrape_job_store.add_error(job_id, f"Error saving lead: {str(e)}")
 
                         # Commit batch
                         await db.commit()
 
                         # Update statistics
-                        job_info["total_items"] = total_leads
-                        job_info["emails_extracted"] = emails_extracted
-
+                        counters = {
+                            "total_items": total_leads - leads_before,
+                            "emails_extracted": emails_extracted - emails_before,
+                        }
                         if job_data.enable_email_extraction:
-                            captcha_cost = scraper.get_captcha_cost()
-                            job_info["captcha_cost"] = captcha_cost
+                            # get_captcha_cost() is cumulative for the scraper
+                            current_cost = scraper.get_captcha_cost()
+                            counters["captcha_cost"] = float(current_cost - captcha_cost)
+                            captcha_cost = current_cost
+                        await scrape_job_store.increment(job_id, **counters)
 
                     except Exception as e:
                         logger.error(f"Error scraping location {location.name}: {str(e)}")
-                        job_info["errors"].append(f"Error scraping {location.name}: {str(e)}")
-
-            # Final progress update
-            job_info["progress"] = 100
-            job_info["processed_items"] = total_leads
+                        await scrape_job_store.add_error(job_id, f"Error scraping {location.name}: {str(e)}")
 
             # Mark as completed
-            job_info["status"] = "completed"
-            job_info["completed_at"] = datetime.now().isoformat()
-            job_info["progress"] = 100
-
-            redis_hset(f"scrape_job:{job_id}", mapping={
-                "data": json.dumps(job_info, default=str)
-            })
+            await scrape_job_store.set_status(
+                job_id,
+                "completed",
+                progress=100,
+                processed_items=total_leads,
+                completed_at=datetime.now().isoformat()
+            )
 
         except Exception as e:
             # Rollback on error
             await db.rollback()
             logger.error(f"Scrape job {job_id} failed: {e}")
 
-            # Load existing job_info to preserve fields, or use fallback
-            existing_job_data = redis_hget(f"scrape_job:{job_id}", "data")
-            if existing_job_data:
-                job_info = json.loads(existing_job_data)
-            else:
-                # Fallback if job_info was never loaded in try block
-                job_info = {
-                    "job_id": job_id,
-                    "errors": []
-                }
-
-            # Update status fields to mark as failed
-            job_info["status"] = "failed"
-            job_info["error"] = str(e)
-            job_info["completed_at"] = datetime.now().isoformat()
-            # Add to errors list if it exists
-            if "errors" in job_info:
-                job_info["errors"].append(f"Fatal error: {str(e)}")
-
-            redis_hset(f"scrape_job:{job_id}", mapping={
-                "data": json.dumps(job_info, default=str)
-            })
\ No newline at end of file
+            await scrape_job_store.add_error(job_id, f"Fatal error: {str(e)}")
+            await scrape_job_store.set_status(
+                job_id,
+                "failed",
+                error=str(e),
+                completed_at=datetime.now().isoformat()
+            )
@@ -15,6 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.config import settings
 from app.core.redis_pubsub import redis_pubsub_manager
+from app.core.realtime_streams import is_valid_event_id, parse_event_id, realtime_stream
+from app.core.websocket_fanout import ConnectionOutbox, coalesce_key, serialize_message
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,8 @@ class ConnectionManager:
     - Heartbeat/ping mechanism
     - Redis Pub/Sub integration
     - Connection health monitoring
+    - Per-connection outbound queues (a slow client only delays itself)
+    - Resume from a stream event ID when Redis Streams history is enabled
     """
 
     def __init__(self):
@@ -39,6 +43,9 @@ class ConnectionManager:
         self.room_subscriptions: Dict[WebSocket, Set[str]] = {}  # websocket -> rooms
         self._lock = asyncio.Lock()
         self._heartbeat_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self._outboxes: Dict[WebSocket, ConnectionOutbox] = {}
+        # Live messages held back while a resuming connection is replayed
+        self._replaying: Dict[WebSocket, List[tuple]] = {}
         self._redis_connected = False
 
     async def initialize_redis(self):
@@ -46,9 +53,11 @@ class ConnectionManager:
         try:
             connected = await redis_pubsub_manager.connect()
             if connected:
-                # Subscribe to all channels and route messages to WebSocket
-                for channel in redis_pubsub_manager.ALL_CHANNELS:
-                    await redis_pubsub_manager.subscribe(channel, self._handle_redis_message)
+                # One pattern subscription routes every channel to WebSocket
+                await redis_pubsub_manager.psubscribe(
+                    redis_pubsub_manager.PATTERN_ALL,
+                    self._handle_redis_message,
+                )
 
                 # Start Redis listener
                 await redis_pubsub_manager.start_listener()
@@ -85,6 +94,7 @@ class ConnectionManager:
         websocket: WebSocket,
         client_id: str = "default",
         channels: Optional[List[str]] = None,
+        resume: bool = False,
     ):
         """
         Accept and register a new WebSocket connection.
@@ -93,10 +103,14 @@ class ConnectionManager:
             websocket: WebSocket connection
             client_id: Client identifier
             channels: Optional list of channels to subscribe to
+            resume: Hold live messages until replay() has sent the missed ones
         """
         await websocket.accept()
 
         async with self._lock:
+            if resume:
+                self._replaying[websocket] = []
+
             if client_id not in self.active_connections:
                 self.active_connections[client_id] = set()
             self.active_connections[client_id].add(websocket)
@@ -110,6 +124,17 @@ class ConnectionManager:
                 for channel in channels:
                     self.channel_subscriptions[websocket].add(channel)
 
+            # Outbound queue and writer task for this connection
+            outbox = ConnectionOutbox(
+                websocket.send_text,
+                label=client_id,
+                max_size=settings.WEBSOCKET_SEND_QUEUE_SIZE,
+                send_timeout=settings.WEBSOCKET_SEND_TIMEOUT,
+                on_error=lambda _outbox, _error: self._handle_send_failure(websocket),
+            )
+            self._outboxes[websocket] = outbox
+            outbox.start()
+
         # Start heartbeat
         self._start_heartbeat(websocket)
 
@@ -139,6 +164,20 @@ class ConnectionManager:
             if websocket in self.room_subscriptions:
                 del self.room_subscriptions[websocket]
 
+            outbox = self._outboxes.pop(websocket, None)
+            self._replaying.pop(websocket, None)
+
+        if outbox:
+            # Remember how far this client got so it can resume later
+            if realtime_stream.enabled and outbox.last_event_id and client_id != "default":
+                try:
+                    await realtime_stream.save_offset(
+                        redis_pubsub_manager.redis_client, client_id, outbox.last_event_id
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to save stream offset for {client_id}: {e}")
+            await outbox.close()
+
         logger.info(f"WebSocket client disconnected: {client_id}")
 
     async def subscribe_to_channel(self, websocket: WebSocket, channel: str):
@@ -171,6 +210,11 @@ class ConnectionManager:
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
+        outbox = self._outboxes.get(websocket)
+        if outbox:
+            outbox.enqueue(serialize_message(message), coalesce_key(message))
+            return
+
         try:
             await websocket.send_json(message)
         except Exception as e:
@@ -211,26 +255,134 @@ class ConnectionManager:
         await self._send_to_connections(connections, message)
 
     async def _send_to_connections(self, connections: List[WebSocket], message: dict):
-        """Send message to a list of connections with error handling."""
-        disconnected = []
+        """
+        Queue a message for a list of connections.
+
+        The message is serialized once and handed to each connection's
+        outbox; the writer tasks do the actual sends, so this never waits
+        on a client socket.
+        """
+        if not connections:
+            return
+
+        text = serialize_message(message)
+        key = coalesce_key(message)
+        event_id = message.get("event_id")
         for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to connection: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        if disconnected:
-            async with self._lock:
-                for client_conns in self.active_connections.values():
-                    for conn in disconnected:
-                        client_conns.discard(conn)
+            held = self._replaying.get(connection)
+            if held is not None:
+                held.append((text, key, event_id))
+                continue
+            outbox = self._outboxes.get(connection)
+            if outbox:
+                outbox.enqueue(text, key, event_id)
+
+    async def resume_point(self, client_id: str, since: Optional[str] = None) -> Optional[str]:
+        """
+        Get the event ID a connecting client should resume from.
+
+        An explicit `since` wins; otherwise the client's stored offset is
+        used. Returns None when stream history is disabled or unavailable.
+        """
+        if not realtime_stream.enabled or not redis_pubsub_manager.redis_client:
+            return None
+        if is_valid_event_id(since):
+            return since
+        if client_id == "default":
+            return None
+        try:
+            offset = await realtime_stream.get_offset(redis_pubsub_manager.redis_client, client_id)
+        except Exception as e:
+            logger.debug(f"Failed to load stream offset for {client_id}: {e}")
+            return None
+        return offset if is_valid_event_id(offset) else None
+
+    def _wants(self, websocket: WebSocket, channel: str, message: dict) -> bool:
+        """Apply the same channel/room routing as live delivery."""
+        room = message.get("room")
+        if room:
+            return room in self.room_subscriptions.get(websocket, set())
+        return channel in self.channel_subscriptions.get(websocket, set())
+
+    async def replay(self, websocket: WebSocket, since: str) -> int:
+        """
+        Send events missed since `since`, then release held live messages.
+
+        Live messages that arrived during the replay and were already
+        replayed are skipped, so the client sees each event once and in order.
+
+        Returns:
+            int: Number of replayed events
+        """
+        outbox = self._outboxes.get(websocket)
+        replayed = 0
+        last_id = parse_event_id(since)
+
+        # Room events can arrive on any channel; otherwise only read (and
+        # check for truncation) the channels this client subscribed to
+        if self.room_subscriptions.get(websocket):
+            channels = redis_pubsub_manager.ALL_CHANNELS
+        else:
+            channels = sorted(self.channel_subscriptions.get(websocket, set()))
+
+        try:
+            events, truncated = await realtime_stream.read_since(
+                redis_pubsub_manager.redis_client,
+                channels,
+                since,
+            )
+            if outbox:
+                for event_id, channel, message in events:
+                    last_id = max(last_id, parse_event_id(event_id))
+                    if self._wants(websocket, channel, message):
+                        outbox.enqueue(serialize_message(message), None, event_id)
+                        replayed += 1
+
+                # Tell the client whether it must re-fetch state over REST
+                outbox.enqueue(serialize_message({
+                    "type": "replay_complete",
+                    "since": since,
+                    "replayed": replayed,
+                    "truncated": truncated,
+                    "timestamp": datetime.utcnow().isoformat(),
+                }))
+        except Exception as e:
+            logger.error(f"Failed to replay events since {since}: {e}")
+
+        finally:
+            held = self._replaying.pop(websocket, [])
+            if outbox:
+                for text, key, event_id in held:
+                    if event_id and is_valid_event_id(event_id) and parse_event_id(event_id) <= last_id:
+                        continue
+                    outbox.enqueue(text, key, event_id)
+
+        return replayed
+
+    async def _handle_send_failure(self, websocket: WebSocket):
+        """Drop a connection whose writer failed or stalled."""
+        await self._remove_connections([websocket])
+        try:
+            # Unblocks the endpoint's receive loop for stalled clients
+            await websocket.close()
+        except Exception:
+            pass
+
+    async def _remove_connections(self, disconnected: List[WebSocket]):
+        """Clean up connections whose writer failed."""
+        async with self._lock:
+            for client_id in list(self.active_connections):
+                client_conns = self.active_connections[client_id]
                 for conn in disconnected:
-                    if conn in self.channel_subscriptions:
-                        del self.channel_subscriptions[conn]
-                    if conn in self.room_subscriptions:
-                        del self.room_subscriptions[conn]
+                    client_conns.discard(conn)
+                if not client_conns:
+                    del self.active_connections[client_id]
+            for conn in disconnected:
+                if conn in self.channel_subscriptions:
+                    del self.channel_subscriptions[conn]
+                if conn in self.room_subscriptions:
+                    del self.room_subscriptions[conn]
+                self._outboxes.pop(conn, None)
 
     def _start_heartbeat(self, websocket: WebSocket):
         """Start heartbeat task for a WebSocket connection."""
@@ -238,14 +390,14 @@ class ConnectionManager:
             try:
                 while True:
                     await asyncio.sleep(settings.WEBSOCKET_PING_INTERVAL)
-                    try:
-                        await websocket.send_json({
-                            "type": "heartbeat",
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                    except Exception as e:
-                        logger.debug(f"Heartbeat failed, connection likely closed: {e}")
+                    outbox = self._outboxes.get(websocket)
+                    if not outbox or outbox.closed:
+                        logger.debug("Heartbeat stopped, connection likely closed")
                         break
+                    await self.send_personal_message({
+                        "type": "heartbeat",
+                        "timestamp": datetime.utcnow().isoformat()
+                    }, websocket)
             except asyncio.CancelledError:
                 pass
 
@@ -268,13 +420,18 @@ class ConnectionManager:
         return sum(len(conns) for conns in self.active_connections.values())
 
     def get_stats(self) -> dict:
-        """Get connection statistics."""
+        """Get connection statistics, including per-connection send lag."""
+        connections = [outbox.get_stats() for outbox in list(self._outboxes.values())]
         return {
             "total_connections": self.get_connection_count(),
             "clients": len(self.active_connections),
             "total_channel_subscriptions": sum(len(subs) for subs in self.channel_subscriptions.values()),
             "total_room_subscriptions": sum(len(subs) for subs in self.room_subscriptions.values()),
             "redis_connected": self._redis_connected,
+            "messages_dropped": sum(c["dropped"] for c in connections),
+            "messages_coalesced": sum(c["coalesced"] for c in connections),
+            "max_pending": max((c["depth"] for c in connections), default=0),
+            "connections": connections,
         }
 
 
@@ -287,6 +444,7 @@ async def websocket_endpoint(
     websocket: WebSocket,
     client_id: str = Query("default"),
     channels: Optional[str] = Query(None),
+    since: Optional[str] = Query(None),
 ):
     """
     Main WebSocket endpoint for real-time updates.
@@ -300,11 +458,13 @@ async def websocket_endpoint(
     Query Parameters:
     - client_id: Client identifier (default: "default")
     - channels: Comma-separated list of channels to subscribe to
+    - since: Last event_id received; missed events are replayed first
     """
     # Parse channels
     channel_list = channels.split(",") if channels else []
 
-    await manager.connect(websocket, client_id, channel_list)
+    resume_from = await manager.resume_point(client_id, since)
+    await manager.connect(websocket, client_id, channel_list, resume=resume_from is not None)
 
     try:
         # Send welcome message
@@ -313,10 +473,14 @@ async def websocket_endpoint(
             "status": "connected",
             "client_id": client_id,
             "channels": channel_list,
+            "resume_from": resume_from,
             "timestamp": datetime.utcnow().isoformat(),
             "message": "WebSocket connection established"
         }, websocket)
 
+        if resume_from:
+            await manager.replay(websocket, resume_from)
+
         # Keep connection alive and handle incoming messages
         while True:
             try:
@@ -557,6 +721,7 @@ async def campaigns_websocket(
     websocket: WebSocket,
     client_id: str = Query("default"),
     campaign_id: Optional[int] = Query(None),
+    since: Optional[str] = Query(None),
 ):
     """
     WebSocket endpoint for campaign updates.
@@ -570,9 +735,11 @@ async def campaigns_websocket(
     Query Parameters:
     - client_id: Client identifier
     - campaign_id: Optional specific campaign ID to monitor
+    - since: Last event_id received; missed events are replayed first
     """
     channels = [redis_pubsub_manager.CHANNEL_CAMPAIGNS]
-    await manager.connect(websocket, f"campaigns_{client_id}", channels)
+    resume_from = await manager.resume_point(f"campaigns_{client_id}", since)
+    await manager.connect(websocket, f"campaigns_{client_id}", channels, resume=resume_from is not None)
 
     # Subscribe to campaign room if specified
     if campaign_id:
@@ -584,9 +751,13 @@ async def campaigns_websocket(
             "channel": "campaigns",
             "campaign_id": campaign_id,
             "status": "connected",
+            "resume_from": resume_from,
             "timestamp": datetime.utcnow().isoformat()
         }, websocket)
 
+        if resume_from:
+            await manager.replay(websocket, resume_from)
+
         # Keep connection alive
         while True:
             data = await websocket.receive_text()
@@ -613,6 +784,7 @@ async def campaigns_websocket(
 async def emails_websocket(
     websocket: WebSocket,
     client_id: str = Query("default"),
+    since: Optional[str] = Query(None),
 ):
     """
     WebSocket endpoint for email tracking events.
@@ -626,16 +798,21 @@ async def emails_websocket(
     - Unsubscribe events
     """
     channels = [redis_pubsub_manager.CHANNEL_EMAILS]
-    await manager.connect(websocket, f"emails_{client_id}", channels)
+    resume_from = await manager.resume_point(f"emails_{client_id}", since)
+    await manager.connect(websocket, f"emails_{client_id}", channels, resume=resume_from is not None)
 
     try:
         await manager.send_personal_message({
             "type": "connection",
             "channel": "emails",
             "status": "connected",
+            "resume_from": resume_from,
             "timestamp": datetime.utcnow().isoformat()
         }, websocket)
 
+        if resume_from:
+            await manager.replay(websocket, resume_from)
+
         # Keep connection alive
         while True:
             await websocket.receive_text()
@@ -650,6 +827,7 @@ async def emails_websocket(
 async def ai_websocket(
     websocket: WebSocket,
     client_id: str = Query("default"),
+    since: Optional[str] = Query(None),
 ):
     """
     WebSocket endpoint for AI processing updates.
@@ -662,16 +840,21 @@ async def ai_websocket(
     - ML model training updates
     """
     channels = [redis_pubsub_manager.CHANNEL_AI]
-    await manager.connect(websocket, f"ai_{client_id}", channels)
+    resume_from = await manager.resume_point(f"ai_{client_id}", since)
+    await manager.connect(websocket, f"ai_{client_id}", channels, resume=resume_from is not None)
 
     try:
         await manager.send_personal_message({
             "type": "connection",
             "channel": "ai",
             "status": "connected",
+            "resume_from": resume_from,
             "timestamp": datetime.utcnow().isoformat()
         }, websocket)
 
+        if resume_from:
+            await manager.replay(websocket, resume_from)
+
         # Keep connection alive
         while True:
             await websocket.receive_text()
@@ -687,6 +870,7 @@ async def demos_websocket(
     websocket: WebSocket,
     client_id: str = Query("default"),
     demo_id: Optional[str] = Query(None),
+    since: Optional[str] = Query(None),
 ):
     """
     WebSocket endpoint for demo generation progress.
@@ -700,7 +884,8 @@ async def demos_websocket(
     - Error notifications
     """
     channels = [redis_pubsub_manager.CHANNEL_DEMOS]
-    await manager.connect(websocket, f"demos_{client_id}", channels)
+    resume_from = await manager.resume_point(f"demos_{client_id}", since)
+    await manager.connect(websocket, f"demos_{client_id}", channels, resume=resume_from is not None)
 
     # Subscribe to demo room if specified
     if demo_id:
@@ -712,9 +897,13 @@ async def demos_websocket(
             "channel": "demos",
             "demo_id": demo_id,
             "status": "connected",
+            "resume_from": resume_from,
             "timestamp": datetime.utcnow().isoformat()
         }, websocket)
 
+        if resume_from:
+            await manager.replay(websocket, resume_from)
+
         # Keep connection alive
         while True:
             data = await websocket.receive_text()
@@ -0,0 +1,112 @@
+"""
+Circuit Breaker
+
+Stops calling a destination that keeps failing, so callers fail fast instead
+of waiting on timeouts, and lets a single trial request through once the
+reset timeout has passed to find out whether it recovered.
+
+States:
+- closed: calls go through, consecutive failures are counted
+- open: calls are rejected until `retry_at`
+- half_open: one trial call is allowed; success closes, failure re-opens
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0, name: str = ""):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+            name: Label used in stats
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() >= self._opened_at + self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a trial call through (0 if closed)."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made now.
+
+        In half-open state only the first caller gets True until it reports
+        its outcome.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self):
+        """Report a successful call."""
+        self.stats["successes"] += 1
+        self._failures = 0
+        self._trial_in_flight = False
+        self._state = self.CLOSED
+
+    def record_failure(self):
+        """Report a failed call."""
+        self.stats["failures"] += 1
+        self._failures += 1
+        # Calls started before the circuit opened only add to the count
+        if self._trial_in_flight or (self._state == self.CLOSED and self._failures >= self.failure_threshold):
+            self.stats["opened"] += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters."""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after, 2),
+            **self.stats,
+        }
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, name: str, retry_after: float, message: Optional[str] = None):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(message or f"Circuit open for {name}, retry in {retry_after:.0f}s")
@@ -52,7 +52,9 @@ class Settings(BaseSettings):
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
-    
+    RATE_LIMIT_LOCAL_TOKENS: int = int(os.getenv("RATE_LIMIT_LOCAL_TOKENS", "0"))  # Tokens leased per Redis trip (0 = off)
+    RATE_LIMIT_LOCAL_TTL: float = float(os.getenv("RATE_LIMIT_LOCAL_TTL", "1.0"))  # Seconds a lease may be spent
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -79,6 +81,29 @@ class Settings(BaseSettings):
     AI_MAX_TOKENS: int = int(os.getenv("AI_MAX_TOKENS", "2000"))
     AI_TEMPERATURE: float = float(os.getenv("AI_TEMPERATURE", "0.7"))
     AI_TIMEOUT_SECONDS: int = int(os.getenv("AI_TIMEOUT_SECONDS", "60"))
+
+    # LLM Gateway (shared connection pool for all AI providers)
+    LLM_HTTP2: bool = os.getenv("LLM_HTTP2", "true").lower() == "true"
+    LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    LLM_PROVIDER_CONCURRENCY: int = int(os.getenv("LLM_PROVIDER_CONCURRENCY", "32"))  # In-flight requests per provider
+
+    # AI Council response cache
+    AI_CACHE_BACKEND: str = os.getenv("AI_CACHE_BACKEND", "redis")  # redis, disk, none (redis falls back to disk without REDIS_URL)
+    AI_CACHE_DIR: str = os.getenv("AI_CACHE_DIR", "storage/ai_cache")
+    AI_CACHE_SEMANTIC: bool = os.getenv("AI_CACHE_SEMANTIC", "false").lower() == "true"  # Near-duplicate matching for deterministic tasks
+    AI_CACHE_SEMANTIC_THRESHOLD: float = float(os.getenv("AI_CACHE_SEMANTIC_THRESHOLD", "0.97"))
+
+    # AI metric sink spool file (written while the database is unreachable)
+    METRIC_SPOOL_PATH: str = os.getenv("METRIC_SPOOL_PATH", "storage/metric_spool.jsonl")
+
+    # Website fetch/analysis cache (conditional GETs, content-addressed results)
+    SITE_CACHE_ENABLED: bool = os.getenv("SITE_CACHE_ENABLED", "true").lower() == "true"
+    SITE_CACHE_DIR: str = os.getenv("SITE_CACHE_DIR", "storage/site_cache")
+    SITE_CACHE_MAX_MB: int = int(os.getenv("SITE_CACHE_MAX_MB", "2048"))  # Least recently used entries are evicted beyond this
+    SITE_CACHE_MAX_AGE_DAYS: int = int(os.getenv("SITE_CACHE_MAX_AGE_DAYS", "30"))  # Pages unused for this long are evicted
+    SITE_CACHE_DERIVED_TTL_DAYS: int = int(os.getenv("SITE_CACHE_DERIVED_TTL_DAYS", "7"))  # Analyses and AI results expire after this
     
     # Phase 3: Email Settings
     SMTP_HOST: str = "smtp.gmail.com"
@@ -93,6 +118,13 @@ class Settings(BaseSettings):
 
     # Phase 3: Notification Settings
     WEBSOCKET_PING_INTERVAL: int = 30
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 256  # Pending messages per connection
+    WEBSOCKET_SEND_TIMEOUT: float = 10.0  # Seconds before a stalled client is dropped
+
+    # Realtime event history (Redis Streams) for websocket resume
+    REALTIME_STREAMS_ENABLED: bool = os.getenv("REALTIME_STREAMS_ENABLED", "false").lower() == "true"
+    REALTIME_STREAM_MAXLEN: int = int(os.getenv("REALTIME_STREAM_MAXLEN", "1000"))  # Events kept per channel
+    REALTIME_REPLAY_LIMIT: int = int(os.getenv("REALTIME_REPLAY_LIMIT", "500"))  # Max events replayed per channel
     NOTIFICATION_MAX_RETRIES: int = 3
     NOTIFICATION_RETRY_DELAY: int = 300  # 5 minutes
     NOTIFICATION_BATCH_SIZE: int = 100
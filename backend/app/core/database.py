@@ -2,8 +2,12 @@
 Database connection and session management.
 """
 
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
 
@@ -22,6 +26,24 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Sync engine for Celery tasks (psycopg2), built on first use so importing this
+# module does not require the sync driver
+_sync_engine: Optional[Engine] = None
+
+
+def SessionLocal() -> Session:
+    """Create a sync session for Celery tasks."""
+    global _sync_engine
+    if _sync_engine is None:
+        _sync_engine = create_engine(
+            settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"),
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+        )
+    return Session(_sync_engine, expire_on_commit=False)
+
 
 async def get_db() -> AsyncSession:
     """Dependency to get database session."""
@@ -38,6 +38,15 @@ class EmailConfig(BaseSettings):
     TRACKING_PIXEL_ENABLED: bool = True
     LINK_TRACKING_ENABLED: bool = True
 
+    # Signed tracking tokens: "<id>:<secret>" pairs, first entry signs new tokens.
+    # Keep retired keys listed until emails signed with them have aged out.
+    TRACKING_TOKEN_KEYS: str = ""
+    TRACKING_TOKEN_MAX_AGE_DAYS: int = 365
+    # Unsigned tokens from emails sent before signing can be forged by anyone;
+    # only enable while migrating, ideally with a cutoff date (YYYY-MM-DD, UTC)
+    TRACKING_ACCEPT_LEGACY_TOKENS: bool = False
+    TRACKING_LEGACY_TOKENS_UNTIL: str = ""
+
     # Rate limiting
     MAX_EMAILS_PER_HOUR: int = 100
     MAX_EMAILS_PER_DAY: int = 1000
@@ -0,0 +1,189 @@
+"""
+Realtime Event Batching
+
+Coalesces high-frequency websocket events before they reach Redis.
+
+Workers emit progress per lead and per email. Instead of one PUBLISH round
+trip per call, events are buffered per channel and flushed every short window
+(or every N events) in one pipeline. Progress-style events are rolled up to
+a single message per job carrying the latest values, with counters such as
+emails sent summed over the window.
+
+`EventBatch` holds the buffering rules; the sync (Celery) variant lives in
+app.core.websocket_publisher, the async (FastAPI) variant is below.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Channel carrying AI streaming events (ai:response_partial, ai:response_ready)
+AI_EVENTS_CHANNEL = "fliptechpro:ai"
+
+# Events rolled up per room and task_id within a window: type -> fields summed across events
+ROLLUP_EVENTS: Dict[str, Tuple[str, ...]] = {
+    "scraper:progress": (),
+    "campaign:email_sent": ("count",),
+    "campaign:stats_updated": (),
+    "demo:composing": (),
+    "batch:progress": (),
+    # Partial replies carry the full text so far, so only the latest matters
+    "ai:response_partial": ("tokens",),
+}
+
+
+class EventBatch:
+    """
+    Thread-safe buffer of pending (channel, message) pairs.
+
+    Rolled-up events keep the queue position of their first occurrence and
+    the values of their latest; everything else is passed through in order.
+    """
+
+    def __init__(self):
+        self._events: "OrderedDict[Hashable, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, channel: str, message: Dict[str, Any]) -> int:
+        """
+        Buffer one event.
+
+        Returns:
+            int: Number of pending messages after adding
+        """
+        event_type = message.get("type")
+
+        with self._lock:
+            if event_type in ROLLUP_EVENTS:
+                # Jobs sharing a room (e.g. files of one demo build) roll up separately
+                key = (channel, event_type, message.get("room"), message.get("task_id"))
+                pending = self._events.get(key)
+                if pending is not None:
+                    _, previous = pending
+                    merged = dict(message)
+                    for field in ROLLUP_EVENTS[event_type]:
+                        merged[field] = previous.get(field, 0) + message.get(field, 0)
+                    merged["rolled_up"] = previous.get("rolled_up", 1) + 1
+                    self._events[key] = (channel, merged)
+                    return len(self._events)
+            else:
+                self._seq += 1
+                key = ("_seq", self._seq)
+
+            self._events[key] = (channel, dict(message))
+            return len(self._events)
+
+    def drain(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Take all pending events in order."""
+        with self._lock:
+            events = list(self._events.values())
+            self._events.clear()
+        return events
+
+
+class AsyncBatchingPublisher:
+    """
+    Batching publisher for the FastAPI process.
+
+    Features:
+    - Non-blocking publish() for request handlers
+    - Flush every `window` seconds or `max_events` events
+    - One pipelined round trip per flush
+    - Drain on shutdown
+    """
+
+    def __init__(self, window: float = 0.25, max_events: int = 100):
+        """
+        Initialize publisher.
+
+        Args:
+            window: Maximum seconds an event is buffered
+            max_events: Pending events that trigger an early flush
+        """
+        self.window = window
+        self.max_events = max_events
+        self._batch = EventBatch()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"published": 0, "flushes": 0, "errors": 0}
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Buffer an event for the next flush."""
+        if "timestamp" not in message:
+            message["timestamp"] = datetime.utcnow().isoformat()
+        if self._batch.add(channel, message) >= self.max_events:
+            self._wakeup.set()
+
+    async def start(self):
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flusher and publish whatever is buffered."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.window)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Publish all buffered events in one pipeline.
+
+        Returns:
+            int: Number of messages published
+        """
+        from app.core.realtime_streams import realtime_stream
+        from app.core.redis_pubsub import redis_pubsub_manager
+
+        events = self._batch.drain()
+        client = redis_pubsub_manager.redis_client
+        if not events or not client:
+            return 0
+
+        try:
+            if realtime_stream.enabled:
+                ids = await realtime_stream.append_many(client, events)
+                for (_, message), event_id in zip(events, ids):
+                    message["event_id"] = event_id
+
+            pipe = client.pipeline(transaction=False)
+            for channel, message in events:
+                pipe.publish(channel, json.dumps(message))
+            await pipe.execute()
+
+            self.stats["published"] += len(events)
+            self.stats["flushes"] += 1
+            return len(events)
+
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Failed to flush {len(events)} realtime events: {e}")
+            return 0
+
+
+# Global instance for the API process
+async_event_publisher = AsyncBatchingPublisher()
@@ -3,7 +3,7 @@ Rate limiting middleware for API endpoints.
 Implements OWASP recommendations for preventing abuse and DoS attacks.
 """
 
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from datetime import datetime
@@ -18,11 +18,13 @@ except ImportError:
     SLOWAPI_AVAILABLE = False
     print("Warning: slowapi not installed. Rate limiting disabled.")
 
-import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
 import logging
 import hashlib
 import json
+import math
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -168,21 +170,106 @@ RATE_LIMITS = {
 }
 
 
+# GCRA (generic cell rate algorithm) in one atomic round trip.
+#
+# Only the bucket's "theoretical arrival time" (TAT) is stored, as a single
+# integer key that expires once the bucket is full again. Up to `limit`
+# requests may arrive back to back; after that one request is admitted
+# every window/limit seconds. Times come from the Redis clock, so all API
+# workers agree on them.
+#
+# KEYS[1]  bucket key
+# ARGV[1]  emission interval in ms (window / limit)
+# ARGV[2]  window in ms (burst tolerance)
+# ARGV[3]  tokens wanted; as many as fit (at least 1) are granted
+#
+# Returns {granted, remaining, retry_after_ms, reset_after_ms}
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local wanted = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+
+local available = math.floor((window - (tat - now)) / interval)
+if available < 1 then
+    local retry_after = tat + interval - window - now
+    return {0, 0, retry_after, tat - now}
+end
+
+local granted = math.min(wanted, available)
+local new_tat = tat + granted * interval
+redis.call('SET', KEYS[1], new_tat, 'PX', math.max(1, new_tat - now))
+return {granted, available - granted, 0, new_tat - now}
+"""
+
+
+class _LocalLease:
+    """Tokens reserved from Redis for one identifier, spent in-process."""
+
+    __slots__ = ("tokens", "expires_at", "remaining", "reset", "blocked_until", "retry_after")
+
+    def __init__(self):
+        self.tokens = 0
+        self.expires_at = 0.0
+        self.remaining = 0
+        self.reset = 0
+        self.blocked_until = 0.0
+        self.retry_after = 0
+
+
 class RateLimiter:
     """
     Custom rate limiter with Redis backend for distributed systems.
+
+    Features:
+    - Non-blocking redis.asyncio client
+    - GCRA check in a single Lua script (one round trip per request)
+    - Optional in-process token leases to absorb bursts without Redis
+    - Local short-circuit of already rejected identifiers
+    - Fails open when Redis is unavailable
     """
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
-        """Initialize rate limiter with Redis client."""
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        local_tokens: int = 0,
+        local_ttl: float = 1.0,
+        max_local_entries: int = 10000,
+    ):
+        """
+        Initialize rate limiter with Redis client.
+
+        Args:
+            redis_client: redis.asyncio client (created from REDIS_URL if omitted)
+            local_tokens: Tokens leased from Redis per trip and spent locally;
+                0 disables the local cache. Leased tokens count against the
+                limit immediately, so a lease that expires unused only makes
+                the limiter stricter, never looser.
+            local_ttl: Seconds a lease may be spent before Redis is asked again
+            max_local_entries: Identifiers kept in the local cache
+        """
         self.redis_client = redis_client
         if not self.redis_client and settings.REDIS_URL:
             try:
-                self.redis_client = redis.from_url(settings.REDIS_URL)
+                self.redis_client = aioredis.from_url(settings.REDIS_URL)
             except Exception as e:
                 logger.error(f"Failed to connect to Redis for rate limiting: {e}")
 
-    def check_rate_limit(
+        self.local_tokens = local_tokens
+        self.local_ttl = local_ttl
+        self.max_local_entries = max_local_entries
+        self._leases: Dict[str, _LocalLease] = {}
+        self._script = self.redis_client.register_script(GCRA_SCRIPT) if self.redis_client else None
+        self.stats = {"redis_calls": 0, "local_hits": 0, "local_rejects": 0, "errors": 0}
+
+    async def check_rate_limit(
         self,
         identifier: str,
         endpoint: str,
@@ -193,60 +280,98 @@ class RateLimiter:
         Check if request should be rate limited.
         Returns (is_allowed, metadata)
         """
-        if not self.redis_client:
+        if not self._script:
             # If Redis is not available, allow all requests
             return True, {"warning": "Rate limiting not active"}
 
-        try:
-            key = f"rate_limit:{endpoint}:{identifier}"
-            current_time = int(datetime.utcnow().timestamp())
-            window_start = current_time - window
-
-            # Use Redis sorted set to track requests
-            pipe = self.redis_client.pipeline()
-
-            # Remove old entries outside the window
-            pipe.zremrangebyscore(key, 0, window_start)
-
-            # Count requests in current window
-            pipe.zcard(key)
-
-            # Add current request
-            pipe.zadd(key, {f"{current_time}:{id(current_time)}": current_time})
-
-            # Set expiry on the key
-            pipe.expire(key, window + 1)
-
-            results = pipe.execute()
-            request_count = results[1]
-
-            # Check if limit exceeded
-            if request_count >= limit:
-                # Calculate retry after
-                oldest_request = self.redis_client.zrange(key, 0, 0, withscores=True)
-                if oldest_request:
-                    retry_after = window - (current_time - int(oldest_request[0][1]))
-                else:
-                    retry_after = window
+        key = f"rate_limit:{endpoint}:{identifier}"
+        lease = self._leases.get(key) if self.local_tokens > 0 else None
 
+        if lease is not None:
+            now = time.monotonic()
+            if lease.tokens > 0 and now < lease.expires_at:
+                lease.tokens -= 1
+                self.stats["local_hits"] += 1
+                return True, {
+                    "limit": limit,
+                    "remaining": lease.remaining + lease.tokens,
+                    "reset": lease.reset
+                }
+            if now < lease.blocked_until:
+                self.stats["local_rejects"] += 1
                 return False, {
                     "limit": limit,
                     "remaining": 0,
-                    "reset": window_start + window,
-                    "retry_after": max(1, retry_after)
+                    "reset": lease.reset,
+                    "retry_after": max(1, math.ceil(lease.blocked_until - now))
                 }
 
-            return True, {
-                "limit": limit,
-                "remaining": limit - request_count - 1,
-                "reset": window_start + window
-            }
+        wanted = min(self.local_tokens, limit) if self.local_tokens > 0 else 1
+        interval_ms = max(1, (window * 1000) // limit)
 
+        try:
+            self.stats["redis_calls"] += 1
+            granted, remaining, retry_after_ms, reset_after_ms = await self._script(
+                keys=[key], args=[interval_ms, window * 1000, wanted]
+            )
         except Exception as e:
+            self.stats["errors"] += 1
             logger.error(f"Rate limiting error: {e}")
             # On error, allow the request but log it
             return True, {"error": "Rate limit check failed"}
 
+        reset = int(time.time() + reset_after_ms / 1000)
+
+        if granted < 1:
+            retry_after = max(1, math.ceil(retry_after_ms / 1000))
+            if self.local_tokens > 0:
+                lease = self._lease_for(key)
+                lease.tokens = 0
+                lease.reset = reset
+                lease.blocked_until = time.monotonic() + retry_after_ms / 1000
+            return False, {
+                "limit": limit,
+                "remaining": 0,
+                "reset": reset,
+                "retry_after": retry_after
+            }
+
+        if self.local_tokens > 0:
+            # The current request spends the first granted token
+            lease = self._lease_for(key)
+            lease.tokens = granted - 1
+            lease.expires_at = time.monotonic() + self.local_ttl
+            lease.remaining = remaining
+            lease.reset = reset
+            lease.blocked_until = 0.0
+
+        return True, {
+            "limit": limit,
+            "remaining": remaining + granted - 1,
+            "reset": reset
+        }
+
+    def _lease_for(self, key: str) -> _LocalLease:
+        """Get or create the local lease of a bucket, bounding the cache size."""
+        lease = self._leases.get(key)
+        if lease is None:
+            if len(self._leases) >= self.max_local_entries:
+                self._evict_expired()
+            lease = self._leases[key] = _LocalLease()
+        return lease
+
+    def _evict_expired(self):
+        """Drop spent leases; if none are spent, drop the oldest half."""
+        now = time.monotonic()
+        expired = [
+            key for key, lease in self._leases.items()
+            if now >= lease.expires_at and now >= lease.blocked_until
+        ]
+        if not expired:
+            expired = list(self._leases)[: len(self._leases) // 2]
+        for key in expired:
+            del self._leases[key]
+
     def get_endpoint_limits(self, endpoint: str) -> tuple[int, int]:
         """
         Get rate limit configuration for an endpoint.
@@ -290,7 +415,10 @@ class RateLimiter:
 
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+rate_limiter = RateLimiter(
+    local_tokens=settings.RATE_LIMIT_LOCAL_TOKENS,
+    local_ttl=settings.RATE_LIMIT_LOCAL_TTL,
+)
 
 
 def create_rate_limit_exceeded_response(request: Request, exc: Exception) -> JSONResponse:
@@ -364,7 +492,7 @@ def rate_limit_middleware(endpoint_limit: str = None):
                 limit, window = rate_limiter.get_endpoint_limits(endpoint)
 
             # Check rate limit
-            is_allowed, metadata = rate_limiter.check_rate_limit(
+            is_allowed, metadata = await rate_limiter.check_rate_limit(
                 identifier, endpoint, limit, window
             )
 
@@ -427,6 +555,7 @@ approvals_rules_write_limiter = rate_limit_middleware("10 per minute")
 
 __all__ = [
     'RateLimiter',
+    'GCRA_SCRIPT',
     'rate_limiter',
     'rate_limit_middleware',
     'scraper_limiter',
@@ -0,0 +1,202 @@
+"""
+Realtime Event Streams
+
+Optional Redis Streams history for websocket events.
+
+Pub/Sub stays the live delivery path. When REALTIME_STREAMS_ENABLED is set,
+publishers also XADD every event to a capped per-channel stream and stamp the
+stream entry ID on the message as `event_id`. Clients that reconnect with
+`since=<event_id>` (or whose last delivered ID was stored as their consumer
+offset) get the missed delta replayed before live events resume.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+STREAM_SUFFIX = ":stream"
+OFFSET_KEY_PREFIX = "fliptechpro:stream_offset:"
+
+# Replayed event: (event_id, channel, message)
+ReplayEvent = Tuple[str, str, Dict[str, Any]]
+
+
+def stream_key(channel: str) -> str:
+    """Get the stream key holding a channel's history."""
+    return f"{channel}{STREAM_SUFFIX}"
+
+
+def parse_event_id(event_id: str) -> Tuple[int, int]:
+    """
+    Parse a stream entry ID ("<ms>-<seq>") into a sortable tuple.
+
+    Raises:
+        ValueError: If the ID is malformed
+    """
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def is_valid_event_id(event_id: Optional[str]) -> bool:
+    """Check whether a client-supplied resume ID is well formed."""
+    if not event_id:
+        return False
+    try:
+        parse_event_id(event_id)
+        return True
+    except ValueError:
+        return False
+
+
+class RealtimeEventStream:
+    """
+    Capped Redis Streams history for realtime channels.
+
+    Works with both the sync client (Celery publishers) and the asyncio
+    client (API process); the *_sync methods take a redis.Redis, the others
+    a redis.asyncio.Redis.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        maxlen: int = 1000,
+        replay_limit: int = 500,
+        offset_ttl_seconds: int = 86400,
+    ):
+        """
+        Initialize stream history.
+
+        Args:
+            enabled: Whether publishers append to streams
+            maxlen: Approximate number of events kept per channel
+            replay_limit: Maximum events replayed per channel on resume
+            offset_ttl_seconds: How long a client's stored offset is kept
+        """
+        self.enabled = enabled
+        self.maxlen = maxlen
+        self.replay_limit = replay_limit
+        self.offset_ttl_seconds = offset_ttl_seconds
+
+    def _entry(self, message: Dict[str, Any]) -> Dict[str, str]:
+        return {"data": json.dumps(message)}
+
+    def append_sync(self, client, channel: str, message: Dict[str, Any]) -> Optional[str]:
+        """Append an event with a sync client, returning its event ID."""
+        if not self.enabled:
+            return None
+        return client.xadd(stream_key(channel), self._entry(message), maxlen=self.maxlen, approximate=True)
+
+    async def append(self, client, channel: str, message: Dict[str, Any]) -> Optional[str]:
+        """Append an event with an asyncio client, returning its event ID."""
+        if not self.enabled:
+            return None
+        return await client.xadd(stream_key(channel), self._entry(message), maxlen=self.maxlen, approximate=True)
+
+    def append_many_sync(self, client, events: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Append (channel, message) pairs in one pipeline with a sync client."""
+        pipe = client.pipeline(transaction=False)
+        for channel, message in events:
+            pipe.xadd(stream_key(channel), self._entry(message), maxlen=self.maxlen, approximate=True)
+        return pipe.execute()
+
+    async def append_many(self, client, events: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Append (channel, message) pairs in one pipeline with an asyncio client."""
+        pipe = client.pipeline(transaction=False)
+        for channel, message in events:
+            pipe.xadd(stream_key(channel), self._entry(message), maxlen=self.maxlen, approximate=True)
+        return await pipe.execute()
+
+    async def read_since(
+        self,
+        client,
+        channels: Iterable[str],
+        since: str,
+    ) -> Tuple[List[ReplayEvent], bool]:
+        """
+        Read events newer than `since` from several channels.
+
+        Args:
+            client: redis.asyncio client
+            channels: Channels to read (only these are checked for truncation)
+            since: Last event ID the client has seen (exclusive)
+
+        Returns:
+            Tuple of (events ordered by ID, truncated). `truncated` is True
+            when events after `since` were already trimmed from one of the
+            channels or the replay limit was hit, i.e. the client should
+            re-fetch state over REST.
+        """
+        channels = list(channels)
+        pipe = client.pipeline(transaction=False)
+        for channel in channels:
+            key = stream_key(channel)
+            pipe.xrange(key, min=f"({since}", max="+", count=self.replay_limit)
+            pipe.xinfo_stream(key)
+        # XINFO fails for channels that have no stream yet
+        results = await pipe.execute(raise_on_error=False)
+
+        since_id = parse_event_id(since)
+        events: List[ReplayEvent] = []
+        truncated = False
+        for index, channel in enumerate(channels):
+            entries, info = results[2 * index], results[2 * index + 1]
+            if isinstance(entries, Exception):
+                raise entries
+
+            if len(entries) >= self.replay_limit:
+                truncated = True
+            if not isinstance(info, Exception) and self._trimmed_after(info, since_id):
+                truncated = True
+
+            for event_id, fields in entries:
+                try:
+                    message = json.loads(fields["data"])
+                except (KeyError, TypeError, json.JSONDecodeError):
+                    logger.warning(f"Skipping malformed stream entry {event_id} on {channel}")
+                    continue
+                message["event_id"] = event_id
+                events.append((event_id, channel, message))
+
+        events.sort(key=lambda event: parse_event_id(event[0]))
+        return events, truncated
+
+    def _trimmed_after(self, info: Dict[str, Any], since_id: Tuple[int, int]) -> bool:
+        """
+        Whether trimming removed entries newer than `since_id` from a stream.
+
+        Uses max-deleted-entry-id (Redis 7+). Older servers only report the
+        first retained entry, which is only conclusive once the stream has
+        reached its cap (a stream created after `since` starts after it too).
+        """
+        max_deleted = info.get("max-deleted-entry-id")
+        if max_deleted is not None:
+            return parse_event_id(max_deleted) > since_id
+
+        first = info.get("first-entry")
+        return (
+            bool(first)
+            and info.get("length", 0) >= self.maxlen
+            and parse_event_id(first[0]) > since_id
+        )
+
+    async def save_offset(self, client, client_id: str, event_id: str):
+        """Store the last event ID delivered to a client."""
+        await client.set(f"{OFFSET_KEY_PREFIX}{client_id}", event_id, ex=self.offset_ttl_seconds)
+
+    async def get_offset(self, client, client_id: str) -> Optional[str]:
+        """Get the stored offset of a client, if any."""
+        return await client.get(f"{OFFSET_KEY_PREFIX}{client_id}")
+
+
+# Global instance
+realtime_stream = RealtimeEventStream(
+    enabled=settings.REALTIME_STREAMS_ENABLED,
+    maxlen=settings.REALTIME_STREAM_MAXLEN,
+    replay_limit=settings.REALTIME_REPLAY_LIMIT,
+)
@@ -8,13 +8,15 @@ Supports multiple channels for different event types: campaigns, emails, scraper
 import asyncio
 import json
 import logging
-from typing import Dict, Set, Optional, Callable, Any
+import zlib
+from typing import Dict, List, Set, Optional, Callable, Any
 from datetime import datetime
 
 import redis.asyncio as redis
 from redis.asyncio.client import PubSub
 
 from app.core.config import settings
+from app.core.realtime_streams import realtime_stream
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +27,11 @@ class RedisPubSubManager:
 
     Features:
     - Multiple channel subscriptions
-    - Pattern-based subscriptions (e.g., "campaign:*")
-    - Message routing to WebSocket clients
-    - Automatic reconnection on failure
+    - Pattern-based subscriptions via PSUBSCRIBE (e.g., "fliptechpro:*")
+    - Blocking listen() loop (no polling delay per message)
+    - Callbacks dispatched to a bounded worker pool; messages of one channel
+      stay ordered on the same worker so a slow handler only delays its lane
+    - Automatic reconnection with resubscription of channels and patterns
     - Health monitoring
     """
 
@@ -41,6 +45,9 @@ class RedisPubSubManager:
     CHANNEL_LEADS = "fliptechpro:leads"
     CHANNEL_CONVERSATIONS = "fliptechpro:conversations"
 
+    # Pattern matching every channel above
+    PATTERN_ALL = "fliptechpro:*"
+
     # All available channels
     ALL_CHANNELS = [
         CHANNEL_CAMPAIGNS,
@@ -53,17 +60,37 @@ class RedisPubSubManager:
         CHANNEL_CONVERSATIONS,
     ]
 
-    def __init__(self):
-        """Initialize Redis Pub/Sub manager."""
+    def __init__(self, dispatch_workers: int = 8, dispatch_queue_size: int = 1000):
+        """
+        Initialize Redis Pub/Sub manager.
+
+        Args:
+            dispatch_workers: Number of callback worker lanes
+            dispatch_queue_size: Pending messages per lane before dropping
+        """
         self.redis_client: Optional[redis.Redis] = None
         self.pubsub: Optional[PubSub] = None
         self.subscriptions: Dict[str, Set[Callable]] = {}
+        self.pattern_subscriptions: Dict[str, Set[Callable]] = {}
         self._running = False
         self._listener_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 10
 
+        self._dispatch_workers = dispatch_workers
+        self._dispatch_queue_size = dispatch_queue_size
+        self._dispatch_queues: List[asyncio.Queue] = []
+        self._worker_tasks: List[asyncio.Task] = []
+        self._has_subscriptions = asyncio.Event()
+        self.stats = {
+            "received": 0,
+            "dispatched": 0,
+            "dropped": 0,
+            "callback_errors": 0,
+            "reconnects": 0,
+        }
+
     async def connect(self) -> bool:
         """
         Connect to Redis and initialize Pub/Sub.
@@ -102,20 +129,13 @@ class RedisPubSubManager:
 
     async def disconnect(self):
         """Disconnect from Redis Pub/Sub."""
-        self._running = False
+        await self.stop_listener()
 
-        # Cancel listener task
-        if self._listener_task and not self._listener_task.done():
-            self._listener_task.cancel()
-            try:
-                await self._listener_task
-            except asyncio.CancelledError:
-                pass
-
-        # Unsubscribe from all channels
+        # Unsubscribe from all channels and patterns
         if self.pubsub:
             try:
                 await self.pubsub.unsubscribe()
+                await self.pubsub.punsubscribe()
                 await self.pubsub.close()
             except Exception as e:
                 logger.error(f"Error closing pubsub: {e}")
@@ -153,6 +173,55 @@ class RedisPubSubManager:
                 except Exception as e:
                     logger.error(f"Failed to subscribe to {channel}: {e}")
 
+            self._has_subscriptions.set()
+
+    async def psubscribe(self, pattern: str, callback: Callable):
+        """
+        Subscribe to all Redis channels matching a glob pattern.
+
+        Callbacks receive the concrete channel name, so one pattern
+        subscription can replace a subscription per channel.
+
+        Args:
+            pattern: Channel pattern (e.g. "fliptechpro:*")
+            callback: Async callback function to handle messages
+        """
+        async with self._lock:
+            if pattern not in self.pattern_subscriptions:
+                self.pattern_subscriptions[pattern] = set()
+
+            self.pattern_subscriptions[pattern].add(callback)
+
+            if self.pubsub:
+                try:
+                    await self.pubsub.psubscribe(pattern)
+                    logger.info(f"Subscribed to Redis pattern: {pattern}")
+                except Exception as e:
+                    logger.error(f"Failed to subscribe to pattern {pattern}: {e}")
+
+            self._has_subscriptions.set()
+
+    async def punsubscribe(self, pattern: str, callback: Callable):
+        """
+        Unsubscribe from a Redis channel pattern.
+
+        Args:
+            pattern: Channel pattern
+            callback: Callback to remove
+        """
+        async with self._lock:
+            if pattern in self.pattern_subscriptions:
+                self.pattern_subscriptions[pattern].discard(callback)
+
+                if not self.pattern_subscriptions[pattern]:
+                    del self.pattern_subscriptions[pattern]
+                    if self.pubsub:
+                        try:
+                            await self.pubsub.punsubscribe(pattern)
+                            logger.info(f"Unsubscribed from Redis pattern: {pattern}")
+                        except Exception as e:
+                            logger.error(f"Failed to unsubscribe from pattern {pattern}: {e}")
+
     async def unsubscribe(self, channel: str, callback: Callable):
         """
         Unsubscribe from a Redis channel.
@@ -195,6 +264,13 @@ class RedisPubSubManager:
             if "timestamp" not in message:
                 message["timestamp"] = datetime.utcnow().isoformat()
 
+            # Keep a replayable copy when stream history is enabled
+            if realtime_stream.enabled:
+                try:
+                    message["event_id"] = await realtime_stream.append(self.redis_client, channel, message)
+                except Exception as e:
+                    logger.error(f"Failed to append to stream for {channel}: {e}")
+
             # Serialize message
             message_json = json.dumps(message)
 
@@ -219,20 +295,44 @@ class RedisPubSubManager:
             return
 
         self._running = True
+
+        # Callback lanes: a channel always maps to the same lane, which keeps
+        # its messages ordered while other channels proceed independently
+        self._dispatch_queues = [
+            asyncio.Queue(maxsize=self._dispatch_queue_size)
+            for _ in range(self._dispatch_workers)
+        ]
+        self._worker_tasks = [
+            asyncio.create_task(self._dispatch_worker(queue))
+            for queue in self._dispatch_queues
+        ]
+
         self._listener_task = asyncio.create_task(self._listen_loop())
         logger.info("Redis Pub/Sub listener started")
 
     async def stop_listener(self):
-        """Stop the Pub/Sub listener."""
+        """Stop the Pub/Sub listener and callback workers."""
         self._running = False
-        if self._listener_task:
-            self._listener_task.cancel()
+        tasks = [t for t in [self._listener_task, *self._worker_tasks] if t]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
             try:
-                await self._listener_task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._listener_task = None
+        self._worker_tasks = []
         logger.info("Redis Pub/Sub listener stopped")
 
+    async def _resubscribe(self):
+        """Subscribe a fresh pubsub to every known channel and pattern."""
+        async with self._lock:
+            if self.subscriptions:
+                await self.pubsub.subscribe(*self.subscriptions.keys())
+            if self.pattern_subscriptions:
+                await self.pubsub.psubscribe(*self.pattern_subscriptions.keys())
+
     async def _listen_loop(self):
         """Main loop for listening to Redis Pub/Sub messages."""
         while self._running:
@@ -240,23 +340,25 @@ class RedisPubSubManager:
                 if not self.pubsub:
                     logger.warning("Pub/Sub not initialized, attempting reconnect...")
                     if await self.connect():
-                        # Re-subscribe to all channels
-                        for channel in list(self.subscriptions.keys()):
-                            await self.pubsub.subscribe(channel)
+                        await self._resubscribe()
+                        self.stats["reconnects"] += 1
                     else:
                         await asyncio.sleep(5)
                         continue
 
-                # Get next message
-                message = await self.pubsub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=1.0
-                )
-
-                if message and message["type"] == "message":
-                    await self._handle_message(message)
+                # listen() returns immediately while nothing is subscribed
+                if not self.subscriptions and not self.pattern_subscriptions:
+                    self._has_subscriptions.clear()
+                    await self._has_subscriptions.wait()
+                    continue
 
-                await asyncio.sleep(0.01)  # Small delay to prevent tight loop
+                # Blocks on the socket; each message is handled as it arrives
+                async for message in self.pubsub.listen():
+                    if message["type"] in ("message", "pmessage"):
+                        self._reconnect_attempts = 0
+                        self._enqueue_message(message)
+                    if not self._running:
+                        break
 
             except asyncio.CancelledError:
                 break
@@ -269,7 +371,43 @@ class RedisPubSubManager:
                     logger.error("Max reconnect attempts reached, stopping listener")
                     break
 
-                await asyncio.sleep(min(self._reconnect_attempts * 2, 30))  # Exponential backoff
+                # Drop the broken pubsub; the next iteration reconnects and
+                # resubscribes everything in one round trip. The first retry
+                # is immediate to keep the gap short.
+                await self._reset_pubsub()
+                if self._reconnect_attempts > 1:
+                    await asyncio.sleep(min(self._reconnect_attempts * 2, 30))  # Exponential backoff
+
+    async def _reset_pubsub(self):
+        """Close a broken pubsub connection so the listener can rebuild it."""
+        if self.pubsub:
+            try:
+                await self.pubsub.close()
+            except Exception:
+                pass
+        self.pubsub = None
+
+    def _enqueue_message(self, message: Dict[str, Any]):
+        """Hand a message to its channel's callback lane without waiting."""
+        self.stats["received"] += 1
+        channel = message["channel"]
+        lane = zlib.crc32(channel.encode("utf-8")) % len(self._dispatch_queues)
+
+        try:
+            self._dispatch_queues[lane].put_nowait(message)
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            if self.stats["dropped"] % 100 == 1:
+                logger.warning(f"Pub/Sub callback lane {lane} is full, dropping messages from {channel}")
+
+    async def _dispatch_worker(self, queue: asyncio.Queue):
+        """Run callbacks for one lane of channels."""
+        while True:
+            message = await queue.get()
+            try:
+                await self._handle_message(message)
+            finally:
+                queue.task_done()
 
     async def _handle_message(self, message: Dict[str, Any]):
         """
@@ -289,17 +427,22 @@ class RedisPubSubManager:
                 logger.error(f"Invalid JSON in message from {channel}: {data}")
                 return
 
-            # Get callbacks for this channel
-            callbacks = self.subscriptions.get(channel, set())
+            # Get callbacks for this channel or the pattern that matched it
+            if message["type"] == "pmessage":
+                callbacks = self.pattern_subscriptions.get(message["pattern"], set())
+            else:
+                callbacks = self.subscriptions.get(channel, set())
 
             # Call all registered callbacks
-            for callback in callbacks:
+            for callback in list(callbacks):
                 try:
                     if asyncio.iscoroutinefunction(callback):
                         await callback(channel, parsed_data)
                     else:
                         callback(channel, parsed_data)
+                    self.stats["dispatched"] += 1
                 except Exception as e:
+                    self.stats["callback_errors"] += 1
                     logger.error(f"Error in callback for {channel}: {e}")
 
         except Exception as e:
@@ -386,9 +529,12 @@ class RedisPubSubManager:
             "healthy": healthy,
             "connected": self.redis_client is not None,
             "running": self._running,
-            "subscriptions": len(self.subscriptions),
+            "subscriptions": len(self.subscriptions) + len(self.pattern_subscriptions),
             "channels": list(self.subscriptions.keys()),
+            "patterns": list(self.pattern_subscriptions.keys()),
             "reconnect_attempts": self._reconnect_attempts,
+            "pending": sum(queue.qsize() for queue in self._dispatch_queues),
+            **self.stats,
             "error": error,
         }
 
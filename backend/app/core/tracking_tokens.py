@@ -0,0 +1,247 @@
+"""
+Signed Email Tracking Tokens
+
+Compact, stateless HMAC-signed tokens embedded in tracking pixels, tracked
+links and unsubscribe links. A token carries the campaign, recipient and lead
+IDs plus its issue time, so the tracking endpoints can authenticate and route
+an event entirely in memory without a database read.
+
+Token layout (base64url, no padding):
+    version (1) | key id (1) | campaign_id (4) | recipient_id (4) | lead_id (4)
+    | issued_at (4, unix seconds) | HMAC-SHA256 truncated to 16 bytes
+
+Key rotation: tokens are always signed with the active key, and verified with
+whichever configured key their key id names, so old keys can stay in the
+verification set until every email signed with them has aged out.
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+TOKEN_VERSION = 1
+_BODY_FORMAT = ">BBIIII"
+_BODY_SIZE = struct.calcsize(_BODY_FORMAT)
+_MAC_SIZE = 16
+
+
+class TrackingTokenError(ValueError):
+    """Raised when a tracking token is malformed, forged or expired."""
+    pass
+
+
+@dataclass(frozen=True)
+class TrackingClaims:
+    """Decoded contents of a verified tracking token."""
+    campaign_id: int
+    lead_id: int
+    recipient_id: Optional[int] = None
+    issued_at: Optional[int] = None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class TrackingTokenSigner:
+    """
+    Signs and verifies tracking tokens with rotating HMAC keys.
+
+    Args:
+        keys: Mapping of key id (0-255) to secret
+        active_key_id: Key id used for new tokens
+        max_age_seconds: Tokens older than this are rejected (0 disables)
+        accept_legacy: Accept unsigned "campaign:lead:random" tokens issued
+            before signing was introduced
+        legacy_until: Unix timestamp after which legacy tokens are rejected
+            even when accept_legacy is set (None means no cutoff)
+    """
+
+    def __init__(
+        self,
+        keys: Dict[int, str],
+        active_key_id: int,
+        max_age_seconds: int = 0,
+        accept_legacy: bool = False,
+        legacy_until: Optional[float] = None,
+    ):
+        if active_key_id not in keys:
+            raise ValueError(f"Active tracking key {active_key_id} is not configured")
+
+        self._keys = {
+            key_id: secret.encode("utf-8")
+            for key_id, secret in keys.items()
+        }
+        self.active_key_id = active_key_id
+        self.max_age_seconds = max_age_seconds
+        self.accept_legacy = accept_legacy
+        self.legacy_until = legacy_until
+
+    def _mac(self, key_id: int, body: bytes) -> bytes:
+        return hmac.new(self._keys[key_id], body, hashlib.sha256).digest()[:_MAC_SIZE]
+
+    def sign(
+        self,
+        campaign_id: int,
+        lead_id: int,
+        recipient_id: Optional[int] = None,
+        issued_at: Optional[int] = None,
+    ) -> str:
+        """
+        Create a signed token.
+
+        Args:
+            campaign_id: Campaign ID
+            lead_id: Lead ID
+            recipient_id: Campaign recipient ID (0/None when not known)
+            issued_at: Unix timestamp, defaults to now
+
+        Returns:
+            URL-safe token string
+        """
+        body = struct.pack(
+            _BODY_FORMAT,
+            TOKEN_VERSION,
+            self.active_key_id,
+            campaign_id,
+            recipient_id or 0,
+            lead_id,
+            int(issued_at if issued_at is not None else time.time()),
+        )
+        return _b64encode(body + self._mac(self.active_key_id, body))
+
+    def verify(self, token: str, now: Optional[float] = None) -> TrackingClaims:
+        """
+        Verify a token and return its claims.
+
+        Raises:
+            TrackingTokenError: If the token is malformed, forged or expired
+        """
+        if ":" in token:
+            return self._verify_legacy(token, now)
+
+        try:
+            raw = _b64decode(token)
+        except (ValueError, TypeError):
+            raise TrackingTokenError("Malformed tracking token")
+
+        if len(raw) != _BODY_SIZE + _MAC_SIZE:
+            raise TrackingTokenError("Malformed tracking token")
+
+        body, mac = raw[:_BODY_SIZE], raw[_BODY_SIZE:]
+        version, key_id, campaign_id, recipient_id, lead_id, issued_at = struct.unpack(_BODY_FORMAT, body)
+
+        if version != TOKEN_VERSION:
+            raise TrackingTokenError(f"Unsupported tracking token version: {version}")
+        if key_id not in self._keys:
+            raise TrackingTokenError(f"Unknown tracking key id: {key_id}")
+        if not hmac.compare_digest(mac, self._mac(key_id, body)):
+            raise TrackingTokenError("Invalid tracking token signature")
+
+        if self.max_age_seconds:
+            age = (now if now is not None else time.time()) - issued_at
+            if age > self.max_age_seconds:
+                raise TrackingTokenError("Tracking token expired")
+
+        return TrackingClaims(
+            campaign_id=campaign_id,
+            lead_id=lead_id,
+            recipient_id=recipient_id or None,
+            issued_at=issued_at,
+        )
+
+    def _verify_legacy(self, token: str, now: Optional[float] = None) -> TrackingClaims:
+        """Parse a pre-signing "campaign:lead:random" token."""
+        if not self.accept_legacy:
+            raise TrackingTokenError("Unsigned tracking tokens are not accepted")
+        if self.legacy_until is not None and (now if now is not None else time.time()) >= self.legacy_until:
+            raise TrackingTokenError("Unsigned tracking tokens are no longer accepted")
+
+        try:
+            parts = token.split(":")
+            claims = TrackingClaims(campaign_id=int(parts[0]), lead_id=int(parts[1]))
+        except (ValueError, IndexError):
+            raise TrackingTokenError(f"Invalid tracking token: {token}")
+
+        # Unsigned tokens are forgeable, so every accepted one is logged
+        logger.warning(
+            f"Accepted unsigned legacy tracking token for campaign {claims.campaign_id}, lead {claims.lead_id}"
+        )
+        return claims
+
+
+def parse_key_ring(spec: str) -> Dict[int, str]:
+    """
+    Parse a "2:new-secret,1:old-secret" key ring.
+
+    Returns:
+        Mapping of key id to secret, in the order given
+    """
+    keys: Dict[int, str] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key_id, _, secret = entry.partition(":")
+        if not secret:
+            raise ValueError("Tracking token keys must be formatted as '<id>:<secret>'")
+        key_id = int(key_id)
+        if not 0 <= key_id <= 255:
+            raise ValueError(f"Tracking key id out of range: {key_id}")
+        keys[key_id] = secret
+    return keys
+
+
+def _build_signer() -> TrackingTokenSigner:
+    """Build the process-wide signer from email configuration."""
+    from app.core.config import settings
+    from app.core.email_config import email_config
+
+    if email_config.TRACKING_TOKEN_KEYS:
+        keys = parse_key_ring(email_config.TRACKING_TOKEN_KEYS)
+        active_key_id = next(iter(keys))
+    else:
+        # Derive a key from SECRET_KEY so tokens stay valid across restarts
+        if not settings.SECRET_KEY:
+            logger.warning("TRACKING_TOKEN_KEYS and SECRET_KEY not set - tracking tokens use an insecure default key")
+        derived = hashlib.sha256(f"tracking:{settings.SECRET_KEY}".encode("utf-8")).hexdigest()
+        keys = {0: derived}
+        active_key_id = 0
+
+    legacy_until = None
+    if email_config.TRACKING_LEGACY_TOKENS_UNTIL:
+        legacy_until = datetime.strptime(
+            email_config.TRACKING_LEGACY_TOKENS_UNTIL, "%Y-%m-%d"
+        ).replace(tzinfo=timezone.utc).timestamp()
+
+    return TrackingTokenSigner(
+        keys=keys,
+        active_key_id=active_key_id,
+        max_age_seconds=email_config.TRACKING_TOKEN_MAX_AGE_DAYS * 86400,
+        accept_legacy=email_config.TRACKING_ACCEPT_LEGACY_TOKENS,
+        legacy_until=legacy_until,
+    )
+
+
+_signer: Optional[TrackingTokenSigner] = None
+
+
+def get_tracking_token_signer() -> TrackingTokenSigner:
+    """Get the process-wide tracking token signer."""
+    global _signer
+    if _signer is None:
+        _signer = _build_signer()
+    return _signer
@@ -14,7 +14,10 @@ Security measures:
 
 import ipaddress
 import re
-from typing import Optional, List, Set
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Set, Tuple
 from urllib.parse import urlparse, urljoin, quote
 import socket
 import logging
@@ -22,6 +25,49 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Hostname resolution cache: hostname -> (expires_at, ip or None if unresolvable),
+# least recently used first. Lookups run in worker threads, hence the lock.
+DNS_CACHE_TTL = 300
+DNS_NEGATIVE_CACHE_TTL = 30
+DNS_CACHE_MAX_ENTRIES = 1024
+_dns_cache: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+_dns_cache_lock = threading.Lock()
+
+
+def resolve_hostname(hostname: str) -> Optional[str]:
+    """
+    Resolve a hostname to an IPv4 address, caching the result.
+
+    Failed lookups are cached for a shorter time so a host that comes back
+    is noticed quickly. At most DNS_CACHE_MAX_ENTRIES hostnames are kept;
+    the least recently used is evicted first.
+
+    Returns:
+        IP address string, or None if the hostname could not be resolved
+    """
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(hostname)
+        if cached and cached[0] > now:
+            _dns_cache.move_to_end(hostname)
+            return cached[1]
+
+    try:
+        ip_str = socket.gethostbyname(hostname)
+        entry = (now + DNS_CACHE_TTL, ip_str)
+    except (socket.gaierror, UnicodeError):
+        ip_str = None
+        entry = (now + DNS_NEGATIVE_CACHE_TTL, None)
+
+    with _dns_cache_lock:
+        _dns_cache[hostname] = entry
+        _dns_cache.move_to_end(hostname)
+        while len(_dns_cache) > DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.popitem(last=False)
+
+    return ip_str
+
+
 class URLSecurityError(Exception):
     """Raised when a URL fails security validation."""
     pass
@@ -240,8 +286,10 @@ class URLValidator:
         except ValueError:
             # Not an IP address, resolve hostname
             try:
-                # Resolve hostname to IP
-                ip_str = socket.gethostbyname(hostname)
+                # Resolve hostname to IP (cached)
+                ip_str = resolve_hostname(hostname)
+                if ip_str is None:
+                    raise socket.gaierror(f"Could not resolve {hostname}")
                 ip = ipaddress.ip_address(ip_str)
 
                 # Check if IP is in private ranges
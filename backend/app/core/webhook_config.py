@@ -148,7 +148,19 @@ class WebhookQueueConfig(BaseModel):
         default=5,
         ge=1,
         le=60,
-        description="Queue processing interval in seconds"
+        description="Fallback poll interval in seconds (workers also wake on NOTIFY)"
+    )
+    claim_timeout: int = Field(
+        default=300,
+        ge=30,
+        le=3600,
+        description="Seconds before a webhook claimed by a dead worker is reclaimed"
+    )
+    max_in_flight: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Deliveries in progress at once; a finished delivery's slot is claimed again immediately"
     )
     priority_enabled: bool = Field(default=True, description="Enable priority processing")
     max_queue_size: int = Field(
@@ -165,6 +177,34 @@ class WebhookQueueConfig(BaseModel):
     )
 
 
+class WebhookDeliveryConfig(BaseModel):
+    """Per-destination delivery lanes."""
+
+    max_concurrency_per_destination: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Concurrent requests to one destination host"
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failures before a destination's circuit opens"
+    )
+    circuit_reset_seconds: int = Field(
+        default=60,
+        ge=5,
+        le=3600,
+        description="Seconds an open circuit waits before a trial request"
+    )
+    validation_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description="Seconds a URL validation result is reused"
+    )
+
+
 class WebhookMonitoringConfig(BaseModel):
     """Webhook monitoring configuration."""
 
@@ -203,6 +243,9 @@ class WebhookConfig(BaseModel):
     # Queue configuration
     queue: WebhookQueueConfig = Field(default_factory=WebhookQueueConfig)
 
+    # Delivery lane configuration
+    delivery: WebhookDeliveryConfig = Field(default_factory=WebhookDeliveryConfig)
+
     # Monitoring configuration
     monitoring: WebhookMonitoringConfig = Field(default_factory=WebhookMonitoringConfig)
 
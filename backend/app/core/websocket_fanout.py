@@ -0,0 +1,236 @@
+"""
+WebSocket Fan-out
+
+Per-connection outbound queues for WebSocket broadcasting.
+
+Each connection gets a bounded outbox and its own writer task, so a slow or
+stalled client only ever delays itself. Broadcasts serialize a message once
+and enqueue the same text into every subscriber's outbox without awaiting
+any socket. When a client falls behind, progress-style events are coalesced
+(only the latest pending update per job/campaign is kept) and, if the outbox
+is still full, the oldest pending message is dropped.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Event types where only the latest pending update matters
+COALESCE_TYPES = {
+    "scraper_progress",
+    "scraper:progress",
+    "campaign_stats_updated",
+    "campaign:stats_updated",
+    "demo:composing",
+    "batch:progress",
+    "heartbeat",
+}
+
+# Fields identifying the job a progress event belongs to, in priority order
+COALESCE_SCOPE_FIELDS = ("scraper_id", "campaign_id", "demo_id", "batch_id", "room")
+
+
+def serialize_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once for all recipients (same format as send_json)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Get the coalescing key of a message.
+
+    Returns:
+        Key shared by messages that supersede each other, or None if the
+        message must always be delivered
+    """
+    message_type = message.get("type")
+    if message_type not in COALESCE_TYPES:
+        return None
+
+    scope = None
+    for field in COALESCE_SCOPE_FIELDS:
+        if message.get(field) is not None:
+            scope = message[field]
+            break
+    return (message_type, scope)
+
+
+class ConnectionOutbox:
+    """
+    Bounded outbound queue and writer task for one WebSocket connection.
+
+    Features:
+    - Non-blocking enqueue for broadcasters
+    - Coalescing of superseded progress events
+    - Drop-oldest when the queue is full
+    - Send timeout for stalled clients
+    - Per-connection lag metrics
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        label: str = "",
+        max_size: int = 256,
+        send_timeout: float = 10.0,
+        on_error: Optional[Callable[["ConnectionOutbox", Exception], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize outbox.
+
+        Args:
+            send: Coroutine function sending one text frame (websocket.send_text)
+            label: Identifier used in logs and metrics (e.g. client id)
+            max_size: Maximum pending messages before dropping
+            send_timeout: Seconds a single send may take before the client
+                is considered stalled
+            on_error: Called once when sending fails or times out
+        """
+        self._send = send
+        self.label = label
+        self.max_size = max_size
+        self.send_timeout = send_timeout
+        self._on_error = on_error
+
+        # key -> (text, enqueued_at, event_id); uncoalesced messages get unique keys
+        self._pending: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.last_event_id: Optional[str] = None
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "max_depth": 0,
+            "last_lag_ms": 0.0,
+            "max_lag_ms": 0.0,
+            "avg_lag_ms": 0.0,
+        }
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self):
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer_loop())
+
+    async def close(self):
+        """Stop the writer task and discard pending messages."""
+        self._closed = True
+        self._pending.clear()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def enqueue(self, text: str, key: Optional[Hashable] = None, event_id: Optional[str] = None) -> bool:
+        """
+        Queue a serialized message without waiting for the socket.
+
+        Args:
+            text: Serialized message
+            key: Coalescing key; a pending message with the same key is
+                replaced in place (keeping its queue position)
+            event_id: Stream event ID, tracked as the client's offset once sent
+
+        Returns:
+            bool: False if the outbox is closed
+        """
+        if self._closed:
+            return False
+
+        now = time.monotonic()
+        if key is not None and key in self._pending:
+            # Keep the original enqueue time so lag reflects the oldest update
+            _, enqueued_at, _ = self._pending[key]
+            self._pending[key] = (text, enqueued_at, event_id)
+            self.stats["coalesced"] += 1
+            return True
+
+        if key is None:
+            self._seq += 1
+            key = ("_seq", self._seq)
+
+        if len(self._pending) >= self.max_size:
+            self._pending.popitem(last=False)
+            self.stats["dropped"] += 1
+            if self.stats["dropped"] % 100 == 1:
+                logger.warning(f"WebSocket client {self.label} is falling behind, dropping messages")
+
+        self._pending[key] = (text, now, event_id)
+        self.stats["enqueued"] += 1
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._pending))
+        self._wakeup.set()
+        return True
+
+    async def _writer_loop(self):
+        """Send pending messages in order until closed."""
+        try:
+            while not self._closed:
+                if not self._pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                _, (text, enqueued_at, event_id) = self._pending.popitem(last=False)
+                try:
+                    await asyncio.wait_for(self._send(text), timeout=self.send_timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    await self._fail(e)
+                    return
+
+                self._record_lag((time.monotonic() - enqueued_at) * 1000)
+                if event_id:
+                    self.last_event_id = event_id
+        except asyncio.CancelledError:
+            pass
+
+    async def _fail(self, error: Exception):
+        """Mark the outbox closed and notify the owner once."""
+        self._closed = True
+        self._pending.clear()
+        if isinstance(error, asyncio.TimeoutError):
+            logger.warning(f"WebSocket client {self.label} stalled for {self.send_timeout}s, disconnecting")
+        else:
+            logger.debug(f"WebSocket send to {self.label} failed: {error}")
+        if self._on_error:
+            try:
+                await self._on_error(self, error)
+            except Exception as e:
+                logger.error(f"Error in WebSocket outbox error handler: {e}")
+
+    def _record_lag(self, lag_ms: float):
+        self.stats["sent"] += 1
+        self.stats["last_lag_ms"] = round(lag_ms, 2)
+        self.stats["max_lag_ms"] = round(max(self.stats["max_lag_ms"], lag_ms), 2)
+        # Exponentially weighted, so a recovered client's average recovers too
+        self.stats["avg_lag_ms"] = round(self.stats["avg_lag_ms"] * 0.9 + lag_ms * 0.1, 2)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-connection metrics."""
+        oldest = next(iter(self._pending.values()), None)
+        return {
+            "label": self.label,
+            **self.stats,
+            "depth": len(self._pending),
+            "oldest_pending_ms": round((time.monotonic() - oldest[1]) * 1000, 2) if oldest else 0.0,
+            "last_event_id": self.last_event_id,
+            "closed": self._closed,
+        }
@@ -6,14 +6,21 @@ for use in Celery tasks (which are synchronous). It handles async/sync bridging
 and Redis connection management.
 """
 
+import atexit
+import json
 import logging
 import asyncio
+import os
+import threading
+from datetime import datetime
 from typing import Dict, Any, Optional
 from functools import wraps
 
 import redis
 
 from app.core.config import settings
+from app.core.event_batching import EventBatch
+from app.core.realtime_streams import realtime_stream
 
 logger = logging.getLogger(__name__)
 
@@ -67,13 +74,17 @@ class SyncWebSocketPublisher:
             return False
 
         try:
-            import json
-            from datetime import datetime
-
             # Add timestamp if not present
             if "timestamp" not in message:
                 message["timestamp"] = datetime.utcnow().isoformat()
 
+            # Keep a replayable copy when stream history is enabled
+            if realtime_stream.enabled:
+                try:
+                    message["event_id"] = realtime_stream.append_sync(self.redis_client, channel, message)
+                except Exception as e:
+                    logger.error(f"Failed to append to stream for {channel}: {e}")
+
             # Serialize and publish
             message_json = json.dumps(message)
             self.redis_client.publish(channel, message_json)
@@ -191,6 +202,29 @@ class SyncWebSocketPublisher:
             "room": f"campaign:{campaign_id}",
         })
 
+    def campaign_email_sent(
+        self,
+        campaign_id: int,
+        recipient_id: Optional[int] = None,
+        emails_sent: Optional[int] = None,
+        emails_remaining: Optional[int] = None,
+    ) -> bool:
+        """
+        Publish per-email campaign progress.
+
+        `count` is summed when the batching publisher rolls several sends of
+        one campaign into a single message.
+        """
+        return self.publish("fliptechpro:campaigns", {
+            "type": "campaign:email_sent",
+            "campaign_id": campaign_id,
+            "recipient_id": recipient_id,
+            "count": 1,
+            "emails_sent": emails_sent,
+            "emails_remaining": emails_remaining,
+            "room": f"campaign:{campaign_id}",
+        })
+
     # Email Events
     def email_sent(
         self,
@@ -369,6 +403,67 @@ class SyncWebSocketPublisher:
             "room": f"conversation:{conversation_id}",
         })
 
+    def batch_progress(
+        self,
+        batch_id: str,
+        task_type: str,
+        total: int,
+        item_id: Optional[int] = None,
+        item_status: str = "success",
+    ) -> bool:
+        """
+        Count one finished item of a fan-out batch and publish progress.
+
+        The completed/failed counters live in Redis so that parallel workers
+        finishing items of the same batch report a consistent total.
+        """
+        if not self.redis_client:
+            return False
+
+        try:
+            key = f"fliptechpro:batch:{batch_id}"
+            pipe = self.redis_client.pipeline()
+            pipe.hincrby(key, "completed", 1)
+            pipe.hincrby(key, "failed", 0 if item_status == "success" else 1)
+            pipe.expire(key, 86400)
+            completed, failed, _ = pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to update batch progress for {batch_id}: {e}")
+            return False
+
+        percent = (completed / total * 100) if total > 0 else 0
+        return self.publish("fliptechpro:ai", {
+            "type": "batch:progress",
+            "batch_id": batch_id,
+            "task_type": task_type,
+            "item_id": item_id,
+            "item_status": item_status,
+            "completed": completed,
+            "failed": failed,
+            "total": total,
+            "percent": round(percent, 2),
+            "room": f"batch:{batch_id}",
+        })
+
+    def batch_completed(
+        self,
+        batch_id: str,
+        task_type: str,
+        total: int,
+        successful: int,
+        failed: int,
+    ) -> bool:
+        """Publish batch completed event."""
+        return self.publish("fliptechpro:ai", {
+            "type": "batch:completed",
+            "batch_id": batch_id,
+            "task_type": task_type,
+            "total": total,
+            "successful": successful,
+            "failed": failed,
+            "room": f"batch:{batch_id}",
+        })
+
     # Demo Events
     def demo_generating(
         self,
@@ -473,5 +568,110 @@ class SyncWebSocketPublisher:
         })
 
 
+class BatchingSyncWebSocketPublisher(SyncWebSocketPublisher):
+    """
+    Batching variant of SyncWebSocketPublisher for worker hot loops.
+
+    publish() only buffers the event; a daemon thread flushes every `window`
+    seconds (or as soon as `max_events` are pending) with one pipelined round
+    trip, rolling progress events up per job (see app.core.event_batching).
+    Worker throughput therefore does not depend on Redis latency.
+    """
+
+    def __init__(self, window: float = 0.25, max_events: int = 100):
+        """
+        Initialize batching publisher.
+
+        Args:
+            window: Maximum seconds an event is buffered
+            max_events: Pending events that trigger an early flush
+        """
+        super().__init__()
+        self.window = window
+        self.max_events = max_events
+        self._batch = EventBatch()
+        self._wakeup = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_pid: Optional[int] = None
+        self._flusher_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> bool:
+        """
+        Buffer a message for the next flush.
+
+        Returns:
+            bool: True if buffered (Redis availability is checked at flush)
+        """
+        if not self.redis_client:
+            return False
+
+        if "timestamp" not in message:
+            message["timestamp"] = datetime.utcnow().isoformat()
+
+        self._ensure_flusher()
+        if self._batch.add(channel, message) >= self.max_events:
+            self._wakeup.set()
+        return True
+
+    def _ensure_flusher(self):
+        """Start the flush thread once per process (Celery prefork forks after import)."""
+        pid = os.getpid()
+        if self._flusher_pid == pid and self._flusher and self._flusher.is_alive():
+            return
+
+        with self._flusher_lock:
+            if self._flusher_pid == pid and self._flusher and self._flusher.is_alive():
+                return
+            if self._flusher_pid is not None and self._flusher_pid != pid:
+                # Events buffered by the parent are the parent's to publish
+                self._batch = EventBatch()
+            self._flusher_pid = pid
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="ws-publisher-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            self._wakeup.wait(self.window)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Publish all buffered events in one pipeline.
+
+        Returns:
+            int: Number of messages published
+        """
+        events = self._batch.drain()
+        if not events or not self.redis_client:
+            return 0
+
+        try:
+            if realtime_stream.enabled:
+                ids = realtime_stream.append_many_sync(self.redis_client, events)
+                for (_, message), event_id in zip(events, ids):
+                    message["event_id"] = event_id
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            for channel, message in events:
+                pipe.publish(channel, json.dumps(message))
+            pipe.execute()
+
+            logger.debug(f"Flushed {len(events)} realtime events")
+            return len(events)
+
+        except Exception as e:
+            logger.error(f"Failed to flush {len(events)} realtime events: {e}")
+            return 0
+
+
 # Global instance for use in Celery tasks
 ws_publisher = SyncWebSocketPublisher()
+
+# Batching instance for per-lead / per-email progress in worker loops
+batched_ws_publisher = BatchingSyncWebSocketPublisher()
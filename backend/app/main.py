@@ -170,6 +170,30 @@ async def lifespan(app: FastAPI):
                 logger.warning(f"⚠ Gmail monitoring failed to start: {e}")
                 logger.warning("  Continuing without Gmail monitoring")
 
+        # Start write-behind aggregator for email open/click tracking
+        try:
+            from app.services.tracking_recorder import tracking_recorder
+            await tracking_recorder.start()
+            logger.info("✓ Tracking event recorder started")
+        except Exception as e:
+            logger.warning(f"⚠ Tracking event recorder failed to start: {e}")
+
+        # Start write-behind sink for AI request metrics
+        try:
+            from app.services.metric_sink import metric_sink
+            await metric_sink.start()
+            logger.info("✓ AI metric sink started")
+        except Exception as e:
+            logger.warning(f"⚠ AI metric sink failed to start: {e}")
+
+        # Start batching publisher for high-frequency realtime events
+        try:
+            from app.core.event_batching import async_event_publisher
+            await async_event_publisher.start()
+            logger.info("✓ Realtime event publisher started")
+        except Exception as e:
+            logger.warning(f"⚠ Realtime event publisher failed to start: {e}")
+
         logger.info(
             "All health checks passed - CraigLeads Pro API ready",
             environment=settings.ENVIRONMENT,
@@ -209,6 +233,47 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning(f"⚠ Error stopping Gmail monitoring: {e}")
 
+        # Drain buffered tracking events
+        try:
+            from app.services.tracking_recorder import tracking_recorder
+            await tracking_recorder.stop()
+            logger.info("✓ Tracking event recorder drained")
+        except Exception as e:
+            logger.warning(f"⚠ Error draining tracking events: {e}")
+
+        # Drain buffered AI metrics (spooled to disk if the database is gone)
+        try:
+            from app.services.metric_sink import metric_sink
+            await metric_sink.stop()
+            logger.info("✓ AI metric sink drained")
+        except Exception as e:
+            logger.warning(f"⚠ Error draining AI metrics: {e}")
+
+        # Close the site cache's revalidation client
+        try:
+            from app.services.site_cache import site_cache
+            if site_cache:
+                await site_cache.close()
+                logger.info("✓ Site cache closed")
+        except Exception as e:
+            logger.warning(f"⚠ Error closing site cache: {e}")
+
+        # Flush buffered realtime events
+        try:
+            from app.core.event_batching import async_event_publisher
+            await async_event_publisher.stop()
+            logger.info("✓ Realtime event publisher flushed")
+        except Exception as e:
+            logger.warning(f"⚠ Error flushing realtime events: {e}")
+
+        # Close pooled LLM connections
+        try:
+            from app.services.llm_gateway import llm_gateway
+            await llm_gateway.close()
+            logger.info("✓ LLM gateway closed")
+        except Exception as e:
+            logger.warning(f"⚠ Error closing LLM gateway: {e}")
+
         logger.info("Application shutdown completed")
 
     except Exception as e:
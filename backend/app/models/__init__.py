@@ -36,7 +36,7 @@ from .n8n_workflows import (
     WorkflowStatus, ApprovalStatus, ApprovalPriority, QueueStatus, MonitoringSeverity
 )
 from .auto_response import AutoResponse, ResponseVariable
-from .campaign_metrics import CampaignMetrics, CampaignMetricsSnapshot
+from .campaign_metrics import CampaignMetrics, CampaignMetricsSnapshot, CampaignStatsHourly
 from .ai_gym import AIGymPerformance
 
 __all__ = [
@@ -141,5 +141,6 @@ __all__ = [
     "ResponseVariable",
     "CampaignMetrics",
     "CampaignMetricsSnapshot",
+    "CampaignStatsHourly",
     "AIGymPerformance"
 ]
\ No newline at end of file
@@ -4,10 +4,11 @@ Campaign Metrics Models for Email Campaign Performance Tracking
 This module provides real-time and aggregated metrics for email campaigns:
 - CampaignMetrics: Aggregated campaign performance statistics
 - CampaignMetricsSnapshot: Point-in-time metric snapshots for historical analysis
+- CampaignStatsHourly: Incrementally maintained per-hour event rollups
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, String, Boolean, Index
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, String, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
@@ -246,3 +247,38 @@ class CampaignMetricsSnapshot(Base):
 
     def __repr__(self):
         return f"<CampaignMetricsSnapshot(campaign_id={self.campaign_id}, snapshot_at={self.snapshot_at})>"
+
+
+class CampaignStatsHourly(Base):
+    """
+    Campaign Stats Hourly Rollup Model
+
+    One row per campaign per hour, incremented from the send path and the
+    tracking event stream. Campaign stats are read by summing these rows
+    instead of aggregating campaign_recipients and email_tracking.
+    """
+    __tablename__ = "campaign_stats_hourly"
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey('campaigns.id', ondelete='CASCADE'), nullable=False, index=True)
+    bucket = Column(DateTime(timezone=True), nullable=False)  # Start of the hour (UTC)
+
+    # Send counters
+    sent = Column(Integer, default=0, nullable=False)
+    failed = Column(Integer, default=0, nullable=False)
+    bounced = Column(Integer, default=0, nullable=False)
+
+    # Engagement counters (total events and first-per-recipient events)
+    opens = Column(Integer, default=0, nullable=False)
+    unique_opens = Column(Integer, default=0, nullable=False)
+    clicks = Column(Integer, default=0, nullable=False)
+    unique_clicks = Column(Integer, default=0, nullable=False)
+    replies = Column(Integer, default=0, nullable=False)
+    unsubscribes = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('campaign_id', 'bucket', name='uq_campaign_stats_hourly_campaign_bucket'),
+    )
+
+    def __repr__(self):
+        return f"<CampaignStatsHourly(campaign_id={self.campaign_id}, bucket={self.bucket})>"
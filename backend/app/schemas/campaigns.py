@@ -127,17 +127,44 @@ class CampaignRecipientBase(BaseModel):
     lead_id: int = Field(..., description="Lead ID to add as recipient")
 
 
+class RecipientLeadFilter(BaseModel):
+    """Lead filter used to select campaign recipients server-side."""
+    location_id: Optional[int] = None
+    status: Optional[str] = None
+    source: Optional[str] = None
+    category: Optional[str] = None
+    is_processed: Optional[bool] = None
+    is_contacted: Optional[bool] = None
+    min_qualification_score: Optional[float] = Field(None, ge=0.0, le=1.0)
+    scraped_after: Optional[datetime] = None
+    scraped_before: Optional[datetime] = None
+
+
 class AddRecipientsRequest(BaseModel):
-    """Request to add multiple recipients to a campaign."""
-    lead_ids: List[int] = Field(..., min_items=1, description="List of lead IDs to add")
+    """Request to add multiple recipients to a campaign.
+
+    Either an explicit list of lead IDs or a lead filter must be given.
+    """
+    lead_ids: Optional[List[int]] = Field(None, min_items=1, description="List of lead IDs to add")
+    lead_filter: Optional[RecipientLeadFilter] = Field(
+        None, description="Add every lead matching this filter instead of an explicit list"
+    )
 
     @validator("lead_ids")
     def validate_unique_leads(cls, v):
         """Ensure no duplicate lead IDs."""
-        if len(v) != len(set(v)):
+        if v is not None and len(v) != len(set(v)):
             raise ValueError("Duplicate lead IDs found")
         return v
 
+    @validator("lead_filter", always=True)
+    def validate_source(cls, v, values):
+        """Ensure exactly one recipient source is provided."""
+        has_ids = values.get("lead_ids") is not None
+        if has_ids == (v is not None):
+            raise ValueError("Provide exactly one of lead_ids or lead_filter")
+        return v
+
 
 class CampaignRecipientResponse(BaseModel):
     """Schema for campaign recipient responses."""
@@ -368,6 +395,13 @@ class BulkOperationResponse(BaseModel):
     message: str
 
 
+class AddRecipientsResponse(BulkOperationResponse):
+    """Response for bulk recipient import."""
+    added: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+
+
 class DeleteCampaignResponse(BaseModel):
     """Response for campaign deletion."""
     success: bool = True
@@ -295,6 +295,16 @@ class AIResponseReadyEvent(BaseEvent):
     tokens_used: int
 
 
+class AIResponsePartialEvent(BaseEvent):
+    """Event carrying the text of an AI response that is still being generated."""
+
+    type: Literal["ai:response_partial"] = "ai:response_partial"
+    task_id: str
+    conversation_id: Optional[int] = None
+    content: str  # Full text generated so far
+    tokens: int  # Deltas since the previous partial event
+
+
 class AIAnalysisCompleteEvent(BaseEvent):
     """Event when AI analysis completes."""
 
@@ -521,6 +531,7 @@ WebSocketEvent = (
     | ScraperJobBoardProgressEvent
     | AIProcessingEvent
     | AIResponseReadyEvent
+    | AIResponsePartialEvent
     | AIAnalysisCompleteEvent
     | AIModelTrainedEvent
     | AIEmailGeneratedEvent
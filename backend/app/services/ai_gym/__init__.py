@@ -8,6 +8,7 @@ Key Components:
 - Model Registry: Track available models with capabilities and costs
 - Model Router: Smart routing to optimal model for each task
 - Metric Tracker: Record performance metrics for every AI call
+- Stats Cache: Rolling per-model performance used by the router
 - A/B Testing: Compare models head-to-head
 - Quality Scoring: Automated quality assessment
 """
@@ -16,6 +17,7 @@ from typing import Optional
 from .models import AIModel, ModelRegistry, get_model_registry
 from .router import ModelRouter, get_model_router
 from .tracker import MetricTracker, get_metric_tracker
+from .stats_cache import ModelStatsCache, get_model_stats_cache
 from .ab_testing import ABTestManager, get_ab_test_manager
 from .quality import QualityScorer, get_quality_scorer
 
@@ -24,11 +26,13 @@ __all__ = [
     "ModelRegistry",
     "ModelRouter",
     "MetricTracker",
+    "ModelStatsCache",
     "ABTestManager",
     "QualityScorer",
     "get_model_registry",
     "get_model_router",
     "get_metric_tracker",
+    "get_model_stats_cache",
     "get_ab_test_manager",
     "get_quality_scorer",
 ]
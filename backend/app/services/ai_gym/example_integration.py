@@ -4,6 +4,7 @@ AI-GYM Integration Examples
 Demonstrates how to integrate AI-GYM into existing services.
 """
 
+import asyncio
 import time
 from decimal import Decimal
 from typing import Dict, Any, Optional
@@ -396,16 +397,16 @@ async def model_council_example(task_type: TaskType, db: AsyncSession):
     ai_client = get_openrouter_client()
     prompt = "Analyze this data..."
 
-    responses = []
-    for model in council:
-        response = await ai_client.generate_completion(
-            prompt=prompt,
-            model=model.id
-        )
-        responses.append({
-            "model": model.name,
-            "response": response
-        })
+    # Query the council concurrently (AICouncil.complete_council adds
+    # quorum / quality cut-offs and cancels stragglers)
+    outputs = await asyncio.gather(*[
+        ai_client.generate_completion(prompt=prompt, model=model.id)
+        for model in council
+    ])
+    responses = [
+        {"model": model.name, "response": response}
+        for model, response in zip(council, outputs)
+    ]
 
     # Combine responses (simple concatenation or more sophisticated merging)
     combined = "\n\n---\n\n".join([
@@ -9,12 +9,11 @@ from typing import List, Optional, Dict, Any
 from decimal import Decimal
 import random
 import logging
-from datetime import datetime, timedelta
 
-from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import AIModel, ModelRegistry, TaskType, get_model_registry
+from .stats_cache import ModelStatsCache, get_model_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +23,26 @@ class ModelRouter:
     Intelligent model routing system.
 
     Selects the optimal model for each task based on:
-    - Historical performance metrics
+    - Historical performance metrics (in-memory EWMA stats, no per-route queries)
     - Cost constraints
     - Quality requirements
     - Task-specific characteristics
     """
 
-    def __init__(self, registry: Optional[ModelRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional[ModelRegistry] = None,
+        stats_cache: Optional[ModelStatsCache] = None
+    ):
         """
         Initialize model router.
 
         Args:
             registry: Model registry (uses global if not provided)
+            stats_cache: Performance stats cache (uses global if not provided)
         """
         self.registry = registry or get_model_registry()
+        self.stats_cache = stats_cache or get_model_stats_cache()
 
     async def route(
         self,
@@ -54,7 +59,7 @@ class ModelRouter:
         Args:
             task_type: Type of task to perform
             strategy: Routing strategy ("best_quality", "best_cost", "balanced", "fastest")
-            db: Database session for historical data (optional)
+            db: Database session, used only to load historical stats on first use
             min_quality_score: Minimum quality score threshold (0-100)
             max_cost_per_request: Maximum cost per request in USD
             exclude_models: Model IDs to exclude from selection
@@ -76,23 +81,18 @@ class ModelRouter:
         if not candidates:
             raise ValueError(f"No suitable models found for task: {task_type}")
 
-        # If we have database access, enhance selection with historical data
-        if db:
-            candidates = await self._rank_by_historical_performance(
-                candidates,
-                task_type,
-                strategy,
-                db
-            )
+        # Load historical stats on first use; afterwards they refresh in the background
+        if db is not None and not self.stats_cache.loaded:
+            await self.stats_cache.maybe_reconcile(db)
+        elif self.stats_cache.loaded:
+            self.stats_cache.schedule_reconcile()
+
+        # Enhance selection with historical data
+        candidates = self._rank_by_historical_performance(candidates, task_type, strategy)
 
         # Apply quality filter
-        if min_quality_score is not None and db:
-            candidates = await self._filter_by_quality(
-                candidates,
-                task_type,
-                min_quality_score,
-                db
-            )
+        if min_quality_score is not None:
+            candidates = self._filter_by_quality(candidates, task_type, min_quality_score)
 
         # Apply cost filter (rough estimate)
         if max_cost_per_request is not None:
@@ -126,6 +126,9 @@ class ModelRouter:
         """
         Select multiple models for ensemble/council decision making.
 
+        Pass the model IDs to AICouncil.complete_council to query them
+        concurrently with a quorum or quality cut-off.
+
         Args:
             task_type: Type of task
             num_models: Number of models to select
@@ -191,113 +194,66 @@ class ModelRouter:
         )
         return selected
 
-    async def _rank_by_historical_performance(
+    def _rank_by_historical_performance(
         self,
         candidates: List[AIModel],
         task_type: TaskType,
-        strategy: str,
-        db: AsyncSession
+        strategy: str
     ) -> List[AIModel]:
         """
         Rank models based on historical performance data.
 
+        Reads the in-memory stats cache only; models without data keep their
+        registry order behind a neutral default score.
+
         Args:
             candidates: Candidate models
             task_type: Task type
             strategy: Routing strategy
-            db: Database session
 
         Returns:
             Re-ranked list of models
         """
-        try:
-            from app.models.feedback import ModelMetric
-
-            # Get performance stats for each model in the last 30 days
-            cutoff_date = datetime.utcnow() - timedelta(days=30)
-
-            model_stats = {}
-            for model in candidates:
-                # Query historical metrics
-                query = select(
-                    func.avg(ModelMetric.quality_score).label('avg_quality'),
-                    func.avg(ModelMetric.cost_usd).label('avg_cost'),
-                    func.avg(ModelMetric.latency_ms).label('avg_latency'),
-                    func.count(ModelMetric.id).label('sample_count')
-                ).where(
-                    and_(
-                        ModelMetric.model_id == model.id,
-                        ModelMetric.task_type == task_type.value,
-                        ModelMetric.created_at >= cutoff_date
-                    )
-                )
-
-                result = await db.execute(query)
-                row = result.first()
-
-                if row and row.sample_count > 0:
-                    model_stats[model.id] = {
-                        'avg_quality': float(row.avg_quality or 0),
-                        'avg_cost': float(row.avg_cost or 0),
-                        'avg_latency': float(row.avg_latency or 0),
-                        'sample_count': int(row.sample_count)
-                    }
-                else:
-                    # No historical data - use defaults
-                    model_stats[model.id] = {
-                        'avg_quality': 70.0,  # Neutral default
-                        'avg_cost': float(model.calculate_cost(1000, 500)),
-                        'avg_latency': model.avg_latency_ms,
-                        'sample_count': 0
-                    }
-
-            # Rank based on strategy with historical data
-            def ranking_score(model: AIModel) -> float:
-                stats = model_stats.get(model.id, {})
-                quality = stats.get('avg_quality', 70.0)
-                cost = stats.get('avg_cost', 1.0)
-                latency = stats.get('avg_latency', 1000)
-                sample_count = stats.get('sample_count', 0)
-
-                # Confidence factor (more samples = more confident)
-                confidence = min(sample_count / 100, 1.0)
-
-                if strategy == "best_quality":
-                    # Prioritize quality
-                    base_score = quality
-                elif strategy == "best_cost":
-                    # Prioritize low cost (normalize to 0-100 scale)
-                    base_score = max(0, 100 - (cost * 100))
-                elif strategy == "fastest":
-                    # Prioritize low latency
-                    base_score = max(0, 100 - (latency / 30))
-                else:  # balanced
-                    # Weighted combination
-                    quality_score = quality
-                    cost_score = max(0, 100 - (cost * 50))
-                    speed_score = max(0, 100 - (latency / 30))
-                    base_score = (quality_score * 0.5) + (cost_score * 0.3) + (speed_score * 0.2)
-
-                # Blend with default score based on confidence
-                default_score = 70.0
-                return (base_score * confidence) + (default_score * (1 - confidence))
-
-            candidates.sort(key=ranking_score, reverse=True)
-            logger.debug(
-                f"Re-ranked {len(candidates)} models by historical performance for {task_type}"
-            )
-
-        except Exception as e:
-            logger.warning(f"Failed to rank by historical performance: {e}")
-
+        def ranking_score(model: AIModel) -> float:
+            stats = self.stats_cache.get(model.id, task_type.value)
+            if stats is None:
+                return 70.0  # Neutral default
+
+            quality = stats.avg_quality if stats.avg_quality is not None else 70.0
+            cost = stats.avg_cost
+            latency = stats.avg_latency
+
+            # Confidence factor (more samples = more confident)
+            confidence = min(stats.sample_count / 100, 1.0)
+
+            if strategy == "best_quality":
+                # Prioritize quality
+                base_score = quality
+            elif strategy == "best_cost":
+                # Prioritize low cost (normalize to 0-100 scale)
+                base_score = max(0, 100 - (cost * 100))
+            elif strategy == "fastest":
+                # Prioritize low latency
+                base_score = max(0, 100 - (latency / 30))
+            else:  # balanced
+                # Weighted combination
+                quality_score = quality
+                cost_score = max(0, 100 - (cost * 50))
+                speed_score = max(0, 100 - (latency / 30))
+                base_score = (quality_score * 0.5) + (cost_score * 0.3) + (speed_score * 0.2)
+
+            # Blend with default score based on confidence
+            default_score = 70.0
+            return (base_score * confidence) + (default_score * (1 - confidence))
+
+        candidates.sort(key=ranking_score, reverse=True)
         return candidates
 
-    async def _filter_by_quality(
+    def _filter_by_quality(
         self,
         candidates: List[AIModel],
         task_type: TaskType,
-        min_quality_score: float,
-        db: AsyncSession
+        min_quality_score: float
     ) -> List[AIModel]:
         """
         Filter models by minimum quality score from historical data.
@@ -306,45 +262,17 @@ class ModelRouter:
             candidates: Candidate models
             task_type: Task type
             min_quality_score: Minimum quality threshold
-            db: Database session
 
         Returns:
             Filtered list of models
         """
-        try:
-            from app.models.feedback import ModelMetric
-
-            cutoff_date = datetime.utcnow() - timedelta(days=30)
-            qualified_models = []
-
-            for model in candidates:
-                # Get average quality score
-                query = select(
-                    func.avg(ModelMetric.quality_score).label('avg_quality'),
-                    func.count(ModelMetric.id).label('sample_count')
-                ).where(
-                    and_(
-                        ModelMetric.model_id == model.id,
-                        ModelMetric.task_type == task_type.value,
-                        ModelMetric.created_at >= cutoff_date
-                    )
-                )
-
-                result = await db.execute(query)
-                row = result.first()
-
-                # Include if meets threshold or no historical data yet
-                if not row or row.sample_count == 0:
-                    # No data - give it a chance
-                    qualified_models.append(model)
-                elif row.avg_quality >= min_quality_score:
-                    qualified_models.append(model)
-
-            return qualified_models
-
-        except Exception as e:
-            logger.warning(f"Failed to filter by quality: {e}")
-            return candidates
+        qualified_models = []
+        for model in candidates:
+            stats = self.stats_cache.get(model.id, task_type.value)
+            # Include if meets threshold or no quality data yet (give it a chance)
+            if stats is None or stats.avg_quality is None or stats.avg_quality >= min_quality_score:
+                qualified_models.append(model)
+        return qualified_models
 
     async def route_with_fallback(
         self,
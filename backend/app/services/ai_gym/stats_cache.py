@@ -0,0 +1,235 @@
+"""
+AI-GYM Model Statistics Cache
+
+Rolling per-(model, task type) performance statistics kept in memory so that
+routing never has to query ModelMetric. Every recorded execution updates the
+exponentially weighted averages directly; a single grouped query periodically
+reconciles them with the database so all workers converge on the same view.
+"""
+
+from typing import Optional, Dict, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelPerformance:
+    """
+    Rolling statistics for one model on one task type.
+
+    Attributes:
+        avg_quality: EWMA of quality scores (None until one is recorded)
+        avg_cost: EWMA of cost per execution in USD
+        avg_latency: EWMA of latency in milliseconds
+        sample_count: Executions seen in the reconciliation window plus since
+        updated_at: Monotonic time of the last update
+    """
+    avg_quality: Optional[float]
+    avg_cost: float
+    avg_latency: float
+    sample_count: int
+    updated_at: float = field(default_factory=time.monotonic)
+
+
+class ModelStatsCache:
+    """
+    In-memory model performance statistics.
+
+    Features:
+    - EWMA quality/cost/latency per (model, task type)
+    - O(1) updates from MetricTracker.record_execution
+    - Periodic reconciliation with one grouped query over ModelMetric
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        reconcile_interval_seconds: float = 300.0,
+        window_days: int = 30
+    ):
+        """
+        Initialize statistics cache.
+
+        Args:
+            alpha: Weight of each new observation in the moving averages
+            reconcile_interval_seconds: How long stats may go without a DB refresh
+            window_days: Look-back window of the reconciliation query
+        """
+        self.alpha = alpha
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.window_days = window_days
+        self._stats: Dict[Tuple[str, str], ModelPerformance] = {}
+        self._last_reconciled: Optional[float] = None
+        self._next_reconcile_at = 0.0
+        self._reconcile_lock = asyncio.Lock()
+        self._reconcile_task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the cache has been reconciled with the database at least once."""
+        return self._last_reconciled is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the reconciliation interval has elapsed."""
+        return time.monotonic() >= self._next_reconcile_at
+
+    def get(self, model_id: str, task_type: str) -> Optional[ModelPerformance]:
+        """Get statistics for a model on a task type, if any have been seen."""
+        return self._stats.get((model_id, task_type))
+
+    def observe(
+        self,
+        model_id: str,
+        task_type: str,
+        cost_usd: float,
+        latency_ms: float,
+        quality_score: Optional[float] = None
+    ):
+        """
+        Fold one execution into the moving averages.
+
+        Args:
+            model_id: Model identifier
+            task_type: Task type value
+            cost_usd: Execution cost
+            latency_ms: Execution latency
+            quality_score: Quality score, if the execution was scored
+        """
+        key = (model_id, task_type)
+        stats = self._stats.get(key)
+
+        if stats is None:
+            self._stats[key] = ModelPerformance(
+                avg_quality=quality_score,
+                avg_cost=float(cost_usd),
+                avg_latency=float(latency_ms),
+                sample_count=1
+            )
+            return
+
+        alpha = self.alpha
+        stats.avg_cost += alpha * (float(cost_usd) - stats.avg_cost)
+        stats.avg_latency += alpha * (float(latency_ms) - stats.avg_latency)
+        if quality_score is not None:
+            if stats.avg_quality is None:
+                stats.avg_quality = quality_score
+            else:
+                stats.avg_quality += alpha * (quality_score - stats.avg_quality)
+        stats.sample_count += 1
+        stats.updated_at = time.monotonic()
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """
+        Reload all statistics with one grouped query.
+
+        Database averages become the new baseline; observations recorded after
+        this call keep adjusting them until the next reconciliation.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of (model, task type) pairs loaded
+        """
+        from app.models.feedback import ModelMetric
+
+        cutoff_date = datetime.utcnow() - timedelta(days=self.window_days)
+
+        query = select(
+            ModelMetric.model_id,
+            ModelMetric.task_type,
+            func.avg(ModelMetric.quality_score).label('avg_quality'),
+            func.avg(ModelMetric.cost_usd).label('avg_cost'),
+            func.avg(ModelMetric.latency_ms).label('avg_latency'),
+            func.count(ModelMetric.id).label('sample_count')
+        ).where(
+            ModelMetric.created_at >= cutoff_date
+        ).group_by(
+            ModelMetric.model_id,
+            ModelMetric.task_type
+        )
+
+        result = await db.execute(query)
+        rows = result.all()
+
+        now = time.monotonic()
+        self._stats = {
+            (row.model_id, row.task_type): ModelPerformance(
+                avg_quality=float(row.avg_quality) if row.avg_quality is not None else None,
+                avg_cost=float(row.avg_cost or 0),
+                avg_latency=float(row.avg_latency or 0),
+                sample_count=int(row.sample_count),
+                updated_at=now
+            )
+            for row in rows
+        }
+        self._last_reconciled = now
+        self._next_reconcile_at = now + self.reconcile_interval_seconds
+
+        logger.debug(f"Reconciled model stats cache: {len(rows)} model/task pairs")
+        return len(rows)
+
+    async def maybe_reconcile(self, db: AsyncSession):
+        """
+        Reconcile if stale, at most once at a time.
+
+        Concurrent callers do not wait for a refresh in progress (they keep
+        using the current statistics) unless nothing has been loaded yet.
+        """
+        if not self.is_stale:
+            return
+        if self._reconcile_lock.locked() and self.loaded:
+            return
+
+        async with self._reconcile_lock:
+            if not self.is_stale:
+                return
+            try:
+                await self.reconcile(db)
+            except Exception as e:
+                # Try again after another interval rather than on every route
+                self._next_reconcile_at = time.monotonic() + self.reconcile_interval_seconds
+                logger.warning(f"Failed to reconcile model stats cache: {e}")
+
+    def schedule_reconcile(self):
+        """
+        Reconcile in a background task with its own session if stale.
+
+        Lets hot paths keep ranking from memory while the refresh runs.
+        """
+        if not self.is_stale or (self._reconcile_task and not self._reconcile_task.done()):
+            return
+        self._reconcile_task = asyncio.create_task(self._reconcile_in_background())
+
+    async def _reconcile_in_background(self):
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            await self.maybe_reconcile(db)
+
+    def clear(self):
+        """Drop all statistics (the next maybe_reconcile reloads them)."""
+        self._stats.clear()
+        self._last_reconciled = None
+        self._next_reconcile_at = 0.0
+
+
+# Global stats cache instance
+_model_stats_cache: Optional[ModelStatsCache] = None
+
+
+def get_model_stats_cache() -> ModelStatsCache:
+    """Get or create the global model statistics cache singleton."""
+    global _model_stats_cache
+    if _model_stats_cache is None:
+        _model_stats_cache = ModelStatsCache()
+    return _model_stats_cache
@@ -9,15 +9,20 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime, timedelta
+import json
 import logging
 
 from sqlalchemy import select, func, and_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.metric_sink import MetricSink, metric_sink
 from .models import TaskType
+from .stats_cache import get_model_stats_cache
 
 logger = logging.getLogger(__name__)
 
+METRICS_TABLE = "ai_model_metrics"
+
 
 @dataclass
 class TaskMetrics:
@@ -87,59 +92,71 @@ class MetricTracker:
 
     Records detailed metrics for every AI execution and provides
     analytics for model performance comparison and optimization.
+    Executions are written through the metric sink in the background.
     """
 
+    def __init__(self, sink: Optional[MetricSink] = None):
+        """
+        Initialize metric tracker.
+
+        Args:
+            sink: Write-behind buffer for metric rows (uses global if not provided)
+        """
+        self.sink = sink or metric_sink
+
     async def record_execution(
         self,
         db: AsyncSession,
         metrics: TaskMetrics
-    ) -> int:
+    ) -> Optional[int]:
         """
         Record metrics for an AI execution.
 
         Args:
-            db: Database session
+            db: Database session (unused; the row is written by the metric sink)
             metrics: Task execution metrics
 
         Returns:
-            ID of created metric record
+            ID of created metric record, or None if no row ID could be reserved
         """
-        try:
-            from app.models.feedback import ModelMetric
-
-            # Create metric record
-            metric = ModelMetric(
-                model_id=metrics.model_id,
-                task_type=metrics.task_type.value,
-                prompt_tokens=metrics.prompt_tokens,
-                completion_tokens=metrics.completion_tokens,
-                latency_ms=metrics.latency_ms,
-                cost_usd=float(metrics.cost_usd),
-                quality_score=metrics.quality_score,
-                user_approved=metrics.user_approved,
-                edit_distance=metrics.edit_distance,
-                error_occurred=metrics.error_occurred,
-                error_message=metrics.error_message,
-                metadata=metrics.metadata or {},
-                created_at=datetime.utcnow()
-            )
-
-            db.add(metric)
-            await db.commit()
-            await db.refresh(metric)
-
-            logger.debug(
-                f"Recorded metrics for {metrics.model_id} on {metrics.task_type}: "
-                f"cost=${metrics.cost_usd:.4f}, latency={metrics.latency_ms}ms, "
-                f"quality={metrics.quality_score or 'N/A'}"
-            )
-
-            return metric.id
-
-        except Exception as e:
-            logger.error(f"Failed to record execution metrics: {e}")
-            await db.rollback()
-            raise
+        now = datetime.utcnow()
+        metric_id = await self.sink.next_id(METRICS_TABLE)
+        if metric_id is None:
+            logger.warning(f"Metric storage unavailable, not recording {metrics.model_id} execution")
+        else:
+            self.sink.insert(METRICS_TABLE, metric_id, {
+                "model_id": metrics.model_id,
+                "task_type": metrics.task_type.value,
+                "prompt_tokens": metrics.prompt_tokens,
+                "completion_tokens": metrics.completion_tokens,
+                "latency_ms": metrics.latency_ms,
+                "cost_usd": float(metrics.cost_usd),
+                "quality_score": metrics.quality_score,
+                "user_approved": metrics.user_approved,
+                "edit_distance": metrics.edit_distance,
+                "error_occurred": metrics.error_occurred,
+                "error_message": metrics.error_message,
+                "execution_metadata": json.dumps(metrics.metadata or {}),
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        # Keep routing stats current without a query per route
+        get_model_stats_cache().observe(
+            metrics.model_id,
+            metrics.task_type.value,
+            cost_usd=float(metrics.cost_usd),
+            latency_ms=metrics.latency_ms,
+            quality_score=metrics.quality_score
+        )
+
+        logger.debug(
+            f"Recorded metrics for {metrics.model_id} on {metrics.task_type}: "
+            f"cost=${metrics.cost_usd:.4f}, latency={metrics.latency_ms}ms, "
+            f"quality={metrics.quality_score or 'N/A'}"
+        )
+
+        return metric_id
 
     async def record_user_feedback(
         self,
@@ -162,6 +179,10 @@ class MetricTracker:
         try:
             from app.models.feedback import ModelMetric
 
+            # The row may still be buffered
+            if self.sink.is_pending(METRICS_TABLE, metric_id):
+                await self.sink.flush_all()
+
             query = select(ModelMetric).where(ModelMetric.id == metric_id)
             result = await db.execute(query)
             metric = result.scalar_one_or_none()
@@ -2,7 +2,8 @@
 
 from .semantic_router import SemanticRouter, TaskType, ModelTier, RouteDecision
 from .ai_gym_tracker import AIGymTracker
-from .ai_council import AICouncil, AICouncilConfig, AICouncilResponse, Message
+from .response_cache import ResponseCache
+from .ai_council import AICouncil, AICouncilConfig, AICouncilResponse, AICouncilResult, AICouncilStream, Message
 from .website_analyzer import WebsiteAnalyzer, analyze_website_quick
 from .email_sender import EmailSender, EmailSenderConfig
 
@@ -12,9 +13,12 @@ __all__ = [
     "ModelTier",
     "RouteDecision",
     "AIGymTracker",
+    "ResponseCache",
     "AICouncil",
     "AICouncilConfig",
     "AICouncilResponse",
+    "AICouncilResult",
+    "AICouncilStream",
     "Message",
     "WebsiteAnalyzer",
     "analyze_website_quick",
@@ -12,19 +12,30 @@ Based on research from Claudes_Updates/02_ML_STRATEGY_AND_EVALUATION.md
 """
 
 import os
+import time
 import asyncio
-from typing import Optional, List, Dict, Any, Literal
+import inspect
+from collections import defaultdict, deque
+from typing import Optional, List, Dict, Any, Literal, Callable, Awaitable, Union, Deque
 from pydantic import BaseModel
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 import structlog
 
 from app.services.ai_mvp.semantic_router import SemanticRouter, TaskType, RouteDecision
 from app.services.ai_mvp.ai_gym_tracker import AIGymTracker
+from app.services.ai_mvp.response_cache import (
+    ResponseCache, CacheLookup, CachedCompletion, response_cache as default_response_cache
+)
+from app.services.llm_gateway import llm_gateway
+from app.core.event_batching import AI_EVENTS_CHANNEL, async_event_publisher
 
 logger = structlog.get_logger(__name__)
 
 
+def estimate_tokens(text: str) -> int:
+    """Rough token count for text the provider has not counted (~4 chars/token)."""
+    return len(text) // 4
+
+
 class Message(BaseModel):
     """Chat message format."""
     role: Literal["system", "user", "assistant"]
@@ -37,6 +48,8 @@ class AICouncilConfig(BaseModel):
     default_temperature: float = 0.7
     default_max_tokens: int = 2000
     timeout_seconds: int = 30
+    cache_enabled: bool = True
+    hedge_delay_seconds: float = 2.0  # Used until a model has enough first-token samples
 
 
 class AICouncilResponse(BaseModel):
@@ -51,6 +64,47 @@ class AICouncilResponse(BaseModel):
     total_cost: float
     request_id: Optional[int] = None
     route_decision: RouteDecision
+    cached: bool = False
+
+
+class AICouncilResult(BaseModel):
+    """Outcome of a parallel multi-model completion."""
+    model_config = {"protected_namespaces": ()}
+
+    response: AICouncilResponse  # Selected answer
+    responses: List[AICouncilResponse]  # Every answer that arrived, in arrival order
+    quality_scores: Dict[str, float] = {}
+    failed_models: List[str] = []
+    cancelled_models: List[str] = []
+    decided_by: str  # quality_threshold, quorum, all_finished or timeout
+
+
+QualityFunction = Callable[[AICouncilResponse], Union[float, Awaitable[float]]]
+
+# Decides whether a completion may be stored in the response cache
+CacheValidator = Callable[[str], bool]
+
+
+class FirstTokenLatency:
+    """Rolling time-to-first-token samples per model, shared by all councils."""
+
+    def __init__(self, max_samples: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples))
+
+    def record(self, model: str, seconds: float):
+        self._samples[model].append(seconds)
+
+    def p95(self, model: str) -> Optional[float]:
+        """95th percentile, or None until min_samples have been seen."""
+        samples = self._samples.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+first_token_latency = FirstTokenLatency()
 
 
 class AICouncil:
@@ -60,31 +114,29 @@ class AICouncil:
     Features:
     - Semantic routing (cheap → expensive based on task complexity)
     - Cost tracking via AI-GYM
-    - Automatic retries with exponential backoff
+    - Response cache with per-task TTLs (optionally semantic)
+    - Pooled connections and jittered retries via the shared LLM gateway
+    - Token streaming (complete_stream) with the same tracking and caching
+    - Parallel council mode with quorum / quality cut-off (complete_council)
+    - Hedged requests against slow first tokens (complete_hedged)
     - Support for all major models via OpenRouter
     """
 
-    OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"  # Correct endpoint
-
     def __init__(
         self,
         config: AICouncilConfig,
-        gym_tracker: Optional[AIGymTracker] = None
+        gym_tracker: Optional[AIGymTracker] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """Initialize AI Council."""
         self.config = config
         self.router = SemanticRouter()
         self.gym_tracker = gym_tracker
-        self.http_client = httpx.AsyncClient(timeout=config.timeout_seconds)
+        self.response_cache = response_cache or (default_response_cache if config.cache_enabled else None)
 
     async def close(self):
-        """Close HTTP client."""
-        await self.http_client.aclose()
+        """Release resources (the HTTP pool is shared and outlives the council)."""
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def _call_openrouter(
         self,
         model: str,
@@ -93,7 +145,7 @@ class AICouncil:
         max_tokens: int = 2000
     ) -> Dict[str, Any]:
         """
-        Call OpenRouter API with retry logic.
+        Call OpenRouter API (retries are handled by the gateway).
 
         Args:
             model: OpenRouter model ID (e.g., "anthropic/claude-sonnet-4")
@@ -104,13 +156,6 @@ class AICouncil:
         Returns:
             OpenRouter API response
         """
-        headers = {
-            "Authorization": f"Bearer {self.config.openrouter_api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/yourusername/craigslist-leads",  # Update with your repo
-            "X-Title": "Craigslist Lead Generation MVP"
-        }
-
         payload = {
             "model": model,
             "messages": [msg.model_dump() for msg in messages],
@@ -126,15 +171,14 @@ class AICouncil:
             max_tokens=max_tokens
         )
 
-        response = await self.http_client.post(
-            self.OPENROUTER_API_URL,
-            headers=headers,
-            json=payload
+        data = await llm_gateway.request(
+            "openrouter",
+            "/chat/completions",
+            payload,
+            api_key=self.config.openrouter_api_key,
+            timeout=self.config.timeout_seconds
         )
 
-        response.raise_for_status()
-        data = response.json()
-
         logger.info(
             "openrouter.response",
             model=model,
@@ -144,6 +188,68 @@ class AICouncil:
 
         return data
 
+    def _route(
+        self,
+        task_type: TaskType,
+        lead_value: Optional[float],
+        force_model: Optional[str]
+    ) -> RouteDecision:
+        """Pick the model for a request (force_model bypasses routing)."""
+        if force_model:
+            route = self.router.route_model(task_type, force_model)
+        else:
+            route = self.router.route(task_type, lead_value)
+
+        logger.info(
+            "ai_council.routed",
+            task_type=task_type.value,
+            model=route.model_name,
+            tier=route.model_tier.value,
+            lead_value=lead_value
+        )
+        return route
+
+    async def _start_tracking(
+        self,
+        task_type: TaskType,
+        route: RouteDecision,
+        lead_id: Optional[int],
+        lead_value: Optional[float],
+        temperature: float,
+        max_tokens: int,
+        lookup: Optional[CacheLookup],
+        streamed: bool = False
+    ) -> Optional[int]:
+        """Open an AI-GYM request record, if a tracker is configured."""
+        if not self.gym_tracker:
+            return None
+
+        metadata = {
+            "lead_value": lead_value,
+            "route_reasoning": route.reasoning,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        if lookup:
+            metadata["cache"] = "miss"
+        if streamed:
+            metadata["streamed"] = True
+        return await self.gym_tracker.start_request(
+            task_type=task_type.value,
+            model_name=route.model_name,
+            lead_id=lead_id,
+            metadata=metadata
+        )
+
+    def _calculate_cost(self, route: RouteDecision, prompt_tokens: int, completion_tokens: int) -> float:
+        """Actual cost from model pricing, or the route estimate when pricing is unknown."""
+        model_info = self.router.get_model_info(route.model_name)
+        if "pricing" in model_info and model_info["pricing"]:
+            input_cost = (prompt_tokens / 1_000_000) * model_info["pricing"]["input"]
+            output_cost = (completion_tokens / 1_000_000) * model_info["pricing"]["output"]
+            return input_cost + output_cost
+        return route.estimated_cost  # Fallback to estimate
+
     async def complete(
         self,
         task_type: TaskType,
@@ -152,7 +258,9 @@ class AICouncil:
         lead_value: Optional[float] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        force_model: Optional[str] = None
+        force_model: Optional[str] = None,
+        use_cache: bool = True,
+        cache_validator: Optional[CacheValidator] = None
     ) -> AICouncilResponse:
         """
         Complete an AI task with semantic routing.
@@ -165,53 +273,50 @@ class AICouncil:
             temperature: Override default temperature
             max_tokens: Override default max tokens
             force_model: Force specific model (bypasses routing)
+            use_cache: Serve from / store to the response cache when the task type allows
+            cache_validator: Store the completion only if this returns True for
+                its content (e.g. it parsed), so bad output is not replayed
 
         Returns:
             AICouncilResponse with completion and metadata
         """
-        # Route to appropriate model
-        if force_model:
-            route = RouteDecision(
-                model_name=force_model,
-                model_tier="custom",
-                task_complexity="custom",
-                reasoning="User forced model",
-                estimated_cost=0.01
-            )
-        else:
-            route = self.router.route(task_type, lead_value)
+        route = self._route(task_type, lead_value, force_model)
 
-        logger.info(
-            "ai_council.routed",
-            task_type=task_type.value,
-            model=route.model_name,
-            tier=route.model_tier.value,
-            lead_value=lead_value
-        )
+        temperature = temperature or self.config.default_temperature
+        max_tokens = max_tokens or self.config.default_max_tokens
 
-        # Start AI-GYM tracking
-        request_id = None
-        if self.gym_tracker:
-            request_id = await self.gym_tracker.start_request(
-                task_type=task_type.value,
-                model_name=route.model_name,
-                lead_id=lead_id,
-                metadata={
-                    "lead_value": lead_value,
-                    "route_reasoning": route.reasoning,
-                    "temperature": temperature or self.config.default_temperature,
-                    "max_tokens": max_tokens or self.config.default_max_tokens
-                }
+        # Check response cache
+        lookup = None
+        if use_cache and self.response_cache:
+            started = time.perf_counter()
+            lookup = await self.response_cache.lookup(
+                task_type.value,
+                route.model_name,
+                [msg.model_dump() for msg in messages],
+                temperature,
+                max_tokens
             )
+            if lookup and lookup.hit:
+                return await self._cached_response(
+                    task_type, route, lookup, lead_id, time.perf_counter() - started
+                )
+
+        # Start AI-GYM tracking
+        request_id = await self._start_tracking(
+            task_type, route, lead_id, lead_value, temperature, max_tokens, lookup
+        )
+        outcome = "cancelled"  # Unless the call completes or raises
 
         try:
             # Call OpenRouter
+            started = time.perf_counter()
             response_data = await self._call_openrouter(
                 model=route.model_name,
                 messages=messages,
-                temperature=temperature or self.config.default_temperature,
-                max_tokens=max_tokens or self.config.default_max_tokens
+                temperature=temperature,
+                max_tokens=max_tokens
             )
+            latency = time.perf_counter() - started
 
             # Extract response
             content = response_data["choices"][0]["message"]["content"]
@@ -220,13 +325,7 @@ class AICouncil:
             completion_tokens = usage.get("completion_tokens", 0)
 
             # Calculate actual cost
-            model_info = self.router.get_model_info(route.model_name)
-            if "pricing" in model_info and model_info["pricing"]:
-                input_cost = (prompt_tokens / 1_000_000) * model_info["pricing"]["input"]
-                output_cost = (completion_tokens / 1_000_000) * model_info["pricing"]["output"]
-                total_cost = input_cost + output_cost
-            else:
-                total_cost = route.estimated_cost  # Fallback to estimate
+            total_cost = self._calculate_cost(route, prompt_tokens, completion_tokens)
 
             # Complete AI-GYM tracking
             if self.gym_tracker and request_id:
@@ -237,6 +336,17 @@ class AICouncil:
                     cost=total_cost,
                     response_text=content[:500]  # Store first 500 chars for quality eval
                 )
+            outcome = "completed"
+
+            if lookup:
+                await self._store_in_cache(lookup, cache_validator, CachedCompletion(
+                    content=content,
+                    model_used=route.model_name,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_cost=total_cost,
+                    latency_seconds=latency
+                ))
 
             return AICouncilResponse(
                 content=content,
@@ -250,20 +360,382 @@ class AICouncil:
             )
 
         except Exception as e:
+            outcome = "failed"
             logger.error(
                 "ai_council.error",
                 task_type=task_type.value,
                 model=route.model_name,
                 error=str(e)
             )
+            if self.gym_tracker and request_id:
+                self.gym_tracker.end_request(request_id, "failed", error=str(e))
             raise
 
+        finally:
+            # Council stragglers are cancelled mid-request
+            if outcome == "cancelled" and self.gym_tracker and request_id:
+                self.gym_tracker.end_request(request_id, "cancelled")
+
+    def complete_stream(
+        self,
+        task_type: TaskType,
+        messages: List[Message],
+        lead_id: Optional[int] = None,
+        lead_value: Optional[float] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        force_model: Optional[str] = None,
+        use_cache: bool = True,
+        cache_validator: Optional[CacheValidator] = None
+    ) -> "AICouncilStream":
+        """
+        Complete an AI task, yielding content as the model produces it.
+
+        Takes the same arguments as complete(). Iterate the result for text
+        deltas; afterwards its .response holds the AICouncilResponse with
+        usage and cost, which are tracked in AI-GYM exactly as for complete().
+
+        Example:
+            stream = council.complete_stream(TaskType.CONVERSATION_RESPONSE, messages)
+            async for delta in stream:
+                ...
+            reply = stream.response
+
+        Returns:
+            AICouncilStream
+        """
+        return AICouncilStream(
+            self,
+            task_type=task_type,
+            messages=messages,
+            lead_id=lead_id,
+            lead_value=lead_value,
+            temperature=temperature or self.config.default_temperature,
+            max_tokens=max_tokens or self.config.default_max_tokens,
+            force_model=force_model,
+            use_cache=use_cache,
+            cache_validator=cache_validator
+        )
+
+    async def complete_council(
+        self,
+        task_type: TaskType,
+        messages: List[Message],
+        models: List[str],
+        quorum: Optional[int] = None,
+        quality_threshold: Optional[float] = None,
+        quality_fn: Optional[QualityFunction] = None,
+        lead_id: Optional[int] = None,
+        lead_value: Optional[float] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> AICouncilResult:
+        """
+        Run the same task on several models concurrently.
+
+        Returns as soon as `quorum` answers have arrived or an answer scores
+        at least `quality_threshold` under `quality_fn`, and cancels the
+        models still running. Without a threshold the quorum defaults to 1
+        (first answer wins); with one, it defaults to waiting for all models.
+
+        Args:
+            task_type: Type of task
+            messages: Chat messages
+            models: OpenRouter model IDs (e.g. from ModelRouter.route_council)
+            quorum: Number of answers to wait for
+            quality_threshold: Accept the first answer scoring at least this
+            quality_fn: Scores an answer (sync or async); required for the
+                threshold and used to pick the best answer otherwise
+            lead_id: Associated lead ID (for tracking)
+            lead_value: Estimated lead value in dollars
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            timeout: Seconds to wait before settling for what has arrived
+
+        Returns:
+            AICouncilResult with the selected answer and the ones collected
+
+        Raises:
+            ValueError: If no models are given, or quality_threshold without quality_fn
+            Exception: The first model error if no model answered
+        """
+        if not models:
+            raise ValueError("complete_council needs at least one model")
+        if quality_threshold is not None and quality_fn is None:
+            raise ValueError("quality_threshold requires a quality_fn")
+        if quorum is None and quality_threshold is None:
+            quorum = 1
+
+        tasks = {
+            asyncio.create_task(self.complete(
+                task_type=task_type,
+                messages=messages,
+                lead_id=lead_id,
+                lead_value=lead_value,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                force_model=model
+            )): model
+            for model in models
+        }
+        pending = set(tasks)
+        responses: List[AICouncilResponse] = []
+        scores: Dict[str, float] = {}
+        failed: List[str] = []
+        errors: List[BaseException] = []
+        selected: Optional[AICouncilResponse] = None
+        decided_by = "all_finished"
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+
+        try:
+            while pending and selected is None:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    decided_by = "timeout"
+                    break
+
+                for task in done:
+                    model = tasks[task]
+                    if task.exception() is not None:
+                        failed.append(model)
+                        errors.append(task.exception())
+                        logger.warning("ai_council.council_member_failed", model=model, error=str(task.exception()))
+                        continue
+
+                    response = task.result()
+                    responses.append(response)
+                    if quality_fn is not None:
+                        score = quality_fn(response)
+                        if inspect.isawaitable(score):
+                            score = await score
+                        scores[model] = score
+                        if quality_threshold is not None and score >= quality_threshold and selected is None:
+                            selected, decided_by = response, "quality_threshold"
+
+                if selected is None and quorum is not None and len(responses) >= quorum:
+                    decided_by = "quorum"
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not responses:
+            if errors:
+                raise errors[0]
+            raise asyncio.TimeoutError(f"No council model answered within {timeout}s")
+
+        if selected is None:
+            selected = max(responses, key=lambda r: scores.get(r.model_used, 0.0)) if scores else responses[0]
+
+        cancelled = [tasks[task] for task in pending]
+        logger.info(
+            "ai_council.council_decided",
+            task_type=task_type.value,
+            decided_by=decided_by,
+            selected=selected.model_used,
+            answered=len(responses),
+            failed=len(failed),
+            cancelled=len(cancelled)
+        )
+
+        return AICouncilResult(
+            response=selected,
+            responses=responses,
+            quality_scores=scores,
+            failed_models=failed,
+            cancelled_models=cancelled,
+            decided_by=decided_by
+        )
+
+    async def complete_hedged(
+        self,
+        task_type: TaskType,
+        messages: List[Message],
+        backup_model: Optional[str] = None,
+        hedge_after: Optional[float] = None,
+        lead_id: Optional[int] = None,
+        lead_value: Optional[float] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        force_model: Optional[str] = None,
+        use_cache: bool = True,
+        cache_validator: Optional[CacheValidator] = None
+    ) -> AICouncilResponse:
+        """
+        Complete a task, racing a backup model if the primary is slow to start.
+
+        The primary (routed) model is streamed; if it has not produced a first
+        token within its p95 time-to-first-token (config.hedge_delay_seconds
+        until enough samples exist), or fails before one, the backup model is
+        started too. Whichever streams first is kept and the other cancelled.
+
+        Args:
+            task_type: Type of task
+            messages: Chat messages
+            backup_model: Model to hedge with (default: another model in the primary's tier)
+            hedge_after: Seconds to wait before hedging (default: primary's p95)
+            lead_id: Associated lead ID
+            lead_value: Estimated lead value
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            force_model: Force the primary model
+            use_cache: Serve from / store to the response cache
+            cache_validator: Only cache completions this accepts
+
+        Returns:
+            AICouncilResponse from the model that answered
+        """
+        primary = self._route(task_type, lead_value, force_model)
+        backup_model = backup_model or self.router.get_backup_model(primary.model_name, primary.model_tier)
+        if hedge_after is None:
+            hedge_after = first_token_latency.p95(primary.model_name) or self.config.hedge_delay_seconds
+
+        def start(route: RouteDecision) -> asyncio.Task:
+            stream = AICouncilStream(
+                self,
+                task_type=task_type,
+                messages=messages,
+                lead_id=lead_id,
+                lead_value=lead_value,
+                temperature=temperature or self.config.default_temperature,
+                max_tokens=max_tokens or self.config.default_max_tokens,
+                force_model=None,
+                use_cache=use_cache,
+                cache_validator=cache_validator,
+                route=route
+            )
+            return asyncio.create_task(self._first_delta(stream))
+
+        contenders = {start(primary)}
+        done, _ = await asyncio.wait(contenders, timeout=hedge_after)
+        primary_failed = bool(done) and next(iter(done)).exception() is not None
+
+        if backup_model and (not done or primary_failed):
+            logger.info(
+                "ai_council.hedging",
+                task_type=task_type.value,
+                primary=primary.model_name,
+                backup=backup_model,
+                hedge_after=hedge_after,
+                primary_failed=primary_failed
+            )
+            backup = self.router.route_model(task_type, backup_model, reasoning=f"Hedge for {primary.model_name}")
+            contenders.add(start(backup))
+
+        winner = None
+        errors: List[BaseException] = []
+        try:
+            while contenders and winner is None:
+                done, contenders = await asyncio.wait(contenders, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        # Both started in the same tick; close the second stream
+                        await task.result()[1].aclose()
+        finally:
+            for task in contenders:
+                task.cancel()
+            if contenders:
+                await asyncio.gather(*contenders, return_exceptions=True)
+
+        if winner is None:
+            raise errors[0]
+
+        stream, deltas, _ = winner
+        async for _ in deltas:
+            pass
+        return stream.response
+
+    @staticmethod
+    async def _first_delta(stream: "AICouncilStream"):
+        """Start a stream and wait for its first delta (used to race streams)."""
+        deltas = stream.__aiter__()
+        try:
+            first = await deltas.__anext__()
+        except StopAsyncIteration:
+            first = ""
+        return stream, deltas, first
+
+    async def _store_in_cache(
+        self,
+        lookup: CacheLookup,
+        cache_validator: Optional[CacheValidator],
+        completion: CachedCompletion
+    ):
+        """Store a completion after a cache miss, unless the validator rejects it."""
+        if cache_validator is not None and not cache_validator(completion.content):
+            logger.info(
+                "ai_council.cache_store_rejected",
+                task_type=lookup.task_type,
+                model=completion.model_used
+            )
+            return
+        await self.response_cache.store(lookup, completion)
+
+    async def _cached_response(
+        self,
+        task_type: TaskType,
+        route: RouteDecision,
+        lookup: CacheLookup,
+        lead_id: Optional[int],
+        duration: float
+    ) -> AICouncilResponse:
+        """Build a response from a cache hit and record it in AI-GYM."""
+        entry = lookup.entry
+
+        logger.info(
+            "ai_council.cache_hit",
+            task_type=task_type.value,
+            model=entry.model_used,
+            kind=lookup.kind,
+            similarity=lookup.similarity,
+            saved_cost=entry.total_cost
+        )
+
+        request_id = None
+        if self.gym_tracker:
+            request_id = await self.gym_tracker.record_cache_hit(
+                task_type=task_type.value,
+                model_name=entry.model_used,
+                saved_cost=entry.total_cost,
+                saved_latency_seconds=entry.latency_seconds,
+                cache_kind=lookup.kind,
+                similarity=lookup.similarity,
+                lead_id=lead_id,
+                duration_seconds=duration
+            )
+
+        # Nothing was spent on this request
+        return AICouncilResponse(
+            content=entry.content,
+            model_used=entry.model_used,
+            model_tier=route.model_tier.value,
+            prompt_tokens=0,
+            completion_tokens=0,
+            total_cost=0.0,
+            request_id=request_id,
+            route_decision=route,
+            cached=True
+        )
+
     async def analyze_website(
         self,
         url: str,
         html_content: str,
         lead_id: Optional[int] = None,
-        lead_value: Optional[float] = None
+        lead_value: Optional[float] = None,
+        hedged: bool = False
     ) -> AICouncilResponse:
         """
         Analyze a website and extract key insights.
@@ -273,6 +745,7 @@ class AICouncil:
             html_content: Scraped HTML content
             lead_id: Associated lead ID
             lead_value: Estimated lead value (for routing)
+            hedged: Race a backup model if the routed one is slow to respond
 
         Returns:
             AICouncilResponse with analysis
@@ -303,7 +776,8 @@ Analyze this website and provide structured insights."""
             )
         ]
 
-        return await self.complete(
+        complete = self.complete_hedged if hedged else self.complete
+        return await complete(
             task_type=TaskType.WEBSITE_ANALYSIS,
             messages=messages,
             lead_id=lead_id,
@@ -318,7 +792,8 @@ Analyze this website and provide structured insights."""
         website_analysis: str,
         our_service_description: str,
         lead_id: Optional[int] = None,
-        lead_value: Optional[float] = None
+        lead_value: Optional[float] = None,
+        hedged: bool = False
     ) -> AICouncilResponse:
         """
         Generate personalized email based on website analysis.
@@ -330,6 +805,7 @@ Analyze this website and provide structured insights."""
             our_service_description: Description of our service/product
             lead_id: Associated lead ID
             lead_value: Estimated lead value (for routing)
+            hedged: Race a backup model if the routed one is slow to respond
 
         Returns:
             AICouncilResponse with email
@@ -365,10 +841,204 @@ BODY: [email body]"""
             )
         ]
 
-        return await self.complete(
+        complete = self.complete_hedged if hedged else self.complete
+        return await complete(
             task_type=TaskType.EMAIL_BODY,
             messages=messages,
             lead_id=lead_id,
             lead_value=lead_value,
             temperature=0.8  # Higher creativity for emails
         )
+
+
+class AICouncilStream:
+    """
+    Streamed AI Council completion.
+
+    Async-iterable of content deltas. A cache hit is yielded as a single
+    delta. Once iteration finishes, .response is set and .time_to_first_token
+    holds the seconds until the first delta arrived.
+    """
+
+    def __init__(
+        self,
+        council: AICouncil,
+        task_type: TaskType,
+        messages: List[Message],
+        lead_id: Optional[int],
+        lead_value: Optional[float],
+        temperature: float,
+        max_tokens: int,
+        force_model: Optional[str],
+        use_cache: bool,
+        route: Optional[RouteDecision] = None,
+        cache_validator: Optional[CacheValidator] = None
+    ):
+        self.council = council
+        self.route = route
+        self.task_type = task_type
+        self.messages = messages
+        self.lead_id = lead_id
+        self.lead_value = lead_value
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.force_model = force_model
+        self.use_cache = use_cache
+        self.cache_validator = cache_validator
+        self.response: Optional[AICouncilResponse] = None
+        self.time_to_first_token: Optional[float] = None
+
+    def __aiter__(self):
+        return self._run()
+
+    async def publish_partials(self, room: str, task_id: str, **fields: Any) -> AICouncilResponse:
+        """
+        Consume the stream, publishing the text so far to a websocket room.
+
+        Each ai:response_partial event carries the tokens added since the
+        previous one. The event publisher rolls partials up per task and sums
+        those counts, so fast streams reach clients at the flush rate.
+
+        Args:
+            room: Websocket room to publish to
+            task_id: Identifies this completion among others in the room
+            **fields: Extra fields for every event (e.g. conversation_id)
+
+        Returns:
+            AICouncilResponse once the stream has finished
+        """
+        content = ""
+        async for delta in self:
+            tokens = estimate_tokens(content + delta) - estimate_tokens(content)
+            content += delta
+            async_event_publisher.publish(AI_EVENTS_CHANNEL, {
+                "type": "ai:response_partial",
+                "room": room,
+                "task_id": task_id,
+                **fields,
+                "content": content,
+                "tokens": tokens,
+            })
+        return self.response
+
+    async def _run(self):
+        council = self.council
+        task_type = self.task_type
+        route = self.route or council._route(task_type, self.lead_value, self.force_model)
+        started = time.perf_counter()
+
+        lookup = None
+        if self.use_cache and council.response_cache:
+            lookup = await council.response_cache.lookup(
+                task_type.value,
+                route.model_name,
+                [msg.model_dump() for msg in self.messages],
+                self.temperature,
+                self.max_tokens
+            )
+            if lookup and lookup.hit:
+                self.response = await council._cached_response(
+                    task_type, route, lookup, self.lead_id, time.perf_counter() - started
+                )
+                self.time_to_first_token = time.perf_counter() - started
+                yield self.response.content
+                return
+
+        request_id = await council._start_tracking(
+            task_type, route, self.lead_id, self.lead_value,
+            self.temperature, self.max_tokens, lookup, streamed=True
+        )
+
+        logger.info(
+            "openrouter.stream_request",
+            model=route.model_name,
+            message_count=len(self.messages),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+
+        parts: List[str] = []
+        usage: Dict[str, Any] = {}
+        started = time.perf_counter()
+        outcome = "cancelled"  # Unless the stream finishes or raises
+        try:
+            async for chunk in llm_gateway.chat_completion_stream(
+                [msg.model_dump() for msg in self.messages],
+                model=route.model_name,
+                api_key=council.config.openrouter_api_key,
+                timeout=council.config.timeout_seconds,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                usage={"include": True}  # OpenRouter reports usage on the final chunk
+            ):
+                if chunk.get("usage"):
+                    usage = chunk["usage"]
+                choices = chunk.get("choices") or []
+                delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                if delta:
+                    if self.time_to_first_token is None:
+                        self.time_to_first_token = time.perf_counter() - started
+                        first_token_latency.record(route.model_name, self.time_to_first_token)
+                    parts.append(delta)
+                    yield delta
+            outcome = "finished"
+        except Exception as e:
+            outcome = "failed"
+            logger.error(
+                "ai_council.stream_error",
+                task_type=task_type.value,
+                model=route.model_name,
+                error=str(e)
+            )
+            if council.gym_tracker and request_id:
+                council.gym_tracker.end_request(request_id, "failed", error=str(e))
+            raise
+        finally:
+            # Hedge losers are cancelled or closed mid-stream
+            if outcome == "cancelled" and council.gym_tracker and request_id:
+                council.gym_tracker.end_request(request_id, "cancelled")
+
+        latency = time.perf_counter() - started
+        content = "".join(parts)
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        # Rough estimate if the provider did not report usage
+        completion_tokens = usage.get("completion_tokens", estimate_tokens(content))
+        total_cost = council._calculate_cost(route, prompt_tokens, completion_tokens)
+
+        logger.info(
+            "openrouter.stream_response",
+            model=route.model_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            time_to_first_token=self.time_to_first_token
+        )
+
+        if council.gym_tracker and request_id:
+            await council.gym_tracker.complete_request(
+                request_id=request_id,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost=total_cost,
+                response_text=content[:500]
+            )
+
+        if lookup:
+            await council._store_in_cache(lookup, self.cache_validator, CachedCompletion(
+                content=content,
+                model_used=route.model_name,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_cost=total_cost,
+                latency_seconds=latency
+            ))
+
+        self.response = AICouncilResponse(
+            content=content,
+            model_used=route.model_name,
+            model_tier=route.model_tier.value,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_cost=total_cost,
+            request_id=request_id,
+            route_decision=route
+        )
@@ -10,6 +10,7 @@ Logs every AI request to enable:
 Based on research from Claudes_Updates/02_ML_STRATEGY_AND_EVALUATION.md
 """
 
+import json
 import time
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -17,19 +18,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import structlog
 
+from app.services.metric_sink import MetricSink, metric_sink
+
 logger = structlog.get_logger(__name__)
 
+PERFORMANCE_TABLE = "ai_gym_performance"
+
 
 class AIGymTracker:
     """
     Tracks AI model usage, costs, and performance metrics.
 
     Stores data in ai_gym_performance table for analysis and optimization.
+    Request bookkeeping is written through the metric sink, so tracking adds
+    no database round trips to an AI call; the session is used for reports.
     """
 
-    def __init__(self, db_session: AsyncSession):
-        """Initialize tracker with database session."""
+    def __init__(self, db_session: Optional[AsyncSession] = None, sink: Optional[MetricSink] = None):
+        """Initialize tracker with database session (for reports) and metric sink."""
         self.db = db_session
+        self.sink = sink or metric_sink
         # Dictionary to track multiple concurrent requests by request_id
         self.active_requests: Dict[int, Dict[str, Any]] = {}
 
@@ -39,7 +47,7 @@ class AIGymTracker:
         model_name: str,
         lead_id: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> Optional[int]:
         """
         Start tracking an AI request.
 
@@ -50,34 +58,26 @@ class AIGymTracker:
             metadata: Additional context (prompt preview, parameters, etc.)
 
         Returns:
-            Request ID for tracking
+            Request ID for tracking, or None if tracking is unavailable
         """
-        # Insert initial record
-        query = text("""
-            INSERT INTO ai_gym_performance (
-                task_type, model_name, lead_id, metadata, created_at
-            )
-            VALUES (:task_type, :model_name, :lead_id, :metadata, NOW())
-            RETURNING id
-        """)
+        # Reserve the row ID now; the insert itself is written in the background
+        request_id = await self.sink.next_id(PERFORMANCE_TABLE)
+        if request_id is None:
+            logger.warning("ai_gym.tracking_skipped", task_type=task_type, model_name=model_name)
+            return None
+        self.sink.insert(PERFORMANCE_TABLE, request_id, {
+            "task_type": task_type,
+            "model_name": model_name,
+            "lead_id": lead_id,
+            "metadata": json.dumps(metadata or {}),
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        })
 
-        import json
-
-        result = await self.db.execute(
-            query,
-            {
-                "task_type": task_type,
-                "model_name": model_name,
-                "lead_id": lead_id,
-                "metadata": json.dumps(metadata or {})
-            }
-        )
-        await self.db.commit()
-
-        request_id = result.scalar()
         # Store start time in dictionary keyed by request_id (thread-safe for concurrent requests)
         self.active_requests[request_id] = {
-            "start_time": time.time()
+            "start_time": time.time(),
+            "metadata": metadata or {}
         }
 
         logger.info(
@@ -115,43 +115,21 @@ class AIGymTracker:
             duration = time.time() - self.active_requests[request_id]["start_time"]
 
         # Update record with completion data
-        query = text("""
-            UPDATE ai_gym_performance
-            SET
-                prompt_tokens = :prompt_tokens,
-                completion_tokens = :completion_tokens,
-                total_tokens = :total_tokens,
-                cost = :cost,
-                duration_seconds = :duration_seconds,
-                response_text = :response_text,
-                faithfulness_score = :faithfulness_score,
-                relevance_score = :relevance_score,
-                coherence_score = :coherence_score,
-                conciseness_score = :conciseness_score,
-                composite_score = :composite_score,
-                updated_at = NOW()
-            WHERE id = :request_id
-        """)
-
         quality = quality_scores or {}
-        await self.db.execute(
-            query,
-            {
-                "request_id": request_id,
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": prompt_tokens + completion_tokens,
-                "cost": cost,
-                "duration_seconds": duration,
-                "response_text": response_text,
-                "faithfulness_score": quality.get("faithfulness"),
-                "relevance_score": quality.get("relevance"),
-                "coherence_score": quality.get("coherence"),
-                "conciseness_score": quality.get("conciseness"),
-                "composite_score": quality.get("composite"),
-            }
-        )
-        await self.db.commit()
+        self.sink.update(PERFORMANCE_TABLE, request_id, {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cost": cost,
+            "duration_seconds": duration,
+            "response_text": response_text,
+            "faithfulness_score": quality.get("faithfulness"),
+            "relevance_score": quality.get("relevance"),
+            "coherence_score": quality.get("coherence"),
+            "conciseness_score": quality.get("conciseness"),
+            "composite_score": quality.get("composite"),
+            "updated_at": datetime.utcnow(),
+        })
 
         logger.info(
             "ai_gym.request_completed",
@@ -165,6 +143,152 @@ class AIGymTracker:
         if request_id in self.active_requests:
             del self.active_requests[request_id]
 
+    def end_request(self, request_id: int, status: str, error: Optional[str] = None):
+        """
+        Close a request that will never complete (cancelled or failed).
+
+        Synchronous so it can run in finally blocks of cancelled tasks; the
+        outcome is recorded in the row's metadata.
+
+        Args:
+            request_id: ID returned from start_request()
+            status: "cancelled" or "failed"
+            error: Error message for failed requests
+        """
+        active = self.active_requests.pop(request_id, None)
+        duration = time.time() - active["start_time"] if active else None
+
+        metadata = dict(active["metadata"]) if active else {}
+        metadata["status"] = status
+        if error:
+            metadata["error"] = error[:500]
+
+        self.sink.update(PERFORMANCE_TABLE, request_id, {
+            "duration_seconds": duration,
+            "metadata": json.dumps(metadata),
+            "updated_at": datetime.utcnow(),
+        })
+
+        logger.info(
+            "ai_gym.request_ended",
+            request_id=request_id,
+            status=status,
+            duration=duration
+        )
+
+    async def record_cache_hit(
+        self,
+        task_type: str,
+        model_name: str,
+        saved_cost: float,
+        saved_latency_seconds: float,
+        cache_kind: str = "exact",
+        similarity: Optional[float] = None,
+        lead_id: Optional[int] = None,
+        duration_seconds: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Log a request answered from the response cache.
+
+        The row has zero cost and tokens; what the original completion cost
+        is kept in metadata as saved_cost / saved_latency_seconds.
+
+        Args:
+            task_type: Type of AI task
+            model_name: Model that produced the cached completion
+            saved_cost: Cost of the original completion in dollars
+            saved_latency_seconds: Latency of the original completion
+            cache_kind: "exact" or "semantic"
+            similarity: Cosine similarity for semantic hits
+            lead_id: Associated lead ID (if applicable)
+            duration_seconds: Time spent serving from cache
+
+        Returns:
+            Request ID, or None if tracking is unavailable
+        """
+        request_id = await self.sink.next_id(PERFORMANCE_TABLE)
+        if request_id is None:
+            logger.warning("ai_gym.tracking_skipped", task_type=task_type, model_name=model_name)
+            return None
+        self.sink.insert(PERFORMANCE_TABLE, request_id, {
+            "task_type": task_type,
+            "model_name": model_name,
+            "lead_id": lead_id,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "cost": 0.0,
+            "duration_seconds": duration_seconds,
+            "metadata": json.dumps({
+                "cache_hit": True,
+                "cache_kind": cache_kind,
+                "similarity": similarity,
+                "saved_cost": saved_cost,
+                "saved_latency_seconds": saved_latency_seconds,
+            }),
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        })
+
+        logger.info(
+            "ai_gym.cache_hit",
+            request_id=request_id,
+            task_type=task_type,
+            cache_kind=cache_kind,
+            saved_cost=saved_cost
+        )
+
+        return request_id
+
+    async def get_cache_summary(
+        self,
+        start_date: Optional[datetime] = None,
+        task_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get response cache effectiveness for a time period.
+
+        Args:
+            start_date: Start of period (default: all time)
+            task_type: Filter by task type
+
+        Returns:
+            Hits, misses, hit rate, saved cost and saved latency
+        """
+        filters = []
+        params = {}
+
+        if start_date:
+            filters.append("created_at >= :start_date")
+            params["start_date"] = start_date
+        if task_type:
+            filters.append("task_type = :task_type")
+            params["task_type"] = task_type
+
+        where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+        query = text(f"""
+            SELECT
+                COUNT(*) FILTER (WHERE (metadata->>'cache_hit')::boolean) as hits,
+                COUNT(*) FILTER (WHERE metadata->>'cache' = 'miss') as misses,
+                SUM((metadata->>'saved_cost')::float) as saved_cost,
+                SUM((metadata->>'saved_latency_seconds')::float) as saved_latency
+            FROM ai_gym_performance
+            {where_clause}
+        """)
+
+        result = await self.db.execute(query, params)
+        row = result.fetchone()
+        hits, misses = row[0] or 0, row[1] or 0
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "saved_cost": float(row[2] or 0),
+            "saved_latency_seconds": float(row[3] or 0)
+        }
+
     async def log_conversion(
         self,
         request_id: int,
@@ -179,6 +303,10 @@ class AIGymTracker:
             conversion_metric: Conversion value (0.0-1.0, or dollar amount)
             metadata: Additional conversion context
         """
+        # The row may still be buffered
+        if self.sink.is_pending(PERFORMANCE_TABLE, request_id):
+            await self.sink.flush_all()
+
         query = text("""
             UPDATE ai_gym_performance
             SET
@@ -188,8 +316,6 @@ class AIGymTracker:
             WHERE id = :request_id
         """)
 
-        import json
-
         await self.db.execute(
             query,
             {
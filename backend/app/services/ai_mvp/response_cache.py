@@ -0,0 +1,360 @@
+"""
+Response Cache - Reuses AI Council completions for repeated requests.
+
+Website analyses of the same domain, re-qualification runs and demo-builder
+retries send the same prompts over and over. Completions are cached under a
+hash of (model, normalized messages, temperature, max_tokens) with a TTL that
+depends on the task type. Live conversation and creative tasks (emails,
+scripts) are never cached by default, nor is anything sampled above
+CACHE_MAX_TEMPERATURE, since a replay would hand every lead the same "varied"
+text. Callers can also pass a validator so only output that passed their
+checks is stored (see AICouncil.complete).
+
+For deterministic tasks (low temperature) an opt-in semantic layer also
+matches near-duplicate prompts by embedding similarity.
+
+Backends:
+- Redis (shared between workers)
+- Local disk (single host, no Redis required)
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Seconds a completion stays valid, per TaskType value (0 = never cached)
+DEFAULT_TTLS: Dict[str, int] = {
+    "category_classification": 7 * 86400,
+    "spam_detection": 7 * 86400,
+    "short_summary": 86400,
+    "website_analysis": 86400,
+    "pain_point_extraction": 86400,
+    "demo_site_planning": 6 * 3600,
+    # Creative copy is meant to differ per lead
+    "video_script": 0,
+    "custom_strategy": 0,
+    "email_subject": 0,
+    "email_body": 0,
+    # Replies to a live conversation must always be fresh
+    "conversation_response": 0,
+    "objection_handling": 0,
+    "final_email_approval": 0,
+}
+
+# Sampling above this is asking for variety, so it is never cached
+CACHE_MAX_TEMPERATURE = 0.5
+
+# Semantic matching is only safe where the same prompt should give the same answer
+SEMANTIC_MAX_TEMPERATURE = 0.3
+
+EmbedFunction = Callable[[str], Awaitable[List[float]]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_messages(messages: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+    """Collapse whitespace so formatting-only differences share a key."""
+    return [
+        (message["role"], _WHITESPACE.sub(" ", message["content"]).strip())
+        for message in messages
+    ]
+
+
+def cache_key(model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> str:
+    """Stable key for a completion request."""
+    material = json.dumps(
+        [model, normalize_messages(messages), round(float(temperature), 3), int(max_tokens)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class CachedCompletion:
+    """A stored completion and what it cost to produce."""
+    content: str
+    model_used: str
+    prompt_tokens: int
+    completion_tokens: int
+    total_cost: float
+    latency_seconds: float
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class CacheLookup:
+    """Result of a lookup; pass it back to store() on a miss."""
+    key: str
+    task_type: str
+    model: str
+    ttl: int
+    entry: Optional[CachedCompletion] = None
+    kind: Optional[str] = None  # "exact" or "semantic" on a hit
+    similarity: Optional[float] = None
+    embedding: Optional[List[float]] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.entry is not None
+
+
+class RedisCacheBackend:
+    """Completions stored as JSON strings with SETEX."""
+
+    def __init__(self, redis_url: str, prefix: str = "ai_cache:"):
+        self.client = aioredis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int):
+        await self.client.setex(self.prefix + key, ttl, json.dumps(value))
+
+
+class DiskCacheBackend:
+    """Completions stored as JSON files, sharded by key prefix."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                record = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if record["expires_at"] < time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return record["value"]
+
+    def _write(self, key: str, value: Dict[str, Any], ttl: int):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"expires_at": time.time() + ttl, "value": value}, handle)
+        # Atomic so concurrent readers never see a partial file
+        os.replace(temp_path, path)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int):
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+
+class ResponseCache:
+    """
+    Completion cache for AICouncil.
+
+    Features:
+    - Exact-match cache keyed by model, normalized messages and parameters
+    - Per-task-type TTLs; uncached task types and high temperatures bypass it
+    - Opt-in semantic lookup for deterministic tasks
+    - Hit/miss, saved cost and saved latency counters
+    """
+
+    def __init__(
+        self,
+        backend,
+        ttls: Optional[Dict[str, int]] = None,
+        max_temperature: float = CACHE_MAX_TEMPERATURE,
+        semantic_enabled: bool = False,
+        semantic_threshold: float = 0.97,
+        semantic_max_entries: int = 1000,
+        embed: Optional[EmbedFunction] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            backend: RedisCacheBackend or DiskCacheBackend
+            ttls: TTL overrides per task type value
+            max_temperature: Requests sampled above this are not cached
+            semantic_enabled: Match near-duplicate prompts on deterministic tasks
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+            semantic_max_entries: Embeddings kept per (task type, model)
+            embed: Async text -> embedding function (defaults to the LLM gateway)
+        """
+        self.backend = backend
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_temperature = max_temperature
+        self.semantic_enabled = semantic_enabled
+        self.semantic_threshold = semantic_threshold
+        self.semantic_max_entries = semantic_max_entries
+        self._embed = embed
+        # (task_type, model) -> key -> (embedding, expires_at), oldest first
+        self._semantic_index: Dict[Tuple[str, str], "OrderedDict[str, Tuple[List[float], float]]"] = {}
+        self.stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "errors": 0,
+            "saved_cost": 0.0,
+            "saved_latency_seconds": 0.0,
+        }
+
+    @classmethod
+    def from_settings(cls) -> Optional["ResponseCache"]:
+        """Build the cache configured in settings, or None if disabled."""
+        from app.core.config import settings
+
+        if settings.AI_CACHE_BACKEND == "redis" and settings.REDIS_URL:
+            backend = RedisCacheBackend(settings.REDIS_URL)
+        elif settings.AI_CACHE_BACKEND in ("redis", "disk"):
+            backend = DiskCacheBackend(settings.AI_CACHE_DIR)
+        else:
+            return None
+
+        return cls(
+            backend,
+            semantic_enabled=settings.AI_CACHE_SEMANTIC,
+            semantic_threshold=settings.AI_CACHE_SEMANTIC_THRESHOLD,
+        )
+
+    def ttl_for(self, task_type: str) -> int:
+        return self.ttls.get(task_type, 0)
+
+    async def _embed_text(self, text: str) -> List[float]:
+        if self._embed is not None:
+            return await self._embed(text)
+
+        from app.core.config import settings
+        from app.services.llm_gateway import llm_gateway
+
+        embeddings = await llm_gateway.embeddings(text, model=settings.AI_MODEL_EMBEDDINGS)
+        return embeddings[0]
+
+    def _uses_semantic(self, temperature: float) -> bool:
+        return self.semantic_enabled and temperature <= SEMANTIC_MAX_TEMPERATURE
+
+    async def lookup(
+        self,
+        task_type: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> Optional[CacheLookup]:
+        """
+        Look up a completion.
+
+        Returns:
+            CacheLookup (check .hit), or None if this task type or
+            temperature is not cached
+        """
+        ttl = self.ttl_for(task_type)
+        if ttl <= 0 or temperature > self.max_temperature:
+            self.stats["bypassed"] += 1
+            return None
+
+        lookup = CacheLookup(
+            key=cache_key(model, messages, temperature, max_tokens),
+            task_type=task_type,
+            model=model,
+            ttl=ttl,
+        )
+
+        try:
+            value = await self.backend.get(lookup.key)
+            if value:
+                lookup.entry, lookup.kind = CachedCompletion(**value), "exact"
+            elif self._uses_semantic(temperature):
+                await self._semantic_lookup(lookup, messages)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning("response_cache.lookup_failed", task_type=task_type, error=str(e))
+            return lookup
+
+        if lookup.hit:
+            self.stats["hits"] += 1
+            if lookup.kind == "semantic":
+                self.stats["semantic_hits"] += 1
+            self.stats["saved_cost"] += lookup.entry.total_cost
+            self.stats["saved_latency_seconds"] += lookup.entry.latency_seconds
+        else:
+            self.stats["misses"] += 1
+        return lookup
+
+    async def _semantic_lookup(self, lookup: CacheLookup, messages: List[Dict[str, str]]):
+        """Find the most similar cached prompt for the same task and model."""
+        text = "\n".join(f"{role}: {content}" for role, content in normalize_messages(messages))
+        lookup.embedding = await self._embed_text(text)
+
+        index = self._semantic_index.get((lookup.task_type, lookup.model))
+        if not index:
+            return
+
+        now = time.time()
+        best_key, best_score = None, self.semantic_threshold
+        for key, (embedding, expires_at) in list(index.items()):
+            if expires_at < now:
+                del index[key]
+                continue
+            score = _cosine(lookup.embedding, embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is not None:
+            value = await self.backend.get(best_key)
+            if value:
+                lookup.entry, lookup.kind, lookup.similarity = CachedCompletion(**value), "semantic", best_score
+            else:
+                index.pop(best_key, None)
+
+    async def store(self, lookup: CacheLookup, completion: CachedCompletion):
+        """Store a completion produced after a miss."""
+        try:
+            await self.backend.set(lookup.key, asdict(completion), lookup.ttl)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning("response_cache.store_failed", task_type=lookup.task_type, error=str(e))
+            return
+
+        if lookup.embedding is not None:
+            index = self._semantic_index.setdefault((lookup.task_type, lookup.model), OrderedDict())
+            index[lookup.key] = (lookup.embedding, time.time() + lookup.ttl)
+            while len(index) > self.semantic_max_entries:
+                index.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global instance (None when caching is disabled)
+response_cache = ResponseCache.from_settings()
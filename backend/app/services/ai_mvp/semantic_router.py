@@ -233,6 +233,35 @@ class SemanticRouter:
             estimated_cost=self._estimate_cost(model_name, 500, 100)
         )
 
+    def route_model(self, task_type: TaskType, model_name: str, reasoning: str = "User forced model") -> RouteDecision:
+        """
+        Build a route decision for a specific model.
+
+        Args:
+            task_type: Type of AI task
+            model_name: OpenRouter model ID
+            reasoning: Why this model was chosen
+
+        Returns:
+            RouteDecision using the model's known tier (moderate if unknown)
+        """
+        info = self.get_model_info(model_name)
+        tier = ModelTier(info["tier"]) if info["pricing"] else ModelTier.MODERATE
+        return RouteDecision(
+            model_name=model_name,
+            model_tier=tier,
+            task_complexity=self.TASK_COMPLEXITY_MAP[task_type],
+            reasoning=reasoning,
+            estimated_cost=self._estimate_cost(model_name, 1000, 300)
+        )
+
+    def get_backup_model(self, model_name: str, tier: ModelTier) -> Optional[str]:
+        """Another model in the same tier (for hedged requests), if there is one."""
+        for candidate in self.MODELS.get(tier, {}):
+            if candidate != model_name:
+                return candidate
+        return None
+
     def _get_best_model_in_tier(self, tier: ModelTier) -> str:
         """Get the best (first) model in a tier."""
         models = list(self.MODELS[tier].keys())
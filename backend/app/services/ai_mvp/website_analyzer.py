@@ -10,17 +10,94 @@ Phase 3 Enhancement: Added comprehensive design, SEO, performance, and accessibi
 import asyncio
 import re
 import json
-from typing import Optional, Dict, Any, List, Tuple
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
 from urllib.parse import urlparse, urljoin
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from bs4 import BeautifulSoup
 import structlog
 
 from app.services.ai_mvp.ai_council import AICouncil, TaskType, Message
+from app.services.site_cache import SiteCache, CachedPage, site_cache as default_site_cache
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Bump when analysis output changes so cached results are not reused
+ANALYSIS_CACHE_VERSION = "1"
+
+# Page scripts shared by fetch_website(capture_metrics=True) and the analyzers
+
+PERFORMANCE_TIMING_JS = """
+    () => {
+        const perfData = window.performance.timing;
+        const navigation = window.performance.getEntriesByType('navigation')[0];
+        return {
+            domContentLoadedTime: perfData.domContentLoadedEventEnd - perfData.navigationStart,
+            loadCompleteTime: perfData.loadEventEnd - perfData.navigationStart,
+            domInteractive: perfData.domInteractive - perfData.navigationStart,
+            firstPaint: navigation ? navigation.domContentLoadedEventEnd : null
+        };
+    }
+"""
+
+RESOURCE_INFO_JS = """
+    () => {
+        const resources = window.performance.getEntriesByType('resource');
+
+        let totalSize = 0;
+        let scripts = [];
+        let stylesheets = [];
+        let images = [];
+        let fonts = [];
+        let renderBlocking = [];
+
+        resources.forEach(resource => {
+            const size = resource.transferSize || resource.decodedBodySize || 0;
+            totalSize += size;
+
+            if (resource.initiatorType === 'script' || resource.name.endsWith('.js')) {
+                scripts.push({ name: resource.name, size: size, duration: resource.duration });
+                if (resource.renderBlockingStatus === 'blocking') {
+                    renderBlocking.push(resource.name);
+                }
+            } else if (resource.initiatorType === 'link' || resource.name.endsWith('.css')) {
+                stylesheets.push({ name: resource.name, size: size, duration: resource.duration });
+                if (resource.renderBlockingStatus === 'blocking') {
+                    renderBlocking.push(resource.name);
+                }
+            } else if (resource.initiatorType === 'img' || /\\.(jpg|jpeg|png|gif|webp|svg)$/i.test(resource.name)) {
+                images.push({ name: resource.name, size: size });
+            } else if (/\\.(woff|woff2|ttf|otf)$/i.test(resource.name)) {
+                fonts.push({ name: resource.name, size: size });
+            }
+        });
+
+        return {
+            totalSize: totalSize,
+            resourceCount: resources.length,
+            scripts: scripts,
+            stylesheets: stylesheets,
+            images: images,
+            fonts: fonts,
+            renderBlocking: renderBlocking
+        };
+    }
+"""
+
+DESIGN_CONTEXT_JS = """
+    () => {
+        const styles = window.getComputedStyle(document.body);
+        return {
+            backgroundColor: styles.backgroundColor,
+            fontFamily: styles.fontFamily,
+            fontSize: styles.fontSize,
+            lineHeight: styles.lineHeight
+        };
+    }
+"""
+
 
 class WebsiteAnalyzer:
     """
@@ -32,14 +109,34 @@ class WebsiteAnalyzer:
     - Extract main content
     - AI-powered business analysis
     - Cost-optimized via semantic routing
+    - Pool of warm browser contexts reused across fetches
+    - Batch analysis with per-domain concurrency limits
+    - Results reused from the site cache while the page is unchanged
     """
 
-    def __init__(self, ai_council: AICouncil, headless: bool = True):
-        """Initialize website analyzer."""
+    def __init__(
+        self,
+        ai_council: AICouncil,
+        headless: bool = True,
+        context_pool_size: int = 4,
+        site_cache: Optional[SiteCache] = None
+    ):
+        """
+        Initialize website analyzer.
+
+        Args:
+            ai_council: AI Council used for AI-powered analysis
+            headless: Run the browser headless
+            context_pool_size: Idle browser contexts kept warm for reuse
+            site_cache: Fetch/analysis cache (defaults to the global one)
+        """
         self.ai_council = ai_council
         self.headless = headless
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self.context_pool_size = context_pool_size
+        self._contexts: asyncio.Queue = asyncio.Queue(maxsize=context_pool_size)
+        self.site_cache = site_cache or default_site_cache
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -70,6 +167,13 @@ class WebsiteAnalyzer:
 
     async def close(self):
         """Close browser and cleanup."""
+        while not self._contexts.empty():
+            context = self._contexts.get_nowait()
+            try:
+                await context.close()
+            except Exception:
+                pass
+
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -77,61 +181,110 @@ class WebsiteAnalyzer:
 
         logger.info("website_analyzer.closed")
 
-    async def fetch_website(self, url: str, timeout: int = 30000) -> Dict[str, Any]:
+    async def _acquire_context(self) -> BrowserContext:
+        """Take a warm context from the pool, or create one."""
+        if not self.browser:
+            await self.start()
+
+        try:
+            return self._contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            return await self.browser.new_context(
+                user_agent=settings.SCRAPER_USER_AGENT,
+                viewport={"width": 1920, "height": 1080}
+            )
+
+    async def _release_context(self, context: BrowserContext):
+        """Return a context to the pool (cookies cleared), or close it if the pool is full."""
+        try:
+            await context.clear_cookies()
+            self._contexts.put_nowait(context)
+        except Exception:
+            # Pool full or context unusable
+            await context.close()
+
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Open a page in a pooled context; the page is closed and the context returned on exit."""
+        context = await self._acquire_context()
+        page = None
+        try:
+            page = await context.new_page()
+            yield page
+        finally:
+            if page:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            await self._release_context(context)
+
+    async def fetch_website(
+        self,
+        url: str,
+        timeout: int = 30000,
+        capture_metrics: bool = False
+    ) -> Dict[str, Any]:
         """
         Fetch website content using Playwright.
 
         Args:
             url: Website URL to fetch
             timeout: Timeout in milliseconds (default: 30s)
+            capture_metrics: Also collect performance timings, resource info and
+                computed body styles from the same navigation (key "page_metrics")
 
         Returns:
             Dict with url, html, title, meta_description, cleaned_text
         """
-        if not self.browser:
-            await self.start()
-
         logger.info("website_analyzer.fetching", url=url)
 
         try:
-            # Create new page with user agent
-            context = await self.browser.new_context(
-                user_agent=settings.SCRAPER_USER_AGENT,
-                viewport={"width": 1920, "height": 1080}
-            )
-            page = await context.new_page()
-
-            # Navigate to URL
-            response = await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+            async with self._pooled_page() as page:
+                loop = asyncio.get_event_loop()
 
-            if not response:
-                raise Exception(f"Failed to load {url}")
+                # Navigate to URL
+                start_time = loop.time()
+                response = await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+                dom_load_time = loop.time() - start_time
 
-            if response.status >= 400:
-                raise Exception(f"HTTP {response.status} for {url}")
+                if not response:
+                    raise Exception(f"Failed to load {url}")
 
-            # Wait for page to load
-            await page.wait_for_load_state("networkidle", timeout=timeout)
+                if response.status >= 400:
+                    raise Exception(f"HTTP {response.status} for {url}")
 
-            # Extract metadata
-            title = await page.title()
+                # Wait for page to load
+                await page.wait_for_load_state("networkidle", timeout=timeout)
+                full_load_time = loop.time() - start_time
 
-            # Get meta description
-            meta_description = await page.evaluate("""
-                () => {
-                    const meta = document.querySelector('meta[name="description"]');
-                    return meta ? meta.getAttribute('content') : '';
-                }
-            """)
+                # Extract metadata
+                title = await page.title()
 
-            # Get full HTML
-            html = await page.content()
+                # Get meta description
+                meta_description = await page.evaluate("""
+                    () => {
+                        const meta = document.querySelector('meta[name="description"]');
+                        return meta ? meta.getAttribute('content') : '';
+                    }
+                """)
 
-            # Extract cleaned text (remove scripts, styles, nav, footer)
-            cleaned_text = await self._extract_clean_text(page)
+                # Get full HTML
+                html = await page.content()
+
+                page_metrics = None
+                if capture_metrics:
+                    # Must run before _extract_clean_text strips the DOM
+                    page_metrics = {
+                        "dom_load_time": dom_load_time,
+                        "full_load_time": full_load_time,
+                        "performance_timing": await page.evaluate(PERFORMANCE_TIMING_JS),
+                        "resource_info": await page.evaluate(RESOURCE_INFO_JS),
+                        "design_context": await page.evaluate(DESIGN_CONTEXT_JS)
+                    }
 
-            await page.close()
-            await context.close()
+                # Extract cleaned text (remove scripts, styles, nav, footer)
+                cleaned_text = await self._extract_clean_text(page)
 
             logger.info(
                 "website_analyzer.fetched",
@@ -142,7 +295,7 @@ class WebsiteAnalyzer:
                 text_length=len(cleaned_text)
             )
 
-            return {
+            result = {
                 "url": url,
                 "html": html,
                 "title": title,
@@ -150,6 +303,10 @@ class WebsiteAnalyzer:
                 "cleaned_text": cleaned_text,
                 "status_code": response.status
             }
+            if page_metrics is not None:
+                result["page_metrics"] = page_metrics
+
+            return result
 
         except Exception as e:
             logger.error("website_analyzer.fetch_failed", url=url, error=str(e))
@@ -187,12 +344,44 @@ class WebsiteAnalyzer:
 
         return cleaned_text
 
+    async def _lookup_cached(
+        self,
+        url: str,
+        analyzer: str,
+        **params: Any
+    ) -> Tuple[Optional[CachedPage], Optional[Dict[str, Any]]]:
+        """
+        Revalidate a URL and look up a previous result for its current content.
+
+        Returns:
+            (page, cached result); page is None when the cache is unavailable
+        """
+        if not self.site_cache:
+            return None, None
+
+        page = await self.site_cache.revalidate(url)
+        if page is None:
+            return None, None
+
+        cached = await self.site_cache.get_derived(
+            page.content_hash, analyzer, ANALYSIS_CACHE_VERSION, **params
+        )
+        if cached is not None:
+            logger.info(
+                "website_analyzer.cache_hit",
+                url=url,
+                analyzer=analyzer,
+                not_modified=page.not_modified
+            )
+        return page, cached
+
     async def analyze_website(
         self,
         url: str,
         lead_id: Optional[int] = None,
         lead_value: Optional[float] = None,
-        fetch_timeout: int = 30000
+        fetch_timeout: int = 30000,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Fetch and analyze website with AI.
@@ -202,14 +391,35 @@ class WebsiteAnalyzer:
             lead_id: Associated lead ID (for tracking)
             lead_value: Estimated lead value (for routing)
             fetch_timeout: Fetch timeout in ms
+            use_cache: Reuse the previous analysis if the page is unchanged
 
         Returns:
             Dict with website data + AI analysis
         """
         logger.info("website_analyzer.analyzing", url=url, lead_value=lead_value)
 
-        # Step 1: Fetch website
-        website_data = await self.fetch_website(url, timeout=fetch_timeout)
+        page, cached = (None, None)
+        if use_cache:
+            page, cached = await self._lookup_cached(url, "website_analysis")
+        if cached is not None:
+            return {
+                **cached,
+                "url": url,
+                "ai_cost": 0.0,
+                "cached": True,
+                "lead_id": lead_id,
+                "lead_value": lead_value
+            }
+
+        # Step 1: Fetch website, reusing the body revalidation just stored;
+        # only pages that render their text with JS need the browser
+        website_data = None
+        if page is not None:
+            html = await self.site_cache.get_html(page.content_hash)
+            if html:
+                website_data = self._website_data_from_html(url, html, page.status_code)
+        if website_data is None:
+            website_data = await self.fetch_website(url, timeout=fetch_timeout)
 
         # Step 2: Prepare content for AI (use cleaned_text, limit to ~15K chars)
         content_for_ai = website_data["cleaned_text"][:15000]
@@ -241,6 +451,15 @@ class WebsiteAnalyzer:
             "lead_value": lead_value
         }
 
+        if page is not None:
+            result["content_hash"] = page.content_hash
+            await self.site_cache.put_derived(
+                page.content_hash,
+                "website_analysis",
+                ANALYSIS_CACHE_VERSION,
+                {k: v for k, v in result.items() if k not in ("lead_id", "lead_value")}
+            )
+
         logger.info(
             "website_analyzer.complete",
             url=url,
@@ -250,6 +469,29 @@ class WebsiteAnalyzer:
 
         return result
 
+    def _website_data_from_html(self, url: str, html: str, status_code: int) -> Optional[Dict[str, Any]]:
+        """
+        Build fetch_website()'s result from already fetched HTML.
+
+        Returns:
+            Website data dict, or None if the HTML has no visible text
+        """
+        cleaned_text = self._clean_html(html)
+        if not cleaned_text:
+            return None
+
+        soup = BeautifulSoup(html, "html.parser")
+        meta = soup.find("meta", attrs={"name": "description"})
+        return {
+            "url": url,
+            "html": html,
+            "title": soup.title.get_text(strip=True) if soup.title else "",
+            "meta_description": (meta.get("content") or "") if meta else "",
+            "cleaned_text": cleaned_text,
+            # A 304 means the stored page is current
+            "status_code": 200 if status_code == 304 else status_code
+        }
+
     def _clean_html(self, html: str) -> str:
         """
         Clean HTML by removing tags (simple version for fallback).
@@ -333,7 +575,9 @@ class WebsiteAnalyzer:
         self,
         url: str,
         html: Optional[str] = None,
-        use_ai: bool = True
+        use_ai: bool = True,
+        soup: Optional[BeautifulSoup] = None,
+        design_context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Analyze website design quality.
@@ -342,6 +586,9 @@ class WebsiteAnalyzer:
             url: Website URL
             html: Optional pre-fetched HTML (avoids re-fetching)
             use_ai: Use AI for subjective design assessment
+            soup: Optional pre-parsed HTML (shared across analyzers)
+            design_context: Computed body styles captured by fetch_website
+                (avoids a second page load for the AI assessment)
 
         Returns:
             Dict with design score, issues, and strengths
@@ -349,11 +596,14 @@ class WebsiteAnalyzer:
         logger.info("website_analyzer.design_analysis", url=url)
 
         # Fetch if not provided
-        if not html:
-            website_data = await self.fetch_website(url)
+        if not html and soup is None:
+            website_data = await self.fetch_website(url, capture_metrics=use_ai)
             html = website_data["html"]
+            if use_ai:
+                design_context = website_data["page_metrics"]["design_context"]
 
-        soup = BeautifulSoup(html, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(html, 'html.parser')
 
         # Technical analysis
         design_metrics = {
@@ -394,32 +644,12 @@ class WebsiteAnalyzer:
         ai_assessment = None
         if use_ai and self.ai_council:
             try:
-                # Take screenshot for visual analysis
-                if not self.browser:
-                    await self.start()
-
-                context = await self.browser.new_context(
-                    viewport={"width": 1920, "height": 1080}
-                )
-                page = await context.new_page()
-                await page.goto(url, timeout=30000, wait_until="domcontentloaded")
-                await page.wait_for_load_state("networkidle", timeout=30000)
-
                 # Get computed styles for AI analysis
-                design_context = await page.evaluate("""
-                    () => {
-                        const styles = window.getComputedStyle(document.body);
-                        return {
-                            backgroundColor: styles.backgroundColor,
-                            fontFamily: styles.fontFamily,
-                            fontSize: styles.fontSize,
-                            lineHeight: styles.lineHeight
-                        };
-                    }
-                """)
-
-                await page.close()
-                await context.close()
+                if design_context is None:
+                    async with self._pooled_page() as page:
+                        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+                        await page.wait_for_load_state("networkidle", timeout=30000)
+                        design_context = await page.evaluate(DESIGN_CONTEXT_JS)
 
                 # Ask AI to evaluate design
                 ai_response = await self._ai_design_assessment(
@@ -441,7 +671,8 @@ class WebsiteAnalyzer:
     async def analyze_seo(
         self,
         url: str,
-        html: Optional[str] = None
+        html: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> Dict[str, Any]:
         """
         Comprehensive SEO audit.
@@ -449,17 +680,19 @@ class WebsiteAnalyzer:
         Args:
             url: Website URL
             html: Optional pre-fetched HTML
+            soup: Optional pre-parsed HTML (shared across analyzers)
 
         Returns:
             Dict with SEO score, issues, and strengths
         """
         logger.info("website_analyzer.seo_analysis", url=url)
 
-        if not html:
+        if not html and soup is None:
             website_data = await self.fetch_website(url)
             html = website_data["html"]
 
-        soup = BeautifulSoup(html, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(html, 'html.parser')
 
         # Meta tags analysis
         title_tag = soup.find('title')
@@ -637,7 +870,9 @@ class WebsiteAnalyzer:
     async def analyze_performance(
         self,
         url: str,
-        html: Optional[str] = None
+        html: Optional[str] = None,
+        page_metrics: Optional[Dict[str, Any]] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> Dict[str, Any]:
         """
         Analyze website performance metrics.
@@ -645,193 +880,121 @@ class WebsiteAnalyzer:
         Args:
             url: Website URL
             html: Optional pre-fetched HTML
+            page_metrics: Metrics captured by fetch_website(capture_metrics=True);
+                the page is loaded here only when these are missing
+            soup: Optional pre-parsed HTML (shared across analyzers)
 
         Returns:
             Dict with performance score, issues, and strengths
         """
         logger.info("website_analyzer.performance_analysis", url=url)
 
-        if not self.browser:
-            await self.start()
-
-        # We need to measure real performance with Playwright
-        context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080}
-        )
-        page = await context.new_page()
-
-        # Track performance metrics
-        metrics = {}
+        if page_metrics is None:
+            try:
+                website_data = await self.fetch_website(url, timeout=60000, capture_metrics=True)
+            except Exception as e:
+                logger.error("performance_analysis.failed", url=url, error=str(e))
+                raise
+            page_metrics = website_data["page_metrics"]
+            html = website_data["html"]
+            soup = None
 
-        try:
-            # Measure page load time
-            start_time = asyncio.get_event_loop().time()
-            response = await page.goto(url, timeout=60000, wait_until="domcontentloaded")
-            dom_load_time = asyncio.get_event_loop().time() - start_time
-
-            await page.wait_for_load_state("networkidle", timeout=60000)
-            full_load_time = asyncio.get_event_loop().time() - start_time
-
-            # Get performance metrics from browser
-            performance_timing = await page.evaluate("""
-                () => {
-                    const perfData = window.performance.timing;
-                    const navigation = window.performance.getEntriesByType('navigation')[0];
-                    return {
-                        domContentLoadedTime: perfData.domContentLoadedEventEnd - perfData.navigationStart,
-                        loadCompleteTime: perfData.loadEventEnd - perfData.navigationStart,
-                        domInteractive: perfData.domInteractive - perfData.navigationStart,
-                        firstPaint: navigation ? navigation.domContentLoadedEventEnd : null
-                    };
-                }
-            """)
-
-            # Analyze resources
-            resource_info = await page.evaluate("""
-                () => {
-                    const resources = window.performance.getEntriesByType('resource');
-
-                    let totalSize = 0;
-                    let scripts = [];
-                    let stylesheets = [];
-                    let images = [];
-                    let fonts = [];
-                    let renderBlocking = [];
-
-                    resources.forEach(resource => {
-                        const size = resource.transferSize || resource.decodedBodySize || 0;
-                        totalSize += size;
-
-                        if (resource.initiatorType === 'script' || resource.name.endsWith('.js')) {
-                            scripts.push({ name: resource.name, size: size, duration: resource.duration });
-                            if (resource.renderBlockingStatus === 'blocking') {
-                                renderBlocking.push(resource.name);
-                            }
-                        } else if (resource.initiatorType === 'link' || resource.name.endsWith('.css')) {
-                            stylesheets.push({ name: resource.name, size: size, duration: resource.duration });
-                            if (resource.renderBlockingStatus === 'blocking') {
-                                renderBlocking.push(resource.name);
-                            }
-                        } else if (resource.initiatorType === 'img' || /\\.(jpg|jpeg|png|gif|webp|svg)$/i.test(resource.name)) {
-                            images.push({ name: resource.name, size: size });
-                        } else if (/\\.(woff|woff2|ttf|otf)$/i.test(resource.name)) {
-                            fonts.push({ name: resource.name, size: size });
-                        }
-                    });
+        if soup is None:
+            soup = BeautifulSoup(html or "", 'html.parser')
 
-                    return {
-                        totalSize: totalSize,
-                        resourceCount: resources.length,
-                        scripts: scripts,
-                        stylesheets: stylesheets,
-                        images: images,
-                        fonts: fonts,
-                        renderBlocking: renderBlocking
-                    };
-                }
-            """)
+        dom_load_time = page_metrics["dom_load_time"]
+        full_load_time = page_metrics["full_load_time"]
+        performance_timing = page_metrics["performance_timing"]
+        resource_info = page_metrics["resource_info"]
 
-            # Get HTML for static analysis
-            html = await page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+        # Count inline scripts/styles
+        inline_scripts = len(soup.find_all('script', src=False))
+        inline_styles = len(soup.find_all('style'))
 
-            # Count inline scripts/styles
-            inline_scripts = len(soup.find_all('script', src=False))
-            inline_styles = len(soup.find_all('style'))
+        # Calculate scores and issues
+        score = 100
+        issues = []
+        strengths = []
 
-            await page.close()
-            await context.close()
+        # Load time scoring (30 points)
+        if full_load_time > 5:
+            issues.append(f"Slow page load ({full_load_time:.1f}s) - should be under 3s")
+            score -= 20
+        elif full_load_time > 3:
+            issues.append(f"Moderate load time ({full_load_time:.1f}s)")
+            score -= 10
+        else:
+            strengths.append(f"Fast load time ({full_load_time:.1f}s)")
 
-            # Calculate scores and issues
-            score = 100
-            issues = []
-            strengths = []
-
-            # Load time scoring (30 points)
-            if full_load_time > 5:
-                issues.append(f"Slow page load ({full_load_time:.1f}s) - should be under 3s")
-                score -= 20
-            elif full_load_time > 3:
-                issues.append(f"Moderate load time ({full_load_time:.1f}s)")
-                score -= 10
-            else:
-                strengths.append(f"Fast load time ({full_load_time:.1f}s)")
-
-            # Resource size (20 points)
-            total_mb = resource_info['totalSize'] / 1024 / 1024
-            if total_mb > 5:
-                issues.append(f"Large page size ({total_mb:.1f}MB) - should be under 3MB")
-                score -= 15
-            elif total_mb > 3:
-                issues.append(f"Moderate page size ({total_mb:.1f}MB)")
-                score -= 7
-            else:
-                strengths.append(f"Optimized page size ({total_mb:.1f}MB)")
-
-            # Script count (15 points)
-            script_count = len(resource_info['scripts']) + inline_scripts
-            if script_count > 20:
-                issues.append(f"Too many scripts ({script_count}) - reduces performance")
-                score -= 12
-            elif script_count > 10:
-                issues.append(f"Moderate script count ({script_count})")
-                score -= 5
-            else:
-                strengths.append(f"Reasonable script count ({script_count})")
-
-            # Stylesheet count (10 points)
-            style_count = len(resource_info['stylesheets']) + inline_styles
-            if style_count > 10:
-                issues.append(f"Too many stylesheets ({style_count})")
-                score -= 8
-            elif style_count > 5:
-                issues.append(f"Moderate stylesheet count ({style_count})")
-                score -= 3
-            else:
-                strengths.append(f"Minimal stylesheets ({style_count})")
+        # Resource size (20 points)
+        total_mb = resource_info['totalSize'] / 1024 / 1024
+        if total_mb > 5:
+            issues.append(f"Large page size ({total_mb:.1f}MB) - should be under 3MB")
+            score -= 15
+        elif total_mb > 3:
+            issues.append(f"Moderate page size ({total_mb:.1f}MB)")
+            score -= 7
+        else:
+            strengths.append(f"Optimized page size ({total_mb:.1f}MB)")
+
+        # Script count (15 points)
+        script_count = len(resource_info['scripts']) + inline_scripts
+        if script_count > 20:
+            issues.append(f"Too many scripts ({script_count}) - reduces performance")
+            score -= 12
+        elif script_count > 10:
+            issues.append(f"Moderate script count ({script_count})")
+            score -= 5
+        else:
+            strengths.append(f"Reasonable script count ({script_count})")
 
-            # Image optimization (15 points)
-            large_images = [img for img in resource_info['images'] if img['size'] > 500000]
-            if large_images:
-                issues.append(f"{len(large_images)} unoptimized images over 500KB")
-                score -= min(15, len(large_images) * 3)
-            else:
-                strengths.append("Images appear optimized")
+        # Stylesheet count (10 points)
+        style_count = len(resource_info['stylesheets']) + inline_styles
+        if style_count > 10:
+            issues.append(f"Too many stylesheets ({style_count})")
+            score -= 8
+        elif style_count > 5:
+            issues.append(f"Moderate stylesheet count ({style_count})")
+            score -= 3
+        else:
+            strengths.append(f"Minimal stylesheets ({style_count})")
 
-            # Render-blocking resources (10 points)
-            if len(resource_info['renderBlocking']) > 0:
-                issues.append(f"{len(resource_info['renderBlocking'])} render-blocking resources")
-                score -= 10
-            else:
-                strengths.append("No render-blocking resources detected")
+        # Image optimization (15 points)
+        large_images = [img for img in resource_info['images'] if img['size'] > 500000]
+        if large_images:
+            issues.append(f"{len(large_images)} unoptimized images over 500KB")
+            score -= min(15, len(large_images) * 3)
+        else:
+            strengths.append("Images appear optimized")
 
-            metrics = {
-                "load_times": {
-                    "dom_content_loaded": round(dom_load_time, 2),
-                    "full_load": round(full_load_time, 2),
-                    "dom_interactive": round(performance_timing.get('domInteractive', 0) / 1000, 2)
-                },
-                "resources": {
-                    "total_size_mb": round(total_mb, 2),
-                    "total_count": resource_info['resourceCount'],
-                    "scripts": len(resource_info['scripts']),
-                    "stylesheets": len(resource_info['stylesheets']),
-                    "images": len(resource_info['images']),
-                    "fonts": len(resource_info['fonts']),
-                    "inline_scripts": inline_scripts,
-                    "inline_styles": inline_styles
-                },
-                "optimization": {
-                    "large_images": len(large_images),
-                    "render_blocking": len(resource_info['renderBlocking'])
-                }
+        # Render-blocking resources (10 points)
+        if len(resource_info['renderBlocking']) > 0:
+            issues.append(f"{len(resource_info['renderBlocking'])} render-blocking resources")
+            score -= 10
+        else:
+            strengths.append("No render-blocking resources detected")
+
+        metrics = {
+            "load_times": {
+                "dom_content_loaded": round(dom_load_time, 2),
+                "full_load": round(full_load_time, 2),
+                "dom_interactive": round(performance_timing.get('domInteractive', 0) / 1000, 2)
+            },
+            "resources": {
+                "total_size_mb": round(total_mb, 2),
+                "total_count": resource_info['resourceCount'],
+                "scripts": len(resource_info['scripts']),
+                "stylesheets": len(resource_info['stylesheets']),
+                "images": len(resource_info['images']),
+                "fonts": len(resource_info['fonts']),
+                "inline_scripts": inline_scripts,
+                "inline_styles": inline_styles
+            },
+            "optimization": {
+                "large_images": len(large_images),
+                "render_blocking": len(resource_info['renderBlocking'])
             }
-
-        except Exception as e:
-            logger.error("performance_analysis.failed", url=url, error=str(e))
-            await page.close()
-            await context.close()
-            raise
+        }
 
         return {
             "score": max(0, score),
@@ -843,7 +1006,8 @@ class WebsiteAnalyzer:
     async def analyze_accessibility(
         self,
         url: str,
-        html: Optional[str] = None
+        html: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> Dict[str, Any]:
         """
         Analyze website accessibility (WCAG compliance).
@@ -851,17 +1015,19 @@ class WebsiteAnalyzer:
         Args:
             url: Website URL
             html: Optional pre-fetched HTML
+            soup: Optional pre-parsed HTML (shared across analyzers)
 
         Returns:
             Dict with accessibility score, issues, and strengths
         """
         logger.info("website_analyzer.accessibility_analysis", url=url)
 
-        if not html:
+        if not html and soup is None:
             website_data = await self.fetch_website(url)
             html = website_data["html"]
 
-        soup = BeautifulSoup(html, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(html, 'html.parser')
 
         score = 100
         issues = []
@@ -1016,36 +1182,52 @@ class WebsiteAnalyzer:
     async def analyze_website_comprehensive(
         self,
         url: str,
-        include_ai_design: bool = False
+        include_ai_design: bool = False,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Perform comprehensive website analysis with all metrics.
 
+        The page is loaded once (performance timings and computed styles are
+        captured during that navigation) and parsed once; all analyzers share
+        the parsed document.
+
         Args:
             url: Website URL
             include_ai_design: Include AI-powered design assessment (slower, costs tokens)
+            use_cache: Reuse the previous analysis if the page is unchanged
 
         Returns:
             Dict with design, SEO, performance, and accessibility scores
         """
         logger.info("website_analyzer.comprehensive_analysis", url=url)
 
+        page, cached = (None, None)
+        if use_cache:
+            page, cached = await self._lookup_cached(
+                url, "comprehensive", include_ai_design=include_ai_design
+            )
+        if cached is not None:
+            return {**cached, "url": url, "cached": True}
+
         # Fetch website once
-        website_data = await self.fetch_website(url)
+        website_data = await self.fetch_website(url, timeout=60000, capture_metrics=True)
         html = website_data["html"]
+        page_metrics = website_data["page_metrics"]
 
-        # Run all analyses (some in parallel where possible)
-        design_task = self.analyze_design_quality(url, html, use_ai=include_ai_design)
-        seo_task = self.analyze_seo(url, html)
-        accessibility_task = self.analyze_accessibility(url, html)
+        # Parse once, off the event loop
+        soup = await asyncio.to_thread(BeautifulSoup, html, 'html.parser')
 
-        # Performance needs to be separate (requires fresh page load)
-        design, seo, accessibility = await asyncio.gather(
-            design_task, seo_task, accessibility_task
+        design, seo, performance, accessibility = await asyncio.gather(
+            self.analyze_design_quality(
+                url, html, use_ai=include_ai_design, soup=soup,
+                design_context=page_metrics["design_context"]
+            ),
+            self.analyze_seo(url, html, soup=soup),
+            self.analyze_performance(url, html, page_metrics=page_metrics, soup=soup),
+            self.analyze_accessibility(url, html, soup=soup)
         )
 
-        performance = await self.analyze_performance(url)
-
         # Calculate overall score
         overall_score = (
             design["score"] * 0.25 +
@@ -1054,7 +1236,7 @@ class WebsiteAnalyzer:
             accessibility["score"] * 0.20
         )
 
-        return {
+        result = {
             "url": url,
             "overall_score": round(overall_score, 1),
             "design": design,
@@ -1066,6 +1248,80 @@ class WebsiteAnalyzer:
             "meta_description": website_data["meta_description"]
         }
 
+        if page is not None:
+            result["content_hash"] = page.content_hash
+            await self.site_cache.put_derived(
+                page.content_hash,
+                "comprehensive",
+                ANALYSIS_CACHE_VERSION,
+                result,
+                include_ai_design=include_ai_design
+            )
+
+        return result
+
+    async def analyze_batch(
+        self,
+        urls: List[str],
+        include_ai_design: bool = False,
+        max_concurrent: Optional[int] = None,
+        per_domain_limit: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Run comprehensive analysis over a queue of lead URLs.
+
+        Pages load concurrently through the warm context pool, with at most
+        `per_domain_limit` in flight per domain so one site is never hammered.
+        A URL waiting on its domain does not hold a global slot.
+
+        Args:
+            urls: URLs to analyze
+            include_ai_design: Include AI-powered design assessment
+            max_concurrent: Max analyses in flight (default: context pool size)
+            per_domain_limit: Max analyses in flight per domain
+
+        Returns:
+            List of analysis results in input order ({"url", "error"} on failure)
+        """
+        logger.info("website_analyzer.batch_comprehensive_start", total=len(urls))
+
+        if not self.browser:
+            await self.start()
+
+        global_slots = asyncio.Semaphore(max_concurrent or self.context_pool_size)
+        domain_slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_domain_limit)
+        )
+
+        async def analyze_one(url: str) -> Dict[str, Any]:
+            async with domain_slots[self._domain_key(url)]:
+                async with global_slots:
+                    try:
+                        return await self.analyze_website_comprehensive(
+                            url, include_ai_design=include_ai_design
+                        )
+                    except Exception as e:
+                        logger.error("website_analyzer.batch_error", url=url, error=str(e))
+                        return {"url": url, "error": str(e)}
+
+        results = await asyncio.gather(*(analyze_one(url) for url in urls))
+
+        success_count = sum(1 for r in results if "error" not in r)
+        logger.info(
+            "website_analyzer.batch_comprehensive_complete",
+            total=len(urls),
+            success=success_count,
+            failed=len(urls) - success_count
+        )
+
+        return results
+
+    @staticmethod
+    def _domain_key(url: str) -> str:
+        """Host used for per-domain limits (``www.`` ignored)."""
+        host = (urlparse(url).hostname or url).lower()
+        return host[4:] if host.startswith("www.") else host
+
     # ==================== HELPER METHODS FOR DESIGN ANALYSIS ====================
 
     def _detect_layout_type(self, soup: BeautifulSoup) -> str:
@@ -10,44 +10,32 @@ from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
-try:
-    import openai
-except ImportError:
-    openai = None
-    
-try:
-    from anthropic import Anthropic
-except ImportError:
-    Anthropic = None
-
 from app.core.database import get_db
 from app.models.leads import Lead
 from app.models.response_templates import ResponseTemplate
 # Note: AutoResponse and ResponseVariable don't exist yet
 from app.core.config import settings
+from app.services.llm_gateway import llm_gateway
 
 
 logger = logging.getLogger(__name__)
 
 
 class AIProvider:
-    """AI provider interface for generating responses."""
+    """AI provider interface for generating responses (via the shared LLM gateway)."""
+    
+    # Chat model used for each provider
+    MODELS = {
+        "openai": "gpt-4",
+        "anthropic": "claude-3-sonnet-20240229",
+        "openrouter": settings.AI_MODEL_DEFAULT,
+    }
     
     def __init__(self, provider_type: str = "openai"):
-        self.provider_type = provider_type
-        
-        if provider_type == "openai":
-            if openai:
-                self.client = openai.AsyncOpenAI(api_key=getattr(settings, 'OPENAI_API_KEY', None))
-            else:
-                self.client = None
-        elif provider_type == "anthropic":
-            if Anthropic:
-                self.client = Anthropic(api_key=getattr(settings, 'ANTHROPIC_API_KEY', None))
-            else:
-                self.client = None
-        else:
+        if provider_type not in self.MODELS:
             raise ValueError(f"Unsupported AI provider: {provider_type}")
+        self.provider_type = provider_type
+        self.model = self.MODELS[provider_type]
     
     async def generate_response(
         self, 
@@ -57,52 +45,50 @@ class AIProvider:
     ) -> str:
         """Generate AI-powered response."""
         try:
-            if self.provider_type == "openai":
-                return await self._generate_openai_response(prompt, tone, max_length)
-            elif self.provider_type == "anthropic":
+            if self.provider_type == "anthropic":
                 return await self._generate_anthropic_response(prompt, tone, max_length)
+            return await self._generate_chat_response(prompt, tone, max_length)
         except Exception as e:
             logger.error(f"AI response generation failed: {e}")
             raise
     
-    async def _generate_openai_response(self, prompt: str, tone: str, max_length: int) -> str:
-        """Generate response using OpenAI."""
-        system_message = f"""
+    def _system_message(self, tone: str, max_length: int) -> str:
+        return f"""
         You are an expert sales professional writing personalized responses to potential leads.
         Write in a {tone} tone and keep the response under {max_length} characters.
         Be specific, helpful, and focus on building rapport.
         Always include a clear call to action.
         """
-        
-        response = await self.client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_message},
+    
+    async def _generate_chat_response(self, prompt: str, tone: str, max_length: int) -> str:
+        """Generate response using an OpenAI-compatible chat API (OpenAI, OpenRouter)."""
+        data = await llm_gateway.chat_completion(
+            [
+                {"role": "system", "content": self._system_message(tone, max_length)},
                 {"role": "user", "content": prompt}
             ],
+            model=self.model,
+            provider=self.provider_type,
             max_tokens=max_length // 4,  # Rough approximation
             temperature=0.7
         )
         
-        return response.choices[0].message.content.strip()
+        return data["choices"][0]["message"]["content"].strip()
     
     async def _generate_anthropic_response(self, prompt: str, tone: str, max_length: int) -> str:
         """Generate response using Anthropic Claude."""
-        system_message = f"""
-        You are an expert sales professional writing personalized responses to potential leads.
-        Write in a {tone} tone and keep the response under {max_length} characters.
-        Be specific, helpful, and focus on building rapport.
-        Always include a clear call to action.
-        """
-        
-        message = self.client.messages.create(
-            model="claude-3-sonnet-20240229",
-            max_tokens=max_length // 4,
-            system=system_message,
-            messages=[{"role": "user", "content": prompt}]
+        data = await llm_gateway.request(
+            "anthropic",
+            "/messages",
+            {
+                "model": self.model,
+                "max_tokens": max_length // 4,
+                "system": self._system_message(tone, max_length),
+                "messages": [{"role": "user", "content": prompt}]
+            }
         )
         
-        return message.content[0].text.strip()
+        return data["content"][0]["text"].strip()
 
 
 class TemplateEngine:
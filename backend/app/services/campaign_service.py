@@ -8,7 +8,10 @@ import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import select, update, delete, func, and_, or_, desc, asc
+from sqlalchemy import (
+    Integer, select, update, delete, func, and_, or_, not_, desc, asc, literal, any_, bindparam
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,7 +25,9 @@ from app.schemas.campaigns import (
     EmailEventTypeEnum,
     CampaignFilters,
     RecipientFilters,
+    RecipientLeadFilter,
 )
+from app.services import campaign_stats
 
 logger = logging.getLogger(__name__)
 
@@ -283,6 +288,8 @@ class CampaignService:
         """
         Add recipients to campaign from lead IDs.
 
+        Thin wrapper over add_recipients_bulk() kept for existing callers.
+
         Args:
             campaign_id: Campaign ID
             lead_ids: List of lead IDs to add
@@ -293,6 +300,59 @@ class CampaignService:
         Raises:
             ValueError: If campaign not found or invalid state
         """
+        counts = await self.add_recipients_bulk(campaign_id, lead_ids=lead_ids)
+
+        errors = []
+        if counts["duplicates"]:
+            errors.append(f"{counts['duplicates']} leads already added to campaign")
+        if counts["invalid"]:
+            errors.append(f"{counts['invalid']} leads not found or without email address")
+
+        return counts["added"], errors
+
+    async def add_recipients_bulk(
+        self,
+        campaign_id: int,
+        lead_ids: Optional[List[int]] = None,
+        lead_filter: Optional[RecipientLeadFilter] = None,
+    ) -> Dict[str, int]:
+        """
+        Add recipients to a campaign with a single INSERT ... SELECT.
+
+        Leads are resolved in the database (either by ID or by filter), leads
+        without an email are skipped, and existing recipients are ignored via
+        ON CONFLICT (campaign_id, lead_id) DO NOTHING. The campaign's
+        total_recipients counter is bumped in the same statement, so nothing
+        is loaded into Python and the transaction stays short regardless of
+        segment size.
+
+        Args:
+            campaign_id: Campaign ID
+            lead_ids: Explicit lead IDs to add
+            lead_filter: Lead filter selecting the leads to add
+
+        Returns:
+            Dictionary with matched, added, duplicates and invalid counts
+
+        Raises:
+            ValueError: If campaign not found, invalid state, no lead source
+                or a lead filter without any criteria
+        """
+        if (lead_ids is None) == (lead_filter is None):
+            raise ValueError("Provide exactly one of lead_ids or lead_filter")
+
+        if lead_ids is not None:
+            if not lead_ids:
+                return {"matched": 0, "added": 0, "duplicates": 0, "invalid": 0}
+            # One array parameter instead of one bind per ID (asyncpg caps a
+            # statement at 32767 parameters)
+            conditions = [Lead.id == any_(bindparam("lead_ids", value=list(lead_ids), type_=ARRAY(Integer)))]
+        else:
+            conditions = self._lead_filter_conditions(lead_filter)
+            if not conditions:
+                # An empty filter would match every lead in the database
+                raise ValueError("Lead filter must set at least one criterion")
+
         try:
             campaign = await self.get_campaign(campaign_id)
             if not campaign:
@@ -302,61 +362,95 @@ class CampaignService:
             if campaign.status in [CampaignStatusEnum.RUNNING, CampaignStatusEnum.COMPLETED]:
                 raise ValueError(f"Cannot add recipients to campaign in '{campaign.status}' status")
 
-            # Fetch leads
-            stmt = select(Lead).where(Lead.id.in_(lead_ids))
-            result = await self.db.execute(stmt)
-            leads = result.scalars().all()
-
-            # Track results
-            successful = 0
-            errors = []
-
-            for lead in leads:
-                try:
-                    # Validate lead has email
-                    if not lead.email:
-                        errors.append(f"Lead {lead.id} has no email address")
-                        continue
-
-                    # Check if already added
-                    existing_stmt = select(CampaignRecipient).where(
-                        and_(
-                            CampaignRecipient.campaign_id == campaign_id,
-                            CampaignRecipient.lead_id == lead.id
-                        )
-                    )
-                    existing_result = await self.db.execute(existing_stmt)
-                    if existing_result.scalar_one_or_none():
-                        errors.append(f"Lead {lead.id} already added to campaign")
-                        continue
-
-                    # Create recipient
-                    recipient = CampaignRecipient(
-                        campaign_id=campaign_id,
-                        lead_id=lead.id,
-                        email_address=lead.email,
-                        status=RecipientStatusEnum.PENDING,
-                    )
-                    self.db.add(recipient)
-                    successful += 1
-
-                except Exception as e:
-                    errors.append(f"Lead {lead.id}: {str(e)}")
-                    logger.error(f"Failed to add lead {lead.id} to campaign: {e}")
+            candidates = (
+                select(Lead.id.label("lead_id"), Lead.email.label("email"))
+                .where(*conditions)
+                .cte("candidates")
+            )
+            has_email = and_(candidates.c.email.isnot(None), candidates.c.email != "")
+
+            inserted = (
+                pg_insert(CampaignRecipient)
+                .from_select(
+                    ["campaign_id", "lead_id", "email_address", "status"],
+                    select(
+                        literal(campaign_id),
+                        candidates.c.lead_id,
+                        candidates.c.email,
+                        literal(RecipientStatusEnum.PENDING.value),
+                    ).where(has_email),
+                )
+                .on_conflict_do_nothing(index_elements=["campaign_id", "lead_id"])
+                .returning(CampaignRecipient.lead_id)
+                .cte("inserted")
+            )
+            added_count = select(func.count()).select_from(inserted).scalar_subquery()
+
+            bumped = (
+                update(Campaign)
+                .where(Campaign.id == campaign_id)
+                .values(total_recipients=Campaign.total_recipients + added_count)
+                .returning(Campaign.id)
+                .cte("bumped")
+            )
 
-            # Update campaign recipient count
-            campaign.total_recipients = campaign.total_recipients + successful
+            stmt = select(
+                select(func.count()).select_from(candidates).scalar_subquery().label("matched"),
+                select(func.count()).select_from(candidates).where(not_(has_email))
+                .scalar_subquery().label("without_email"),
+                added_count.label("added"),
+                select(func.count()).select_from(bumped).scalar_subquery().label("bumped"),
+            )
 
+            row = (await self.db.execute(stmt)).one()
             await self.db.commit()
 
-            logger.info(f"Added {successful} recipients to campaign {campaign.campaign_id}")
-            return successful, errors
+            # Unknown lead IDs count as invalid alongside leads without email
+            not_found = len(lead_ids) - row.matched if lead_ids is not None else 0
+            counts = {
+                "matched": row.matched,
+                "added": row.added,
+                "duplicates": row.matched - row.without_email - row.added,
+                "invalid": row.without_email + not_found,
+            }
+
+            logger.info(
+                f"Added {counts['added']} recipients to campaign {campaign.campaign_id} "
+                f"({counts['duplicates']} duplicates, {counts['invalid']} invalid)"
+            )
+            return counts
 
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Failed to add recipients to campaign {campaign_id}: {e}")
             raise
 
+    @staticmethod
+    def _lead_filter_conditions(lead_filter: RecipientLeadFilter) -> List[Any]:
+        """Translate a recipient lead filter into SQL conditions on Lead."""
+        conditions = []
+
+        if lead_filter.location_id:
+            conditions.append(Lead.location_id == lead_filter.location_id)
+        if lead_filter.status:
+            conditions.append(Lead.status == lead_filter.status)
+        if lead_filter.source:
+            conditions.append(Lead.source == lead_filter.source)
+        if lead_filter.category:
+            conditions.append(Lead.category == lead_filter.category)
+        if lead_filter.is_processed is not None:
+            conditions.append(Lead.is_processed == lead_filter.is_processed)
+        if lead_filter.is_contacted is not None:
+            conditions.append(Lead.is_contacted == lead_filter.is_contacted)
+        if lead_filter.min_qualification_score is not None:
+            conditions.append(Lead.qualification_score >= lead_filter.min_qualification_score)
+        if lead_filter.scraped_after:
+            conditions.append(Lead.scraped_at >= lead_filter.scraped_after)
+        if lead_filter.scraped_before:
+            conditions.append(Lead.scraped_at <= lead_filter.scraped_before)
+
+        return conditions
+
     async def get_recipients(
         self,
         campaign_id: int,
@@ -553,6 +647,8 @@ class CampaignService:
                     "failed": 0,
                     "errors": []
                 }
+                rollup = campaign_stats.new_deltas()
+                bucket = campaign_stats.hour_bucket()
 
                 for recipient in recipients:
                     try:
@@ -561,13 +657,15 @@ class CampaignService:
                         if not lead or not lead.email:
                             logger.warning(f"Recipient {recipient.id} has no valid email")
                             recipient.status = RecipientStatusEnum.FAILED
+                            rollup[(campaign.id, bucket)]["failed"] += 1
                             results["failed"] += 1
                             continue
 
                         # Generate tracking token
                         tracking_token = email_service._generate_tracking_token(
                             campaign.id,
-                            lead.id
+                            lead.id,
+                            recipient_id=recipient.id
                         )
 
                         # TODO: Get actual template from database
@@ -607,6 +705,7 @@ class CampaignService:
                         recipient.status = RecipientStatusEnum.SENT
                         recipient.sent_at = datetime.utcnow()
                         campaign.emails_sent += 1
+                        rollup[(campaign.id, bucket)]["sent"] += 1
 
                         results["sent"] += 1
                         logger.info(f"Sent email to {lead.email} for campaign {campaign_id}")
@@ -615,6 +714,7 @@ class CampaignService:
                         logger.error(f"Failed to send email to recipient {recipient.id}: {e}")
                         recipient.status = RecipientStatusEnum.FAILED
                         campaign.emails_failed += 1
+                        rollup[(campaign.id, bucket)]["failed"] += 1
                         results["failed"] += 1
                         results["errors"].append({
                             "recipient_id": recipient.id,
@@ -641,6 +741,7 @@ class CampaignService:
                     campaign.completed_at = datetime.utcnow()
                     logger.info(f"Campaign {campaign_id} completed")
 
+                await campaign_stats.apply_deltas(self.db, rollup)
                 await self.db.commit()
                 sync_db.commit()
 
@@ -835,6 +936,9 @@ class CampaignService:
         """
         Get real-time campaign statistics.
 
+        Reads the hourly rollups (see app.services.campaign_stats) rather than
+        aggregating recipients, so polling stays cheap for large campaigns.
+
         Args:
             campaign_id: Campaign ID
 
@@ -846,20 +950,14 @@ class CampaignService:
             if not campaign:
                 return None
 
-            # Get recipient status counts
-            status_counts_stmt = select(
-                CampaignRecipient.status,
-                func.count(CampaignRecipient.id).label("count")
-            ).where(
-                CampaignRecipient.campaign_id == campaign_id
-            ).group_by(CampaignRecipient.status)
-
-            status_result = await self.db.execute(status_counts_stmt)
-            status_counts = {row.status: row.count for row in status_result}
+            # Lifetime totals from the hourly rollups
+            totals = await campaign_stats.get_totals(self.db, campaign_id)
 
             # Calculate progress
             total_recipients = campaign.total_recipients
-            sent = status_counts.get(RecipientStatusEnum.SENT, 0)
+            sent = totals["sent"]
+            unsent = max(total_recipients - sent - totals["failed"], 0)
+            not_launched = campaign.status in (CampaignStatusEnum.DRAFT, CampaignStatusEnum.SCHEDULED)
             progress_percentage = (sent / total_recipients * 100) if total_recipients > 0 else 0
 
             # Calculate estimated completion time
@@ -878,11 +976,11 @@ class CampaignService:
                 "campaign_name": campaign.name,
                 "status": campaign.status,
                 "total_recipients": total_recipients,
-                "pending": status_counts.get(RecipientStatusEnum.PENDING, 0),
-                "queued": status_counts.get(RecipientStatusEnum.QUEUED, 0),
+                "pending": unsent if not_launched else 0,
+                "queued": 0 if not_launched else unsent,
                 "sent": sent,
-                "failed": status_counts.get(RecipientStatusEnum.FAILED, 0),
-                "bounced": status_counts.get(RecipientStatusEnum.BOUNCED, 0),
+                "failed": totals["failed"],
+                "bounced": totals["bounced"],
                 "opened": campaign.emails_opened,
                 "clicked": campaign.emails_clicked,
                 "replied": campaign.emails_replied,
@@ -927,8 +1025,9 @@ class CampaignService:
             if not campaign:
                 return None
 
-            # Get basic stats
+            # Get basic stats and hourly time series from the rollups
             stats = await self.get_campaign_stats(campaign_id)
+            hourly = await campaign_stats.get_hourly(self.db, campaign_id)
 
             # Get tracking events for analytics
             tracking_stmt = select(EmailTracking).join(
@@ -969,9 +1068,15 @@ class CampaignService:
             analytics = {
                 "campaign": campaign.to_dict(),
                 "stats": stats,
-                "hourly_sends": [],  # TODO: Implement time series data
-                "hourly_opens": [],  # TODO: Implement time series data
-                "hourly_clicks": [],  # TODO: Implement time series data
+                "hourly_sends": [
+                    {"hour": row["hour"], "count": row["sent"]} for row in hourly if row["sent"]
+                ],
+                "hourly_opens": [
+                    {"hour": row["hour"], "count": row["opens"]} for row in hourly if row["opens"]
+                ],
+                "hourly_clicks": [
+                    {"hour": row["hour"], "count": row["clicks"]} for row in hourly if row["clicks"]
+                ],
                 "opens_by_location": opens_by_location,
                 "clicks_by_location": {},  # TODO: Implement
                 "opens_by_device": opens_by_device,
@@ -1041,28 +1146,40 @@ class CampaignService:
             # Update recipient timestamps and campaign metrics
             now = datetime.utcnow()
             campaign = await self.get_campaign(recipient.campaign_id)
+            rollup = campaign_stats.new_deltas()
+            counters = rollup[(recipient.campaign_id, campaign_stats.hour_bucket())]
 
             if event_type == EmailEventTypeEnum.OPEN:
+                counters["opens"] += 1
                 if not recipient.opened_at:
                     recipient.opened_at = now
                     campaign.emails_opened += 1
+                    counters["unique_opens"] += 1
 
             elif event_type == EmailEventTypeEnum.CLICK:
+                counters["clicks"] += 1
                 if not recipient.clicked_at:
                     recipient.clicked_at = now
                     campaign.emails_clicked += 1
+                    counters["unique_clicks"] += 1
 
             elif event_type == EmailEventTypeEnum.BOUNCE:
                 if not recipient.bounced_at:
                     recipient.bounced_at = now
                     recipient.status = RecipientStatusEnum.BOUNCED
                     campaign.emails_bounced += 1
+                    counters["bounced"] += 1
 
             elif event_type == EmailEventTypeEnum.REPLY:
                 if not recipient.replied_at:
                     recipient.replied_at = now
                     campaign.emails_replied += 1
+                    counters["replies"] += 1
+
+            elif event_type == EmailEventTypeEnum.UNSUBSCRIBE:
+                counters["unsubscribes"] += 1
 
+            await campaign_stats.apply_deltas(self.db, rollup)
             await self.db.commit()
             await self.db.refresh(tracking)
 
@@ -0,0 +1,243 @@
+"""
+Campaign Stats Store
+
+Incrementally maintained per-campaign, per-hour statistics.
+
+Writers (send path, tracking recorder, bounce/reply tracking) add counter
+deltas to `campaign_stats_hourly` with an upsert inside their own
+transaction. Readers sum a campaign's hourly rows, which is a handful of rows
+per campaign instead of a scan over campaign_recipients and email_tracking.
+`rebuild()` recomputes the rollups from raw events for backfills.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.campaign_metrics import CampaignStatsHourly
+from app.models.campaigns import CampaignRecipient, EmailTracking
+
+logger = logging.getLogger(__name__)
+
+
+COUNTERS = (
+    "sent",
+    "failed",
+    "bounced",
+    "opens",
+    "unique_opens",
+    "clicks",
+    "unique_clicks",
+    "replies",
+    "unsubscribes",
+)
+
+# Deltas keyed by (campaign_id, hour bucket) -> counter -> increment
+StatsDeltas = Dict[Tuple[int, datetime], Dict[str, int]]
+
+
+def hour_bucket(moment: Optional[datetime] = None) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour."""
+    moment = moment or datetime.now(timezone.utc)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def new_deltas() -> StatsDeltas:
+    """Create an empty delta accumulator."""
+    return defaultdict(lambda: defaultdict(int))
+
+
+def build_upsert(deltas: StatsDeltas):
+    """
+    Build one INSERT ... ON CONFLICT DO UPDATE adding all deltas.
+
+    Works on both sync and async sessions.
+
+    Returns:
+        Statement, or None if there is nothing to apply
+    """
+    rows = []
+    for (campaign_id, bucket), counters in deltas.items():
+        if not any(counters.values()):
+            continue
+        row = {name: counters.get(name, 0) for name in COUNTERS}
+        row.update(campaign_id=campaign_id, bucket=bucket)
+        rows.append(row)
+
+    if not rows:
+        return None
+
+    stmt = pg_insert(CampaignStatsHourly).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["campaign_id", "bucket"],
+        set_={
+            name: getattr(CampaignStatsHourly, name) + getattr(stmt.excluded, name)
+            for name in COUNTERS
+        },
+    )
+
+
+async def apply_deltas(session, deltas: StatsDeltas) -> None:
+    """Add deltas to the hourly rollups within the caller's transaction."""
+    stmt = build_upsert(deltas)
+    if stmt is not None:
+        await session.execute(stmt)
+
+
+def apply_deltas_sync(session, deltas: StatsDeltas) -> None:
+    """Synchronous variant of apply_deltas() for Celery workers."""
+    stmt = build_upsert(deltas)
+    if stmt is not None:
+        session.execute(stmt)
+
+
+def _totals_query(campaign_ids: Iterable[int]):
+    return (
+        select(
+            CampaignStatsHourly.campaign_id,
+            *[func.coalesce(func.sum(getattr(CampaignStatsHourly, name)), 0).label(name) for name in COUNTERS],
+        )
+        .where(CampaignStatsHourly.campaign_id.in_(list(campaign_ids)))
+        .group_by(CampaignStatsHourly.campaign_id)
+    )
+
+
+def _empty_totals() -> Dict[str, int]:
+    return {name: 0 for name in COUNTERS}
+
+
+async def get_totals(session, campaign_id: int) -> Dict[str, int]:
+    """Get lifetime counter totals for one campaign."""
+    totals = await get_totals_many(session, [campaign_id])
+    return totals.get(campaign_id, _empty_totals())
+
+
+async def get_totals_many(session, campaign_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """Get lifetime counter totals for several campaigns in one query."""
+    if not campaign_ids:
+        return {}
+    result = await session.execute(_totals_query(campaign_ids))
+    return {row.campaign_id: {name: int(getattr(row, name)) for name in COUNTERS} for row in result}
+
+
+def get_totals_many_sync(session, campaign_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """Synchronous variant of get_totals_many() for Celery workers."""
+    if not campaign_ids:
+        return {}
+    result = session.execute(_totals_query(campaign_ids))
+    return {row.campaign_id: {name: int(getattr(row, name)) for name in COUNTERS} for row in result}
+
+
+async def get_hourly(session, campaign_id: int) -> List[Dict[str, Any]]:
+    """Get the hourly time series for one campaign, oldest first."""
+    result = await session.execute(
+        select(CampaignStatsHourly)
+        .where(CampaignStatsHourly.campaign_id == campaign_id)
+        .order_by(CampaignStatsHourly.bucket)
+    )
+    return [
+        {"hour": row.bucket.isoformat(), **{name: getattr(row, name) for name in COUNTERS}}
+        for row in result.scalars()
+    ]
+
+
+def _rebuild_source(campaign_id: Optional[int]):
+    """
+    Select (campaign_id, bucket, counter columns) rows from raw data.
+
+    Sends, failures and first opens/clicks come from recipient timestamps;
+    total opens/clicks, replies and unsubscribes from tracking events.
+    """
+    def recipient_part(timestamp_column, counter, extra_condition=None):
+        conditions = [timestamp_column.isnot(None)]
+        if extra_condition is not None:
+            conditions.append(extra_condition)
+        if campaign_id is not None:
+            conditions.append(CampaignRecipient.campaign_id == campaign_id)
+        return select(
+            CampaignRecipient.campaign_id.label("campaign_id"),
+            func.date_trunc("hour", timestamp_column).label("bucket"),
+            *[
+                (literal(1) if name == counter else literal(0)).label(name)
+                for name in COUNTERS
+            ],
+        ).where(and_(*conditions))
+
+    def event_part(event_type, counter):
+        conditions = [EmailTracking.event_type == event_type]
+        if campaign_id is not None:
+            conditions.append(CampaignRecipient.campaign_id == campaign_id)
+        return (
+            select(
+                CampaignRecipient.campaign_id.label("campaign_id"),
+                func.date_trunc("hour", EmailTracking.created_at).label("bucket"),
+                *[
+                    (literal(1) if name == counter else literal(0)).label(name)
+                    for name in COUNTERS
+                ],
+            )
+            .select_from(EmailTracking)
+            .join(CampaignRecipient, EmailTracking.campaign_recipient_id == CampaignRecipient.id)
+            .where(and_(*conditions))
+        )
+
+    return union_all(
+        recipient_part(CampaignRecipient.sent_at, "sent"),
+        recipient_part(CampaignRecipient.updated_at, "failed", CampaignRecipient.status == "failed"),
+        recipient_part(CampaignRecipient.bounced_at, "bounced"),
+        recipient_part(CampaignRecipient.opened_at, "unique_opens"),
+        recipient_part(CampaignRecipient.clicked_at, "unique_clicks"),
+        event_part("open", "opens"),
+        event_part("click", "clicks"),
+        event_part("reply", "replies"),
+        event_part("unsubscribe", "unsubscribes"),
+    ).subquery("raw")
+
+
+async def rebuild(session, campaign_id: Optional[int] = None) -> int:
+    """
+    Rebuild hourly rollups from raw recipients and tracking events.
+
+    Args:
+        session: Async database session (committed by this function)
+        campaign_id: Rebuild a single campaign, or all campaigns if None
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    raw = _rebuild_source(campaign_id)
+
+    clear = delete(CampaignStatsHourly)
+    if campaign_id is not None:
+        clear = clear.where(CampaignStatsHourly.campaign_id == campaign_id)
+
+    aggregated = select(
+        raw.c.campaign_id,
+        raw.c.bucket,
+        *[cast(func.sum(raw.c[name]), Integer).label(name) for name in COUNTERS],
+    ).group_by(raw.c.campaign_id, raw.c.bucket)
+
+    fill = pg_insert(CampaignStatsHourly).from_select(
+        ["campaign_id", "bucket", *COUNTERS],
+        aggregated,
+    )
+
+    try:
+        await session.execute(clear)
+        result = await session.execute(fill)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+    logger.info(
+        f"Rebuilt {result.rowcount} campaign stats rows"
+        + (f" for campaign {campaign_id}" if campaign_id is not None else "")
+    )
+    return result.rowcount
@@ -13,12 +13,14 @@ Based on UX_FLOW_CONVERSATIONS.md requirements.
 
 import json
 import re
+import uuid
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
 import structlog
 
-from app.services.ai_mvp.ai_council import AICouncil, Message
+from app.core.event_batching import AI_EVENTS_CHANNEL, async_event_publisher
+from app.services.ai_mvp.ai_council import AICouncil, AICouncilResponse, Message
 from app.services.ai_mvp.semantic_router import TaskType
 from app.services.vector_store import VectorStore
 
@@ -196,7 +198,8 @@ Return ONLY valid JSON matching this schema. Be accurate and concise."""
         lead_context: Dict[str, Any],
         lead_id: Optional[int] = None,
         lead_value: Optional[float] = None,
-        tone_preference: str = "professional"
+        tone_preference: str = "professional",
+        stream_conversation_id: Optional[int] = None
     ) -> GeneratedReply:
         """
         Generate a contextual, personalized reply.
@@ -209,6 +212,8 @@ Return ONLY valid JSON matching this schema. Be accurate and concise."""
             lead_id: Lead ID for tracking
             lead_value: Estimated deal value (affects model routing)
             tone_preference: Desired tone ("professional", "friendly", etc.)
+            stream_conversation_id: If set, push the reply to this conversation's
+                websocket room as it is written (ai:response_partial events)
 
         Returns:
             GeneratedReply with AI-generated response
@@ -285,13 +290,17 @@ Write ONLY the email body (no subject line). Be personable and helpful."""
         ]
 
         # Use CONVERSATION_RESPONSE task (premium model for critical customer-facing content)
-        response = await self.ai_council.complete(
-            task_type=TaskType.CONVERSATION_RESPONSE,
-            messages=messages,
-            lead_id=lead_id,
-            lead_value=lead_value,
-            temperature=0.8  # Higher creativity for emails
-        )
+        task_id = uuid.uuid4().hex
+        if stream_conversation_id is not None:
+            response = await self._stream_reply(messages, lead_id, lead_value, stream_conversation_id, task_id)
+        else:
+            response = await self.ai_council.complete(
+                task_type=TaskType.CONVERSATION_RESPONSE,
+                messages=messages,
+                lead_id=lead_id,
+                lead_value=lead_value,
+                temperature=0.8  # Higher creativity for emails
+            )
 
         # Calculate confidence score based on multiple factors
         confidence = self._calculate_reply_confidence(
@@ -301,6 +310,17 @@ Write ONLY the email body (no subject line). Be personable and helpful."""
             has_similar_examples=len(similar_convos) > 0
         )
 
+        if stream_conversation_id is not None:
+            async_event_publisher.publish(AI_EVENTS_CHANNEL, {
+                "type": "ai:response_ready",
+                "room": f"conversation:{stream_conversation_id}",
+                "task_id": task_id,
+                "conversation_id": stream_conversation_id,
+                "response": response.content,
+                "confidence": confidence,
+                "tokens_used": response.prompt_tokens + response.completion_tokens,
+            })
+
         # Extract key points and CTA
         key_points = self._extract_key_points(response.content)
         cta = self._extract_call_to_action(response.content)
@@ -316,6 +336,38 @@ Write ONLY the email body (no subject line). Be personable and helpful."""
             estimated_response_time=self._estimate_response_time(reply_analysis.urgency_level)
         )
 
+    async def _stream_reply(
+        self,
+        messages: List[Message],
+        lead_id: Optional[int],
+        lead_value: Optional[float],
+        conversation_id: int,
+        task_id: str
+    ) -> AICouncilResponse:
+        """
+        Generate a reply with streaming, publishing the text so far as it grows.
+        """
+        stream = self.ai_council.complete_stream(
+            task_type=TaskType.CONVERSATION_RESPONSE,
+            messages=messages,
+            lead_id=lead_id,
+            lead_value=lead_value,
+            temperature=0.8
+        )
+
+        response = await stream.publish_partials(
+            room=f"conversation:{conversation_id}",
+            task_id=task_id,
+            conversation_id=conversation_id
+        )
+
+        logger.info(
+            "conversation_ai.reply_streamed",
+            conversation_id=conversation_id,
+            time_to_first_token=stream.time_to_first_token
+        )
+        return response
+
     async def suggest_improvements(
         self,
         draft_reply: str,
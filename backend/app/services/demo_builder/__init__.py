@@ -9,11 +9,33 @@ from .template_engine import TemplateEngine
 from .vercel_deployer import VercelDeployer
 from .analytics_tracker import AnalyticsTracker
 from .content_personalizer import ContentPersonalizer
+from .fragment_cache import FragmentCache
+from .builder import (
+    DemoSiteBuilder,
+    Framework,
+    BuildStatus,
+    FileDefinition,
+    DeploymentConfig,
+    DemoSiteBuild,
+    ImprovementPlan,
+    OriginalSite,
+    build_demo_quick
+)
 
 __all__ = [
     'SiteGenerator',
     'TemplateEngine',
     'VercelDeployer',
     'AnalyticsTracker',
-    'ContentPersonalizer'
+    'ContentPersonalizer',
+    'FragmentCache',
+    'DemoSiteBuilder',
+    'Framework',
+    'BuildStatus',
+    'FileDefinition',
+    'DeploymentConfig',
+    'DemoSiteBuild',
+    'ImprovementPlan',
+    'OriginalSite',
+    'build_demo_quick'
 ]
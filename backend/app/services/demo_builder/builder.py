@@ -16,16 +16,20 @@ Architecture:
 import asyncio
 import json
 import re
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Tuple, Callable
 from enum import Enum
 from pydantic import BaseModel, Field
 import structlog
 
 from app.services.ai_mvp.ai_council import AICouncil, Message, AICouncilResponse
 from app.services.ai_mvp.semantic_router import TaskType
+from app.services.site_cache import SiteCache, content_hash, site_cache as default_site_cache
 
 logger = structlog.get_logger(__name__)
 
+# Bump when generation prompts/output change so cached builds are not reused
+DEMO_CACHE_VERSION = "1"
+
 
 class Framework(str, Enum):
     """Supported frameworks for demo site generation."""
@@ -108,16 +112,33 @@ class DemoSiteBuilder:
     - Syntax validation
     - Deployment configuration
     - Inline improvement comments
+    - Optional reuse of valid builds for unchanged sites and plans
+    - Parallel mode: one AI task per planned file, validated and retried
+      individually
     """
 
-    def __init__(self, ai_council: AICouncil):
+    def __init__(
+        self,
+        ai_council: AICouncil,
+        site_cache: Optional[SiteCache] = None,
+        max_concurrent_files: int = 4,
+        max_file_attempts: int = 2
+    ):
         """
         Initialize demo site builder.
 
         Args:
             ai_council: AI Council for code generation
+            site_cache: Cache for builds keyed by the original HTML's content
+                hash (no caching if None)
+            max_concurrent_files: File generations in flight (parallel mode)
+            max_file_attempts: Attempts per file before it is reported as failed
+                (parallel mode)
         """
         self.ai_council = ai_council
+        self.site_cache = site_cache
+        self.max_concurrent_files = max_concurrent_files
+        self.max_file_attempts = max_file_attempts
 
     async def build_demo_site(
         self,
@@ -125,7 +146,9 @@ class DemoSiteBuilder:
         improvement_plan: ImprovementPlan,
         framework: Framework = Framework.REACT,
         lead_value: Optional[float] = None,
-        include_comments: bool = True
+        include_comments: bool = True,
+        stream_demo_id: Optional[str] = None,
+        parallel: bool = False
     ) -> DemoSiteBuild:
         """
         Build a complete demo site with improvements applied.
@@ -136,6 +159,11 @@ class DemoSiteBuilder:
             framework: Target framework (html, react, nextjs)
             lead_value: Lead value for AI routing
             include_comments: Include explanation comments in code
+            stream_demo_id: If set, push generated code to the demo:{id}
+                websocket room as it is written (ai:response_partial events)
+            parallel: Generate each planned file as its own AI task instead of
+                the whole site in one completion (a failed file does not fail
+                the build; it is reported in validation_results)
 
         Returns:
             Complete demo site build with all files
@@ -150,6 +178,28 @@ class DemoSiteBuilder:
             improvements_count=len(improvement_plan.improvements)
         )
 
+        digest = content_hash(original_site.html_content) if self.site_cache else None
+        cache_params = {
+            "site": original_site.model_dump(exclude={"html_content"}),
+            "plan": improvement_plan.model_dump(mode="json"),
+            "framework": framework.value,
+            "include_comments": include_comments
+        }
+
+        if digest:
+            cached = await self.site_cache.get_derived(
+                digest, "demo_site", DEMO_CACHE_VERSION, **cache_params
+            )
+            if cached is not None:
+                logger.info("demo_builder.cache_hit", url=original_site.url, framework=framework.value)
+                return DemoSiteBuild(
+                    **{
+                        **cached,
+                        "generation_time_seconds": time.time() - start_time,
+                        "ai_cost": 0.0
+                    }
+                )
+
         try:
             # Step 1: Generate file structure plan
             file_structure = await self._plan_file_structure(
@@ -164,11 +214,15 @@ class DemoSiteBuilder:
                 framework=framework,
                 file_structure=file_structure,
                 lead_value=lead_value,
-                include_comments=include_comments
+                include_comments=include_comments,
+                stream_demo_id=stream_demo_id,
+                parallel=parallel
             )
 
             # Step 3: Validate generated code
-            validation_results = await self._validate_code(files, framework)
+            validation_results = await self._validate_code(
+                files, framework, expected_files=list(file_structure) if parallel else None
+            )
 
             # Step 4: Create deployment config
             deployment_config = self._create_deployment_config(framework)
@@ -202,6 +256,15 @@ class DemoSiteBuilder:
                 generation_time=generation_time
             )
 
+            if digest and validation_results.get("is_valid"):
+                await self.site_cache.put_derived(
+                    digest,
+                    "demo_site",
+                    DEMO_CACHE_VERSION,
+                    build.model_dump(mode="json"),
+                    **cache_params
+                )
+
             return build
 
         except Exception as e:
@@ -277,7 +340,9 @@ class DemoSiteBuilder:
         framework: Framework,
         file_structure: Dict[str, str],
         lead_value: Optional[float],
-        include_comments: bool
+        include_comments: bool,
+        stream_demo_id: Optional[str] = None,
+        parallel: bool = False
     ) -> Dict[str, str]:
         """
         Generate all files for the demo site.
@@ -289,52 +354,283 @@ class DemoSiteBuilder:
             file_structure: Planned file structure
             lead_value: Lead value for routing
             include_comments: Include explanation comments
+            stream_demo_id: Demo ID whose room receives partial output
+            parallel: Generate planned files concurrently, one AI task each
 
         Returns:
             Dict mapping file paths to content
         """
         files = {}
 
+        if parallel:
+            return await self._generate_files_parallel(
+                original_site, improvement_plan, framework, file_structure,
+                lead_value, include_comments, stream_demo_id
+            )
+
         # Generate core files with AI
         if framework == Framework.HTML:
             files = await self._generate_html_site(
-                original_site, improvement_plan, lead_value, include_comments
+                original_site, improvement_plan, lead_value, include_comments, stream_demo_id
             )
         elif framework == Framework.REACT:
             files = await self._generate_react_site(
-                original_site, improvement_plan, lead_value, include_comments
+                original_site, improvement_plan, lead_value, include_comments, stream_demo_id
             )
         elif framework == Framework.NEXTJS:
             files = await self._generate_nextjs_site(
-                original_site, improvement_plan, lead_value, include_comments
+                original_site, improvement_plan, lead_value, include_comments, stream_demo_id
             )
 
         return files
 
-    async def _generate_html_site(
+    def _get_static_files(
+        self,
+        framework: Framework,
+        improvement_plan: ImprovementPlan,
+        original_url: str
+    ) -> Dict[str, str]:
+        """Files produced without AI (configuration and README)."""
+        files = {}
+        if framework == Framework.REACT:
+            files.update(self._get_react_config_files())
+        elif framework == Framework.NEXTJS:
+            files.update(self._get_nextjs_config_files())
+        files["README.md"] = self._generate_readme(framework, improvement_plan, original_url)
+        return files
+
+    def _build_shared_context(
         self,
         original_site: OriginalSite,
         improvement_plan: ImprovementPlan,
-        lead_value: Optional[float],
+        framework: Framework,
+        file_structure: Dict[str, str],
         include_comments: bool
+    ) -> str:
+        """
+        Build the prompt prefix shared by every per-file generation.
+
+        It describes the site, the improvements and the whole file plan, so
+        separately generated files agree on component names and imports.
+        """
+        improvements_text = "\n".join([
+            f"{i+1}. **{imp.get('title', 'Improvement')}**: {imp.get('description', '')}"
+            for i, imp in enumerate(improvement_plan.improvements[:10])
+        ])
+
+        file_plan = "\n".join(f"- {path}: {purpose}" for path, purpose in file_structure.items())
+
+        if framework == Framework.HTML:
+            site_details = f"""HTML Preview (first 2000 chars):
+{original_site.html_content[:2000]}"""
+            conventions = "index.html links styles.css and script.js."
+        else:
+            site_details = f"Description: {original_site.meta_description or 'N/A'}"
+            conventions = (
+                "Every component file default-exports one function component named after the file "
+                "and takes no required props. Import components by their planned paths."
+            )
+
+        return f"""You are generating one file of a {framework.value} demo site. Other files are generated separately from this same brief.
+
+**ORIGINAL SITE**:
+URL: {original_site.url}
+Title: {original_site.title}
+{site_details}
+
+**IMPROVEMENT PLAN**:
+Strategy: {improvement_plan.overall_strategy}
+
+Key Improvements:
+{improvements_text}
+
+**FILE PLAN** (the complete project):
+{file_plan}
+
+**CONVENTIONS**:
+{conventions} {'Add comments explaining improvements.' if include_comments else ''}"""
+
+    async def _generate_files_parallel(
+        self,
+        original_site: OriginalSite,
+        improvement_plan: ImprovementPlan,
+        framework: Framework,
+        file_structure: Dict[str, str],
+        lead_value: Optional[float],
+        include_comments: bool,
+        stream_demo_id: Optional[str] = None
     ) -> Dict[str, str]:
-        """Generate plain HTML/CSS/JS site."""
+        """
+        Generate each planned file as its own AI task.
 
-        # Build comprehensive prompt
-        prompt = self._build_html_generation_prompt(
-            original_site, improvement_plan, include_comments
+        Configuration files and the README are produced without AI; the rest
+        run concurrently (up to max_concurrent_files), so the build takes about
+        as long as its slowest file. Files that still fail after
+        max_file_attempts are left out and reported by _validate_code.
+
+        Returns:
+            Dict mapping file paths to content
+        """
+        files = self._get_static_files(framework, improvement_plan, original_site.url)
+        shared_context = self._build_shared_context(
+            original_site, improvement_plan, framework, file_structure, include_comments
         )
+        semaphore = asyncio.Semaphore(self.max_concurrent_files)
 
-        # Call AI to generate code
-        response = await self.ai_council.complete(
+        pending = [
+            (path, purpose) for path, purpose in file_structure.items()
+            if path not in files
+        ]
+
+        results = await asyncio.gather(*[
+            self._generate_file(
+                path, purpose, shared_context, framework, lead_value, semaphore, stream_demo_id
+            )
+            for path, purpose in pending
+        ])
+
+        for (path, _), content in zip(pending, results):
+            if content is not None:
+                files[path] = content
+
+        logger.info(
+            "demo_builder.parallel_complete",
+            framework=framework.value,
+            generated=sum(1 for content in results if content is not None),
+            failed=sum(1 for content in results if content is None)
+        )
+
+        return files
+
+    async def _generate_file(
+        self,
+        path: str,
+        purpose: str,
+        shared_context: str,
+        framework: Framework,
+        lead_value: Optional[float],
+        semaphore: asyncio.Semaphore,
+        stream_demo_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Generate, validate and (on errors) retry a single file.
+
+        Returns:
+            File content, or None if every attempt failed
+        """
+        prompt = f"""{shared_context}
+
+**YOUR TASK**:
+Generate ONLY the file `{path}` ({purpose}). Output exactly one code block whose first line is the FILE comment for `{path}`."""
+
+        def extract(text: str) -> Tuple[Optional[str], List[str]]:
+            parsed = self._parse_ai_code_response(text, framework)
+            content = parsed.get(path)
+            if content is None and len(parsed) == 1:
+                content = next(iter(parsed.values()))
+            if content is None:
+                return None, [f"{path}: No code block for this file in the response"]
+            return content, self._validate_file(path, content)[0]
+
+        errors: List[str] = []
+        async with semaphore:
+            for attempt in range(1, self.max_file_attempts + 1):
+                attempt_prompt = prompt
+                if errors:
+                    attempt_prompt += "\n\nThe previous attempt had these problems, fix them:\n" + \
+                        "\n".join(f"- {error}" for error in errors)
+
+                try:
+                    response = await self._complete_code(
+                        framework.value, attempt_prompt, lead_value, max_tokens=3000,
+                        stream_demo_id=stream_demo_id,
+                        stream_task_id=f"{stream_demo_id}:{path}" if stream_demo_id else None,
+                        # A cached answer is what just failed; retries must regenerate
+                        use_cache=attempt == 1,
+                        cache_validator=lambda text: not extract(text)[1]
+                    )
+                except Exception as e:
+                    errors = [f"{path}: Generation error - {str(e)}"]
+                    logger.warning("demo_builder.file_failed", path=path, attempt=attempt, error=str(e))
+                    continue
+
+                content, errors = extract(response.content)
+                if not errors:
+                    logger.info("demo_builder.file_generated", path=path, attempt=attempt)
+                    return content
+
+                logger.warning("demo_builder.file_invalid", path=path, attempt=attempt, errors=errors)
+
+        logger.error("demo_builder.file_gave_up", path=path, errors=errors)
+        return None
+
+    async def _complete_code(
+        self,
+        framework_key: str,
+        prompt: str,
+        lead_value: Optional[float],
+        max_tokens: int,
+        stream_demo_id: Optional[str] = None,
+        stream_task_id: Optional[str] = None,
+        use_cache: bool = True,
+        cache_validator: Optional[Callable[[str], bool]] = None
+    ) -> AICouncilResponse:
+        """
+        Run a code generation prompt through the AI Council.
+
+        Args:
+            framework_key: System prompt key ("html", "react", "nextjs")
+            prompt: Generation prompt
+            lead_value: Lead value for routing
+            max_tokens: Completion token limit
+            stream_demo_id: If set, stream and publish the code written so far
+            stream_task_id: task_id of the published events (default: stream_demo_id)
+            use_cache: Serve from / store to the response cache (off for retries)
+            cache_validator: Only cache output this accepts
+
+        Returns:
+            AICouncilResponse with the generated code
+        """
+        kwargs = dict(
             task_type=TaskType.DEMO_SITE_PLANNING,  # Complex task
             messages=[
-                Message(role="system", content=self._get_system_prompt("html")),
+                Message(role="system", content=self._get_system_prompt(framework_key)),
                 Message(role="user", content=prompt)
             ],
             lead_value=lead_value,
             temperature=0.3,  # Lower temp for more consistent code
-            max_tokens=4000
+            max_tokens=max_tokens,
+            use_cache=use_cache,
+            cache_validator=cache_validator
+        )
+
+        if stream_demo_id is None:
+            return await self.ai_council.complete(**kwargs)
+
+        stream = self.ai_council.complete_stream(**kwargs)
+        return await stream.publish_partials(
+            room=f"demo:{stream_demo_id}",
+            task_id=stream_task_id or stream_demo_id
+        )
+
+    async def _generate_html_site(
+        self,
+        original_site: OriginalSite,
+        improvement_plan: ImprovementPlan,
+        lead_value: Optional[float],
+        include_comments: bool,
+        stream_demo_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Generate plain HTML/CSS/JS site."""
+
+        # Build comprehensive prompt
+        prompt = self._build_html_generation_prompt(
+            original_site, improvement_plan, include_comments
+        )
+
+        # Call AI to generate code
+        response = await self._complete_code(
+            "html", prompt, lead_value, max_tokens=4000, stream_demo_id=stream_demo_id
         )
 
         # Parse AI response into files
@@ -353,7 +649,8 @@ class DemoSiteBuilder:
         original_site: OriginalSite,
         improvement_plan: ImprovementPlan,
         lead_value: Optional[float],
-        include_comments: bool
+        include_comments: bool,
+        stream_demo_id: Optional[str] = None
     ) -> Dict[str, str]:
         """Generate React site with TypeScript."""
 
@@ -361,15 +658,8 @@ class DemoSiteBuilder:
             original_site, improvement_plan, include_comments
         )
 
-        response = await self.ai_council.complete(
-            task_type=TaskType.DEMO_SITE_PLANNING,
-            messages=[
-                Message(role="system", content=self._get_system_prompt("react")),
-                Message(role="user", content=prompt)
-            ],
-            lead_value=lead_value,
-            temperature=0.3,
-            max_tokens=6000
+        response = await self._complete_code(
+            "react", prompt, lead_value, max_tokens=6000, stream_demo_id=stream_demo_id
         )
 
         files = self._parse_ai_code_response(response.content, Framework.REACT)
@@ -390,7 +680,8 @@ class DemoSiteBuilder:
         original_site: OriginalSite,
         improvement_plan: ImprovementPlan,
         lead_value: Optional[float],
-        include_comments: bool
+        include_comments: bool,
+        stream_demo_id: Optional[str] = None
     ) -> Dict[str, str]:
         """Generate Next.js site with App Router."""
 
@@ -398,15 +689,8 @@ class DemoSiteBuilder:
             original_site, improvement_plan, include_comments
         )
 
-        response = await self.ai_council.complete(
-            task_type=TaskType.DEMO_SITE_PLANNING,
-            messages=[
-                Message(role="system", content=self._get_system_prompt("nextjs")),
-                Message(role="user", content=prompt)
-            ],
-            lead_value=lead_value,
-            temperature=0.3,
-            max_tokens=6000
+        response = await self._complete_code(
+            "nextjs", prompt, lead_value, max_tokens=6000, stream_demo_id=stream_demo_id
         )
 
         files = self._parse_ai_code_response(response.content, Framework.NEXTJS)
@@ -969,10 +1253,47 @@ This site is ready to deploy to:
 Generated with AI-powered demo builder.
 """
 
+    def _validate_file(self, file_path: str, content: str) -> Tuple[List[str], List[str]]:
+        """
+        Validate a single generated file.
+
+        Args:
+            file_path: File path
+            content: File content
+
+        Returns:
+            Tuple of (errors, warnings)
+        """
+        errors = []
+        warnings = []
+
+        # Check if file is empty
+        if not content.strip():
+            errors.append(f"{file_path}: File is empty")
+
+        # Check for common syntax issues
+        if file_path.endswith('.json'):
+            try:
+                json.loads(content)
+            except json.JSONDecodeError as e:
+                errors.append(f"{file_path}: Invalid JSON - {str(e)}")
+
+        # Check for placeholder comments
+        placeholders = [
+            "TODO", "FIXME", "PLACEHOLDER", "...", "your code here",
+            "implement this", "add your"
+        ]
+        for placeholder in placeholders:
+            if placeholder.lower() in content.lower():
+                warnings.append(f"{file_path}: Contains placeholder '{placeholder}'")
+
+        return errors, warnings
+
     async def _validate_code(
         self,
         files: Dict[str, str],
-        framework: Framework
+        framework: Framework,
+        expected_files: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Validate generated code for syntax errors.
@@ -980,6 +1301,7 @@ Generated with AI-powered demo builder.
         Args:
             files: Generated files
             framework: Target framework
+            expected_files: Planned files that must be present (parallel mode)
 
         Returns:
             Validation results
@@ -994,29 +1316,16 @@ Generated with AI-powered demo builder.
 
         # Basic validation checks
         for file_path, content in files.items():
-            # Check if file is empty
-            if not content.strip():
-                results["errors"].append(f"{file_path}: File is empty")
+            errors, warnings = self._validate_file(file_path, content)
+            results["errors"].extend(errors)
+            results["warnings"].extend(warnings)
+            if errors:
                 results["is_valid"] = False
 
-            # Check for common syntax issues
-            if file_path.endswith('.json'):
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError as e:
-                    results["errors"].append(f"{file_path}: Invalid JSON - {str(e)}")
-                    results["is_valid"] = False
-
-            # Check for placeholder comments
-            placeholders = [
-                "TODO", "FIXME", "PLACEHOLDER", "...", "your code here",
-                "implement this", "add your"
-            ]
-            for placeholder in placeholders:
-                if placeholder.lower() in content.lower():
-                    results["warnings"].append(
-                        f"{file_path}: Contains placeholder '{placeholder}'"
-                    )
+        for file_path in expected_files or []:
+            if file_path not in files:
+                results["errors"].append(f"{file_path}: Generation failed")
+                results["is_valid"] = False
 
         # Framework-specific checks
         if framework == Framework.HTML:
@@ -1089,7 +1398,8 @@ async def build_demo_quick(
     html_content: str,
     improvement_plan_dict: Dict[str, Any],
     ai_council: AICouncil,
-    framework: Framework = Framework.REACT
+    framework: Framework = Framework.REACT,
+    site_cache: Optional[SiteCache] = default_site_cache
 ) -> DemoSiteBuild:
     """
     Quick demo site generation.
@@ -1100,11 +1410,12 @@ async def build_demo_quick(
         improvement_plan_dict: Improvement plan as dict
         ai_council: AI Council instance
         framework: Target framework
+        site_cache: Cache for finished builds (None disables caching)
 
     Returns:
         Complete demo site build
     """
-    builder = DemoSiteBuilder(ai_council)
+    builder = DemoSiteBuilder(ai_council, site_cache=site_cache)
 
     original_site = OriginalSite(
         url=url,
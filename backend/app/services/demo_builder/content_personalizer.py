@@ -3,17 +3,128 @@ Content Personalizer for Demo Sites
 
 This service uses AI to personalize demo site content based on lead data.
 Generates compelling copy, headlines, and CTAs tailored to each lead.
+
+Copy is generated per section and cached as fragments keyed by
+(template type, industry, section, tone), written with lead tokens such as
+[COMPANY]. Personalizing a site for a new lead is then a token substitution
+over cached fragments; only sections that depend on the lead's own
+description call the AI for every lead.
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 import logging
 
 from app.services.openrouter_client import OpenRouterClient
+from app.services.demo_builder.fragment_cache import (
+    FRAGMENT_TOKEN_INSTRUCTIONS,
+    FragmentCache,
+    fragment_cache as default_fragment_cache,
+    substitute_lead_tokens,
+)
 from app.models.leads import Lead
 
 logger = logging.getLogger(__name__)
 
 
+# Sections generated per template type: (JSON shape, max_tokens)
+TEMPLATE_SECTIONS: Dict[str, Dict[str, tuple]] = {
+    "landing": {
+        "hero": ("""{
+    "headline": "Attention-grabbing headline (max 60 chars)",
+    "subheadline": "Value proposition (max 120 chars)",
+    "cta_text": "Action-oriented CTA button text",
+    "cta_subtext": "Supporting text under CTA"
+}""", 300),
+        "intro": ("""{
+    "hero_text": "2-3 sentence description of value"
+}""", 250),
+        "features": ("""{
+    "features": [
+        {"title": "Feature 1", "description": "Benefit-focused description"},
+        {"title": "Feature 2", "description": "Benefit-focused description"},
+        {"title": "Feature 3", "description": "Benefit-focused description"}
+    ]
+}""", 400),
+        "testimonial": ("""{
+    "testimonial": {
+        "quote": "Realistic testimonial quote",
+        "author": "Similar company in the industry"
+    }
+}""", 200),
+    },
+    "portfolio": {
+        "hero": ("""{
+    "headline": "Professional headline",
+    "tagline": "Brief professional tagline",
+    "cta_text": "Contact or collaboration CTA"
+}""", 200),
+        "about": ("""{
+    "about_text": "3-4 sentence about section"
+}""", 300),
+        "projects": ("""{
+    "projects": [
+        {"title": "Project 1", "description": "Brief description", "tech": ["tech1", "tech2"]},
+        {"title": "Project 2", "description": "Brief description", "tech": ["tech1", "tech2"]},
+        {"title": "Project 3", "description": "Brief description", "tech": ["tech1", "tech2"]}
+    ]
+}""", 400),
+        "skills": ("""{
+    "skills": ["Skill 1", "Skill 2", "Skill 3", "Skill 4", "Skill 5"]
+}""", 100),
+    },
+    "saas": {
+        "hero": ("""{
+    "headline": "Product value headline",
+    "subheadline": "How it solves their problem",
+    "cta_text": "Get Started / Book Demo"
+}""", 200),
+        "features": ("""{
+    "features": [
+        {"icon": "⚡", "title": "Feature 1", "description": "Benefit"},
+        {"icon": "🎯", "title": "Feature 2", "description": "Benefit"},
+        {"icon": "📈", "title": "Feature 3", "description": "Benefit"},
+        {"icon": "🔒", "title": "Feature 4", "description": "Benefit"}
+    ]
+}""", 400),
+        "pricing": ("""{
+    "pricing_tiers": [
+        {"name": "Starter", "price": "$X/mo", "features": ["Feature 1", "Feature 2"]},
+        {"name": "Professional", "price": "$X/mo", "features": ["All Starter", "Feature 3", "Feature 4"]},
+        {"name": "Enterprise", "price": "Custom", "features": ["All Pro", "Feature 5", "Support"]}
+    ]
+}""", 400),
+        "faq": ("""{
+    "faq": [
+        {"question": "Common question 1?", "answer": "Answer"},
+        {"question": "Common question 2?", "answer": "Answer"},
+        {"question": "Common question 3?", "answer": "Answer"}
+    ]
+}""", 400),
+    },
+    "generic": {
+        "hero": ("""{
+    "headline": "Main headline",
+    "subheadline": "Supporting text",
+    "cta_text": "Call to action"
+}""", 200),
+        "body": ("""{
+    "body_text": "2-3 paragraphs of content"
+}""", 500),
+    },
+}
+
+# Sections written from the lead's own description (never shared between leads)
+LEAD_SPECIFIC_SECTIONS = {"intro", "about", "body"}
+
+TEMPLATE_BRIEFS = {
+    "landing": "a personalized landing page",
+    "portfolio": "a portfolio page",
+    "saas": "a SaaS demo page",
+    "generic": "a business website",
+}
+
+
 class ContentPersonalizer:
     """
     AI-powered content personalization service.
@@ -22,11 +133,21 @@ class ContentPersonalizer:
     - Lead profile (name, company, industry)
     - Template type
     - Business goals
+
+    Shared sections come from the fragment cache, so a batch of leads in the
+    same industry costs a handful of AI calls rather than one per lead.
     """
 
-    def __init__(self):
-        """Initialize content personalizer with AI client."""
+    def __init__(self, fragment_cache: Optional[FragmentCache] = default_fragment_cache):
+        """
+        Initialize content personalizer with AI client.
+
+        Args:
+            fragment_cache: Cache of AI copy fragments (None generates every
+                section for every lead)
+        """
         self.ai_client = OpenRouterClient()
+        self.fragment_cache = fragment_cache
 
     async def personalize_content(
         self,
@@ -41,7 +162,8 @@ class ContentPersonalizer:
         Args:
             lead: Lead object with profile data
             template_type: Type of template (landing, portfolio, saas)
-            base_content: Base content to personalize
+            base_content: Base content to personalize (an optional 'tone'
+                selects the copy tone, default 'professional')
             ai_model: AI model to use
 
         Returns:
@@ -51,15 +173,26 @@ class ContentPersonalizer:
             # Extract lead info
             lead_info = self._extract_lead_info(lead)
 
-            # Generate personalized content based on template type
-            if template_type == "landing":
-                content = await self._personalize_landing_page(lead_info, base_content, ai_model)
-            elif template_type == "portfolio":
-                content = await self._personalize_portfolio(lead_info, base_content, ai_model)
-            elif template_type == "saas":
-                content = await self._personalize_saas_demo(lead_info, base_content, ai_model)
-            else:
-                content = await self._personalize_generic(lead_info, base_content, ai_model)
+            if template_type not in TEMPLATE_SECTIONS:
+                template_type = "generic"
+            tone = base_content.get('tone') or 'professional'
+
+            sections = TEMPLATE_SECTIONS[template_type]
+            fragments = await asyncio.gather(*[
+                self._get_section(template_type, section, lead_info, tone, ai_model)
+                for section in sections
+            ])
+
+            # Sections that failed keep the base content
+            content = dict(base_content)
+            for fragment in fragments:
+                if fragment:
+                    content.update(fragment)
+
+            # Add lead personalization
+            content['lead_name'] = lead_info['name']
+            content['company_name'] = lead_info['company']
+            content['industry'] = lead_info['industry']
 
             return content
 
@@ -89,205 +222,114 @@ class ContentPersonalizer:
             'description': getattr(lead, 'description', None)
         }
 
-    async def _personalize_landing_page(
-        self,
-        lead_info: Dict[str, Any],
-        base_content: Dict[str, Any],
-        ai_model: str
-    ) -> Dict[str, Any]:
-        """Personalize content for a landing page."""
-        prompt = f"""
-You are a professional copywriter creating a personalized landing page.
-
-LEAD INFORMATION:
-- Name: {lead_info['name']}
-- Company: {lead_info['company']}
-- Industry: {lead_info['industry']}
-- Location: {lead_info.get('location', 'N/A')}
-
-TASK:
-Create compelling landing page content that:
-1. Addresses {lead_info['company']}'s specific needs
-2. Uses industry-specific language for {lead_info['industry']}
-3. Creates urgency and value
-4. Includes a clear call-to-action
-
-Generate the following (return as JSON):
-{{
-    "headline": "Attention-grabbing headline (max 60 chars)",
-    "subheadline": "Value proposition (max 120 chars)",
-    "hero_text": "2-3 sentence description of value",
-    "cta_text": "Action-oriented CTA button text",
-    "cta_subtext": "Supporting text under CTA",
-    "features": [
-        {{"title": "Feature 1", "description": "Benefit-focused description"}},
-        {{"title": "Feature 2", "description": "Benefit-focused description"}},
-        {{"title": "Feature 3", "description": "Benefit-focused description"}}
-    ],
-    "testimonial": {{
-        "quote": "Realistic testimonial quote",
-        "author": "Similar company in {lead_info['industry']}"
-    }}
-}}
-
-Requirements:
-- Be specific to {lead_info['company']} and {lead_info['industry']}
-- Focus on benefits, not features
-- Use action verbs
-- Keep it concise and impactful
-- Make it sound natural, not salesy
-"""
-
-        response = await self.ai_client.generate_completion(
-            model=ai_model,
-            prompt=prompt,
-            max_tokens=1000,
-            temperature=0.7
-        )
-
-        # Parse AI response
-        content = self._parse_ai_json(response, base_content)
-
-        # Add lead personalization
-        content['lead_name'] = lead_info['name']
-        content['company_name'] = lead_info['company']
-        content['industry'] = lead_info['industry']
-
-        return content
-
-    async def _personalize_portfolio(
+    async def _get_section(
         self,
+        template_type: str,
+        section: str,
         lead_info: Dict[str, Any],
-        base_content: Dict[str, Any],
+        tone: str,
         ai_model: str
-    ) -> Dict[str, Any]:
-        """Personalize content for a portfolio page."""
-        prompt = f"""
-Create personalized portfolio page content for {lead_info['company']}.
-
-Industry: {lead_info['industry']}
-Lead Name: {lead_info['name']}
-
-Generate (return as JSON):
-{{
-    "headline": "Professional headline",
-    "tagline": "Brief professional tagline",
-    "about_text": "3-4 sentence about section",
-    "projects": [
-        {{"title": "Project 1", "description": "Brief description", "tech": ["tech1", "tech2"]}},
-        {{"title": "Project 2", "description": "Brief description", "tech": ["tech1", "tech2"]}},
-        {{"title": "Project 3", "description": "Brief description", "tech": ["tech1", "tech2"]}}
-    ],
-    "skills": ["Skill 1", "Skill 2", "Skill 3", "Skill 4", "Skill 5"],
-    "cta_text": "Contact or collaboration CTA"
-}}
-
-Make it relevant to {lead_info['industry']} industry.
-"""
-
-        response = await self.ai_client.generate_completion(
-            model=ai_model,
-            prompt=prompt,
-            max_tokens=800,
-            temperature=0.7
-        )
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one section's copy for a lead.
 
-        content = self._parse_ai_json(response, base_content)
-        content['lead_name'] = lead_info['name']
-        content['company_name'] = lead_info['company']
+        Lead-specific sections are written for the lead when it has a
+        description; everything else is a cached fragment with the lead's
+        details substituted in.
+        """
+        if section in LEAD_SPECIFIC_SECTIONS and lead_info.get('description'):
+            return await self._generate_section(template_type, section, lead_info, tone, ai_model)
+
+        async def generate() -> Optional[Dict[str, Any]]:
+            return await self._generate_section(template_type, section, None, tone, ai_model,
+                                                industry=lead_info['industry'])
+
+        if self.fragment_cache is None:
+            fragment = await generate()
+        else:
+            fragment = await self.fragment_cache.get_or_generate(
+                template=template_type,
+                industry=lead_info['industry'],
+                section=section,
+                tone=tone,
+                generate=generate,
+                variant_seed=f"{lead_info['company']}|{lead_info['name']}"
+            )
 
-        return content
+        return substitute_lead_tokens(fragment, lead_info) if fragment else None
 
-    async def _personalize_saas_demo(
+    async def _generate_section(
         self,
-        lead_info: Dict[str, Any],
-        base_content: Dict[str, Any],
-        ai_model: str
-    ) -> Dict[str, Any]:
-        """Personalize content for a SaaS demo page."""
-        prompt = f"""
-Create personalized SaaS demo page content for {lead_info['company']}.
-
-Industry: {lead_info['industry']}
-Target: {lead_info['name']}
+        template_type: str,
+        section: str,
+        lead_info: Optional[Dict[str, Any]],
+        tone: str,
+        ai_model: str,
+        industry: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate one section's copy with AI.
 
-Generate (return as JSON):
-{{
-    "headline": "Product value headline",
-    "subheadline": "How it solves their problem",
-    "features": [
-        {{"icon": "⚡", "title": "Feature 1", "description": "Benefit"}},
-        {{"icon": "🎯", "title": "Feature 2", "description": "Benefit"}},
-        {{"icon": "📈", "title": "Feature 3", "description": "Benefit"}},
-        {{"icon": "🔒", "title": "Feature 4", "description": "Benefit"}}
-    ],
-    "pricing_tiers": [
-        {{"name": "Starter", "price": "$X/mo", "features": ["Feature 1", "Feature 2"]}},
-        {{"name": "Professional", "price": "$X/mo", "features": ["All Starter", "Feature 3", "Feature 4"]}},
-        {{"name": "Enterprise", "price": "Custom", "features": ["All Pro", "Feature 5", "Support"]}}
-    ],
-    "faq": [
-        {{"question": "Common question 1?", "answer": "Answer"}},
-        {{"question": "Common question 2?", "answer": "Answer"}},
-        {{"question": "Common question 3?", "answer": "Answer"}}
-    ],
-    "cta_text": "Get Started / Book Demo"
-}}
+        Args:
+            template_type: Template type
+            section: Section name
+            lead_info: Lead details for lead-specific copy, or None for a
+                reusable fragment written with lead tokens
+            tone: Copy tone
+            ai_model: AI model to use
+            industry: Industry of a reusable fragment
 
-Tailor to {lead_info['industry']} industry needs.
-"""
+        Returns:
+            Section fields, or None if generation failed
+        """
+        shape, max_tokens = TEMPLATE_SECTIONS[template_type][section]
 
-        response = await self.ai_client.generate_completion(
-            model=ai_model,
-            prompt=prompt,
-            max_tokens=1200,
-            temperature=0.7
-        )
+        if lead_info:
+            audience = f"""LEAD INFORMATION:
+- Name: {lead_info['name']}
+- Company: {lead_info['company']}
+- Industry: {lead_info['industry']}
+- Location: {lead_info.get('location') or 'N/A'}
+- About: {lead_info.get('description') or 'N/A'}
 
-        content = self._parse_ai_json(response, base_content)
-        content['lead_name'] = lead_info['name']
-        content['company_name'] = lead_info['company']
+Be specific to {lead_info['company']} and what they do."""
+            industry = lead_info['industry']
+        else:
+            audience = f"""INDUSTRY: {industry}
 
-        return content
+{FRAGMENT_TOKEN_INSTRUCTIONS}"""
 
-    async def _personalize_generic(
-        self,
-        lead_info: Dict[str, Any],
-        base_content: Dict[str, Any],
-        ai_model: str
-    ) -> Dict[str, Any]:
-        """Personalize content for a generic template."""
         prompt = f"""
-Create personalized website content for {lead_info['company']}.
+You are a professional copywriter creating the "{section}" section of {TEMPLATE_BRIEFS[template_type]}.
 
-Lead: {lead_info['name']}
-Industry: {lead_info['industry']}
+{audience}
 
-Generate (return as JSON):
-{{
-    "headline": "Main headline",
-    "subheadline": "Supporting text",
-    "body_text": "2-3 paragraphs of content",
-    "cta_text": "Call to action"
-}}
+Generate the following (return as JSON):
+{shape}
 
-Make it relevant and compelling for their industry.
+Requirements:
+- Use industry-specific language for {industry}
+- Tone: {tone}
+- Focus on benefits, not features
+- Use action verbs
+- Keep it concise and impactful
+- Make it sound natural, not salesy
 """
 
-        response = await self.ai_client.generate_completion(
-            model=ai_model,
-            prompt=prompt,
-            max_tokens=600,
-            temperature=0.7
-        )
-
-        content = self._parse_ai_json(response, base_content)
-        content['lead_name'] = lead_info['name']
-        content['company_name'] = lead_info['company']
+        try:
+            response = await self.ai_client.generate_completion(
+                model=ai_model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+        except Exception as e:
+            logger.warning(f"Section generation failed ({template_type}/{section}): {str(e)}")
+            return None
 
-        return content
+        return self._parse_ai_json(response, None)
 
-    def _parse_ai_json(self, ai_response: str, fallback: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_ai_json(self, ai_response: str, fallback: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Parse JSON from AI response, with fallback."""
         try:
             import json
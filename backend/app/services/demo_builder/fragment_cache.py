@@ -0,0 +1,228 @@
+"""
+Fragment Cache for Demo Sites
+
+Leads in the same industry and template get nearly identical hero/features
+copy, so AI-written copy is cached as fragments keyed by
+(template, industry, section, tone). Fragments are written with lead tokens
+([NAME], [COMPANY], [INDUSTRY], [LOCATION]) that are substituted per lead, so
+personalizing a demo site is a string replacement instead of an AI call.
+
+Each key keeps a few variant slots so a batch of leads does not all get the
+exact same wording. A lead's seed picks its slot, and the slot is filled on
+first use, so a lead gets the same variant whether or not it wrote it.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.ai_mvp.response_cache import DiskCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+# Tokens AI fragments use in place of lead details
+LEAD_TOKENS = {
+    "[NAME]": "name",
+    "[COMPANY]": "company",
+    "[INDUSTRY]": "industry",
+    "[LOCATION]": "location",
+}
+
+FRAGMENT_TOKEN_INSTRUCTIONS = (
+    "Write the copy so it can be reused for any business in this industry: "
+    "wherever you would mention the lead, write the tokens [NAME], [COMPANY], "
+    "[INDUSTRY] or [LOCATION] literally instead of a real value."
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+FragmentGenerator = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def substitute_lead_tokens(value: Any, lead_info: Dict[str, Any]) -> Any:
+    """
+    Replace lead tokens in a fragment (strings, lists and dicts, recursively).
+
+    Args:
+        value: Fragment value
+        lead_info: Lead details (name, company, industry, location)
+
+    Returns:
+        Fragment with tokens replaced
+    """
+    if isinstance(value, str):
+        for token, field in LEAD_TOKENS.items():
+            if token in value:
+                value = value.replace(token, str(lead_info.get(field) or ""))
+        return value
+    if isinstance(value, list):
+        return [substitute_lead_tokens(item, lead_info) for item in value]
+    if isinstance(value, dict):
+        return {key: substitute_lead_tokens(item, lead_info) for key, item in value.items()}
+    return value
+
+
+def _normalize(part: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", (part or "").strip().lower())
+
+
+class FragmentCache:
+    """
+    Cache of AI-generated copy fragments.
+
+    Features:
+    - Keys normalized from (template, industry, section, tone)
+    - `variants_per_key` variant slots, picked per lead by a stable hash
+    - Single-flight generation per slot (concurrent leads wait, not duplicate)
+    - Hit/generation counters
+    """
+
+    def __init__(
+        self,
+        backend,
+        variants_per_key: int = 3,
+        ttl_seconds: int = 30 * 86400
+    ):
+        """
+        Initialize fragment cache.
+
+        Args:
+            backend: RedisCacheBackend or DiskCacheBackend
+            variants_per_key: Copy variants per key (leads are spread over them)
+            ttl_seconds: How long fragments are kept
+        """
+        self.backend = backend
+        self.variants_per_key = variants_per_key
+        self.ttl_seconds = ttl_seconds
+        # Generation locks per unfilled slot; one lock for read-modify-write of stored slots
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._store_lock = asyncio.Lock()
+        self.stats = {
+            "hits": 0,
+            "generated": 0,
+            "generation_failures": 0,
+            "errors": 0,
+        }
+
+    @classmethod
+    def from_settings(cls) -> Optional["FragmentCache"]:
+        """Build the cache on the AI cache backend configured in settings, or None if disabled."""
+        if settings.AI_CACHE_BACKEND == "redis" and settings.REDIS_URL:
+            backend = RedisCacheBackend(settings.REDIS_URL, prefix="demo_fragment:")
+        elif settings.AI_CACHE_BACKEND in ("redis", "disk"):
+            backend = DiskCacheBackend(os.path.join(settings.AI_CACHE_DIR, "fragments"))
+        else:
+            return None
+        return cls(backend)
+
+    @staticmethod
+    def key(template: str, industry: str, section: str, tone: str) -> str:
+        """Stable key for a fragment slot."""
+        material = json.dumps(
+            [_normalize(template), _normalize(industry), _normalize(section), _normalize(tone)],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def _variants(self, key: str) -> List[Optional[Dict[str, Any]]]:
+        """Variant slots of a key, None where a slot is not filled yet."""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Fragment cache read failed: {e}")
+            value = None
+        variants = list(value["variants"]) if value else []
+        variants = variants[:self.variants_per_key]
+        return variants + [None] * (self.variants_per_key - len(variants))
+
+    async def _store_variant(self, key: str, slot: int, fragment: Dict[str, Any]):
+        """Fill one slot, keeping slots other leads filled meanwhile."""
+        async with self._store_lock:
+            variants = await self._variants(key)
+            variants[slot] = fragment
+            try:
+                await self.backend.set(key, {"variants": variants}, self.ttl_seconds)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Fragment cache write failed: {e}")
+
+    def _slot(self, variant_seed: str) -> int:
+        return int(hashlib.sha256(variant_seed.encode("utf-8")).hexdigest(), 16) % self.variants_per_key
+
+    async def get_or_generate(
+        self,
+        template: str,
+        industry: str,
+        section: str,
+        tone: str,
+        generate: FragmentGenerator,
+        variant_seed: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the seed's variant of a fragment, generating it on first use.
+
+        Args:
+            template: Template name or type
+            industry: Lead industry
+            section: Section name (hero, features, ...)
+            tone: Copy tone
+            generate: Coroutine function returning a new fragment (with lead
+                tokens) or None on failure
+            variant_seed: Chooses the variant (e.g. lead ID or company name)
+
+        Returns:
+            Fragment with lead tokens still in place. If generation fails,
+            another variant of the key, or None if there is none.
+        """
+        key = self.key(template, industry, section, tone)
+        slot = self._slot(variant_seed)
+        variants = await self._variants(key)
+
+        if variants[slot] is None:
+            # Leads on different slots generate concurrently
+            lock_key = f"{key}:{slot}"
+            lock = self._locks.setdefault(lock_key, asyncio.Lock())
+            async with lock:
+                # Another lead may have filled the slot while we waited
+                variants = await self._variants(key)
+                generated = variants[slot] is None
+                if generated:
+                    fragment = await generate()
+                    if not fragment:
+                        self.stats["generation_failures"] += 1
+                        filled = [variant for variant in variants if variant is not None]
+                        if not filled:
+                            return None
+                        self.stats["hits"] += 1
+                        return filled[slot % len(filled)]
+
+                    self.stats["generated"] += 1
+                    await self._store_variant(key, slot, fragment)
+
+                # The slot is filled, so later leads will not need the lock
+                if self._locks.get(lock_key) is lock:
+                    del self._locks[lock_key]
+                if generated:
+                    return fragment
+
+        self.stats["hits"] += 1
+        return variants[slot]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        served = self.stats["hits"] + self.stats["generated"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / served, 4) if served else 0.0,
+        }
+
+
+# Global instance (None when AI caching is disabled)
+fragment_cache = FragmentCache.from_settings()
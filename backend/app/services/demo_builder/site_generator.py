@@ -3,8 +3,14 @@ AI-Powered Demo Site Generator
 
 This service uses OpenRouter AI to generate personalized demo sites.
 Supports multiple AI models (GPT-4, Claude, etc.) for HTML/CSS/JS generation.
+
+AI copy enhancements of a template are cached per (template, industry, tone)
+with lead tokens in place of lead details, so most leads get their enhanced
+copy by substitution instead of a fresh AI call.
 """
 
+import hashlib
+import json
 import os
 import re
 from typing import Dict, Any, Optional, List
@@ -12,6 +18,12 @@ from jinja2 import Template, Environment, BaseLoader
 import logging
 
 from app.services.openrouter_client import OpenRouterClient
+from app.services.demo_builder.fragment_cache import (
+    FRAGMENT_TOKEN_INSTRUCTIONS,
+    FragmentCache,
+    fragment_cache as default_fragment_cache,
+    substitute_lead_tokens,
+)
 from app.models.demo_sites import DemoSiteTemplate
 
 logger = logging.getLogger(__name__)
@@ -25,10 +37,17 @@ class SiteGenerator:
     templates and personalization data.
     """
 
-    def __init__(self):
-        """Initialize the site generator with AI client."""
+    def __init__(self, fragment_cache: Optional[FragmentCache] = default_fragment_cache):
+        """
+        Initialize the site generator with AI client.
+
+        Args:
+            fragment_cache: Cache of AI copy enhancements (None calls the AI
+                for every site)
+        """
         self.ai_client = OpenRouterClient()
         self.jinja_env = Environment(loader=BaseLoader())
+        self.fragment_cache = fragment_cache
 
     async def generate_site(
         self,
@@ -58,6 +77,7 @@ class SiteGenerator:
             # If AI enhancement is enabled, enhance the content
             if use_ai:
                 enhanced = await self._enhance_with_ai(
+                    template,
                     rendered,
                     content_data,
                     style_settings,
@@ -119,6 +139,7 @@ class SiteGenerator:
 
     async def _enhance_with_ai(
         self,
+        template: DemoSiteTemplate,
         rendered: Dict[str, str],
         content_data: Dict[str, Any],
         style_settings: Dict[str, Any],
@@ -132,21 +153,51 @@ class SiteGenerator:
         - Meta descriptions
         - Call-to-action text
         - Feature descriptions
+
+        Enhancements are written once per (template, industry, tone) with lead
+        tokens and reused for every lead through the fragment cache.
         """
         try:
-            # Build enhancement prompt
-            prompt = self._build_enhancement_prompt(rendered, content_data)
+            industry = content_data.get('industry') or 'business'
+            tone = content_data.get('tone') or 'professional'
+
+            async def generate() -> Optional[Dict[str, Any]]:
+                # Build enhancement prompt
+                prompt = self._build_enhancement_prompt(template, industry, tone)
+
+                # Call AI to enhance
+                response = await self.ai_client.generate_completion(
+                    model=ai_model,
+                    prompt=prompt,
+                    max_tokens=2000,
+                    temperature=0.7
+                )
+                return self._parse_enhancements(response)
+
+            if self.fragment_cache is None:
+                enhancements = await generate()
+            else:
+                enhancements = await self.fragment_cache.get_or_generate(
+                    # Editing a template starts a fresh set of fragments
+                    template=f"{template.template_name}:{hashlib.sha256(template.html_template.encode('utf-8')).hexdigest()[:16]}",
+                    industry=industry,
+                    section="enhancement",
+                    tone=tone,
+                    generate=generate,
+                    variant_seed=f"{content_data.get('company_name', '')}|{content_data.get('lead_name', '')}"
+                )
 
-            # Call AI to enhance
-            response = await self.ai_client.generate_completion(
-                model=ai_model,
-                prompt=prompt,
-                max_tokens=2000,
-                temperature=0.7
-            )
+            if not enhancements:
+                return rendered
 
-            # Parse AI response and apply enhancements
-            enhanced = self._apply_ai_enhancements(rendered, response)
+            # Substitute lead details and apply enhancements
+            enhancements = substitute_lead_tokens(enhancements, {
+                'name': content_data.get('lead_name') or 'User',
+                'company': content_data.get('company_name') or 'Your Company',
+                'industry': industry,
+                'location': content_data.get('location') or '',
+            })
+            enhanced = self._apply_ai_enhancements(rendered, enhancements)
 
             return enhanced
 
@@ -156,35 +207,38 @@ class SiteGenerator:
 
     def _build_enhancement_prompt(
         self,
-        rendered: Dict[str, str],
-        content_data: Dict[str, Any]
+        template: DemoSiteTemplate,
+        industry: str,
+        tone: str
     ) -> str:
-        """Build the prompt for AI enhancement."""
-        lead_name = content_data.get('lead_name', 'the user')
-        company_name = content_data.get('company_name', 'their company')
-        industry = content_data.get('industry', 'their industry')
+        """
+        Build the prompt for AI enhancement.
 
+        Uses the unrendered template and lead tokens so the result can be
+        reused for every lead in the industry.
+        """
         prompt = f"""
 You are a professional copywriter creating a personalized demo website.
 
 CONTEXT:
-- Lead Name: {lead_name}
-- Company: {company_name}
 - Industry: {industry}
+- Tone: {tone}
 
-CURRENT CONTENT:
-{rendered.get('html', '')[:1000]}...
+TEMPLATE:
+{template.html_template[:1000]}...
 
 TASK:
 Enhance the following elements to be more personalized and compelling:
-1. Headline (make it attention-grabbing and relevant to {company_name})
+1. Headline (make it attention-grabbing and relevant to [COMPANY])
 2. Subheadline (clearly state the value proposition)
 3. Call-to-action text (action-oriented, specific to the industry)
 4. Feature descriptions (benefit-focused, industry-specific)
 
+{FRAGMENT_TOKEN_INSTRUCTIONS}
+
 REQUIREMENTS:
-- Keep it professional and concise
-- Use the lead's name and company naturally
+- Keep it {tone} and concise
+- Use the [NAME] and [COMPANY] tokens naturally
 - Focus on benefits, not features
 - Make CTAs action-oriented
 - Keep formatting simple (plain text)
@@ -199,33 +253,37 @@ Return your enhancements in this JSON format:
 """
         return prompt
 
+    def _parse_enhancements(self, ai_response: str) -> Optional[Dict[str, Any]]:
+        """Extract the enhancement JSON from an AI response."""
+        try:
+            # Try to find JSON in the response
+            json_match = re.search(r'\{[\s\S]*\}', ai_response)
+            if json_match:
+                return json.loads(json_match.group())
+        except Exception as e:
+            logger.warning(f"Failed to parse AI enhancements: {str(e)}")
+        return None
+
     def _apply_ai_enhancements(
         self,
         rendered: Dict[str, str],
-        ai_response: str
+        enhancements: Dict[str, Any]
     ) -> Dict[str, str]:
         """Apply AI enhancements to the rendered site."""
         try:
-            # Extract JSON from AI response
-            import json
-            # Try to find JSON in the response
-            json_match = re.search(r'\{[\s\S]*\}', ai_response)
-            if json_match:
-                enhancements = json.loads(json_match.group())
-
-                # Apply enhancements to HTML
-                html = rendered['html']
+            # Apply enhancements to HTML
+            html = rendered['html']
 
-                if 'headline' in enhancements:
-                    html = self._replace_placeholder(html, 'headline', enhancements['headline'])
+            if 'headline' in enhancements:
+                html = self._replace_placeholder(html, 'headline', enhancements['headline'])
 
-                if 'subheadline' in enhancements:
-                    html = self._replace_placeholder(html, 'subheadline', enhancements['subheadline'])
+            if 'subheadline' in enhancements:
+                html = self._replace_placeholder(html, 'subheadline', enhancements['subheadline'])
 
-                if 'cta_text' in enhancements:
-                    html = self._replace_placeholder(html, 'cta_text', enhancements['cta_text'])
+            if 'cta_text' in enhancements:
+                html = self._replace_placeholder(html, 'cta_text', enhancements['cta_text'])
 
-                rendered['html'] = html
+            rendered['html'] = html
 
         except Exception as e:
             logger.warning(f"Failed to apply AI enhancements: {str(e)}")
@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from app.core.email_config import email_config
+from app.core.tracking_tokens import get_tracking_token_signer
 from app.models import Campaign, CampaignMetrics, Lead
 from app.core.database import get_db
 
@@ -556,19 +557,20 @@ class EmailService:
             "Install 'resend' package and uncomment code above."
         )
 
-    def _generate_tracking_token(self, campaign_id: int, lead_id: int) -> str:
-        """Generate tracking token for campaign and lead"""
-        # Simple encoding: campaign_id:lead_id:random
-        random_part = secrets.token_hex(8)
-        return f"{campaign_id}:{lead_id}:{random_part}"
-
-    def _decode_tracking_token(self, token: str) -> tuple[int, int]:
-        """Decode tracking token to campaign_id and lead_id"""
-        try:
-            parts = token.split(':')
-            return int(parts[0]), int(parts[1])
-        except (ValueError, IndexError):
-            raise ValueError(f"Invalid tracking token: {token}")
+    def _generate_tracking_token(
+        self,
+        campaign_id: int,
+        lead_id: int,
+        recipient_id: Optional[int] = None
+    ) -> str:
+        """Generate signed tracking token for campaign, lead and recipient"""
+        return get_tracking_token_signer().sign(campaign_id, lead_id, recipient_id=recipient_id)
+
+    @staticmethod
+    def _decode_tracking_token(token: str) -> tuple[int, int]:
+        """Verify tracking token and return campaign_id and lead_id"""
+        claims = get_tracking_token_signer().verify(token)
+        return claims.campaign_id, claims.lead_id
 
     def _generate_tracking_pixel(self) -> bytes:
         """Generate 1x1 transparent GIF pixel"""
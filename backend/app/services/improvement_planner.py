@@ -22,9 +22,13 @@ import structlog
 from pydantic import BaseModel, Field
 
 from app.services.ai_mvp.ai_council import AICouncil, Message, TaskType
+from app.services.site_cache import SiteCache, site_cache as default_site_cache
 
 logger = structlog.get_logger(__name__)
 
+# Bump when the improvement prompt/parsing changes so cached plans are not reused
+PLANNER_CACHE_VERSION = "1"
+
 
 class ImprovementCategory(str, Enum):
     """Categories of website improvements."""
@@ -100,14 +104,17 @@ class ImprovementPlanner:
     with specific implementation guidance.
     """
 
-    def __init__(self, ai_council: AICouncil):
+    def __init__(self, ai_council: AICouncil, site_cache: Optional[SiteCache] = None):
         """
         Initialize improvement planner.
 
         Args:
             ai_council: AI Council instance for generating creative improvements
+            site_cache: Cache for AI improvements of unchanged pages (defaults
+                to the global one; used when analysis_result has a content_hash)
         """
         self.ai_council = ai_council
+        self.site_cache = site_cache or default_site_cache
 
     async def generate_plan(
         self,
@@ -146,16 +153,43 @@ class ImprovementPlanner:
         # Generate improvements using different strategies
         improvements: List[Improvement] = []
 
-        # 1. Generate AI-powered improvements
-        ai_improvements = await self._generate_ai_improvements(
-            url=url,
-            analysis=ai_analysis,
-            title=title,
-            meta_description=meta_description,
-            industry=industry,
-            focus_areas=focus_areas,
-            lead_value=lead_value
-        )
+        # 1. Generate AI-powered improvements (reused while the page is unchanged)
+        content_hash = analysis_result.get("content_hash")
+        cache_params = {
+            "analysis": ai_analysis,
+            "title": title,
+            "meta_description": meta_description,
+            "industry": industry,
+            "focus_areas": focus_areas
+        }
+
+        cached = None
+        if content_hash and self.site_cache:
+            cached = await self.site_cache.get_derived(
+                content_hash, "improvement_plan", PLANNER_CACHE_VERSION, **cache_params
+            )
+
+        if cached is not None:
+            ai_improvements = [Improvement(**item) for item in cached["improvements"]]
+            logger.info("improvement_planner.cache_hit", url=url, count=len(ai_improvements))
+        else:
+            ai_improvements = await self._generate_ai_improvements(
+                url=url,
+                analysis=ai_analysis,
+                title=title,
+                meta_description=meta_description,
+                industry=industry,
+                focus_areas=focus_areas,
+                lead_value=lead_value
+            )
+            if content_hash and self.site_cache and ai_improvements:
+                await self.site_cache.put_derived(
+                    content_hash,
+                    "improvement_plan",
+                    PLANNER_CACHE_VERSION,
+                    {"improvements": [imp.model_dump(mode="json") for imp in ai_improvements]},
+                    **cache_params
+                )
         improvements.extend(ai_improvements)
 
         # 2. Generate rule-based improvements from analysis
@@ -0,0 +1,593 @@
+"""
+LLM Gateway - Shared HTTP transport for all AI provider calls.
+
+Every LLM and embedding request in the process goes through one
+httpx.AsyncClient, so connections (and their TLS sessions) are reused across
+OpenRouterClient, AICouncil, VectorStore and the auto-responder instead of
+being set up per call or per service object.
+
+Features:
+- One pooled client, HTTP/2 when the h2 package is installed
+- Per-provider concurrency limits
+- Retries with full-jitter exponential backoff that honour Retry-After
+- Per-request timing (connect, TLS, time to first byte, total) via hooks
+- Server-sent event streaming for token-by-token completions
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+TimingHook = Callable[[Dict[str, Any]], None]
+
+
+class LLMGatewayError(Exception):
+    """Raised when a provider request fails after all retries."""
+
+    def __init__(
+        self,
+        message: str,
+        provider: str,
+        status_code: Optional[int] = None,
+        response_text: Optional[str] = None
+    ):
+        self.provider = provider
+        self.status_code = status_code
+        self.response_text = response_text
+        super().__init__(message)
+
+
+class LLMProvider:
+    """Connection settings and concurrency limit for one upstream API."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: str = "",
+        auth_header: str = "Authorization",
+        auth_prefix: str = "Bearer ",
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = 32
+    ):
+        """
+        Initialize provider.
+
+        Args:
+            name: Provider name used by callers (e.g. "openrouter")
+            base_url: API base URL; request paths are appended to it
+            api_key: Default API key
+            auth_header: Header carrying the key
+            auth_prefix: Prefix before the key in auth_header
+            headers: Extra headers sent with every request
+            max_concurrency: Maximum in-flight requests to this provider
+        """
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.auth_header = auth_header
+        self.auth_prefix = auth_prefix
+        self.headers = headers or {}
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "in_flight": 0,
+            "total_ms": 0.0,
+        }
+
+    def build_headers(self, api_key: Optional[str] = None) -> Dict[str, str]:
+        """Headers for a request, with an optional per-call key override."""
+        return {
+            "Content-Type": "application/json",
+            **self.headers,
+            self.auth_header: f"{self.auth_prefix}{api_key or self.api_key}",
+        }
+
+
+class _RequestTimer:
+    """Collects httpcore trace events for a single attempt."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+
+    async def trace(self, event_name: str, info: Dict[str, Any]):
+        self.marks[event_name] = time.perf_counter()
+
+    def _span(self, prefix: str) -> Optional[float]:
+        started = self.marks.get(f"{prefix}.started")
+        completed = self.marks.get(f"{prefix}.complete")
+        if started is None or completed is None:
+            return None
+        return round((completed - started) * 1000, 2)
+
+    def summary(self) -> Dict[str, Any]:
+        headers_received = (
+            self.marks.get("http2.receive_response_headers.complete")
+            or self.marks.get("http11.receive_response_headers.complete")
+        )
+        # httpcore resolves DNS inside connect_tcp, so connect_ms includes it
+        connect_ms = self._span("connection.connect_tcp")
+        return {
+            "reused_connection": connect_ms is None,
+            "connect_ms": connect_ms,
+            "tls_ms": self._span("connection.start_tls"),
+            "ttfb_ms": round((headers_received - self.started) * 1000, 2) if headers_received else None,
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+        }
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    """Decode `data:` lines of a server-sent event stream (comments are skipped)."""
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        if data:
+            yield json.loads(data)
+
+
+class LLMGateway:
+    """
+    Process-wide gateway for LLM HTTP requests.
+
+    Providers are registered by name; callers pass the provider name and a
+    path relative to its base URL. The underlying client is created lazily
+    on first use and shared by every caller.
+    """
+
+    def __init__(
+        self,
+        timeout: float = settings.AI_TIMEOUT_SECONDS,
+        max_connections: int = settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        http2: bool = settings.LLM_HTTP2,
+        max_retries: int = settings.LLM_MAX_RETRIES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        max_retry_after: float = 60.0
+    ):
+        """
+        Initialize gateway.
+
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections: Pool size across all providers
+            max_keepalive_connections: Idle connections kept open
+            http2: Use HTTP/2 when available
+            max_retries: Retries after the first attempt
+            backoff_base: First backoff ceiling in seconds
+            backoff_max: Largest backoff ceiling in seconds
+            max_retry_after: Longest Retry-After we are willing to wait
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("h2 not installed, LLM gateway falling back to HTTP/1.1")
+
+        self.providers: Dict[str, LLMProvider] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._timing_hooks: List[TimingHook] = []
+
+        self._register_default_providers()
+
+    def _register_default_providers(self):
+        """Register the providers configured in settings."""
+        concurrency = settings.LLM_PROVIDER_CONCURRENCY
+        self.register_provider(LLMProvider(
+            "openrouter",
+            settings.OPENROUTER_BASE_URL,
+            api_key=settings.OPENROUTER_API_KEY,
+            headers={
+                "HTTP-Referer": "https://fliptechpro.com",
+                "X-Title": "FlipTech Pro Lead Generation",
+            },
+            max_concurrency=concurrency,
+        ))
+        self.register_provider(LLMProvider(
+            "openai",
+            "https://api.openai.com/v1",
+            api_key=settings.OPENAI_API_KEY,
+            max_concurrency=concurrency,
+        ))
+        self.register_provider(LLMProvider(
+            "anthropic",
+            "https://api.anthropic.com/v1",
+            api_key=settings.ANTHROPIC_API_KEY,
+            auth_header="x-api-key",
+            auth_prefix="",
+            headers={"anthropic-version": "2023-06-01"},
+            max_concurrency=concurrency,
+        ))
+
+    def register_provider(self, provider: LLMProvider):
+        """Add or replace a provider."""
+        self.providers[provider.name] = provider
+
+    def add_timing_hook(self, hook: TimingHook):
+        """
+        Register a callback receiving the timing record of every attempt.
+
+        Records contain provider, path, attempt, status_code, reused_connection,
+        connect_ms, tls_ms, ttfb_ms and total_ms. Hooks run inline and must
+        be cheap.
+        """
+        self._timing_hooks.append(hook)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+            )
+        return self._client
+
+    def _provider(self, name: str) -> LLMProvider:
+        provider = self.providers.get(name)
+        if provider is None:
+            raise ValueError(f"Unknown LLM provider: {name}")
+        return provider
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+
+        Retry-After (seconds or HTTP date) wins over the computed backoff.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                if delay > self.max_retry_after:
+                    return None
+                # Small jitter so callers throttled together do not return together
+                return max(0.0, delay) + random.uniform(0, self.backoff_base)
+
+        # Full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _emit_timing(self, record: Dict[str, Any]):
+        for hook in self._timing_hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                logger.debug(f"LLM timing hook failed: {e}")
+
+    def _record_attempt(
+        self,
+        upstream: LLMProvider,
+        path: str,
+        attempt: int,
+        timer: _RequestTimer,
+        status_code: Optional[int],
+        **extra
+    ):
+        timing = timer.summary()
+        upstream.stats["total_ms"] += timing["total_ms"]
+        self._emit_timing({
+            "provider": upstream.name,
+            "path": path,
+            "attempt": attempt,
+            "status_code": status_code,
+            **timing,
+            **extra,
+        })
+
+    def _handle_failure(
+        self,
+        upstream: LLMProvider,
+        path: str,
+        attempt: int,
+        response: Optional[httpx.Response],
+        error: Optional[Exception]
+    ) -> float:
+        """
+        Decide what to do after a failed attempt.
+
+        Returns:
+            Seconds to wait before retrying
+
+        Raises:
+            LLMGatewayError: When the failure is final
+        """
+        provider = upstream.name
+        retryable = error is not None or response.status_code in RETRYABLE_STATUS_CODES
+        delay = self._retry_delay(attempt, response) if retryable else None
+
+        if delay is None:
+            upstream.stats["failures"] += 1
+            if response is not None:
+                logger.error(f"{provider} API error: {response.status_code} - {response.text[:500]}")
+                raise LLMGatewayError(
+                    f"{provider} request failed: {response.status_code}",
+                    provider=provider,
+                    status_code=response.status_code,
+                    response_text=response.text,
+                )
+            logger.error(f"{provider} request error: {error}")
+            raise LLMGatewayError(f"{provider} request failed: {error}", provider=provider) from error
+
+        upstream.stats["retries"] += 1
+        logger.warning(
+            f"{provider} {path} attempt {attempt + 1} failed "
+            f"({response.status_code if response is not None else error}), retrying in {delay:.2f}s"
+        )
+        return delay
+
+    async def request(
+        self,
+        provider: str,
+        path: str,
+        payload: Dict[str, Any],
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON payload to a provider and return the decoded response.
+
+        Args:
+            provider: Registered provider name
+            path: Path relative to the provider base URL (e.g. "/chat/completions")
+            payload: JSON body
+            api_key: Override the provider's default key
+            timeout: Override the default timeout
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            LLMGatewayError: On a non-retryable error or when retries run out
+        """
+        upstream = self._provider(provider)
+        url = f"{upstream.base_url}{path}"
+        headers = upstream.build_headers(api_key)
+        attempt = 0
+
+        while True:
+            timer = _RequestTimer()
+            response = None
+            error: Optional[Exception] = None
+
+            async with upstream.semaphore:
+                upstream.stats["requests"] += 1
+                upstream.stats["in_flight"] += 1
+                try:
+                    response = await self.client.post(
+                        url,
+                        headers=headers,
+                        json=payload,
+                        timeout=timeout or self.timeout,
+                        extensions={"trace": timer.trace},
+                    )
+                except httpx.TransportError as e:
+                    error = e
+                finally:
+                    upstream.stats["in_flight"] -= 1
+
+            self._record_attempt(
+                upstream, path, attempt, timer, response.status_code if response is not None else None
+            )
+
+            if response is not None and response.status_code < 400:
+                return response.json()
+
+            await asyncio.sleep(self._handle_failure(upstream, path, attempt, response, error))
+            attempt += 1
+
+    async def stream(
+        self,
+        provider: str,
+        path: str,
+        payload: Dict[str, Any],
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        POST a JSON payload and yield the server-sent events of the response.
+
+        Retries follow the same rules as request() but only until the first
+        event has been yielded; a stream that breaks midway raises.
+
+        Args:
+            provider: Registered provider name
+            path: Path relative to the provider base URL
+            payload: JSON body (the caller sets the provider's stream flag)
+            api_key: Override the provider's default key
+            timeout: Override the default timeout (applies per read)
+
+        Yields:
+            Decoded JSON of each `data:` line, until `[DONE]`
+
+        Raises:
+            LLMGatewayError: On a non-retryable error, when retries run out,
+                or when the stream breaks after events were yielded
+        """
+        upstream = self._provider(provider)
+        url = f"{upstream.base_url}{path}"
+        headers = {**upstream.build_headers(api_key), "Accept": "text/event-stream"}
+        attempt = 0
+
+        while True:
+            timer = _RequestTimer()
+            response = None
+            error: Optional[Exception] = None
+            first_event_ms = None
+            events = 0
+
+            async with upstream.semaphore:
+                upstream.stats["requests"] += 1
+                upstream.stats["in_flight"] += 1
+                try:
+                    async with self.client.stream(
+                        "POST",
+                        url,
+                        headers=headers,
+                        json=payload,
+                        timeout=timeout or self.timeout,
+                        extensions={"trace": timer.trace},
+                    ) as response:
+                        if response.status_code < 400:
+                            async for event in _iter_sse(response):
+                                if first_event_ms is None:
+                                    first_event_ms = round((time.perf_counter() - timer.started) * 1000, 2)
+                                events += 1
+                                yield event
+                            return
+                        await response.aread()
+                except httpx.TransportError as e:
+                    if events:
+                        upstream.stats["failures"] += 1
+                        raise LLMGatewayError(
+                            f"{provider} stream interrupted: {e}", provider=provider
+                        ) from e
+                    error, response = e, None
+                finally:
+                    upstream.stats["in_flight"] -= 1
+                    self._record_attempt(
+                        upstream, path, attempt, timer,
+                        response.status_code if response is not None else None,
+                        first_event_ms=first_event_ms,
+                        events=events,
+                    )
+
+            await asyncio.sleep(self._handle_failure(upstream, path, attempt, response, error))
+            attempt += 1
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        provider: str = "openrouter",
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **params
+    ) -> Dict[str, Any]:
+        """
+        OpenAI-compatible chat completion.
+
+        Args:
+            messages: Chat messages as role/content dicts
+            model: Model identifier
+            provider: Registered provider name
+            api_key: Override the provider's default key
+            timeout: Override the default timeout
+            **params: Extra body fields (temperature, max_tokens, ...)
+
+        Returns:
+            Raw completion response
+        """
+        payload = {"model": model, "messages": messages, **params}
+        return await self.request(provider, "/chat/completions", payload, api_key=api_key, timeout=timeout)
+
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        provider: str = "openrouter",
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **params
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        OpenAI-compatible streamed chat completion.
+
+        Args:
+            messages: Chat messages as role/content dicts
+            model: Model identifier
+            provider: Registered provider name
+            api_key: Override the provider's default key
+            timeout: Override the default timeout
+            **params: Extra body fields (temperature, max_tokens, ...)
+
+        Yields:
+            Completion chunks (choices[0].delta, and usage on the last one
+            when the provider reports it)
+        """
+        payload = {"model": model, "messages": messages, **params, "stream": True}
+        async for chunk in self.stream(provider, "/chat/completions", payload, api_key=api_key, timeout=timeout):
+            yield chunk
+
+    async def embeddings(
+        self,
+        input: Union[str, List[str]],
+        model: str,
+        provider: str = "openrouter",
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[List[float]]:
+        """
+        OpenAI-compatible embeddings.
+
+        Returns:
+            One vector per input, in input order
+        """
+        data = await self.request(
+            provider, "/embeddings", {"model": model, "input": input}, api_key=api_key, timeout=timeout
+        )
+        return [item["embedding"] for item in sorted(data["data"], key=lambda item: item.get("index", 0))]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider request counters."""
+        return {
+            "http2": self.http2,
+            "providers": {
+                name: {**provider.stats, "max_concurrency": provider.max_concurrency}
+                for name, provider in self.providers.items()
+            },
+        }
+
+    async def close(self):
+        """Close the shared client (application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global instance
+llm_gateway = LLMGateway()
@@ -0,0 +1,400 @@
+"""
+Metric Sink
+
+Write-behind buffer for AI bookkeeping rows (ai_gym_performance and
+ai_model_metrics).
+
+Trackers reserve row IDs from a locally cached block of sequence values
+(refilled in the background) and queue the insert or update instead of
+committing on the request path. A background flusher coalesces each batch (an update to a row that has not been
+written yet is folded into its insert), writes it with one bulk INSERT and one
+bulk UPDATE per table, and appends the batch to a local spool file when the
+database is unavailable. The spool is replayed once writes succeed again.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, column, insert, table, text, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot spool {type(value).__name__}")
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class MetricSink:
+    """
+    Buffers metric inserts/updates and persists them in batches.
+
+    Features:
+    - Row IDs from preallocated sequence blocks, refilled in the background
+      (next_id returns None instead of raising while the database is down)
+    - Non-blocking insert()/update() for the request path
+    - Flush every `batch_size` operations or `flush_interval` seconds
+    - One lock around taking, persisting and replaying batches, so they are
+      written in queue order
+    - Updates of still-buffered rows merged into their insert
+    - Spool file fallback while the database is down, replayed afterwards
+    - Drain on shutdown
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 50_000,
+        id_block_size: int = 100,
+        id_retry_seconds: float = 5.0,
+        spool_path: str = settings.METRIC_SPOOL_PATH,
+    ):
+        """
+        Initialize sink.
+
+        Args:
+            batch_size: Maximum operations persisted per flush
+            flush_interval: Maximum seconds an operation waits in the buffer
+            max_queue_size: Operations beyond this are dropped (and counted)
+            id_block_size: Sequence values reserved per ID refill (unused
+                values are skipped after a restart)
+            id_retry_seconds: How long to skip tracking after an ID refill
+                failed, instead of querying on every request
+            spool_path: JSON-lines file for batches that could not be written
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.id_block_size = id_block_size
+        self.id_retry_seconds = id_retry_seconds
+        self.spool_path = spool_path
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._running = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set on the first queued operation / once a full batch is queued
+        self._work = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        # Held while a batch is off the queue, until it is written or spooled
+        self._flush_lock = asyncio.Lock()
+
+        self._ids: Dict[str, Deque[int]] = defaultdict(deque)
+        self._id_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._id_refills: Dict[str, asyncio.Task] = {}
+        self._id_retry_at: Dict[str, float] = {}
+        # (table, id) of inserts not yet written, so readers can flush first
+        self._pending: Set[Tuple[str, int]] = set()
+
+        self.stats = {
+            "queued": 0,
+            "dropped": 0,
+            "flushed": 0,
+            "spooled": 0,
+            "replayed": 0,
+            "flush_errors": 0,
+            "id_errors": 0,
+        }
+
+    async def next_id(self, table_name: str) -> Optional[int]:
+        """
+        Reserve the primary key for a new row.
+
+        The block is topped up in the background once a quarter of it is
+        left, so the request path only queries when IDs ran out entirely.
+
+        Args:
+            table_name: Table whose `id` sequence to draw from
+
+        Returns:
+            Row ID to pass to insert(), or None if no ID could be reserved
+            (the caller skips tracking instead of failing)
+        """
+        ids = self._ids[table_name]
+        if not ids:
+            await self._refill_ids(table_name)
+            if not ids:
+                return None
+
+        row_id = ids.popleft()
+        if len(ids) <= self.id_block_size // 4:
+            refill = self._id_refills.get(table_name)
+            if refill is None or refill.done():
+                self._id_refills[table_name] = asyncio.create_task(self._refill_ids(table_name))
+        return row_id
+
+    async def _refill_ids(self, table_name: str):
+        """Reserve another block of sequence values (errors are logged, not raised)."""
+        ids = self._ids[table_name]
+        async with self._id_locks[table_name]:
+            loop = asyncio.get_running_loop()
+            if len(ids) > self.id_block_size // 4 or loop.time() < self._id_retry_at.get(table_name, 0.0):
+                return
+            try:
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        text(
+                            "SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) "
+                            "FROM generate_series(1, :count)"
+                        ),
+                        {"table_name": table_name, "count": self.id_block_size}
+                    )
+                    ids.extend(row[0] for row in result)
+            except Exception as e:
+                self.stats["id_errors"] += 1
+                self._id_retry_at[table_name] = loop.time() + self.id_retry_seconds
+                logger.warning(f"Could not reserve {table_name} IDs, tracking is skipped meanwhile: {e}")
+
+    def insert(self, table_name: str, row_id: int, values: Dict[str, Any]) -> bool:
+        """
+        Queue a new row.
+
+        Returns:
+            bool: False if the buffer is full and the row was dropped
+        """
+        if self._enqueue({"op": "insert", "table": table_name, "id": row_id, "values": values}):
+            self._pending.add((table_name, row_id))
+            return True
+        return False
+
+    def update(self, table_name: str, row_id: int, values: Dict[str, Any]) -> bool:
+        """
+        Queue column updates for a row (buffered or already written).
+
+        Returns:
+            bool: False if the buffer is full and the update was dropped
+        """
+        return self._enqueue({"op": "update", "table": table_name, "id": row_id, "values": values})
+
+    def is_pending(self, table_name: str, row_id: int) -> bool:
+        """Whether a row's insert is still buffered."""
+        return (table_name, row_id) in self._pending
+
+    def _enqueue(self, operation: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(operation)
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            logger.warning(f"Metric buffer full, dropped {operation['op']} on {operation['table']}")
+            return False
+
+        self.stats["queued"] += 1
+        self._work.set()
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_full.set()
+        self._ensure_running()
+        return True
+
+    def _ensure_running(self):
+        """Start the flusher on the current loop if it is not running there."""
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._running = True
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+            except RuntimeError:
+                # No running loop; the next enqueue inside one starts it
+                self._running = False
+
+    async def start(self):
+        """Start the background flusher."""
+        if self._running and self._flush_task and not self._flush_task.done():
+            logger.warning("Metric sink already running")
+            return
+
+        self._ensure_running()
+        logger.info("Metric sink started")
+
+    async def stop(self):
+        """Stop the flusher and drain buffered operations (spooling on failure)."""
+        self._running = False
+        # Wake the loop instead of cancelling it, so a batch it holds is
+        # written or spooled before it exits
+        self._work.set()
+        self._batch_full.set()
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush_all()
+        logger.info("Metric sink stopped")
+
+    async def flush_all(self):
+        """Persist everything currently buffered."""
+        while not self._queue.empty():
+            await self.flush()
+
+    async def _flush_loop(self):
+        """Flush on size or time, whichever comes first."""
+        while self._running:
+            try:
+                await self._wait_for_batch()
+                await self.flush()
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logger.error(f"Error flushing metrics: {e}")
+                await asyncio.sleep(self.flush_interval)
+
+    async def _wait_for_batch(self):
+        """
+        Wait until a full batch is queued, or `flush_interval` after the first
+        operation arrived. Nothing is taken off the queue while waiting.
+        """
+        while self._queue.empty() and self._running:
+            self._work.clear()
+            await self._work.wait()
+
+        if self._running and self._queue.qsize() < self.batch_size:
+            self._batch_full.clear()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def flush(self) -> int:
+        """
+        Persist up to one batch of buffered operations.
+
+        Returns:
+            int: Number of operations persisted (0 if the batch was spooled)
+        """
+        async with self._flush_lock:
+            batch = self._collect_batch()
+            if not batch:
+                return 0
+
+            try:
+                # Older spooled operations go first so updates find their rows
+                if os.path.exists(self.spool_path):
+                    await self._replay_spool()
+                await self._persist(batch)
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logger.warning(f"Metric flush failed, spooling {len(batch)} operations: {e}")
+                await asyncio.to_thread(self._spool, batch)
+                self.stats["spooled"] += len(batch)
+                return 0
+            finally:
+                for operation in batch:
+                    if operation["op"] == "insert":
+                        self._pending.discard((operation["table"], operation["id"]))
+
+        self.stats["flushed"] += len(batch)
+        return len(batch)
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Take up to one batch off the queue (call with _flush_lock held)."""
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _persist(self, batch: List[Dict[str, Any]]):
+        """Write one batch in a single transaction."""
+        inserts: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        updates: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+        for operation in batch:
+            key = (operation["table"], operation["id"])
+            if operation["op"] == "insert":
+                inserts[key] = dict(operation["values"])
+            elif key in inserts:
+                inserts[key].update(operation["values"])
+            else:
+                updates.setdefault(key, {}).update(operation["values"])
+
+        # Bulk statements need the same columns in every row
+        insert_groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = defaultdict(list)
+        for (table_name, row_id), values in inserts.items():
+            insert_groups[(table_name, tuple(sorted(values)))].append({"id": row_id, **values})
+
+        update_groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = defaultdict(list)
+        for (table_name, row_id), values in updates.items():
+            # Bind names must differ from the SET columns
+            update_groups[(table_name, tuple(sorted(values)))].append(
+                {"_id": row_id, **{f"_{name}": value for name, value in values.items()}}
+            )
+
+        async with AsyncSessionLocal() as session:
+            try:
+                for (table_name, columns), rows in insert_groups.items():
+                    target = table(table_name, column("id"), *(column(name) for name in columns))
+                    await session.execute(insert(target), rows)
+
+                for (table_name, columns), rows in update_groups.items():
+                    target = table(table_name, column("id"), *(column(name) for name in columns))
+                    await session.execute(
+                        update(target)
+                        .where(target.c.id == bindparam("_id"))
+                        .values({name: bindparam(f"_{name}") for name in columns}),
+                        rows
+                    )
+
+                await session.commit()
+                logger.debug(f"Flushed {len(inserts)} metric inserts and {len(updates)} updates")
+
+            except Exception:
+                await session.rollback()
+                raise
+
+    def _spool(self, batch: List[Dict[str, Any]]):
+        """Append a batch to the spool file."""
+        directory = os.path.dirname(self.spool_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spool_path, "a", encoding="utf-8") as handle:
+            for operation in batch:
+                handle.write(json.dumps(operation, default=_encode) + "\n")
+
+    def _take_spool(self) -> List[Dict[str, Any]]:
+        """Move the spool aside and read it back."""
+        replay_path = f"{self.spool_path}.replay"
+        os.replace(self.spool_path, replay_path)
+        with open(replay_path, "r", encoding="utf-8") as handle:
+            operations = [json.loads(line, object_hook=_decode) for line in handle if line.strip()]
+        os.remove(replay_path)
+        return operations
+
+    async def _replay_spool(self):
+        """
+        Write spooled operations in original order (call with _flush_lock held).
+
+        Raises:
+            Exception: If a chunk fails; the unwritten remainder is spooled again
+        """
+        operations = await asyncio.to_thread(self._take_spool)
+        logger.info(f"Replaying {len(operations)} spooled metric operations")
+
+        for start in range(0, len(operations), self.batch_size):
+            chunk = operations[start:start + self.batch_size]
+            try:
+                await self._persist(chunk)
+            except Exception:
+                await asyncio.to_thread(self._spool, operations[start:])
+                raise
+            self.stats["replayed"] += len(chunk)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sink statistics."""
+        return {
+            **self.stats,
+            "buffered": self._queue.qsize(),
+            "running": self._running,
+            "spool_exists": os.path.exists(self.spool_path),
+        }
+
+
+# Global instance
+metric_sink = MetricSink()
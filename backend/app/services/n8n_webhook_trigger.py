@@ -9,11 +9,13 @@ retries, and error handling.
 import aiohttp
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 import json
 import time
 
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.core.webhook_config import webhook_config, get_webhook_url
 from app.core.url_validator import URLValidator, URLSecurityError
 from app.utils.webhook_security import WebhookSecurity
@@ -31,6 +33,38 @@ class N8nWebhookTimeoutError(N8nWebhookTriggerError):
     pass
 
 
+class N8nWebhookCircuitOpenError(N8nWebhookTriggerError, CircuitOpenError):
+    """Destination is failing; delivery was not attempted."""
+    pass
+
+
+class DestinationLane:
+    """
+    Delivery lane for one destination host.
+
+    Each lane has its own concurrency limit and circuit breaker, so a slow
+    or dead destination only ever ties up its own lane.
+    """
+
+    def __init__(self, destination: str, max_concurrency: int, failure_threshold: int, reset_timeout: float):
+        self.destination = destination
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.breaker = CircuitBreaker(
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+            name=destination
+        )
+        self.in_flight = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get lane state."""
+        return {
+            "destination": self.destination,
+            "in_flight": self.in_flight,
+            "circuit": self.breaker.get_stats()
+        }
+
+
 class N8nWebhookTrigger:
     """
     Trigger n8n workflows via webhooks from backend events.
@@ -38,13 +72,24 @@ class N8nWebhookTrigger:
     This service provides methods to trigger various n8n workflows
     in response to backend events like lead scraping, demo deployment,
     video generation, etc.
+
+    Features:
+    - Per-destination lanes with concurrency limits and circuit breakers
+    - Failed deliveries rescheduled in the webhook queue, never slept on
+    - Cached URL validation and DNS lookups
     """
 
+    # Upper bound on cached URL validation results
+    MAX_VALIDATION_CACHE = 1000
+
     def __init__(self):
         """Initialize webhook trigger service."""
         self.config = webhook_config
         self.security = WebhookSecurity()
         self._session: Optional[aiohttp.ClientSession] = None
+        self._lanes: Dict[str, DestinationLane] = {}
+        # url -> (expires_at, validated_url, error)
+        self._validated_urls: Dict[str, Tuple[float, Optional[str], Optional[str]]] = {}
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP client session."""
@@ -500,7 +545,13 @@ class N8nWebhookTrigger:
         priority: int = 0
     ) -> bool:
         """
-        Send webhook with retry logic.
+        Send webhook through its destination lane.
+
+        Makes a single delivery attempt. If it fails and retries are allowed,
+        the webhook is rescheduled in the persistent webhook queue instead of
+        being retried inline, so the caller is never held through the backoff
+        schedule. The queue processor calls with retry_count=0 and handles
+        retries itself.
 
         SECURITY: Validates webhook URL to prevent SSRF attacks
         OWASP: https://cheatsheetseries.owasp.org/cheatsheets/Server_Side_Request_Forgery_Prevention_Cheat_Sheet.html
@@ -515,23 +566,15 @@ class N8nWebhookTrigger:
             priority: Priority level (0=normal, 1=high, 2=urgent, 3=critical)
 
         Returns:
-            True if webhook was sent successfully
+            True if webhook was delivered by this call
 
         Raises:
-            N8nWebhookTriggerError: If webhook delivery fails after retries
+            N8nWebhookTriggerError: If the webhook URL fails validation
+            N8nWebhookCircuitOpenError: If the destination's circuit is open
+                and retry_count is 0 (the caller owns retries)
         """
         # Validate webhook URL to prevent SSRF
-        from app.core.security_config import get_webhook_allowed_domains
-        validator = URLValidator(
-            allowed_domains=get_webhook_allowed_domains(),
-            allow_private_ips=False,
-            strict_mode=True
-        )
-        try:
-            validated_url = validator.validate_webhook_url(webhook_url)
-        except URLSecurityError as e:
-            logger.error(f"Blocked unsafe webhook URL: {webhook_url} - {e}")
-            raise N8nWebhookTriggerError(f"Invalid webhook URL: {str(e)}")
+        validated_url = await self._validate_url(webhook_url)
 
         if retry_count is None:
             retry_count = self.config.retry.max_retries
@@ -553,16 +596,60 @@ class N8nWebhookTrigger:
             )
             request_headers.update(signed_payload['headers'])
 
-        # Get session
-        session = await self.get_session()
+        lane = self._get_lane(validated_url)
+
+        if not lane.breaker.allow():
+            retry_after = lane.breaker.retry_after
+            logger.warning(
+                f"Circuit open for {lane.destination}, not sending webhook: "
+                f"url={webhook_url}, retry_in={retry_after:.0f}s"
+            )
+            if retry_count == 0:
+                raise N8nWebhookCircuitOpenError(lane.destination, retry_after)
+            await self._reschedule(
+                webhook_url, data, headers, entity_type, entity_id, priority,
+                retry_count, delay=retry_after, error=f"Circuit open for {lane.destination}"
+            )
+            return False
 
-        # Attempt delivery with retries
-        last_error = None
-        for attempt in range(retry_count + 1):
+        success, last_error = await self._attempt(lane, validated_url, data, request_headers)
+        if success:
+            return True
+
+        if retry_count > 0:
+            first_delay = self.config.retry.retry_delays[0] if self.config.retry.retry_delays else 5
+            await self._reschedule(
+                webhook_url, data, headers, entity_type, entity_id, priority,
+                retry_count, delay=max(first_delay, lane.breaker.retry_after), error=last_error
+            )
+        else:
+            logger.error(f"Webhook delivery failed: url={webhook_url}, last_error={last_error}")
+
+        return False
+
+    async def _attempt(
+        self,
+        lane: DestinationLane,
+        validated_url: str,
+        data: Dict[str, Any],
+        request_headers: Dict[str, str]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Make one delivery attempt within the lane's concurrency limit.
+
+        Server errors, throttling and network failures count against the
+        destination's circuit; other 4xx responses mean the destination is
+        up and only this request was rejected.
+
+        Returns:
+            Tuple of (success, error message)
+        """
+        async with lane.semaphore:
+            lane.in_flight += 1
             try:
                 start_time = time.time()
+                session = await self.get_session()
 
-                # Send request using validated URL
                 async with session.post(
                     validated_url,  # Use the validated URL
                     json=data,
@@ -573,48 +660,140 @@ class N8nWebhookTrigger:
                     # Read response
                     response_text = await response.text()
 
-                    # Check status
                     if response.status >= 200 and response.status < 300:
+                        lane.breaker.record_success()
                         logger.info(
-                            f"Webhook sent successfully: url={webhook_url}, "
+                            f"Webhook sent successfully: url={validated_url}, "
                             f"event={data.get('event')}, status={response.status}, "
                             f"duration_ms={duration_ms}"
                         )
-                        return True
+                        return True, None
+
+                    if response.status >= 500 or response.status == 429:
+                        lane.breaker.record_failure()
                     else:
-                        error_msg = f"Webhook failed with status {response.status}: {response_text}"
-                        logger.warning(error_msg)
-                        last_error = error_msg
+                        lane.breaker.record_success()
+
+                    error_msg = f"Webhook failed with status {response.status}: {response_text}"
+                    logger.warning(error_msg)
+                    return False, error_msg
 
             except asyncio.TimeoutError:
+                lane.breaker.record_failure()
                 error_msg = f"Webhook request timeout after {self.config.retry.timeout_seconds}s"
-                logger.warning(f"{error_msg}: url={webhook_url}, attempt={attempt + 1}")
-                last_error = error_msg
+                logger.warning(f"{error_msg}: url={validated_url}")
+                return False, error_msg
 
             except aiohttp.ClientError as e:
+                lane.breaker.record_failure()
                 error_msg = f"Webhook request failed: {str(e)}"
-                logger.warning(f"{error_msg}: url={webhook_url}, attempt={attempt + 1}")
-                last_error = error_msg
+                logger.warning(f"{error_msg}: url={validated_url}")
+                return False, error_msg
 
             except Exception as e:
+                lane.breaker.record_failure()
                 error_msg = f"Unexpected error sending webhook: {str(e)}"
-                logger.error(f"{error_msg}: url={webhook_url}, attempt={attempt + 1}")
-                last_error = error_msg
-
-            # Wait before retry (if not last attempt)
-            if attempt < retry_count:
-                retry_delay = self.config.retry.retry_delays[
-                    min(attempt, len(self.config.retry.retry_delays) - 1)
-                ]
-                logger.info(f"Retrying webhook in {retry_delay}s (attempt {attempt + 2}/{retry_count + 1})")
-                await asyncio.sleep(retry_delay)
-
-        # All retries failed
-        logger.error(
-            f"Webhook delivery failed after {retry_count + 1} attempts: "
-            f"url={webhook_url}, last_error={last_error}"
-        )
-        return False
+                logger.error(f"{error_msg}: url={validated_url}")
+                return False, error_msg
+
+            finally:
+                lane.in_flight -= 1
+
+    async def _reschedule(
+        self,
+        webhook_url: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+        entity_type: Optional[str],
+        entity_id: Optional[int],
+        priority: int,
+        retry_count: int,
+        delay: float,
+        error: Optional[str]
+    ):
+        """Hand a failed delivery to the webhook queue for a later retry."""
+        from app.services.webhook_queue import schedule_webhook_retry
+
+        try:
+            queue_id = await schedule_webhook_retry(
+                webhook_url=webhook_url,
+                payload=data,
+                event_type=data.get('event', 'unknown'),
+                delay_seconds=delay,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                priority=priority,
+                headers=headers,
+                retries=retry_count,
+                last_error=error
+            )
+            logger.info(
+                f"Webhook rescheduled: queue_id={queue_id}, url={webhook_url}, "
+                f"retry_in={delay:.0f}s, last_error={error}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Webhook delivery failed and could not be rescheduled: "
+                f"url={webhook_url}, last_error={error}, error={str(e)}"
+            )
+
+    async def _validate_url(self, webhook_url: str) -> str:
+        """
+        Validate a webhook URL, reusing recent results.
+
+        Validation resolves the hostname (blocking), so cache misses run in
+        a worker thread.
+
+        Raises:
+            N8nWebhookTriggerError: If the URL fails validation
+        """
+        ttl = self.config.delivery.validation_cache_ttl
+        now = time.monotonic()
+        cached = self._validated_urls.get(webhook_url)
+
+        if cached and cached[0] > now:
+            _, validated_url, error = cached
+        else:
+            from app.core.security_config import get_webhook_allowed_domains
+            validator = URLValidator(
+                allowed_domains=get_webhook_allowed_domains(),
+                allow_private_ips=False,
+                strict_mode=True
+            )
+            try:
+                validated_url = await asyncio.to_thread(validator.validate_webhook_url, webhook_url)
+                error = None
+            except URLSecurityError as e:
+                validated_url, error = None, str(e)
+
+            if ttl:
+                if len(self._validated_urls) >= self.MAX_VALIDATION_CACHE:
+                    self._validated_urls.clear()
+                self._validated_urls[webhook_url] = (now + ttl, validated_url, error)
+
+        if error:
+            logger.error(f"Blocked unsafe webhook URL: {webhook_url} - {error}")
+            raise N8nWebhookTriggerError(f"Invalid webhook URL: {error}")
+
+        return validated_url
+
+    def _get_lane(self, url: str) -> DestinationLane:
+        """Get or create the delivery lane for a URL's host."""
+        destination = urlparse(url).netloc.lower()
+        lane = self._lanes.get(destination)
+        if lane is None:
+            delivery = self.config.delivery
+            lane = self._lanes[destination] = DestinationLane(
+                destination,
+                max_concurrency=delivery.max_concurrency_per_destination,
+                failure_threshold=delivery.circuit_failure_threshold,
+                reset_timeout=delivery.circuit_reset_seconds
+            )
+        return lane
+
+    def get_lane_stats(self) -> List[Dict[str, Any]]:
+        """Get state of every destination lane."""
+        return [lane.get_stats() for lane in self._lanes.values()]
 
     async def batch_send_webhooks(
         self,
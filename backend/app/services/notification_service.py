@@ -6,18 +6,19 @@ import asyncio
 import json
 import logging
 import smtplib
+import time
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass
 
 import aiohttp
 import websockets
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, insert, select, update
 
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.models.notifications import (
     Notification, NotificationChannel, NotificationDelivery, 
     NotificationPreference, NotificationTemplate, NotificationDigest,
@@ -235,13 +236,8 @@ class EmailNotificationSender:
             else:
                 msg.attach(MIMEText(body, 'plain'))
             
-            # Send email
-            with smtplib.SMTP(self.smtp_config['host'], self.smtp_config['port']) as server:
-                if self.smtp_config['use_tls']:
-                    server.starttls()
-                
-                server.login(self.smtp_config['username'], self.smtp_config['password'])
-                server.send_message(msg)
+            # smtplib blocks, so send from a worker thread
+            await asyncio.to_thread(self._send_message, msg)
             
             logger.info(f"Email sent to {to_email}: {subject}")
             return True
@@ -249,6 +245,15 @@ class EmailNotificationSender:
         except Exception as e:
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
+    
+    def _send_message(self, msg: MIMEMultipart):
+        """Deliver a message over SMTP (blocking)."""
+        with smtplib.SMTP(self.smtp_config['host'], self.smtp_config['port']) as server:
+            if self.smtp_config['use_tls']:
+                server.starttls()
+            
+            server.login(self.smtp_config['username'], self.smtp_config['password'])
+            server.send_message(msg)
 
 
 class WebhookNotificationSender:
@@ -258,9 +263,19 @@ class WebhookNotificationSender:
         self, 
         webhook_url: str, 
         payload: Dict[str, Any], 
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ) -> bool:
-        """Send webhook notification."""
+        """
+        Send webhook notification.
+        
+        Args:
+            webhook_url: Destination URL
+            payload: JSON payload
+            headers: Extra headers
+            session: Pooled session to send with; a one-off session is
+                used when omitted
+        """
         try:
             default_headers = {
                 'Content-Type': 'application/json',
@@ -270,23 +285,35 @@ class WebhookNotificationSender:
             if headers:
                 default_headers.update(headers)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_url,
-                    json=payload,
-                    headers=default_headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status < 400:
-                        logger.info(f"Webhook sent to {webhook_url}: {response.status}")
-                        return True
-                    else:
-                        logger.error(f"Webhook failed to {webhook_url}: {response.status}")
-                        return False
+            if session is None:
+                async with aiohttp.ClientSession() as one_off_session:
+                    return await self._post(one_off_session, webhook_url, payload, default_headers)
+            
+            return await self._post(session, webhook_url, payload, default_headers)
             
         except Exception as e:
             logger.error(f"Failed to send webhook to {webhook_url}: {e}")
             return False
+    
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        webhook_url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str]
+    ) -> bool:
+        async with session.post(
+            webhook_url,
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            if response.status < 400:
+                logger.info(f"Webhook sent to {webhook_url}: {response.status}")
+                return True
+            else:
+                logger.error(f"Webhook failed to {webhook_url}: {response.status}")
+                return False
 
 
 class SlackNotificationSender:
@@ -298,7 +325,8 @@ class SlackNotificationSender:
         message: str, 
         channel: Optional[str] = None,
         username: Optional[str] = "CraigLeads",
-        icon_emoji: Optional[str] = ":robot_face:"
+        icon_emoji: Optional[str] = ":robot_face:",
+        session: Optional[aiohttp.ClientSession] = None
     ) -> bool:
         """Send Slack notification."""
         try:
@@ -311,7 +339,7 @@ class SlackNotificationSender:
             if channel:
                 payload["channel"] = channel
             
-            return await WebhookNotificationSender().send_webhook(webhook_url, payload)
+            return await WebhookNotificationSender().send_webhook(webhook_url, payload, session=session)
             
         except Exception as e:
             logger.error(f"Failed to send Slack message: {e}")
@@ -326,7 +354,8 @@ class DiscordNotificationSender:
         webhook_url: str, 
         content: str, 
         username: Optional[str] = "CraigLeads",
-        avatar_url: Optional[str] = None
+        avatar_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ) -> bool:
         """Send Discord notification."""
         try:
@@ -338,7 +367,7 @@ class DiscordNotificationSender:
             if avatar_url:
                 payload["avatar_url"] = avatar_url
             
-            return await WebhookNotificationSender().send_webhook(webhook_url, payload)
+            return await WebhookNotificationSender().send_webhook(webhook_url, payload, session=session)
             
         except Exception as e:
             logger.error(f"Failed to send Discord message: {e}")
@@ -364,7 +393,9 @@ class SMSNotificationSender:
                 logger.error("Twilio client not available")
                 return False
             
-            message = self.client.messages.create(
+            # Twilio's client blocks, so send from a worker thread
+            message = await asyncio.to_thread(
+                self.client.messages.create,
                 body=message,
                 from_=self.from_number,
                 to=to_number
@@ -378,8 +409,110 @@ class SMSNotificationSender:
             return False
 
 
+class NotificationDeliveryError(Exception):
+    """Raised by channel senders when a notification cannot be delivered."""
+    pass
+
+
+class TokenBucket:
+    """Non-blocking token bucket; callers check capacity instead of waiting."""
+    
+    def __init__(self, rate: int, per_seconds: float):
+        self.capacity = float(max(1, rate))
+        self.fill_rate = self.capacity / per_seconds
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+        self.updated_at = now
+    
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+    
+    def wait_time(self) -> float:
+        """Seconds until one token is available."""
+        return max(0.0, (1 - self.available()) / self.fill_rate)
+    
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+
+class ChannelLane:
+    """
+    Delivery lane for one notification channel.
+    
+    Holds the channel's concurrency limit, its rate limits (from the
+    channel's rate_limit_per_minute / rate_limit_per_hour) and, for HTTP
+    channels, a pooled client session.
+    """
+    
+    def __init__(self, channel_type: str, concurrency: int, per_minute: int, per_hour: int):
+        self.channel_type = channel_type
+        self.concurrency = concurrency
+        self.limits = (per_minute, per_hour)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.buckets: List[TokenBucket] = []
+        # WebSocket pushes are local, so they are never rate limited
+        if channel_type != "websocket":
+            if per_minute:
+                self.buckets.append(TokenBucket(per_minute, 60))
+            if per_hour:
+                self.buckets.append(TokenBucket(per_hour, 3600))
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def has_capacity(self) -> bool:
+        return all(bucket.available() >= 1 for bucket in self.buckets)
+    
+    def wait_time(self) -> float:
+        return max((bucket.wait_time() for bucket in self.buckets), default=0.0)
+    
+    def acquire(self):
+        for bucket in self.buckets:
+            bucket.take()
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the lane's pooled HTTP session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency)
+            )
+        return self._session
+    
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
 class NotificationService:
-    """Main notification service."""
+    """
+    Main notification service.
+    
+    Features:
+    - Paged, lock-free dispatch of pending notifications (SKIP LOCKED)
+    - Per-run preference, channel and template caches
+    - Concurrent channel fan-out through per-channel lanes
+    - Bulk delivery, status and channel-statistics writes
+    """
+    
+    # Notifications locked and dispatched per page
+    PAGE_SIZE = 500
+    
+    # Concurrent sends per channel
+    CHANNEL_CONCURRENCY = {
+        "email": 10,
+        "sms": 5,
+        "slack": 10,
+        "discord": 10,
+        "webhook": 20,
+        "websocket": 200
+    }
+    
+    # Seconds before a failed notification is retried
+    RETRY_DELAY_SECONDS = 300
     
     def __init__(self):
         self.db = None  # Will be set per request
@@ -399,6 +532,11 @@ class NotificationService:
             "sms": self._send_sms_notification,
             "websocket": self._send_websocket_notification
         }
+        
+        # Channel config ID -> delivery lane
+        self._lanes: Dict[int, ChannelLane] = {}
+        # Notification type -> active email template (refreshed every dispatch run)
+        self._email_templates: Dict[str, Optional[NotificationTemplate]] = {}
     
     async def create_notification(
         self,
@@ -565,7 +703,13 @@ class NotificationService:
                 return False
             
             start_time = datetime.utcnow()
-            success = await sender_func(notification, channel_config, delivery)
+            lane = self._lane_for(channel_config)
+            async with lane.semaphore:
+                try:
+                    success = await sender_func(notification, channel_config)
+                except Exception as e:
+                    delivery.error_message = str(e)
+                    success = False
             end_time = datetime.utcnow()
             
             # Update delivery record
@@ -598,188 +742,145 @@ class NotificationService:
     async def _send_websocket_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send WebSocket notification."""
-        try:
-            message = WebSocketMessage(
-                type="notification",
-                data={
-                    "id": notification.id,
-                    "type": notification.notification_type,
-                    "priority": notification.priority,
-                    "title": notification.title,
-                    "message": notification.message,
-                    "data": notification.data
-                }
-            )
-            
-            if notification.broadcast:
-                return await self.websocket_manager.broadcast(message)
-            elif notification.user_id:
-                return await self.websocket_manager.send_to_user(notification.user_id, message)
-            else:
-                return False
-                
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
+        message = WebSocketMessage(
+            type="notification",
+            data={
+                "id": notification.id,
+                "type": notification.notification_type,
+                "priority": notification.priority,
+                "title": notification.title,
+                "message": notification.message,
+                "data": notification.data
+            }
+        )
+        
+        if notification.broadcast:
+            return await self.websocket_manager.broadcast(message)
+        elif notification.user_id:
+            return await self.websocket_manager.send_to_user(notification.user_id, message)
+        else:
             return False
     
     async def _send_email_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send email notification."""
-        try:
-            # Get email template
-            template = self.db.query(NotificationTemplate).filter(
+        # Get email template
+        template = self._get_email_template(notification.notification_type)
+        
+        if template:
+            # Render template with notification data
+            title = self._render_template(template.title_template, notification.data or {})
+            body = self._render_template(template.message_template, notification.data or {})
+        else:
+            title = notification.title
+            body = notification.message
+        
+        # Get user email (for now, assume user_id is email)
+        to_email = notification.user_id if notification.user_id else channel_config.configuration.get("default_email")
+        
+        if not to_email:
+            raise NotificationDeliveryError("No email address available")
+        
+        return await self.email_sender.send_email(to_email, title, body)
+    
+    def _get_email_template(self, notification_type: str) -> Optional[NotificationTemplate]:
+        """Get the active email template for a notification type (cached)."""
+        if notification_type not in self._email_templates and self.db is not None:
+            self._email_templates[notification_type] = self.db.query(NotificationTemplate).filter(
                 and_(
-                    NotificationTemplate.notification_type == notification.notification_type,
+                    NotificationTemplate.notification_type == notification_type,
                     NotificationTemplate.channel_type == "email",
                     NotificationTemplate.is_active == True
                 )
             ).first()
-            
-            if template:
-                # Render template with notification data
-                title = self._render_template(template.title_template, notification.data)
-                body = self._render_template(template.message_template, notification.data)
-            else:
-                title = notification.title
-                body = notification.message
-            
-            # Get user email (for now, assume user_id is email)
-            to_email = notification.user_id if notification.user_id else channel_config.configuration.get("default_email")
-            
-            if not to_email:
-                delivery.error_message = "No email address available"
-                self.db.commit()
-                return False
-            
-            return await self.email_sender.send_email(to_email, title, body)
-            
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
-            return False
+        return self._email_templates.get(notification_type)
     
     async def _send_webhook_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send webhook notification."""
-        try:
-            webhook_url = channel_config.webhook_url
-            if not webhook_url:
-                delivery.error_message = "No webhook URL configured"
-                self.db.commit()
-                return False
-            
-            payload = {
-                "id": notification.id,
-                "type": notification.notification_type,
-                "priority": notification.priority,
-                "title": notification.title,
-                "message": notification.message,
-                "data": notification.data,
-                "timestamp": notification.created_at.isoformat()
-            }
-            
-            headers = channel_config.configuration.get("headers", {})
-            return await self.webhook_sender.send_webhook(webhook_url, payload, headers)
-            
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
-            return False
+        webhook_url = channel_config.webhook_url
+        if not webhook_url:
+            raise NotificationDeliveryError("No webhook URL configured")
+        
+        payload = {
+            "id": notification.id,
+            "type": notification.notification_type,
+            "priority": notification.priority,
+            "title": notification.title,
+            "message": notification.message,
+            "data": notification.data,
+            "timestamp": notification.created_at.isoformat()
+        }
+        
+        headers = (channel_config.configuration or {}).get("headers", {})
+        session = await self._lane_for(channel_config).get_session()
+        return await self.webhook_sender.send_webhook(webhook_url, payload, headers, session=session)
     
     async def _send_slack_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send Slack notification."""
-        try:
-            webhook_url = channel_config.webhook_url
-            if not webhook_url:
-                delivery.error_message = "No Slack webhook URL configured"
-                self.db.commit()
-                return False
-            
-            config = channel_config.configuration or {}
-            message = f"*{notification.title}*\n{notification.message}"
-            
-            return await self.slack_sender.send_slack_message(
-                webhook_url=webhook_url,
-                message=message,
-                channel=config.get("channel"),
-                username=config.get("username", "CraigLeads"),
-                icon_emoji=config.get("icon_emoji", ":robot_face:")
-            )
-            
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
-            return False
+        webhook_url = channel_config.webhook_url
+        if not webhook_url:
+            raise NotificationDeliveryError("No Slack webhook URL configured")
+        
+        config = channel_config.configuration or {}
+        message = f"*{notification.title}*\n{notification.message}"
+        
+        return await self.slack_sender.send_slack_message(
+            webhook_url=webhook_url,
+            message=message,
+            channel=config.get("channel"),
+            username=config.get("username", "CraigLeads"),
+            icon_emoji=config.get("icon_emoji", ":robot_face:"),
+            session=await self._lane_for(channel_config).get_session()
+        )
     
     async def _send_discord_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send Discord notification."""
-        try:
-            webhook_url = channel_config.webhook_url
-            if not webhook_url:
-                delivery.error_message = "No Discord webhook URL configured"
-                self.db.commit()
-                return False
-            
-            config = channel_config.configuration or {}
-            content = f"**{notification.title}**\n{notification.message}"
-            
-            return await self.discord_sender.send_discord_message(
-                webhook_url=webhook_url,
-                content=content,
-                username=config.get("username", "CraigLeads"),
-                avatar_url=config.get("avatar_url")
-            )
-            
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
-            return False
+        webhook_url = channel_config.webhook_url
+        if not webhook_url:
+            raise NotificationDeliveryError("No Discord webhook URL configured")
+        
+        config = channel_config.configuration or {}
+        content = f"**{notification.title}**\n{notification.message}"
+        
+        return await self.discord_sender.send_discord_message(
+            webhook_url=webhook_url,
+            content=content,
+            username=config.get("username", "CraigLeads"),
+            avatar_url=config.get("avatar_url"),
+            session=await self._lane_for(channel_config).get_session()
+        )
     
     async def _send_sms_notification(
         self, 
         notification: Notification, 
-        channel_config: NotificationChannel, 
-        delivery: NotificationDelivery
+        channel_config: NotificationChannel
     ) -> bool:
         """Send SMS notification."""
-        try:
-            # Get user phone number (would need user management system)
-            phone_number = channel_config.configuration.get("phone_number")
-            if not phone_number:
-                delivery.error_message = "No phone number configured"
-                self.db.commit()
-                return False
-            
-            message = f"{notification.title}\n{notification.message}"
-            return await self.sms_sender.send_sms(phone_number, message)
-            
-        except Exception as e:
-            delivery.error_message = str(e)
-            self.db.commit()
-            return False
+        # Get user phone number (would need user management system)
+        phone_number = (channel_config.configuration or {}).get("phone_number")
+        if not phone_number:
+            raise NotificationDeliveryError("No phone number configured")
+        
+        message = f"{notification.title}\n{notification.message}"
+        return await self.sms_sender.send_sms(phone_number, message)
     
     def _render_template(self, template: str, data: Dict[str, Any]) -> str:
         """Render notification template with data."""
@@ -806,30 +907,359 @@ class NotificationService:
             logger.error(f"Failed to get user preferences: {e}")
             return None
     
-    async def process_pending_notifications(self):
-        """Process all pending notifications."""
+    async def process_pending_notifications(self, page_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Dispatch all due pending notifications.
+        
+        Due notifications are paged by ID and each page is locked with
+        SKIP LOCKED, so concurrent dispatchers split the work. Channel
+        configs and email templates are loaded once per run, preferences
+        once per user. All channels of all notifications in a page are sent
+        concurrently through their channel lanes; notifications whose
+        channels are out of rate-limit budget are rescheduled for when
+        budget frees up. Deliveries, statuses and channel counters are then
+        written in bulk with one commit per page.
+        
+        Args:
+            page_size: Notifications per page (defaults to PAGE_SIZE)
+        
+        Returns:
+            Counts per outcome
+        """
+        page_size = page_size or self.PAGE_SIZE
+        summary = {
+            "processed": 0, "sent": 0, "partial": 0, "failed": 0, "retrying": 0,
+            "skipped": 0, "expired": 0, "deferred": 0
+        }
+        started = time.monotonic()
+        
         try:
-            pending_notifications = self.db.query(Notification).filter(
-                and_(
-                    Notification.status == "pending",
-                    or_(
-                        Notification.scheduled_at.is_(None),
-                        Notification.scheduled_at <= datetime.utcnow()
+            async with AsyncSessionLocal() as session:
+                channel_configs = await self._load_channel_configs(session)
+                await self._load_email_templates(session)
+                preferences: Dict[Tuple[str, str], NotificationPreference] = {}
+                loaded_users: Set[str] = set()
+                last_id = 0
+                
+                while True:
+                    result = await session.execute(
+                        select(Notification)
+                        .where(
+                            and_(
+                                Notification.status == "pending",
+                                or_(
+                                    Notification.scheduled_at.is_(None),
+                                    Notification.scheduled_at <= datetime.utcnow()
+                                ),
+                                Notification.id > last_id
+                            )
+                        )
+                        .order_by(Notification.id)
+                        .limit(page_size)
+                        .with_for_update(skip_locked=True)
                     )
+                    page = list(result.scalars())
+                    if not page:
+                        break
+                    last_id = page[-1].id
+                    
+                    users = {
+                        n.user_id for n in page
+                        if n.user_id and not n.broadcast and n.user_id not in loaded_users
+                    }
+                    if users:
+                        await self._load_preferences(session, users, preferences)
+                        loaded_users |= users
+                    
+                    try:
+                        await self._dispatch_page(session, page, channel_configs, preferences, summary)
+                        await session.commit()
+                    except Exception as e:
+                        logger.error(f"Failed to dispatch notification page after id {page[0].id - 1}: {e}")
+                        await session.rollback()
+                    
+                    # Release the page's objects before loading the next one
+                    session.expunge_all()
+                    
+                    if len(page) < page_size:
+                        break
+            
+        except Exception as e:
+            logger.error(f"Failed to process pending notifications: {e}")
+        
+        logger.info(
+            f"Processed {summary['processed']} pending notifications in "
+            f"{time.monotonic() - started:.2f}s: {summary}"
+        )
+        return summary
+    
+    async def _load_channel_configs(self, session) -> Dict[str, NotificationChannel]:
+        """Load the active configuration of each channel type."""
+        result = await session.execute(
+            select(NotificationChannel)
+            .where(NotificationChannel.is_active == True)
+            .order_by(NotificationChannel.id)
+        )
+        configs: Dict[str, NotificationChannel] = {}
+        for config in result.scalars():
+            # Same choice as the single-notification path: first active config wins
+            configs.setdefault(config.channel_type, config)
+        return configs
+    
+    async def _load_email_templates(self, session):
+        """Refresh the email template cache."""
+        result = await session.execute(
+            select(NotificationTemplate).where(
+                and_(
+                    NotificationTemplate.channel_type == "email",
+                    NotificationTemplate.is_active == True
                 )
-            ).all()
+            )
+        )
+        templates: Dict[str, Optional[NotificationTemplate]] = {}
+        for template in result.scalars():
+            templates.setdefault(template.notification_type, template)
+        self._email_templates = templates
+    
+    async def _load_preferences(
+        self,
+        session,
+        user_ids: Set[str],
+        preferences: Dict[Tuple[str, str], NotificationPreference]
+    ):
+        """Load all preferences of a set of users in one query."""
+        result = await session.execute(
+            select(NotificationPreference).where(NotificationPreference.user_id.in_(user_ids))
+        )
+        for preference in result.scalars():
+            preferences[(preference.user_id, preference.notification_type)] = preference
+    
+    def _plan_delivery(
+        self,
+        notification: Notification,
+        preference: Optional[NotificationPreference],
+        now: datetime
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Apply expiry and user preferences to a notification.
+        
+        Returns:
+            Tuple of (final status if the notification must not be sent,
+            channels to send through)
+        """
+        if notification.expires_at and notification.expires_at < now:
+            return "expired", []
+        
+        channels = list(notification.channels or [])
+        if notification.user_id and not notification.broadcast:
+            if not preference or not preference.enabled:
+                return "skipped", []
+            
+            # Filter channels based on preferences
+            channels = [ch for ch in channels if ch in preference.channels]
+            
+            # Check priority threshold
+            priority_levels = {"low": 1, "normal": 2, "high": 3, "urgent": 4}
+            if priority_levels.get(notification.priority, 2) < priority_levels.get(preference.priority_threshold, 2):
+                return "skipped", []
+        
+        return None, channels
+    
+    async def _dispatch_page(
+        self,
+        session,
+        page: List[Notification],
+        channel_configs: Dict[str, NotificationChannel],
+        preferences: Dict[Tuple[str, str], NotificationPreference],
+        summary: Dict[str, int]
+    ):
+        """Send one page of notifications and stage the bulk writes."""
+        now = datetime.utcnow()
+        notification_updates = []
+        jobs = []
+        planned_channels: Dict[int, List[str]] = {}
+        
+        for notification in page:
+            summary["processed"] += 1
+            status, channels = self._plan_delivery(
+                notification,
+                preferences.get((notification.user_id, notification.notification_type)),
+                now
+            )
+            if status:
+                notification_updates.append({"id": notification.id, "status": status})
+                summary[status] += 1
+                continue
+            
+            # Reserve rate-limit budget on every channel, or defer the whole
+            # notification until the busiest channel has budget again
+            lanes = [
+                self._lane_for(channel_configs[channel])
+                for channel in channels if channel in channel_configs
+            ]
+            blocked = [lane for lane in lanes if not lane.has_capacity()]
+            if blocked:
+                delay = max(lane.wait_time() for lane in blocked)
+                notification_updates.append({
+                    "id": notification.id,
+                    "scheduled_at": now + timedelta(seconds=max(1.0, delay))
+                })
+                summary["deferred"] += 1
+                continue
+            for lane in lanes:
+                lane.acquire()
             
-            logger.info(f"Processing {len(pending_notifications)} pending notifications")
+            planned_channels[notification.id] = channels
+            for channel in channels:
+                jobs.append((notification, channel, channel_configs.get(channel)))
+        
+        results = await asyncio.gather(*(
+            self._deliver(notification, channel, config) for notification, channel, config in jobs
+        ))
+        
+        deliveries = []
+        successes: Dict[int, int] = {}
+        channel_stats: Dict[int, Dict[str, int]] = {}
+        for (notification, channel, config), (success, error, delivery_time_ms) in zip(jobs, results):
+            if success:
+                successes[notification.id] = successes.get(notification.id, 0) + 1
+            if config is None:
+                continue
+            
+            deliveries.append({
+                "notification_id": notification.id,
+                "channel_id": config.id,
+                "status": "delivered" if success else "failed",
+                "sent_at": now if success else None,
+                "error_message": error,
+                "delivery_time_ms": delivery_time_ms
+            })
+            
+            stats = channel_stats.setdefault(config.id, {"sent": 0, "failed": 0, "trailing_failures": 0})
+            if success:
+                stats["sent"] += 1
+                stats["trailing_failures"] = 0
+            else:
+                stats["failed"] += 1
+                stats["trailing_failures"] += 1
+        
+        for notification in page:
+            channels = planned_channels.get(notification.id)
+            if channels is None:
+                continue
             
-            for notification in pending_notifications:
-                try:
-                    await self._send_notification(notification.id)
-                except Exception as e:
-                    logger.error(f"Failed to process notification {notification.id}: {e}")
-                    continue
+            success_count = successes.get(notification.id, 0)
+            values = {
+                "id": notification.id,
+                "status": "failed",
+                "channels": channels,
+                "sent_at": None,
+                "retry_count": notification.retry_count,
+                "scheduled_at": notification.scheduled_at
+            }
             
-        except Exception as e:
-            logger.error(f"Failed to process pending notifications: {e}")
+            if success_count > 0:
+                values["status"] = "sent" if success_count == len(channels) else "partial"
+                values["sent_at"] = now
+            else:
+                values["retry_count"] += 1
+                
+                # Schedule retry if under max retries
+                if values["retry_count"] < notification.max_retries:
+                    values["status"] = "pending"
+                    values["scheduled_at"] = now + timedelta(seconds=self.RETRY_DELAY_SECONDS)
+            
+            summary["retrying" if values["status"] == "pending" else values["status"]] += 1
+            notification_updates.append(values)
+        
+        # Bulk writes: executemany INSERT, UPDATE by primary key, one UPDATE per channel
+        if deliveries:
+            await session.execute(insert(NotificationDelivery), deliveries)
+        if notification_updates:
+            await session.execute(update(Notification), notification_updates)
+        
+        for channel_id, stats in channel_stats.items():
+            values = {
+                "total_sent": NotificationChannel.total_sent + stats["sent"] + stats["failed"],
+                "successful_sent": NotificationChannel.successful_sent + stats["sent"],
+                "failed_sent": NotificationChannel.failed_sent + stats["failed"],
+                "last_sent_at": now
+            }
+            if stats["sent"]:
+                values["consecutive_failures"] = stats["trailing_failures"]
+                values["is_healthy"] = stats["trailing_failures"] < 5
+            else:
+                # Mark unhealthy after multiple consecutive failures
+                consecutive = NotificationChannel.consecutive_failures + stats["failed"]
+                values["consecutive_failures"] = consecutive
+                values["is_healthy"] = consecutive < 5
+            
+            await session.execute(
+                update(NotificationChannel)
+                .where(NotificationChannel.id == channel_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+    
+    async def _deliver(
+        self,
+        notification: Notification,
+        channel: str,
+        channel_config: Optional[NotificationChannel]
+    ) -> Tuple[bool, Optional[str], Optional[float]]:
+        """
+        Send one notification through one channel within the channel's lane.
+        
+        Returns:
+            Tuple of (success, error message, delivery time in ms)
+        """
+        if not channel_config:
+            logger.error(f"No active configuration for channel {channel}")
+            return False, None, None
+        
+        sender_func = self.channel_senders.get(channel)
+        if not sender_func:
+            logger.error(f"No sender available for channel {channel}")
+            return False, "No sender available", None
+        
+        lane = self._lane_for(channel_config)
+        async with lane.semaphore:
+            start_time = time.monotonic()
+            try:
+                success = await sender_func(notification, channel_config)
+                error = None
+            except Exception as e:
+                logger.error(f"Failed to send notification {notification.id} through {channel}: {e}")
+                success = False
+                error = str(e)
+            return bool(success), error, (time.monotonic() - start_time) * 1000
+    
+    def _lane_for(self, channel_config: NotificationChannel) -> ChannelLane:
+        """Get the delivery lane of a channel, rebuilding it if its limits changed."""
+        limits = (channel_config.rate_limit_per_minute, channel_config.rate_limit_per_hour)
+        lane = self._lanes.get(channel_config.id)
+        if lane is None or lane.limits != limits:
+            if lane is not None:
+                # Limits changed: keep the pooled session, reset the budget
+                new_lane = ChannelLane(
+                    channel_config.channel_type, lane.concurrency, *limits
+                )
+                new_lane._session = lane._session
+                lane = new_lane
+            else:
+                lane = ChannelLane(
+                    channel_config.channel_type,
+                    self.CHANNEL_CONCURRENCY.get(channel_config.channel_type, 10),
+                    *limits
+                )
+            self._lanes[channel_config.id] = lane
+        return lane
+    
+    async def close(self):
+        """Close pooled channel sessions."""
+        for lane in self._lanes.values():
+            await lane.close()
+        self._lanes.clear()
     
     def get_notification_analytics(self, days: int = 30) -> Dict:
         """Get notification service analytics."""
@@ -5,10 +5,10 @@ Provides access to GPT-4, Claude 3.5, Qwen, Grok, and other models
 through a single API key and consistent interface.
 """
 
-import httpx
 import asyncio
 from typing import List, Dict, Any, Optional
 from app.core.config import settings
+from app.services.llm_gateway import llm_gateway, LLMGatewayError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,13 +34,6 @@ class OpenRouterClient:
         if not self.api_key:
             logger.warning("OpenRouter API key not configured. AI features will use placeholder responses.")
 
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": "https://fliptechpro.com",  # Optional: for rankings
-            "X-Title": "FlipTech Pro Lead Generation",  # Optional: shows in OpenRouter dashboard
-            "Content-Type": "application/json"
-        }
-
     async def generate_completion(
         self,
         prompt: str,
@@ -75,30 +68,19 @@ class OpenRouterClient:
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": prompt})
 
-        payload = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"OpenRouter API error: {e.response.status_code} - {e.response.text}")
-            raise Exception(f"AI generation failed: {e.response.status_code}")
-        except httpx.RequestError as e:
-            logger.error(f"OpenRouter request error: {str(e)}")
+            data = await llm_gateway.chat_completion(
+                messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=self.timeout
+            )
+            return data["choices"][0]["message"]["content"]
+
+        except LLMGatewayError as e:
+            if e.status_code:
+                raise Exception(f"AI generation failed: {e.status_code}")
             raise Exception(f"AI generation request failed: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in AI generation: {str(e)}")
@@ -130,28 +112,13 @@ class OpenRouterClient:
 
         model = model or settings.AI_MODEL_EMBEDDINGS
 
-        payload = {
-            "model": model,
-            "input": text
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/embeddings",
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                return data["data"][0]["embedding"]
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"OpenRouter embedding API error: {e.response.status_code} - {e.response.text}")
-            raise Exception(f"Embedding generation failed: {e.response.status_code}")
-        except httpx.RequestError as e:
-            logger.error(f"OpenRouter embedding request error: {str(e)}")
+            embeddings = await llm_gateway.embeddings(text, model=model, timeout=self.timeout)
+            return embeddings[0]
+
+        except LLMGatewayError as e:
+            if e.status_code:
+                raise Exception(f"Embedding generation failed: {e.status_code}")
             raise Exception(f"Embedding generation request failed: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in embedding generation: {str(e)}")
@@ -178,22 +145,8 @@ class OpenRouterClient:
 
         model = model or settings.AI_MODEL_EMBEDDINGS
 
-        payload = {
-            "model": model,
-            "input": texts
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout * 2) as client:
-                response = await client.post(
-                    f"{self.base_url}/embeddings",
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                return [item["embedding"] for item in data["data"]]
+            return await llm_gateway.embeddings(texts, model=model, timeout=self.timeout * 2)
 
         except Exception as e:
             logger.error(f"Batch embedding generation failed: {str(e)}")
@@ -3,15 +3,17 @@ Advanced scheduling service for automated tasks.
 """
 
 import asyncio
+import heapq
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from croniter import croniter
 import pytz
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.core.database import get_db
+from app.core.database import get_db, engine, AsyncSessionLocal
 from app.models.schedules import (
     Schedule, ScheduleExecution, ScheduleTemplate, ScrapingSchedule,
     ScheduleNotification, ScheduleType, ScheduleStatus, RecurrenceType
@@ -23,6 +25,9 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Postgres NOTIFY channel fired by the schedules_notify trigger
+NOTIFY_CHANNEL = "schedules"
+
 
 class CronManager:
     """Manages CRON expression parsing and next run calculations."""
@@ -487,182 +492,413 @@ class TaskExecutor:
             logger.error(f"Failed to send execution notification: {e}")
 
 
+class DispatchedRun:
+    """
+    Handle for a schedule run dispatched to Celery.
+
+    Mirrors the parts of the asyncio.Task interface callers already use
+    (done/cancelled/cancel), backed by the Celery result.
+    """
+
+    def __init__(self, schedule_id: int, result):
+        self.schedule_id = schedule_id
+        self.result = result
+        self.dispatched_at = datetime.utcnow()
+
+    @property
+    def task_id(self) -> str:
+        return self.result.id
+
+    def done(self) -> bool:
+        return self.result.ready()
+
+    def cancelled(self) -> bool:
+        return self.result.state == "REVOKED"
+
+    def failed(self) -> bool:
+        return self.result.failed()
+
+    def cancel(self):
+        """Revoke the task, terminating it if a worker already started it."""
+        self.result.revoke(terminate=True)
+
+    def status(self) -> Dict[str, bool]:
+        """
+        Snapshot of the run's state.
+
+        Every check queries the Celery result backend, so async callers should
+        run this in a thread (asyncio.to_thread).
+        """
+        state = self.result.state
+        return {
+            "done": state in ("SUCCESS", "FAILURE", "REVOKED"),
+            "cancelled": state == "REVOKED",
+            "failed": state == "FAILURE",
+        }
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a datetime to naive UTC (the scheduler's internal clock)."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(pytz.UTC).replace(tzinfo=None)
+    return value
+
+
 class SchedulerService:
-    """Main scheduler service."""
+    """
+    Main scheduler service.
+
+    Features:
+    - In-memory min-heap of next-run times, seeded from the database
+    - Heap kept current through Postgres LISTEN/NOTIFY on schedule changes
+    - Single leader across app instances via a Postgres advisory lock
+    - Execution dispatched to Celery; the loop only sleeps until the next due time
+    """
+
+    LOCK_KEY = 72_410_001  # pg advisory lock id for scheduler leadership
+    LEADER_RETRY_SECONDS = 15  # Followers retry the lock this often
+    RESYNC_SECONDS = 300  # Full reload from the database, in case a NOTIFY was missed
     
     def __init__(self):
         self.db = None  # Will be set per request
         self.task_executor = TaskExecutor(self.db)
-        self.running_schedules: Dict[int, asyncio.Task] = {}
+        self.running_schedules: Dict[int, DispatchedRun] = {}
         self.scheduler_running = False
+        self.is_leader = False
+
+        self._heap: List[Tuple[datetime, int]] = []
+        self._next_runs: Dict[int, datetime] = {}  # Current heap entry per schedule
+        self._changed: Set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._last_resync = 0.0
     
     async def start_scheduler(self):
-        """Start the main scheduler loop."""
+        """Start the main scheduler loop (blocks until stop_scheduler)."""
         self.scheduler_running = True
         logger.info("Starting scheduler service")
         
         while self.scheduler_running:
+            connection = None
             try:
-                await self._process_due_schedules()
-                await self._cleanup_completed_tasks()
-                
-                # Wait before next iteration
-                await asyncio.sleep(60)  # Check every minute
-                
+                connection = await self._acquire_leadership()
+                if connection is None:
+                    await self._sleep(self.LEADER_RETRY_SECONDS)
+                    continue
+
+                await self._run_as_leader(connection)
+
             except Exception as e:
                 logger.error(f"Scheduler loop error: {e}")
-                await asyncio.sleep(60)
+                await self._sleep(self.LEADER_RETRY_SECONDS)
+
+            finally:
+                if connection is not None:
+                    await self._release_leadership(connection)
     
     async def stop_scheduler(self):
-        """Stop the scheduler and cancel running tasks."""
+        """
+        Stop the scheduler loop.
+
+        Runs already dispatched to Celery keep going; cancel them explicitly
+        through their DispatchedRun handles if needed.
+        """
         logger.info("Stopping scheduler service")
         self.scheduler_running = False
-        
-        # Cancel all running tasks
-        for task in self.running_schedules.values():
-            if not task.done():
-                task.cancel()
-        
-        # Wait for tasks to complete
-        if self.running_schedules:
-            await asyncio.gather(*self.running_schedules.values(), return_exceptions=True)
-        
-        self.running_schedules.clear()
+        self._wakeup.set()
         logger.info("Scheduler stopped")
+
+    async def _sleep(self, seconds: float):
+        """Sleep, returning early if woken (notification or stop)."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, seconds))
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _acquire_leadership(self) -> Optional[AsyncConnection]:
+        """
+        Try to become the scheduling leader.
+
+        The advisory lock is session-scoped, so it is held for as long as the
+        returned connection stays open and is released by Postgres if this
+        process dies.
+
+        Returns:
+            The connection holding the lock, or None if another instance leads
+        """
+        connection = await engine.connect()
+        try:
+            result = await connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.LOCK_KEY}
+            )
+            if result.scalar():
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                self.is_leader = True
+                logger.info("Scheduler acquired leadership")
+                return connection
+        except Exception:
+            await connection.close()
+            raise
+
+        await connection.close()
+        logger.debug("Another instance holds scheduler leadership")
+        return None
+
+    async def _release_leadership(self, connection: AsyncConnection):
+        """UNLISTEN, release the advisory lock and close the connection."""
+        self.is_leader = False
+        self._heap.clear()
+        self._next_runs.clear()
+        try:
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+            await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.LOCK_KEY})
+        except Exception as e:
+            logger.debug(f"Error releasing scheduler leadership: {e}")
+        await connection.close()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        """asyncpg notification callback; payload is the schedule id."""
+        try:
+            self._changed.add(int(payload))
+        except (TypeError, ValueError):
+            # Unknown payload, fall back to a full reload
+            self._last_resync = 0.0
+        self._wakeup.set()
+
+    async def _run_as_leader(self, connection: AsyncConnection):
+        """Fire schedules from the heap until stopped or leadership is lost."""
+        loop = asyncio.get_running_loop()
+        self._last_resync = 0.0
+
+        while self.scheduler_running:
+            if loop.time() - self._last_resync >= self.RESYNC_SECONDS:
+                # Also proves the lock connection is still alive
+                await connection.execute(text("SELECT 1"))
+                await self._load_schedules()
+                await self._cleanup_completed_tasks()
+                self._last_resync = loop.time()
+            elif self._changed:
+                changed, self._changed = self._changed, set()
+                await self._load_schedules(changed)
+
+            await self._process_due_schedules()
+
+            # Sleep until the next run is due, a schedule changes, or resync
+            timeout = self.RESYNC_SECONDS - (loop.time() - self._last_resync)
+            if self._heap:
+                until_next = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+                timeout = min(timeout, until_next)
+            await self._sleep(timeout)
+
+    def _push(self, schedule_id: int, run_at: Optional[datetime]):
+        """Set (or clear) the next run of a schedule in the heap."""
+        if run_at is None:
+            self._next_runs.pop(schedule_id, None)
+            return
+        self._next_runs[schedule_id] = run_at
+        # Superseded entries stay in the heap and are skipped when popped
+        heapq.heappush(self._heap, (run_at, schedule_id))
+
+    async def _load_schedules(self, schedule_ids: Optional[Set[int]] = None):
+        """
+        Load next-run times from the database into the heap.
+
+        Args:
+            schedule_ids: Only reload these schedules; None rebuilds the heap
+        """
+        query = select(Schedule.id, Schedule.next_run_at).where(Schedule.is_active == True)
+        if schedule_ids is not None:
+            query = query.where(Schedule.id.in_(schedule_ids))
+
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(query)).all()
+
+        if schedule_ids is None:
+            self._heap.clear()
+            self._next_runs.clear()
+        else:
+            # Deleted or deactivated schedules simply are not returned
+            for schedule_id in schedule_ids:
+                self._next_runs.pop(schedule_id, None)
+
+        now = datetime.utcnow()
+        for schedule_id, next_run_at in rows:
+            # Schedules without a next run are due immediately
+            self._push(schedule_id, _as_utc(next_run_at) or now)
+
+        if schedule_ids is None:
+            heapq.heapify(self._heap)
+            logger.debug(f"Scheduler loaded {len(self._next_runs)} active schedules")
     
     async def _process_due_schedules(self):
-        """Process schedules that are due to run."""
+        """Pop due schedules off the heap and dispatch them."""
+        current_time = datetime.utcnow()
+        due_ids = []
+
+        while self._heap and self._heap[0][0] <= current_time:
+            run_at, schedule_id = heapq.heappop(self._heap)
+            if self._next_runs.get(schedule_id) != run_at:
+                continue  # Superseded entry
+            del self._next_runs[schedule_id]
+            due_ids.append(schedule_id)
+
+        if not due_ids:
+            return
+
+        if any(schedule_id in self.running_schedules for schedule_id in due_ids):
+            # Refresh so runs that already finished do not block this occurrence
+            await self._cleanup_completed_tasks()
+
         try:
-            current_time = datetime.utcnow()
-            
-            # Get due schedules
-            due_schedules = self.db.query(Schedule).filter(
-                and_(
-                    Schedule.is_active == True,
-                    or_(
-                        Schedule.next_run_at.is_(None),
-                        Schedule.next_run_at <= current_time
-                    )
+            async with AsyncSessionLocal() as session:
+                # Row locks guard against a second scheduler during a leadership handover
+                result = await session.execute(
+                    select(Schedule)
+                    .where(Schedule.id.in_(due_ids), Schedule.is_active == True)
+                    .with_for_update(skip_locked=True)
                 )
-            ).all()
-            
-            for schedule in due_schedules:
-                try:
-                    # Skip if already running
-                    if schedule.id in self.running_schedules:
+                to_dispatch = []
+
+                for schedule in result.scalars().all():
+                    next_run_at = _as_utc(schedule.next_run_at)
+                    if next_run_at and next_run_at > current_time:
+                        # Moved later since it was loaded
+                        self._push(schedule.id, next_run_at)
                         continue
-                    
-                    # Check peak time constraints
-                    if not PeakTimeManager.is_peak_time(schedule, current_time):
+
+                    if schedule.id in self.running_schedules:
+                        # Previous run still going; skip this occurrence
+                        self._compute_next_run(schedule, current_time)
+                    elif not PeakTimeManager.is_peak_time(schedule, current_time):
                         logger.debug(f"Skipping schedule {schedule.id} - outside peak hours")
-                        # Update next run to next peak time
                         schedule.next_run_at = PeakTimeManager.get_next_peak_time(schedule, current_time)
-                        self.db.commit()
-                        continue
-                    
-                    # Execute schedule
-                    await self._execute_schedule(schedule)
-                    
+                    else:
+                        to_dispatch.append(schedule)
+                        self._compute_next_run(schedule, current_time)
+
+                    if schedule.is_active:
+                        self._push(schedule.id, _as_utc(schedule.next_run_at))
+
+                await session.commit()
+
+            for schedule in to_dispatch:
+                try:
+                    await self._execute_schedule(schedule, update_next_run=False)
                 except Exception as e:
                     logger.error(f"Failed to process schedule {schedule.id}: {e}")
-                    continue
-                    
+
         except Exception as e:
             logger.error(f"Failed to process due schedules: {e}")
+            # Put them back so they are retried on the next pass
+            for schedule_id in due_ids:
+                if schedule_id not in self._next_runs:
+                    self._push(schedule_id, current_time + timedelta(seconds=self.LEADER_RETRY_SECONDS))
     
-    async def _execute_schedule(self, schedule: Schedule):
-        """Execute a single schedule."""
+    async def _execute_schedule(self, schedule: Schedule, update_next_run: bool = True):
+        """
+        Dispatch a single schedule to Celery.
+
+        Args:
+            schedule: Schedule to run
+            update_next_run: Also advance and persist next_run_at (manual runs)
+        """
         try:
-            logger.info(f"Starting execution of schedule {schedule.id}: {schedule.name}")
-            
-            # Create execution task with timeout
+            logger.info(f"Dispatching schedule {schedule.id}: {schedule.name}")
+
+            from app.tasks.schedule_tasks import execute_schedule
+
+            # Celery's own limits back up the in-task wait_for timeout
             timeout = schedule.timeout_minutes * 60
-            task = asyncio.create_task(
-                asyncio.wait_for(
-                    self.task_executor.execute_schedule(schedule),
-                    timeout=timeout
-                )
+            result = await asyncio.to_thread(
+                execute_schedule.apply_async,
+                args=[schedule.id],
+                soft_time_limit=timeout + 30,
+                time_limit=timeout + 60,
             )
-            
+
             # Store running task
-            self.running_schedules[schedule.id] = task
-            
-            # Calculate next run time
-            self._calculate_next_run_time(schedule)
-            
-            # The task will complete in the background
+            self.running_schedules[schedule.id] = DispatchedRun(schedule.id, result)
+
+            if update_next_run:
+                self._calculate_next_run_time(schedule)
             
         except Exception as e:
             logger.error(f"Failed to execute schedule {schedule.id}: {e}")
+            raise
+
+    def _compute_next_run(self, schedule: Schedule, current_time: Optional[datetime] = None):
+        """Advance next_run_at (and is_active) on a schedule without committing."""
+        if current_time is None:
+            current_time = datetime.utcnow()
+
+        if schedule.recurrence_type == RecurrenceType.ONCE:
+            # One-time schedule, disable after running
+            schedule.is_active = False
+            schedule.next_run_at = None
+
+        elif schedule.recurrence_type == RecurrenceType.CUSTOM_CRON:
+            if schedule.cron_expression:
+                schedule.next_run_at = CronManager.get_next_run(
+                    schedule.cron_expression, current_time
+                )
+            else:
+                logger.error(f"No CRON expression for schedule {schedule.id}")
+
+        else:
+            # Interval-based schedule
+            if schedule.interval_minutes:
+                schedule.next_run_at = current_time + timedelta(minutes=schedule.interval_minutes)
+            else:
+                # Use standard CRON for the recurrence type
+                cron_expr = CronManager.get_standard_cron(schedule.recurrence_type)
+                schedule.next_run_at = CronManager.get_next_run(cron_expr, current_time)
+
+        # Apply peak time constraints
+        if schedule.peak_hours_only and schedule.next_run_at:
+            if not PeakTimeManager.is_peak_time(schedule, schedule.next_run_at):
+                schedule.next_run_at = PeakTimeManager.get_next_peak_time(
+                    schedule, schedule.next_run_at
+                )
+
+        # Check end date constraint
+        end_date = _as_utc(schedule.end_date)
+        if end_date and schedule.next_run_at and schedule.next_run_at > end_date:
+            schedule.is_active = False
+            schedule.next_run_at = None
+
+        if schedule.next_run_at:
+            logger.info(f"Schedule {schedule.id} next run: {schedule.next_run_at}")
+        else:
+            logger.info(f"Schedule {schedule.id} completed or deactivated")
     
     def _calculate_next_run_time(self, schedule: Schedule):
         """Calculate and update the next run time for a schedule."""
         try:
-            current_time = datetime.utcnow()
-            
-            if schedule.recurrence_type == RecurrenceType.ONCE:
-                # One-time schedule, disable after running
-                schedule.is_active = False
-                schedule.next_run_at = None
-                
-            elif schedule.recurrence_type == RecurrenceType.CUSTOM_CRON:
-                if schedule.cron_expression:
-                    schedule.next_run_at = CronManager.get_next_run(
-                        schedule.cron_expression, current_time
-                    )
-                else:
-                    logger.error(f"No CRON expression for schedule {schedule.id}")
-                    
-            else:
-                # Interval-based schedule
-                if schedule.interval_minutes:
-                    schedule.next_run_at = current_time + timedelta(minutes=schedule.interval_minutes)
-                else:
-                    # Use standard CRON for the recurrence type
-                    cron_expr = CronManager.get_standard_cron(schedule.recurrence_type)
-                    schedule.next_run_at = CronManager.get_next_run(cron_expr, current_time)
-            
-            # Apply peak time constraints
-            if schedule.peak_hours_only and schedule.next_run_at:
-                if not PeakTimeManager.is_peak_time(schedule, schedule.next_run_at):
-                    schedule.next_run_at = PeakTimeManager.get_next_peak_time(
-                        schedule, schedule.next_run_at
-                    )
-            
-            # Check end date constraint
-            if schedule.end_date and schedule.next_run_at and schedule.next_run_at > schedule.end_date:
-                schedule.is_active = False
-                schedule.next_run_at = None
-            
+            self._compute_next_run(schedule)
             self.db.commit()
-            
-            if schedule.next_run_at:
-                logger.info(f"Schedule {schedule.id} next run: {schedule.next_run_at}")
-            else:
-                logger.info(f"Schedule {schedule.id} completed or deactivated")
                 
         except Exception as e:
             logger.error(f"Failed to calculate next run time for schedule {schedule.id}: {e}")
     
     async def _cleanup_completed_tasks(self):
-        """Clean up completed schedule tasks."""
+        """Clean up finished schedule runs."""
         try:
-            completed_schedules = []
-            
-            for schedule_id, task in self.running_schedules.items():
-                if task.done():
-                    completed_schedules.append(schedule_id)
-                    
-                    try:
-                        # Get the result (this will raise any exceptions)
-                        result = await task
-                        logger.debug(f"Schedule {schedule_id} task completed successfully")
-                    except Exception as e:
-                        logger.error(f"Schedule {schedule_id} task failed: {e}")
-            
-            # Remove completed tasks
-            for schedule_id in completed_schedules:
-                del self.running_schedules[schedule_id]
+            runs = list(self.running_schedules.values())
+            # Result checks hit the Celery backend, keep them off the event loop
+            statuses = await asyncio.to_thread(lambda: [(run, run.status()) for run in runs])
+
+            for run, status in statuses:
+                if not status["done"]:
+                    continue
+                if status["cancelled"]:
+                    logger.info(f"Schedule {run.schedule_id} run was cancelled")
+                elif status["failed"]:
+                    logger.error(f"Schedule {run.schedule_id} task failed: {run.result.result}")
+                else:
+                    logger.debug(f"Schedule {run.schedule_id} task completed successfully")
+                self.running_schedules.pop(run.schedule_id, None)
                 
         except Exception as e:
             logger.error(f"Failed to cleanup completed tasks: {e}")
@@ -0,0 +1,336 @@
+"""
+Scrape Job Store
+
+Scrape job state on redis.asyncio.
+
+Each job is a Redis hash with one field per attribute, so progress ticks and
+counters are single-field writes (HSET / HINCRBY / HINCRBYFLOAT) instead of
+re-serializing the whole job. Errors go to a capped list per job. Jobs are
+indexed in sorted sets by creation time (overall and per status), so listing
+is a ZREVRANGE plus one pipelined HGETALL instead of a KEYS scan. Every state
+change is announced on the scrapers realtime channel.
+
+Keys:
+    scrape_job:{id}                 hash of job fields
+    scrape_job:{id}:errors          newest-first list of error messages
+    scrape_jobs:index               zset job_id -> created_at timestamp
+    scrape_jobs:status:{status}     zset job_id -> created_at timestamp
+    scrape_queue:{priority}         list of queued job ids
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+JOB_STATUSES = ("queued", "running", "completed", "failed", "cancelled")
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+# Fields stored as JSON (everything else is a plain string)
+JSON_FIELDS = ("location_ids", "categories", "keywords")
+INT_FIELDS = ("max_pages", "progress", "total_items", "processed_items", "emails_extracted")
+FLOAT_FIELDS = ("captcha_cost",)
+BOOL_FIELDS = ("enable_email_extraction",)
+
+
+def _job_key(job_id: str) -> str:
+    return f"scrape_job:{job_id}"
+
+
+def _errors_key(job_id: str) -> str:
+    return f"scrape_job:{job_id}:errors"
+
+
+def _status_key(status: str) -> str:
+    return f"scrape_jobs:status:{status}"
+
+
+INDEX_KEY = "scrape_jobs:index"
+
+
+def encode_job(job: Dict[str, Any]) -> Dict[str, str]:
+    """Flatten a job dict into hash fields."""
+    fields = {}
+    for name, value in job.items():
+        if name == "errors" or value is None:
+            continue
+        if name in JSON_FIELDS:
+            fields[name] = json.dumps(value)
+        elif name in BOOL_FIELDS:
+            fields[name] = "1" if value else "0"
+        elif isinstance(value, datetime):
+            fields[name] = value.isoformat()
+        else:
+            fields[name] = str(value)
+    return fields
+
+
+def decode_job(fields: Dict[str, str], errors: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Rebuild a job dict from hash fields."""
+    job: Dict[str, Any] = dict(fields)
+    for name in JSON_FIELDS:
+        if name in job:
+            job[name] = json.loads(job[name])
+    for name in INT_FIELDS:
+        job[name] = int(job.get(name) or 0)
+    for name in FLOAT_FIELDS:
+        job[name] = float(job.get(name) or 0.0)
+    for name in BOOL_FIELDS:
+        job[name] = job.get(name) == "1"
+    job.setdefault("started_at", None)
+    job.setdefault("completed_at", None)
+    # Stored newest first
+    job["errors"] = list(reversed(errors or []))
+    return job
+
+
+class ScrapeJobStore:
+    """
+    Scrape job state with per-field updates.
+
+    Features:
+    - O(1) progress and counter updates (HSET / HINCRBY)
+    - Bounded error lists
+    - Sorted-set indexes for listing by recency and status
+    - Change notifications on the scrapers channel
+    - Degrades to a no-op store when Redis is not configured
+    """
+
+    def __init__(self, max_errors: int = 100, retention_seconds: int = 7 * 86400):
+        """
+        Initialize store.
+
+        Args:
+            max_errors: Errors kept per job (oldest are dropped)
+            retention_seconds: How long finished jobs are kept
+        """
+        self.max_errors = max_errors
+        self.retention_seconds = retention_seconds
+        self._client: Optional[aioredis.Redis] = None
+
+    @property
+    def client(self) -> Optional[aioredis.Redis]:
+        if self._client is None and settings.REDIS_URL:
+            self._client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._client
+
+    def _notify(self, event_type: str, job_id: str, **fields):
+        """Announce a job change without waiting on Redis."""
+        from app.core.event_batching import async_event_publisher
+
+        async_event_publisher.publish("fliptechpro:scrapers", {
+            "type": event_type,
+            "scraper_id": job_id,
+            "source": "craigslist",
+            "room": f"scraper:{job_id}",
+            **fields,
+        })
+
+    async def create(self, job: Dict[str, Any]) -> bool:
+        """
+        Store a new job, index it and push it onto its priority queue.
+
+        Args:
+            job: Job fields; must include job_id, status and priority
+        """
+        client = self.client
+        if client is None:
+            return False
+
+        job_id = job["job_id"]
+        score = time.time()
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.hset(_job_key(job_id), mapping=encode_job(job))
+            pipe.zadd(INDEX_KEY, {job_id: score})
+            pipe.zadd(_status_key(job["status"]), {job_id: score})
+            pipe.lpush(f"scrape_queue:{job['priority']}", job_id)
+            # Drop index entries of jobs whose keys have expired
+            cutoff = score - self.retention_seconds
+            pipe.zremrangebyscore(INDEX_KEY, 0, cutoff)
+            for status in JOB_STATUSES:
+                pipe.zremrangebyscore(_status_key(status), 0, cutoff)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store scrape job {job_id}: {e}")
+            return False
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job, or None if it does not exist."""
+        jobs = await self.get_many([job_id])
+        return jobs[0] if jobs else None
+
+    async def get_many(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several jobs in one round trip, skipping missing ones."""
+        client = self.client
+        if client is None or not job_ids:
+            return []
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for job_id in job_ids:
+                pipe.hgetall(_job_key(job_id))
+                pipe.lrange(_errors_key(job_id), 0, -1)
+            results = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to read scrape jobs: {e}")
+            return []
+
+        jobs = []
+        for index in range(len(job_ids)):
+            fields, errors = results[2 * index], results[2 * index + 1]
+            if fields:
+                jobs.append(decode_job(fields, errors))
+        return jobs
+
+    async def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        List jobs newest first.
+
+        Args:
+            status: Only jobs in this status
+            limit: Maximum jobs returned
+        """
+        client = self.client
+        if client is None:
+            return []
+
+        key = _status_key(status) if status else INDEX_KEY
+        try:
+            job_ids = await client.zrevrange(key, 0, limit - 1)
+        except Exception as e:
+            logger.error(f"Failed to list scrape jobs: {e}")
+            return []
+        return await self.get_many(job_ids)
+
+    async def count(self, status: str) -> int:
+        """Count jobs in a status."""
+        client = self.client
+        if client is None:
+            return 0
+        try:
+            return await client.zcard(_status_key(status))
+        except Exception as e:
+            logger.error(f"Failed to count scrape jobs: {e}")
+            return 0
+
+    async def queue_lengths(self, priorities: List[str]) -> Dict[str, int]:
+        """Get the length of each priority queue."""
+        client = self.client
+        if client is None:
+            return {priority: 0 for priority in priorities}
+        try:
+            pipe = client.pipeline(transaction=False)
+            for priority in priorities:
+                pipe.llen(f"scrape_queue:{priority}")
+            return dict(zip(priorities, await pipe.execute()))
+        except Exception as e:
+            logger.error(f"Failed to read scrape queue lengths: {e}")
+            return {priority: 0 for priority in priorities}
+
+    async def set_status(self, job_id: str, status: str, **fields) -> bool:
+        """
+        Move a job to a new status, re-indexing it and setting extra fields.
+
+        Finished jobs get an expiry so they age out after retention_seconds.
+        """
+        client = self.client
+        if client is None:
+            return False
+
+        try:
+            score = await client.zscore(INDEX_KEY, job_id) or time.time()
+            pipe = client.pipeline(transaction=True)
+            pipe.hset(_job_key(job_id), mapping=encode_job({"status": status, **fields}))
+            for other in JOB_STATUSES:
+                if other != status:
+                    pipe.zrem(_status_key(other), job_id)
+            pipe.zadd(_status_key(status), {job_id: score})
+            if status in FINISHED_STATUSES:
+                pipe.expire(_job_key(job_id), self.retention_seconds)
+                pipe.expire(_errors_key(job_id), self.retention_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to update scrape job {job_id} status: {e}")
+            return False
+
+        event_type = {
+            "running": "scraper:started",
+            "completed": "scraper:completed",
+            "failed": "scraper:failed",
+        }.get(status, "scraper:status")
+        self._notify(event_type, job_id, status=status, **fields)
+        return True
+
+    async def update_progress(self, job_id: str, progress: int, current: int, total: int, leads_found: int) -> bool:
+        """Record a progress tick (single-field write)."""
+        client = self.client
+        if client is None:
+            return False
+
+        try:
+            await client.hset(_job_key(job_id), "progress", progress)
+        except Exception as e:
+            logger.error(f"Failed to update scrape job {job_id} progress: {e}")
+            return False
+
+        self._notify(
+            "scraper:progress", job_id,
+            current=current,
+            total=total,
+            percent=progress,
+            leads_found=leads_found,
+        )
+        return True
+
+    async def increment(self, job_id: str, **counters) -> Dict[str, float]:
+        """
+        Atomically add to counters (HINCRBY, or HINCRBYFLOAT for floats).
+
+        Returns:
+            New counter values
+        """
+        client = self.client
+        if client is None or not counters:
+            return {}
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for name, amount in counters.items():
+                if isinstance(amount, float):
+                    pipe.hincrbyfloat(_job_key(job_id), name, amount)
+                else:
+                    pipe.hincrby(_job_key(job_id), name, amount)
+            return dict(zip(counters, await pipe.execute()))
+        except Exception as e:
+            logger.error(f"Failed to update scrape job {job_id} counters: {e}")
+            return {}
+
+    async def add_error(self, job_id: str, message: str) -> bool:
+        """Append an error, keeping only the newest max_errors."""
+        client = self.client
+        if client is None:
+            return False
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.lpush(_errors_key(job_id), message)
+            pipe.ltrim(_errors_key(job_id), 0, self.max_errors - 1)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to record scrape job {job_id} error: {e}")
+            return False
+
+
+# Global instance
+scrape_job_store = ScrapeJobStore()
@@ -0,0 +1,474 @@
+"""
+Site Cache - Content-addressed cache of website fetches and analyses.
+
+The same business websites are analyzed again and again (once per lead that
+points at the domain, and again by the improvement planner and demo builder).
+Each URL is revalidated with a single conditional GET (ETag / Last-Modified);
+the raw HTML is stored gzip-compressed under its SHA-256, and derived results
+(SEO, accessibility, design metrics, AI analyses, generated demos) are stored
+under that hash plus the producing analyzer's name and version. An unchanged
+site therefore costs one conditional GET and no AI tokens.
+
+Layout under SITE_CACHE_DIR:
+- urls/<key[:2]>/<key>.json             validators + current content hash per URL
+- html/<hash[:2]>/<hash>.html.gz        raw HTML, shared by every URL serving it
+- derived/<hash[:2]>/<hash>/<name>.json.gz
+
+File mtimes double as bookkeeping: URL records and HTML are touched when
+used, derived results keep the time they were written. A periodic sweep
+removes derived results past their TTL and anything unused for `max_age`,
+then evicts the oldest files until the directory is under `max_bytes`.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import httpx
+
+from app.core.config import settings
+from app.core.url_validator import URLSecurityError, URLValidator
+
+logger = logging.getLogger(__name__)
+
+
+# Query parameters that never change page content
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+MAX_REDIRECTS = 5
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for cache keys.
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query.
+    """
+    if "://" not in url:
+        url = f"https://{url}"
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (name.lower().startswith("utm_") or name.lower() in _TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def content_hash(html: str) -> str:
+    """SHA-256 of HTML content (the cache's content address)."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """Outcome of revalidating a URL."""
+    url: str
+    content_hash: str
+    changed: bool  # False if the content hash is the same as last time
+    not_modified: bool  # Server answered 304
+    status_code: int
+
+
+class SiteCache:
+    """
+    Disk cache for website HTML and everything derived from it.
+
+    Features:
+    - URL normalization so tracking parameters / trailing slashes share entries
+    - Conditional GET revalidation with stored ETag / Last-Modified
+    - SSRF validation of the URL and every redirect hop
+    - Gzip-compressed, deduplicated HTML store keyed by content hash
+    - Derived results keyed by content hash, analyzer name/version and params
+    - Derived results expire after `derived_ttl`
+    - Background sweep by age and LRU eviction down to `max_bytes`
+    - Hit/miss counters
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.SITE_CACHE_DIR,
+        timeout: float = 15.0,
+        url_validator: Optional[URLValidator] = None,
+        max_bytes: int = settings.SITE_CACHE_MAX_MB * 1024 * 1024,
+        max_age: float = settings.SITE_CACHE_MAX_AGE_DAYS * 86400,
+        derived_ttl: float = settings.SITE_CACHE_DERIVED_TTL_DAYS * 86400,
+        sweep_interval: float = 3600.0
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Root directory of the cache
+            timeout: Timeout of revalidation requests in seconds
+            url_validator: Validator applied to every fetched URL (defaults
+                to blocking private and metadata addresses)
+            max_bytes: Size the sweep trims the cache down to
+            max_age: Seconds a URL record or page is kept without being used
+            derived_ttl: Seconds a derived result is served after it was stored
+            sweep_interval: Minimum seconds between sweeps (started after writes)
+        """
+        self.directory = directory
+        self.timeout = timeout
+        self.url_validator = url_validator or URLValidator(allow_private_ips=False, strict_mode=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.derived_ttl = derived_ttl
+        self.sweep_interval = sweep_interval
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._last_sweep = 0.0
+        self.stats = {
+            "revalidations": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "changed": 0,
+            "revalidation_errors": 0,
+            "derived_hits": 0,
+            "derived_misses": 0,
+            "derived_expired": 0,
+            "sweeps": 0,
+            "evicted_files": 0,
+            "evicted_bytes": 0,
+        }
+
+    # ==================== PATHS ====================
+
+    def _url_path(self, normalized_url: str) -> str:
+        key = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "urls", key[:2], f"{key}.json")
+
+    def _html_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "html", digest[:2], f"{digest}.html.gz")
+
+    def _derived_path(self, digest: str, analyzer: str, version: str, params: Dict[str, Any]) -> str:
+        name = f"{analyzer}-v{version}"
+        if params:
+            material = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+            name += "-" + hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, "derived", digest[:2], digest, f"{name}.json.gz")
+
+    # ==================== FILE I/O (run in threads) ====================
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+        # Atomic so concurrent readers never see a partial file
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _read_json(path: str, compressed: bool = False) -> Optional[Dict[str, Any]]:
+        try:
+            opener = gzip.open if compressed else open
+            with opener(path, "rt", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def _store_html(self, digest: str, html: str):
+        path = self._html_path(digest)
+        if not os.path.exists(path):
+            self._write_atomic(path, gzip.compress(html.encode("utf-8")))
+
+    def _load_html(self, digest: str) -> Optional[str]:
+        path = self._html_path(digest)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                html = handle.read()
+        except OSError:
+            return None
+        self._touch(path)
+        return html
+
+    def _read_derived(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read a derived result unless it is older than `derived_ttl`."""
+        try:
+            if time.time() - os.path.getmtime(path) > self.derived_ttl:
+                self.stats["derived_expired"] += 1
+                return None
+        except OSError:
+            return None
+        return self._read_json(path, compressed=True)
+
+    @staticmethod
+    def _touch(*paths: str):
+        """Mark files as recently used for the LRU sweep."""
+        for path in paths:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    # ==================== EVICTION ====================
+
+    def sweep(self) -> int:
+        """
+        Evict expired and least recently used files.
+
+        Derived results past `derived_ttl` and URL records / pages unused for
+        `max_age` are removed first; then the oldest remaining files go until
+        the cache is under `max_bytes`. Runs in a thread.
+
+        Returns:
+            int: Number of files removed
+        """
+        now = time.time()
+        derived_root = os.path.join(self.directory, "derived")
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(".tmp") and now - info.st_mtime <= self.max_age:
+                    continue  # Still being written
+                files.append((info.st_mtime, info.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        # Oldest first, so the size cap evicts least recently used files
+        for mtime, size, path in sorted(files):
+            limit = self.derived_ttl if path.startswith(derived_root) else self.max_age
+            if now - mtime <= limit and total <= self.max_bytes:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            self.stats["evicted_bytes"] += size
+            self._remove_empty_dirs(os.path.dirname(path))
+
+        self.stats["sweeps"] += 1
+        self.stats["evicted_files"] += removed
+        if removed:
+            logger.info(f"Site cache sweep removed {removed} files, {total} bytes remain")
+        return removed
+
+    def _remove_empty_dirs(self, directory: str):
+        root = os.path.abspath(self.directory)
+        directory = os.path.abspath(directory)
+        while directory != root and directory.startswith(root):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    def _schedule_sweep(self):
+        """Start a background sweep if the last one is `sweep_interval` old."""
+        loop = asyncio.get_running_loop()
+        if self._sweep_task is not None and not self._sweep_task.done():
+            return
+        if self._last_sweep and loop.time() - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = loop.time()
+        self._sweep_task = asyncio.create_task(self._run_sweep())
+
+    async def _run_sweep(self):
+        try:
+            await asyncio.to_thread(self.sweep)
+        except Exception as e:
+            logger.warning(f"Site cache sweep failed: {e}")
+
+    # ==================== REVALIDATION ====================
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Redirects are followed by hand so every hop is validated
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=False,
+                headers={"User-Agent": settings.SCRAPER_USER_AGENT},
+            )
+        return self._client
+
+    async def _fetch(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """
+        GET a URL, following redirects only to URLs that pass validation.
+
+        Raises:
+            URLSecurityError: If the URL or a redirect target is not allowed
+            httpx.HTTPError: On request failures or too many redirects
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            # Validation resolves the hostname (blocking), so run it in a thread
+            await asyncio.to_thread(self.url_validator.validate_webhook_url, url)
+            response = await self._get_client().get(url, headers=headers)
+            if response.status_code not in _REDIRECT_CODES or "location" not in response.headers:
+                return response
+            url = urljoin(url, response.headers["location"])
+        raise httpx.TooManyRedirects(f"More than {MAX_REDIRECTS} redirects", request=response.request)
+
+    async def revalidate(self, url: str) -> Optional[CachedPage]:
+        """
+        Bring a URL's cache entry up to date with one (conditional) GET.
+
+        Args:
+            url: Website URL
+
+        Returns:
+            CachedPage, or None if the site could not be fetched (callers then
+            proceed without the cache)
+        """
+        # The normalized URL is only the cache key; the page is fetched as given
+        normalized = normalize_url(url)
+        url = url.strip()
+        if "://" not in url:
+            url = f"https://{url}"
+        record_path = self._url_path(normalized)
+        record = await asyncio.to_thread(self._read_json, record_path)
+
+        headers = {}
+        if record and await asyncio.to_thread(os.path.exists, self._html_path(record["content_hash"])):
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+
+        self.stats["revalidations"] += 1
+        try:
+            response = await self._fetch(url, headers)
+        except URLSecurityError as e:
+            self.stats["revalidation_errors"] += 1
+            logger.warning(f"Site cache refused to fetch {url}: {e}")
+            return None
+        except httpx.HTTPError as e:
+            self.stats["revalidation_errors"] += 1
+            logger.warning(f"Site cache revalidation failed for {url}: {e}")
+            return None
+
+        if response.status_code == 304 and headers:
+            self.stats["not_modified"] += 1
+            await asyncio.to_thread(self._touch, record_path, self._html_path(record["content_hash"]))
+            return CachedPage(
+                url=normalized,
+                content_hash=record["content_hash"],
+                changed=False,
+                not_modified=True,
+                status_code=304,
+            )
+
+        if response.status_code >= 400:
+            self.stats["revalidation_errors"] += 1
+            logger.warning(f"Site cache revalidation got HTTP {response.status_code} for {url}")
+            return None
+
+        html = response.text
+        digest = content_hash(html)
+        changed = not record or record.get("content_hash") != digest
+        self.stats["changed" if changed else "unchanged"] += 1
+
+        await asyncio.to_thread(self._store_html, digest, html)
+        await asyncio.to_thread(
+            self._write_atomic,
+            record_path,
+            json.dumps({
+                "url": normalized,
+                "content_hash": digest,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "fetched_at": time.time(),
+            }).encode("utf-8"),
+        )
+        self._schedule_sweep()
+
+        return CachedPage(
+            url=normalized,
+            content_hash=digest,
+            changed=changed,
+            not_modified=False,
+            status_code=response.status_code,
+        )
+
+    async def get_html(self, digest: str) -> Optional[str]:
+        """Load stored HTML by content hash."""
+        return await asyncio.to_thread(self._load_html, digest)
+
+    # ==================== DERIVED RESULTS ====================
+
+    async def get_derived(
+        self,
+        digest: str,
+        analyzer: str,
+        version: str,
+        **params: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a result derived from some content.
+
+        Args:
+            digest: Content hash of the input HTML
+            analyzer: Name of the producing analyzer
+            version: Analyzer version (bump it when its output changes)
+            **params: Other inputs that affect the result
+
+        Returns:
+            Stored result, or None if missing or older than `derived_ttl`
+        """
+        result = await asyncio.to_thread(
+            self._read_derived, self._derived_path(digest, analyzer, version, params)
+        )
+        self.stats["derived_hits" if result is not None else "derived_misses"] += 1
+        return result
+
+    async def put_derived(
+        self,
+        digest: str,
+        analyzer: str,
+        version: str,
+        result: Dict[str, Any],
+        **params: Any
+    ):
+        """Store a result derived from some content (see get_derived)."""
+        data = gzip.compress(json.dumps(result, default=str).encode("utf-8"))
+        try:
+            await asyncio.to_thread(
+                self._write_atomic, self._derived_path(digest, analyzer, version, params), data
+            )
+        except OSError as e:
+            logger.warning(f"Failed to store {analyzer} result in site cache: {e}")
+            return
+        self._schedule_sweep()
+
+    async def close(self):
+        """Close the revalidation HTTP client and wait for a running sweep."""
+        if self._sweep_task is not None:
+            await self._sweep_task
+            self._sweep_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.stats["derived_hits"] + self.stats["derived_misses"]
+        return {
+            **self.stats,
+            "derived_hit_rate": self.stats["derived_hits"] / lookups if lookups else 0.0,
+        }
+
+
+# Global instance (None when SITE_CACHE_ENABLED is off)
+site_cache: Optional[SiteCache] = SiteCache() if settings.SITE_CACHE_ENABLED else None
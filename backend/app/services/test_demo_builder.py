@@ -616,7 +616,8 @@ class TestUtilityFunctions:
             html_content="<html><body>Test</body></html>",
             improvement_plan_dict=improvement_dict,
             ai_council=mock_ai_council,
-            framework=Framework.HTML
+            framework=Framework.HTML,
+            site_cache=None
         )
 
         assert isinstance(build, DemoSiteBuild)
@@ -0,0 +1,351 @@
+"""
+Tracking Event Recorder
+
+Write-behind buffer for email open/click tracking events.
+
+The public tracking endpoints only append events to an in-process queue and
+return immediately. A background aggregator drains the queue in batches,
+bulk-inserts EmailTracking rows, stamps first opens/clicks on recipients,
+applies counter deltas to each campaign with one UPDATE per flush and feeds
+the hourly stats rollups, so open storms no longer contend on the campaign
+row per pixel hit.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select, tuple_, update
+
+from app.core.database import AsyncSessionLocal
+from app.models.campaigns import Campaign, CampaignRecipient, EmailTracking
+from app.schemas.campaigns import EmailEventTypeEnum
+from app.services import campaign_stats
+
+logger = logging.getLogger(__name__)
+
+
+# Recipient timestamp column and campaign counter touched by a first event
+FIRST_EVENT_COLUMNS = {
+    EmailEventTypeEnum.OPEN.value: ("opened_at", "emails_opened"),
+    EmailEventTypeEnum.CLICK.value: ("clicked_at", "emails_clicked"),
+}
+
+# Hourly rollup counters: (every event, first event per recipient)
+ROLLUP_COUNTERS = {
+    EmailEventTypeEnum.OPEN.value: ("opens", "unique_opens"),
+    EmailEventTypeEnum.CLICK.value: ("clicks", "unique_clicks"),
+}
+
+
+class TrackingEventRecorder:
+    """
+    Buffers tracking events and persists them in batches.
+
+    Features:
+    - Non-blocking record() for the request path
+    - Flush every `batch_size` events or `flush_interval` seconds
+    - First-open/first-click dedupe via conditional UPDATE ... RETURNING
+    - One counter UPDATE per campaign per flush
+    - Failed batches are retried (up to `max_flush_attempts` per event)
+    - Drain on shutdown
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 100_000,
+        max_flush_attempts: int = 5,
+    ):
+        """
+        Initialize recorder.
+
+        Args:
+            batch_size: Maximum events persisted per flush
+            flush_interval: Maximum seconds an event waits in the buffer
+            max_queue_size: Events beyond this are dropped (and counted)
+            max_flush_attempts: Failed writes of an event before it is given up
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_flush_attempts = max_flush_attempts
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # Events from failed flushes, persisted before anything new
+        self._retry_buffer: Deque[Dict[str, Any]] = deque()
+        self._running = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set on the first buffered event / once a full batch is buffered
+        self._work = asyncio.Event()
+        self._batch_full = asyncio.Event()
+
+        self.stats = {
+            "recorded": 0,
+            "dropped": 0,
+            "flushed": 0,
+            "unmatched": 0,
+            "flush_errors": 0,
+            "requeued": 0,
+            "abandoned": 0,
+        }
+
+    def record(
+        self,
+        event_type: str,
+        campaign_id: int,
+        lead_id: int,
+        recipient_id: Optional[int] = None,
+        event_data: Optional[Dict[str, Any]] = None,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+    ) -> bool:
+        """
+        Append a tracking event to the buffer without touching the database.
+
+        Events carrying a recipient_id (from signed tracking tokens) skip the
+        recipient lookup at flush time.
+
+        Returns:
+            bool: False if the buffer is full and the event was dropped
+        """
+        event = {
+            "event_type": event_type,
+            "campaign_id": campaign_id,
+            "lead_id": lead_id,
+            "recipient_id": recipient_id,
+            "event_data": event_data or {},
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "created_at": datetime.now(timezone.utc),
+            "attempts": 0,
+        }
+
+        try:
+            self._queue.put_nowait(event)
+            self.stats["recorded"] += 1
+            self._work.set()
+            if self._queue.qsize() >= self.batch_size:
+                self._batch_full.set()
+            return True
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            logger.warning(f"Tracking buffer full, dropped {event_type} event for campaign {campaign_id}")
+            return False
+
+    async def start(self):
+        """Start the background aggregator."""
+        if self._running:
+            logger.warning("Tracking recorder already running")
+            return
+
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info("Tracking event recorder started")
+
+    async def stop(self):
+        """Stop the aggregator and drain buffered events."""
+        self._running = False
+        # Wake the loop instead of cancelling it, so a batch it is writing
+        # is persisted or requeued before it exits
+        self._work.set()
+        self._batch_full.set()
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+        # Drain whatever is still buffered; failed events are retried until
+        # they run out of attempts, so this terminates even if the DB is down
+        while not self._queue.empty() or self._retry_buffer:
+            try:
+                await self.flush()
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logger.error(f"Error flushing tracking events on shutdown: {e}")
+
+        logger.info("Tracking event recorder stopped")
+
+    async def _flush_loop(self):
+        """Flush on size or time, whichever comes first."""
+        while self._running:
+            try:
+                await self._wait_for_batch()
+                await self.flush()
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logger.error(f"Error flushing tracking events: {e}")
+                await asyncio.sleep(self.flush_interval)
+
+    async def _wait_for_batch(self):
+        """
+        Wait until a full batch is buffered, or `flush_interval` after the
+        first event arrived. Nothing is taken off the queue while waiting.
+        """
+        while self._queue.empty() and not self._retry_buffer and self._running:
+            self._work.clear()
+            await self._work.wait()
+
+        if self._running and not self._retry_buffer and self._queue.qsize() < self.batch_size:
+            self._batch_full.clear()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def flush(self) -> int:
+        """
+        Persist up to one batch of buffered events.
+
+        Returns:
+            int: Number of events persisted
+        """
+        batch = self._collect_batch()
+        if not batch:
+            return 0
+
+        try:
+            await self._persist(batch)
+        except Exception:
+            self._requeue(batch)
+            raise
+
+        self.stats["flushed"] += len(batch)
+        return len(batch)
+
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        """Put the events of a failed flush back for the next one."""
+        requeued = 0
+        for event in batch:
+            event["attempts"] += 1
+            if event["attempts"] >= self.max_flush_attempts:
+                self.stats["abandoned"] += 1
+                continue
+            self._retry_buffer.append(event)
+            requeued += 1
+
+        self.stats["requeued"] += requeued
+        if requeued < len(batch):
+            logger.error(
+                f"Gave up on {len(batch) - requeued} tracking events after "
+                f"{self.max_flush_attempts} failed flushes"
+            )
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Take up to one batch, retried events first."""
+        batch: List[Dict[str, Any]] = []
+
+        while len(batch) < self.batch_size and self._retry_buffer:
+            batch.append(self._retry_buffer.popleft())
+
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    async def _persist(self, batch: List[Dict[str, Any]]):
+        """Write one batch of events in a single transaction."""
+        pairs = {(e["campaign_id"], e["lead_id"]) for e in batch if not e["recipient_id"]}
+
+        async with AsyncSessionLocal() as session:
+            try:
+                # Resolve legacy (campaign, lead) pairs to recipients in one query
+                recipients: Dict[Tuple[int, int], int] = {}
+                if pairs:
+                    result = await session.execute(
+                        select(
+                            CampaignRecipient.id,
+                            CampaignRecipient.campaign_id,
+                            CampaignRecipient.lead_id,
+                        ).where(
+                            tuple_(CampaignRecipient.campaign_id, CampaignRecipient.lead_id).in_(list(pairs))
+                        )
+                    )
+                    recipients = {(row.campaign_id, row.lead_id): row.id for row in result}
+
+                rows = []
+                unmatched = 0
+                first_candidates: Dict[str, set] = defaultdict(set)
+                rollup = campaign_stats.new_deltas()
+                for event in batch:
+                    recipient_id = event["recipient_id"] or recipients.get(
+                        (event["campaign_id"], event["lead_id"])
+                    )
+                    if recipient_id is None:
+                        unmatched += 1
+                        continue
+
+                    rows.append({
+                        "campaign_recipient_id": recipient_id,
+                        "event_type": event["event_type"],
+                        "event_data": event["event_data"],
+                        "user_agent": event["user_agent"],
+                        "ip_address": event["ip_address"],
+                        "created_at": event["created_at"],
+                    })
+                    if event["event_type"] in FIRST_EVENT_COLUMNS:
+                        first_candidates[event["event_type"]].add(recipient_id)
+                    if event["event_type"] in ROLLUP_COUNTERS:
+                        total_counter, _ = ROLLUP_COUNTERS[event["event_type"]]
+                        bucket = campaign_stats.hour_bucket(event["created_at"])
+                        rollup[(event["campaign_id"], bucket)][total_counter] += 1
+
+                if not rows:
+                    self.stats["unmatched"] += unmatched
+                    return
+
+                await session.execute(insert(EmailTracking), rows)
+
+                # Stamp first opens/clicks; RETURNING yields only recipients
+                # that had not been stamped yet, which gives the unique counts
+                deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+                now = datetime.now(timezone.utc)
+                for event_type, recipient_ids in first_candidates.items():
+                    timestamp_column, counter = FIRST_EVENT_COLUMNS[event_type]
+                    column = getattr(CampaignRecipient, timestamp_column)
+                    stamped = await session.execute(
+                        update(CampaignRecipient)
+                        .where(CampaignRecipient.id.in_(recipient_ids), column.is_(None))
+                        .values({timestamp_column: now})
+                        .returning(CampaignRecipient.campaign_id)
+                        .execution_options(synchronize_session=False)
+                    )
+                    _, unique_counter = ROLLUP_COUNTERS[event_type]
+                    for (campaign_id,) in stamped:
+                        deltas[campaign_id][counter] += 1
+                        rollup[(campaign_id, campaign_stats.hour_bucket(now))][unique_counter] += 1
+
+                # One counter UPDATE per campaign
+                for campaign_id, counters in deltas.items():
+                    await session.execute(
+                        update(Campaign)
+                        .where(Campaign.id == campaign_id)
+                        .values({
+                            name: getattr(Campaign, name) + delta
+                            for name, delta in counters.items()
+                        })
+                        .execution_options(synchronize_session=False)
+                    )
+
+                # Hourly rollups for campaign stats, same transaction
+                await campaign_stats.apply_deltas(session, rollup)
+
+                await session.commit()
+                self.stats["unmatched"] += unmatched
+                logger.debug(f"Flushed {len(rows)} tracking events across {len(deltas)} campaigns")
+
+            except Exception:
+                await session.rollback()
+                raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recorder statistics."""
+        return {
+            **self.stats,
+            "buffered": self._queue.qsize() + len(self._retry_buffer),
+            "running": self._running,
+        }
+
+
+# Global instance
+tracking_recorder = TrackingEventRecorder()
@@ -13,11 +13,12 @@ Used by ConversationAI to provide context from historical conversations.
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import httpx
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.services.llm_gateway import llm_gateway
+
 logger = structlog.get_logger(__name__)
 
 
@@ -34,7 +35,6 @@ class VectorStore:
     # OpenAI embedding model (cheap and effective)
     EMBEDDING_MODEL = "text-embedding-3-small"
     EMBEDDING_DIMENSIONS = 1536
-    OPENAI_EMBEDDING_URL = "https://api.openai.com/v1/embeddings"
 
     def __init__(
         self,
@@ -44,11 +44,9 @@ class VectorStore:
         """Initialize vector store."""
         self.db = db_session
         self.openai_api_key = openai_api_key
-        self.http_client = httpx.AsyncClient(timeout=30.0)
 
     async def close(self):
-        """Close HTTP client."""
-        await self.http_client.aclose()
+        """Release resources (the HTTP pool is shared and outlives the store)."""
 
     async def _get_embedding(self, text: str) -> List[float]:
         """
@@ -61,20 +59,14 @@ class VectorStore:
             Embedding vector (1536 dimensions)
         """
         try:
-            response = await self.http_client.post(
-                self.OPENAI_EMBEDDING_URL,
-                headers={
-                    "Authorization": f"Bearer {self.openai_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "input": text,
-                    "model": self.EMBEDDING_MODEL
-                }
+            embeddings = await llm_gateway.embeddings(
+                text,
+                model=self.EMBEDDING_MODEL,
+                provider="openai",
+                api_key=self.openai_api_key,
+                timeout=30.0
             )
-            response.raise_for_status()
-            data = response.json()
-            embedding = data["data"][0]["embedding"]
+            embedding = embeddings[0]
 
             logger.info(
                 "vector_store.embedding_created",
@@ -7,10 +7,12 @@ ensuring reliable delivery even when external services are temporarily unavailab
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Set
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, or_, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from app.models.webhook_queue import (
     WebhookQueueItem,
@@ -18,32 +20,63 @@ from app.models.webhook_queue import (
     WebhookRetryHistory,
     WebhookStatus
 )
-from app.services.n8n_webhook_trigger import N8nWebhookTrigger
+from app.services.n8n_webhook_trigger import N8nWebhookTrigger, N8nWebhookCircuitOpenError
+from app.core.database import AsyncSessionLocal, engine
 from app.core.webhook_config import webhook_config
 
 logger = logging.getLogger(__name__)
 
 
+# Channel notified by the webhook_queue trigger (migration 026)
+NOTIFY_CHANNEL = "webhook_queue"
+
+# Columns returned when claiming a batch
+CLAIM_COLUMNS = (
+    WebhookQueueItem.id,
+    WebhookQueueItem.webhook_url,
+    WebhookQueueItem.payload,
+    WebhookQueueItem.headers,
+    WebhookQueueItem.event_type,
+    WebhookQueueItem.entity_type,
+    WebhookQueueItem.entity_id,
+    WebhookQueueItem.priority,
+    WebhookQueueItem.retry_count,
+    WebhookQueueItem.max_retries,
+    WebhookQueueItem.signature,
+    WebhookQueueItem.queue_metadata,
+    WebhookQueueItem.created_at,
+)
+
+
 class WebhookQueue:
     """
     Reliable webhook delivery with retry and queue management.
 
     This service provides persistent webhook queuing with automatic
     retry, prioritization, and comprehensive logging.
+
+    Features:
+    - Atomic batch claiming, safe across app instances
+    - LISTEN/NOTIFY wakeups with polling fallback
+    - Up to `max_in_flight` deliveries at once; a finished delivery frees its
+      slot for the next claim, so a slow destination never holds up the rest
+    - Bulk outcome, retry history and log writes
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[Session] = None):
         """
         Initialize webhook queue service.
 
         Args:
-            db: Database session
+            db: Database session for enqueueing and admin operations; the
+                processor loop uses its own async sessions
         """
         self.db = db
         self.config = webhook_config
         self.webhook_trigger = N8nWebhookTrigger()
         self._processing = False
         self._process_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
 
     async def enqueue(
         self,
@@ -100,7 +133,7 @@ class WebhookQueue:
             priority=priority,
             max_retries=max_retries,
             retry_count=0,
-            metadata=metadata,
+            queue_metadata=metadata,
             created_at=datetime.utcnow()
         )
 
@@ -119,8 +152,16 @@ class WebhookQueue:
         """
         Background task to process webhook queue.
 
-        This method runs continuously, processing pending webhooks
-        from the queue with retry logic.
+        Claims batches of due webhooks atomically (FOR UPDATE SKIP LOCKED),
+        so any number of app instances can run this loop side by side
+        without delivering the same row twice. Deliveries run as independent
+        tasks: whenever some finish, their outcomes are recorded and the freed
+        slots are claimed again, without waiting for slower deliveries.
+
+        The loop wakes on NOTIFY webhook_queue (sent by a trigger when a row
+        becomes pending), on finished deliveries, and falls back to polling
+        every processing_interval seconds, which also picks up scheduled
+        retries.
         """
         if not self.config.queue.enabled:
             logger.info("Webhook queue processing is disabled")
@@ -128,215 +169,356 @@ class WebhookQueue:
 
         logger.info("Starting webhook queue processor")
         self._processing = True
+        listener = await self._start_listener()
 
-        while self._processing:
-            try:
-                # Get pending webhooks
-                pending_webhooks = self._get_pending_webhooks()
+        in_flight: Set[asyncio.Task] = set()
+        try:
+            while self._processing:
+                try:
+                    free = self.config.queue.max_in_flight - len(in_flight)
+                    if free > 0:
+                        # Notifications arriving while deliveries run keep
+                        # the event set, so the next wait returns immediately
+                        self._wakeup.clear()
+                        requested = min(free, self.config.queue.batch_size)
+                        claimed = await self._claim_batch(requested)
+                        if claimed:
+                            logger.info(f"Processing {len(claimed)} claimed webhooks")
+                            in_flight.update(asyncio.create_task(self._deliver(webhook)) for webhook in claimed)
+                        else:
+                            logger.debug("No pending webhooks to process")
+
+                        if len(claimed) == requested and len(in_flight) < self.config.queue.max_in_flight:
+                            # A full claim means more work is probably waiting
+                            continue
+
+                    done = await self._wait_for_work(
+                        in_flight, accept_new=len(in_flight) < self.config.queue.max_in_flight
+                    )
+                    if done:
+                        in_flight -= done
+                        await self._record_outcomes([task.result() for task in done])
 
-                if pending_webhooks:
-                    logger.info(f"Processing {len(pending_webhooks)} pending webhooks")
-                    await self._process_webhooks(pending_webhooks)
-                else:
-                    logger.debug("No pending webhooks to process")
+                except Exception as e:
+                    logger.error(f"Error in webhook queue processor: {str(e)}", exc_info=True)
+                    await asyncio.sleep(self.config.queue.processing_interval)
+        finally:
+            await self._finish_in_flight(in_flight)
+            await self._stop_listener(listener)
 
-                # Wait before next iteration
-                await asyncio.sleep(self.config.queue.processing_interval)
+        logger.info("Webhook queue processor stopped")
 
-            except Exception as e:
-                logger.error(f"Error in webhook queue processor: {str(e)}", exc_info=True)
-                await asyncio.sleep(self.config.queue.processing_interval)
+    async def _start_listener(self) -> Optional[AsyncConnection]:
+        """
+        LISTEN for queue notifications on a dedicated connection.
 
-        logger.info("Webhook queue processor stopped")
+        Returns:
+            The connection holding the listener, or None when notifications
+            are unavailable (the processor then only polls)
+        """
+        try:
+            connection = await engine.connect()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+            logger.info(f"Listening for webhook queue notifications on '{NOTIFY_CHANNEL}'")
+            return connection
+        except Exception as e:
+            logger.warning(f"Webhook queue notifications unavailable, polling only: {e}")
+            return None
+
+    async def _stop_listener(self, connection: Optional[AsyncConnection]):
+        """UNLISTEN and release the listener connection."""
+        if connection is None:
+            return
+        try:
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+        except Exception as e:
+            logger.debug(f"Error removing webhook queue listener: {e}")
+        await connection.close()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        """asyncpg notification callback."""
+        self._wakeup.set()
 
-    def _get_pending_webhooks(self) -> List[WebhookQueueItem]:
+    async def _wait_for_work(self, in_flight: Set[asyncio.Task], accept_new: bool) -> Set[asyncio.Task]:
         """
-        Get pending webhooks from queue.
+        Sleep until deliveries finish, a notification arrives (if there is room
+        for new work) or the fallback poll interval passes.
 
         Returns:
-            List of webhook queue items ready for processing
+            Deliveries that finished
         """
-        now = datetime.utcnow()
+        waiters = set(in_flight)
+        wakeup = None
+        if accept_new:
+            wakeup = asyncio.create_task(self._wakeup.wait())
+            waiters.add(wakeup)
 
-        # Query for pending webhooks
-        query = self.db.query(WebhookQueueItem).filter(
-            and_(
-                WebhookQueueItem.status.in_([
-                    WebhookStatus.PENDING.value,
-                    WebhookStatus.FAILED.value
-                ]),
-                WebhookQueueItem.retry_count < WebhookQueueItem.max_retries,
-                or_(
-                    WebhookQueueItem.next_retry_at.is_(None),
-                    WebhookQueueItem.next_retry_at <= now
-                )
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=self.config.queue.processing_interval, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if wakeup is not None:
+                wakeup.cancel()
+
+        return {task for task in done if task is not wakeup}
+
+    async def _finish_in_flight(self, in_flight: Set[asyncio.Task]):
+        """Let running deliveries finish on shutdown and record their outcomes."""
+        if not in_flight:
+            return
+        logger.info(f"Waiting for {len(in_flight)} webhook deliveries to finish")
+        await asyncio.wait(in_flight)
+        try:
+            await self._record_outcomes([task.result() for task in in_flight])
+        except Exception as e:
+            # Rows stay in SENDING and are reclaimed after claim_timeout
+            logger.error(f"Error recording webhook outcomes on shutdown: {str(e)}", exc_info=True)
+
+    async def _claim_batch(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Atomically claim due webhooks for this worker.
+
+        Rows are locked with SKIP LOCKED and flipped to SENDING in the same
+        statement, so concurrent workers never claim the same row. Rows left
+        in SENDING by a worker that died are reclaimed after claim_timeout;
+        the interrupted delivery counts as a failed attempt, so a webhook
+        that keeps crashing the worker still stops at max_retries.
+
+        Args:
+            limit: Maximum rows to claim (default: queue batch_size)
+
+        Returns:
+            Claimed webhooks as dictionaries, highest priority first
+        """
+        queue = self.config.queue
+        now = func.now()
+
+        # SET expressions see the pre-update retry_count
+        attempts = WebhookQueueItem.retry_count + 1
+        reclaim = (
+            update(WebhookQueueItem)
+            .where(
+                WebhookQueueItem.status == WebhookStatus.SENDING.value,
+                WebhookQueueItem.updated_at < now - timedelta(seconds=queue.claim_timeout)
+            )
+            .values(
+                status=WebhookStatus.FAILED.value,
+                retry_count=attempts,
+                next_retry_at=None,
+                failed_at=case((attempts >= WebhookQueueItem.max_retries, now), else_=None),
+                last_error="Delivery interrupted before its outcome was recorded",
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        ready = select(WebhookQueueItem.id).where(
+            WebhookQueueItem.status.in_([
+                WebhookStatus.PENDING.value,
+                WebhookStatus.FAILED.value
+            ]),
+            WebhookQueueItem.retry_count < WebhookQueueItem.max_retries,
+            or_(
+                WebhookQueueItem.next_retry_at.is_(None),
+                WebhookQueueItem.next_retry_at <= now
             )
         )
 
         # Apply priority ordering if enabled
-        if self.config.queue.priority_enabled:
-            query = query.order_by(
+        if queue.priority_enabled:
+            ready = ready.order_by(
                 WebhookQueueItem.priority.desc(),
                 WebhookQueueItem.created_at.asc()
             )
         else:
-            query = query.order_by(WebhookQueueItem.created_at.asc())
-
-        # Limit batch size
-        webhooks = query.limit(self.config.queue.batch_size).all()
+            ready = ready.order_by(WebhookQueueItem.created_at.asc())
 
-        return webhooks
+        ready = ready.limit(limit or queue.batch_size).with_for_update(skip_locked=True)
 
-    async def _process_webhooks(self, webhooks: List[WebhookQueueItem]):
-        """
-        Process a batch of webhooks.
+        stmt = (
+            update(WebhookQueueItem)
+            .where(WebhookQueueItem.id.in_(ready.scalar_subquery()))
+            .values(status=WebhookStatus.SENDING.value, updated_at=now)
+            .returning(*CLAIM_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
 
-        Args:
-            webhooks: List of webhook queue items to process
-        """
-        tasks = []
-        for webhook in webhooks:
-            task = self._process_single_webhook(webhook)
-            tasks.append(task)
+        async with AsyncSessionLocal() as session:
+            reclaimed = await session.execute(reclaim)
+            if reclaimed.rowcount:
+                logger.warning(f"Reclaimed {reclaimed.rowcount} webhooks stuck in sending")
+            result = await session.execute(stmt)
+            claimed = [dict(row._mapping) for row in result]
+            await session.commit()
+
+        # RETURNING does not preserve the subquery's order
+        if queue.priority_enabled:
+            claimed.sort(key=lambda webhook: (-webhook["priority"], webhook["created_at"]))
+        else:
+            claimed.sort(key=lambda webhook: webhook["created_at"])
 
-        # Process all webhooks concurrently
-        await asyncio.gather(*tasks, return_exceptions=True)
+        return claimed
 
-    async def _process_single_webhook(self, webhook: WebhookQueueItem):
+    async def _deliver(self, webhook: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Process a single webhook from the queue.
+        Send a single claimed webhook.
 
         Args:
-            webhook: Webhook queue item to process
-        """
-        try:
-            # Update status to sending
-            webhook.status = WebhookStatus.SENDING.value
-            self.db.commit()
+            webhook: Claimed webhook
 
-            # Log attempt
-            start_time = datetime.utcnow()
+        Returns:
+            Outcome with success flag, error and timing
+        """
+        start_time = time.monotonic()
+        error = None
+        deferred_for = None
 
-            # Send webhook
+        try:
             success = await self.webhook_trigger.send_webhook(
-                webhook_url=webhook.webhook_url,
-                data=webhook.payload,
-                headers=webhook.headers,
+                webhook_url=webhook["webhook_url"],
+                data=webhook["payload"],
+                headers=webhook["headers"],
                 retry_count=0,  # Queue handles retries
-                entity_type=webhook.entity_type,
-                entity_id=webhook.entity_id,
-                priority=webhook.priority
+                entity_type=webhook["entity_type"],
+                entity_id=webhook["entity_id"],
+                priority=webhook["priority"]
             )
+        except N8nWebhookCircuitOpenError as e:
+            # Destination is down; wait for its circuit without using a retry
+            success = False
+            error = str(e)
+            deferred_for = e.retry_after
+        except Exception as e:
+            logger.error(f"Error processing webhook {webhook['id']}: {str(e)}", exc_info=True)
+            success = False
+            error = str(e)
 
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        return {
+            "webhook": webhook,
+            "success": success,
+            "error": error,
+            "deferred_for": deferred_for,
+            "duration_ms": int((time.monotonic() - start_time) * 1000),
+            "attempted_at": datetime.utcnow()
+        }
 
-            # Record retry attempt
-            retry_history = WebhookRetryHistory(
-                webhook_queue_id=webhook.id,
-                attempt_number=webhook.retry_count + 1,
-                status="sent" if success else "failed",
-                response_time_ms=duration_ms,
-                attempted_at=datetime.utcnow()
-            )
-            self.db.add(retry_history)
+    async def _record_outcomes(self, outcomes: List[Dict[str, Any]]):
+        """
+        Write queue status, retry history and logs for a batch in one transaction.
 
-            if success:
-                # Mark as sent
-                webhook.status = WebhookStatus.SENT.value
-                webhook.sent_at = datetime.utcnow()
-                logger.info(f"Webhook sent successfully: id={webhook.id}, event_type={webhook.event_type}")
+        Args:
+            outcomes: Results of _deliver
+        """
+        retry_delays = self.config.retry.retry_delays
+        updates = []
+        history = []
+        logs = []
+        sent = 0
+        deferred = 0
+
+        for outcome in outcomes:
+            webhook = outcome["webhook"]
+            attempted_at = outcome["attempted_at"]
+            error = outcome["error"]
+
+            values = {
+                "id": webhook["id"],
+                "status": WebhookStatus.FAILED.value,
+                "retry_count": webhook["retry_count"],
+                "next_retry_at": None,
+                "sent_at": None,
+                "failed_at": None,
+                "last_error": None,
+                "error_details": None,
+                "response_time_ms": outcome["duration_ms"],
+                "updated_at": attempted_at
+            }
 
+            if outcome["success"]:
+                sent += 1
+                values["status"] = WebhookStatus.SENT.value
+                values["sent_at"] = attempted_at
+            elif outcome["deferred_for"] is not None:
+                deferred += 1
+                values["last_error"] = error
+                values["next_retry_at"] = attempted_at + timedelta(seconds=max(1, outcome["deferred_for"]))
             else:
-                # Update retry count
-                webhook.retry_count += 1
-
-                # Check if should retry
-                if webhook.retry_count < webhook.max_retries:
-                    # Calculate next retry time
-                    webhook.next_retry_at = webhook.calculate_next_retry(
-                        self.config.retry.retry_delays
-                    )
-                    webhook.status = WebhookStatus.FAILED.value
+                retry_count = webhook["retry_count"] + 1
+                values["retry_count"] = retry_count
+                if error:
+                    values["last_error"] = error[:1000]
+                    values["error_details"] = {"error": error, "timestamp": attempted_at.isoformat()}
+
+                if retry_count < webhook["max_retries"]:
+                    delay_seconds = retry_delays[min(retry_count, len(retry_delays) - 1)]
+                    values["next_retry_at"] = attempted_at + timedelta(seconds=delay_seconds)
                     logger.warning(
-                        f"Webhook failed, will retry: id={webhook.id}, "
-                        f"attempt={webhook.retry_count}/{webhook.max_retries}, "
-                        f"next_retry={webhook.next_retry_at}"
+                        f"Webhook failed, will retry: id={webhook['id']}, "
+                        f"attempt={retry_count}/{webhook['max_retries']}, "
+                        f"next_retry={values['next_retry_at']}"
                     )
                 else:
-                    # Max retries reached
-                    webhook.status = WebhookStatus.FAILED.value
-                    webhook.failed_at = datetime.utcnow()
-                    webhook.last_error = "Maximum retry attempts reached"
+                    values["failed_at"] = attempted_at
+                    values["last_error"] = values["last_error"] or "Maximum retry attempts reached"
                     logger.error(
-                        f"Webhook failed permanently after {webhook.max_retries} attempts: "
-                        f"id={webhook.id}, event_type={webhook.event_type}"
+                        f"Webhook failed permanently after {webhook['max_retries']} attempts: "
+                        f"id={webhook['id']}, event_type={webhook['event_type']}"
                     )
 
-            self.db.commit()
-
-            # Create webhook log
-            await self._log_webhook(webhook, success, duration_ms)
-
-        except Exception as e:
-            logger.error(f"Error processing webhook {webhook.id}: {str(e)}", exc_info=True)
-
-            # Update webhook with error
-            webhook.retry_count += 1
-            webhook.last_error = str(e)
-            webhook.error_details = {
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-
-            if webhook.retry_count < webhook.max_retries:
-                webhook.next_retry_at = webhook.calculate_next_retry(
-                    self.config.retry.retry_delays
-                )
-                webhook.status = WebhookStatus.FAILED.value
-            else:
-                webhook.status = WebhookStatus.FAILED.value
-                webhook.failed_at = datetime.utcnow()
-
-            self.db.commit()
-
-    async def _log_webhook(
-        self,
-        webhook: WebhookQueueItem,
-        success: bool,
-        duration_ms: int
-    ):
-        """
-        Log webhook attempt.
-
-        Args:
-            webhook: Webhook queue item
-            success: Whether webhook was successful
-            duration_ms: Duration in milliseconds
-        """
-        try:
-            log_entry = WebhookLog(
-                direction="outgoing",
-                event_type=webhook.event_type,
-                webhook_url=webhook.webhook_url,
-                method="POST",
-                headers=webhook.headers,
-                payload=webhook.payload,
-                response_status=200 if success else 500,
-                duration_ms=duration_ms,
-                error_message=webhook.last_error if not success else None,
-                entity_type=webhook.entity_type,
-                entity_id=webhook.entity_id,
-                webhook_queue_id=webhook.id,
-                signature=webhook.signature,
-                metadata=webhook.metadata,
-                created_at=datetime.utcnow()
-            )
-
-            self.db.add(log_entry)
-            self.db.commit()
+            updates.append(values)
+
+            if outcome["deferred_for"] is not None:
+                # Not attempted, so no retry history or delivery log
+                continue
+
+            history.append({
+                "webhook_queue_id": webhook["id"],
+                "attempt_number": webhook["retry_count"] + 1,
+                "status": "sent" if outcome["success"] else "failed",
+                "error_message": values["last_error"],
+                "response_time_ms": outcome["duration_ms"],
+                "attempted_at": attempted_at
+            })
+
+            logs.append({
+                "direction": "outgoing",
+                "event_type": webhook["event_type"],
+                "webhook_url": webhook["webhook_url"],
+                "method": "POST",
+                "headers": webhook["headers"],
+                "payload": webhook["payload"],
+                "response_status": 200 if outcome["success"] else 500,
+                "duration_ms": outcome["duration_ms"],
+                "error_message": values["last_error"],
+                "entity_type": webhook["entity_type"],
+                "entity_id": webhook["entity_id"],
+                "webhook_queue_id": webhook["id"],
+                "signature": webhook["signature"],
+                "log_metadata": webhook["queue_metadata"],
+                "created_at": attempted_at
+            })
+
+        async with AsyncSessionLocal() as session:
+            try:
+                # Bulk UPDATE by primary key and executemany INSERTs
+                await session.execute(update(WebhookQueueItem), updates)
+                if history:
+                    await session.execute(insert(WebhookRetryHistory), history)
+                    await session.execute(insert(WebhookLog), logs)
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                # Rows stay in SENDING and are reclaimed after claim_timeout
+                logger.error(f"Error recording webhook outcomes: {str(e)}", exc_info=True)
+                raise
 
-        except Exception as e:
-            logger.error(f"Error logging webhook: {str(e)}", exc_info=True)
+        logger.info(
+            f"Webhook batch done: sent={sent}, deferred={deferred}, "
+            f"failed={len(outcomes) - sent - deferred}"
+        )
 
     async def retry_failed(self, webhook_id: int) -> bool:
         """
@@ -498,6 +680,7 @@ class WebhookQueue:
     async def stop_processing(self):
         """Stop background queue processing."""
         self._processing = False
+        self._wakeup.set()
         if self._process_task and not self._process_task.done():
             await self._process_task
             logger.info("Webhook queue processing stopped")
@@ -506,3 +689,62 @@ class WebhookQueue:
         """Clean up resources."""
         await self.stop_processing()
         await self.webhook_trigger.close()
+
+
+async def schedule_webhook_retry(
+    webhook_url: str,
+    payload: Dict[str, Any],
+    event_type: str,
+    delay_seconds: float,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    priority: int = 0,
+    headers: Optional[Dict[str, str]] = None,
+    retries: Optional[int] = None,
+    last_error: Optional[str] = None
+) -> int:
+    """
+    Queue a webhook whose first delivery attempt already failed.
+
+    Used by N8nWebhookTrigger so failed deliveries are retried by the queue
+    processor rather than slept on by the caller.
+
+    Args:
+        webhook_url: URL to send webhook to
+        payload: Webhook payload
+        event_type: Type of event
+        delay_seconds: Seconds until the next attempt
+        entity_type: Entity type
+        entity_id: Entity ID
+        priority: Priority level
+        headers: Custom headers (signature headers are recomputed on send)
+        retries: Retries remaining after the failed attempt
+        last_error: Error of the failed attempt
+
+    Returns:
+        Webhook queue item ID
+    """
+    if retries is None:
+        retries = webhook_config.retry.max_retries
+
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as session:
+        queue_item = WebhookQueueItem(
+            webhook_url=webhook_url,
+            payload=payload,
+            headers=headers,
+            event_type=event_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            status=WebhookStatus.FAILED.value,
+            priority=priority,
+            # The failed attempt counts as the first of retries + 1
+            retry_count=1,
+            max_retries=retries + 1,
+            next_retry_at=now + timedelta(seconds=delay_seconds),
+            last_error=last_error[:1000] if last_error else None,
+            created_at=now
+        )
+        session.add(queue_item)
+        await session.commit()
+        return queue_item.id
@@ -25,6 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.services.openrouter_client import get_openrouter_client
+from app.services.site_cache import SiteCache, site_cache as default_site_cache
 from app.models.website_analysis import WebsiteAnalysis, AnalysisStatus
 from app.schemas.website_analysis import (
     CategoryScore,
@@ -38,6 +39,9 @@ from app.schemas.website_analysis import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when analysis output changes so cached results are not reused
+ANALYSIS_CACHE_VERSION = "1"
+
 
 class WebsiteAnalyzer:
     """
@@ -50,12 +54,21 @@ class WebsiteAnalyzer:
     4. Run AI analysis via OpenRouter
     5. Generate structured improvement plan
     6. Calculate overall score
+
+    Steps 1-5 are skipped when the site cache shows the page is unchanged
+    since a previous analysis with the same depth and model.
     """
 
-    def __init__(self):
-        """Initialize the analyzer."""
+    def __init__(self, site_cache: Optional[SiteCache] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            site_cache: Fetch/analysis cache (defaults to the global one)
+        """
         self.openrouter_client = get_openrouter_client()
         self.browser: Optional[Browser] = None
+        self.site_cache = site_cache or default_site_cache
 
     async def analyze_website(
         self,
@@ -65,6 +78,7 @@ class WebsiteAnalyzer:
         include_screenshot: bool = True,
         ai_model: Optional[str] = None,
         store_html: bool = False,
+        use_cache: bool = True,
     ) -> WebsiteAnalysis:
         """
         Analyze a website and generate improvement recommendations.
@@ -76,6 +90,7 @@ class WebsiteAnalyzer:
             include_screenshot: Whether to capture screenshot
             ai_model: Specific AI model to use (defaults to GPT-4)
             store_html: Whether to store full HTML content
+            use_cache: Reuse the previous analysis if the page is unchanged
 
         Returns:
             WebsiteAnalysis object with complete analysis
@@ -97,30 +112,82 @@ class WebsiteAnalyzer:
         try:
             logger.info(f"Starting {depth} analysis for {url}")
 
-            # Step 1: Fetch HTML and metrics
-            html_content, page_metrics = await self._fetch_html_with_metrics(url)
-
-            # Step 2: Capture screenshot
-            screenshot_path = None
-            if include_screenshot:
-                screenshot_path = await self._capture_screenshot(url, analysis.id)
-
-            # Step 3: Parse HTML for technical analysis
-            soup = BeautifulSoup(html_content, 'html.parser')
-            technical_metrics = self._extract_technical_metrics(soup, page_metrics)
-            seo_metrics = await self._extract_seo_metrics(url, soup)
-
-            # Step 4: AI Analysis
-            logger.info(f"Running AI analysis for {url}")
-            ai_analysis = await self._run_ai_analysis(
-                url=url,
-                html_content=html_content[:50000],  # Limit to avoid token limits
-                soup=soup,
-                technical_metrics=technical_metrics,
-                seo_metrics=seo_metrics,
-                depth=depth,
-                model=ai_model,
-            )
+            # Revalidate the cached copy (one conditional GET)
+            page = None
+            cached = None
+            if use_cache and self.site_cache:
+                page = await self.site_cache.revalidate(url)
+                if page is not None:
+                    cached = await self.site_cache.get_derived(
+                        page.content_hash,
+                        "website_analysis",
+                        ANALYSIS_CACHE_VERSION,
+                        depth=depth,
+                        model=ai_model or settings.AI_MODEL_DEFAULT,
+                    )
+
+            if cached is not None:
+                logger.info(f"Page unchanged, reusing cached analysis for {url}")
+                html_content = await self.site_cache.get_html(page.content_hash) or ""
+                technical_metrics = cached['technical_metrics']
+                seo_metrics = cached['seo_metrics']
+                ai_analysis = cached['ai_analysis']
+                title = cached['title']
+
+                screenshot_path = None
+                if include_screenshot:
+                    screenshot_path = self._copy_screenshot(cached.get('screenshot_path'), analysis.id)
+                    if not screenshot_path:
+                        screenshot_path = await self._capture_screenshot(url, analysis.id)
+            else:
+                # Step 1: Fetch HTML and metrics
+                html_content, page_metrics = await self._fetch_html_with_metrics(url)
+
+                # Step 2: Capture screenshot
+                screenshot_path = None
+                if include_screenshot:
+                    screenshot_path = await self._capture_screenshot(url, analysis.id)
+
+                # Step 3: Parse HTML for technical analysis
+                soup = BeautifulSoup(html_content, 'html.parser')
+                technical_metrics = self._extract_technical_metrics(soup, page_metrics)
+                seo_metrics = await self._extract_seo_metrics(url, soup)
+
+                # Step 4: AI Analysis
+                logger.info(f"Running AI analysis for {url}")
+                ai_analysis = await self._run_ai_analysis(
+                    url=url,
+                    html_content=html_content[:50000],  # Limit to avoid token limits
+                    soup=soup,
+                    technical_metrics=technical_metrics,
+                    seo_metrics=seo_metrics,
+                    depth=depth,
+                    model=ai_model,
+                )
+
+                title_tag = soup.find('title')
+                title = title_tag.get_text() if title_tag else None
+
+                # Never cache the fallback analysis; the next run should retry the AI
+                is_fallback = any(
+                    str(imp.get('id', '')).startswith('fallback-')
+                    for imp in ai_analysis.get('improvements', [])
+                )
+                if page is not None and not is_fallback:
+                    await self.site_cache.put_derived(
+                        page.content_hash,
+                        "website_analysis",
+                        ANALYSIS_CACHE_VERSION,
+                        {
+                            'title': title,
+                            'technical_metrics': technical_metrics,
+                            'seo_metrics': seo_metrics,
+                            'ai_analysis': ai_analysis,
+                            'screenshot_path': screenshot_path,
+                        },
+                        depth=depth,
+                        model=ai_model or settings.AI_MODEL_DEFAULT,
+                    )
 
             # Step 5: Update analysis record
             analysis.status = AnalysisStatus.COMPLETED
@@ -128,8 +195,7 @@ class WebsiteAnalyzer:
             analysis.processing_time_seconds = time.time() - start_time
 
             # Store title
-            title_tag = soup.find('title')
-            analysis.title = title_tag.get_text() if title_tag else None
+            analysis.title = title
 
             # Store scores
             analysis.overall_score = ai_analysis['overall_score']
@@ -176,8 +242,8 @@ class WebsiteAnalyzer:
             if store_html:
                 analysis.html_content = html_content[:100000]  # Limit size
 
-            # Store AI cost estimate
-            analysis.ai_cost = self._estimate_cost(html_content, ai_model)
+            # Store AI cost estimate (nothing was spent on a cache hit)
+            analysis.ai_cost = 0.0 if cached is not None else self._estimate_cost(html_content, ai_model)
 
             await db.commit()
             await db.refresh(analysis)
@@ -277,6 +343,30 @@ class WebsiteAnalyzer:
             finally:
                 await browser.close()
 
+    def _copy_screenshot(self, source_path: Optional[str], analysis_id: int) -> Optional[str]:
+        """
+        Copy an earlier analysis' screenshot for a new analysis.
+
+        Each analysis owns its file (it is deleted with the analysis), so the
+        cached screenshot is copied rather than shared.
+
+        Returns:
+            Path of the copy, or None if the source no longer exists
+        """
+        import shutil
+        from pathlib import Path
+
+        if not source_path or not Path(source_path).exists():
+            return None
+
+        screenshot_path = Path(source_path).parent / f"analysis_{analysis_id}.png"
+        try:
+            shutil.copyfile(source_path, screenshot_path)
+        except OSError as e:
+            logger.warning(f"Failed to copy cached screenshot: {str(e)}")
+            return None
+        return str(screenshot_path)
+
     def _extract_technical_metrics(
         self, soup: BeautifulSoup, page_metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -45,6 +45,7 @@ from app.tasks.ai_tasks import (
     analyze_lead,
     process_conversation,
     batch_analyze_leads,
+    aggregate_lead_analysis,
     generate_email_content,
 )
 
@@ -81,6 +82,7 @@ __all__ = [
     "analyze_lead",
     "process_conversation",
     "batch_analyze_leads",
+    "aggregate_lead_analysis",
     "generate_email_content",
     # Demo tasks
     "generate_demo_site",
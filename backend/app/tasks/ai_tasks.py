@@ -12,7 +12,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from celery import shared_task, group
+from celery import shared_task, chord
 from celery.exceptions import SoftTimeLimitExceeded
 import os
 
@@ -91,6 +91,8 @@ def analyze_lead(
     self,
     lead_id: int,
     analysis_type: str = "full",
+    batch_id: Optional[str] = None,
+    batch_total: int = 0,
 ) -> Dict[str, Any]:
     """
     Analyze a lead using AI to determine quality, fit, and next actions.
@@ -98,6 +100,10 @@ def analyze_lead(
     Args:
         lead_id: Lead ID to analyze
         analysis_type: Type of analysis ("quick", "full", "deep")
+        batch_id: Set when run as part of batch_analyze_leads; progress is
+            published per lead and a final failure is returned as a result
+            instead of raised, so one bad lead does not fail the chord
+        batch_total: Number of leads in the batch
 
     Returns:
         dict: Lead analysis results
@@ -142,6 +148,9 @@ def analyze_lead(
 
         logger.info(f"Lead {lead_id} analyzed successfully")
 
+        if batch_id:
+            _report_batch_item(batch_id, batch_total, lead_id, "success")
+
         return {
             "status": "success",
             "lead_id": lead_id,
@@ -151,6 +160,16 @@ def analyze_lead(
 
     except Exception as e:
         logger.error(f"Failed to analyze lead {lead_id}: {str(e)}")
+
+        if batch_id and self.request.retries >= self.max_retries:
+            _report_batch_item(batch_id, batch_total, lead_id, "failed")
+            return {
+                "status": "failed",
+                "lead_id": lead_id,
+                "analysis_type": analysis_type,
+                "error": str(e),
+            }
+
         raise self.retry(exc=e)
 
     finally:
@@ -215,6 +234,22 @@ def process_conversation(
         db.close()
 
 
+def _report_batch_item(batch_id: str, total: int, lead_id: int, item_status: str):
+    """Publish per-lead batch progress; never fails the analysis itself."""
+    from app.core.websocket_publisher import ws_publisher
+
+    try:
+        ws_publisher.batch_progress(
+            batch_id,
+            "lead_analysis",
+            total,
+            item_id=lead_id,
+            item_status=item_status,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish batch progress for {batch_id}: {e}")
+
+
 @shared_task(
     bind=True,
     name="app.tasks.ai_tasks.batch_analyze_leads",
@@ -228,49 +263,122 @@ def batch_analyze_leads(
     """
     Analyze multiple leads in batch.
 
+    Fans out one analyze_lead task per lead as a chord and returns
+    immediately; aggregate_lead_analysis collects the results. The worker
+    slot is never held while subtasks run, so large batches cannot starve
+    or deadlock the AI pool. Progress is published on the "ai" websocket
+    channel under room "batch:<batch_id>".
+
     Args:
         lead_ids: List of lead IDs to analyze
         analysis_type: Type of analysis
 
     Returns:
-        dict: Batch analysis results
+        dict: Dispatch info with batch_id and the aggregation task ID
     """
-    logger.info(f"Starting batch lead analysis: {len(lead_ids)} leads")
+    batch_id = self.request.id or f"batch_{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+    logger.info(f"Starting batch lead analysis {batch_id}: {len(lead_ids)} leads")
+
+    if not lead_ids:
+        return {
+            "status": "success",
+            "batch_id": batch_id,
+            "total": 0,
+            "successful": 0,
+            "failed": 0,
+            "results": [],
+        }
 
     try:
-        # Create parallel tasks for each lead
-        tasks = [
-            analyze_lead.s(lead_id=lead_id, analysis_type=analysis_type)
+        header = [
+            analyze_lead.s(
+                lead_id=lead_id,
+                analysis_type=analysis_type,
+                batch_id=batch_id,
+                batch_total=len(lead_ids),
+            )
             for lead_id in lead_ids
         ]
+        callback = aggregate_lead_analysis.s(
+            batch_id=batch_id,
+            analysis_type=analysis_type,
+        ).on_error(batch_analysis_failed.s(batch_id=batch_id))
 
-        # Execute in parallel
-        job = group(tasks)
-        results = job.apply_async()
-        task_results = results.get()
-
-        # Aggregate results
-        successful = sum(1 for r in task_results if r.get("status") == "success")
-        failed = len(task_results) - successful
-
-        logger.info(f"Batch analysis complete: {successful} successful, {failed} failed")
+        result = chord(header)(callback)
 
         return {
-            "status": "success",
+            "status": "dispatched",
+            "batch_id": batch_id,
             "total": len(lead_ids),
-            "successful": successful,
-            "failed": failed,
-            "results": task_results,
+            "aggregate_task_id": result.id,
         }
 
     except Exception as e:
         logger.error(f"Batch lead analysis failed: {str(e)}")
         return {
             "status": "failed",
+            "batch_id": batch_id,
             "error": str(e),
         }
 
 
+@shared_task(
+    bind=True,
+    name="app.tasks.ai_tasks.aggregate_lead_analysis",
+)
+def aggregate_lead_analysis(
+    self,
+    task_results: List[Dict[str, Any]],
+    batch_id: str,
+    analysis_type: str = "quick",
+) -> Dict[str, Any]:
+    """
+    Chord callback for batch_analyze_leads.
+
+    Args:
+        task_results: Results of the analyze_lead tasks
+        batch_id: Batch ID
+        analysis_type: Type of analysis
+
+    Returns:
+        dict: Batch analysis results
+    """
+    from app.core.websocket_publisher import ws_publisher
+
+    successful = sum(1 for r in task_results if r and r.get("status") == "success")
+    failed = len(task_results) - successful
+
+    logger.info(f"Batch analysis {batch_id} complete: {successful} successful, {failed} failed")
+    ws_publisher.batch_completed(batch_id, "lead_analysis", len(task_results), successful, failed)
+
+    return {
+        "status": "success" if failed == 0 else "partial",
+        "batch_id": batch_id,
+        "analysis_type": analysis_type,
+        "total": len(task_results),
+        "successful": successful,
+        "failed": failed,
+        "failed_lead_ids": [
+            r.get("lead_id") for r in task_results
+            if r and r.get("status") != "success"
+        ],
+        "results": task_results,
+    }
+
+
+@shared_task(name="app.tasks.ai_tasks.batch_analysis_failed")
+def batch_analysis_failed(request, exc, traceback, batch_id: str) -> None:
+    """Errback for a batch whose chord could not complete."""
+    from app.core.websocket_publisher import ws_publisher
+
+    logger.error(f"Batch analysis {batch_id} failed: {exc}")
+    ws_publisher.system_notification(
+        level="error",
+        title="Batch lead analysis failed",
+        message=f"Batch {batch_id} could not complete: {exc}",
+    )
+
+
 @shared_task(
     bind=True,
     name="app.tasks.ai_tasks.generate_email_content",
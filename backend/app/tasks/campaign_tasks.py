@@ -362,15 +362,16 @@ def update_campaign_metrics(self) -> Dict[str, Any]:
     """
     Update metrics for all running campaigns.
 
-    This task runs periodically to recalculate campaign metrics
-    like open rates, click rates, etc.
+    Refreshes the denormalized counters on each running campaign from the
+    hourly stats rollups with one grouped query, instead of loading every
+    recipient. Rates are derived from the counters by the model.
 
     Returns:
         dict: Update results
     """
     from app.core.database import SessionLocal
-    from app.models.campaigns import Campaign, CampaignRecipient, CampaignStatusEnum
-    from sqlalchemy import func
+    from app.models.campaigns import Campaign, CampaignStatusEnum
+    from app.services import campaign_stats
 
     logger.info("Updating campaign metrics")
 
@@ -391,38 +392,20 @@ def update_campaign_metrics(self) -> Dict[str, Any]:
                 "message": "No running campaigns"
             }
 
+        totals = campaign_stats.get_totals_many_sync(db, [c.id for c in campaigns])
+
         updated = 0
         for campaign in campaigns:
-            try:
-                # Get recipient counts
-                recipients = db.query(CampaignRecipient).filter(
-                    CampaignRecipient.campaign_id == campaign.id
-                ).all()
-
-                sent = sum(1 for r in recipients if r.sent_at is not None)
-                opened = sum(1 for r in recipients if r.opened_at is not None)
-                clicked = sum(1 for r in recipients if r.clicked_at is not None)
-                replied = sum(1 for r in recipients if r.replied_at is not None)
-                bounced = sum(1 for r in recipients if r.bounced_at is not None)
-
-                # Update campaign metrics
-                campaign.emails_sent = sent
-                campaign.emails_opened = opened
-                campaign.emails_clicked = clicked
-                campaign.emails_replied = replied
-                campaign.emails_bounced = bounced
-
-                # Calculate rates
-                if sent > 0:
-                    campaign.open_rate = (opened / sent) * 100
-                    campaign.click_rate = (clicked / sent) * 100
-                    campaign.reply_rate = (replied / sent) * 100
-                    campaign.bounce_rate = (bounced / sent) * 100
-
-                updated += 1
+            counters = totals.get(campaign.id)
+            if not counters:
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to update metrics for campaign {campaign.id}: {str(e)}")
+            campaign.emails_sent = counters["sent"]
+            campaign.emails_opened = counters["unique_opens"]
+            campaign.emails_clicked = counters["unique_clicks"]
+            campaign.emails_replied = counters["replies"]
+            campaign.emails_bounced = counters["bounced"]
+            updated += 1
 
         db.commit()
 
@@ -13,7 +13,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import os
 
-from celery import shared_task, chain, group
+from celery import shared_task, chord
 from celery.exceptions import SoftTimeLimitExceeded
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,7 @@ def generate_demo_site(
     lead_id: int,
     template: str = "default",
     customizations: Optional[Dict[str, Any]] = None,
+    package_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Generate a personalized demo site for a lead.
@@ -43,6 +44,9 @@ def generate_demo_site(
         lead_id: Lead ID to generate demo for
         template: Demo template to use
         customizations: Optional customizations
+        package_id: Set when run as part of create_full_demo_package; a final
+            failure is returned as a result instead of raised so the package
+            can still be assembled from the remaining components
 
     Returns:
         dict: Demo generation result with URL
@@ -86,6 +90,15 @@ def generate_demo_site(
 
     except Exception as e:
         logger.error(f"Failed to generate demo site: {str(e)}")
+
+        if package_id and self.request.retries >= self.max_retries:
+            return {
+                "status": "failed",
+                "component": "site",
+                "lead_id": lead_id,
+                "error": str(e),
+            }
+
         raise self.retry(exc=e)
 
     finally:
@@ -287,7 +300,10 @@ def create_full_demo_package(
     """
     Create a complete demo package with website, video, and materials.
 
-    This chains together multiple tasks to create a full demo.
+    Dispatches the component tasks as a chord and returns immediately;
+    assemble_demo_package builds the package once they finish. Progress
+    is published on the "demos" websocket channel under room
+    "demo:<package_id>".
 
     Args:
         lead_id: Lead ID
@@ -295,16 +311,18 @@ def create_full_demo_package(
         include_pdf: Include PDF materials
 
     Returns:
-        dict: Complete demo package result
+        dict: Dispatch info with package_id and the assembly task ID
     """
-    logger.info(f"Creating full demo package for lead {lead_id}")
+    from app.core.websocket_publisher import ws_publisher
+
+    package_id = self.request.id or f"package_{lead_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+    logger.info(f"Creating full demo package {package_id} for lead {lead_id}")
 
     try:
-        tasks = []
+        components = []
 
         # Generate demo site
-        demo_task = generate_demo_site.s(lead_id=lead_id)
-        tasks.append(demo_task)
+        components.append(generate_demo_site.s(lead_id=lead_id, package_id=package_id))
 
         # Generate video if requested
         if include_video:
@@ -316,25 +334,29 @@ def create_full_demo_package(
         if include_pdf:
             logger.info("PDF generation would be included")
 
-        # Execute tasks in chain (sequential)
-        if tasks:
-            job = chain(tasks)
-            result = job.apply_async()
-            final_result = result.get()
-
-            logger.info(f"Full demo package created for lead {lead_id}")
-
-            return {
-                "status": "success",
-                "lead_id": lead_id,
-                "package": final_result,
-            }
-        else:
+        if not components:
             return {
                 "status": "error",
                 "message": "No tasks to execute",
             }
 
+        ws_publisher.demo_generating(demo_id=package_id, lead_id=lead_id, template="full_package")
+
+        callback = assemble_demo_package.s(
+            lead_id=lead_id,
+            package_id=package_id,
+        ).on_error(demo_package_failed.s(lead_id=lead_id, package_id=package_id))
+
+        result = chord(components)(callback)
+
+        return {
+            "status": "dispatched",
+            "lead_id": lead_id,
+            "package_id": package_id,
+            "components": len(components),
+            "assemble_task_id": result.id,
+        }
+
     except Exception as e:
         logger.error(f"Failed to create demo package: {str(e)}")
         return {
@@ -343,6 +365,74 @@ def create_full_demo_package(
         }
 
 
+@shared_task(
+    bind=True,
+    name="app.tasks.demo_tasks.assemble_demo_package",
+)
+def assemble_demo_package(
+    self,
+    component_results: List[Dict[str, Any]],
+    lead_id: int,
+    package_id: str,
+) -> Dict[str, Any]:
+    """
+    Chord callback for create_full_demo_package.
+
+    Args:
+        component_results: Results of the component tasks
+        lead_id: Lead ID
+        package_id: Package ID
+
+    Returns:
+        dict: Complete demo package result
+    """
+    from app.core.websocket_publisher import ws_publisher
+
+    succeeded = [r for r in component_results if r and r.get("status") == "success"]
+    failed = [r for r in component_results if not r or r.get("status") != "success"]
+
+    site = next((r for r in succeeded if r.get("demo_url")), None)
+    if site is None:
+        error = "; ".join(r.get("error", "unknown error") for r in failed if r) or "No demo site generated"
+        logger.error(f"Demo package {package_id} failed for lead {lead_id}: {error}")
+        ws_publisher.demo_failed(demo_id=package_id, lead_id=lead_id, error=error, step_failed="site")
+        return {
+            "status": "failed",
+            "lead_id": lead_id,
+            "package_id": package_id,
+            "error": error,
+            "components": component_results,
+        }
+
+    ws_publisher.demo_completed(
+        demo_id=package_id,
+        lead_id=lead_id,
+        demo_url=site["demo_url"],
+        duration_seconds=0,
+        video_url=next((r.get("video_url") for r in succeeded if r.get("video_url")), None),
+    )
+
+    logger.info(f"Full demo package {package_id} created for lead {lead_id}")
+
+    return {
+        "status": "success" if not failed else "partial",
+        "lead_id": lead_id,
+        "package_id": package_id,
+        "package": site,
+        "components": component_results,
+        "failed_components": [r.get("component") for r in failed if r],
+    }
+
+
+@shared_task(name="app.tasks.demo_tasks.demo_package_failed")
+def demo_package_failed(request, exc, traceback, lead_id: int, package_id: str) -> None:
+    """Errback for a package whose chord could not complete."""
+    from app.core.websocket_publisher import ws_publisher
+
+    logger.error(f"Demo package {package_id} failed for lead {lead_id}: {exc}")
+    ws_publisher.demo_failed(demo_id=package_id, lead_id=lead_id, error=str(exc), step_failed="assemble")
+
+
 @shared_task(
     bind=True,
     name="app.tasks.demo_tasks.optimize_video",
@@ -300,7 +300,9 @@ def send_campaign_email(
     """
     from app.services.email_service import EmailService
     from app.services.email_template_service import EmailTemplateService
+    from app.services import campaign_stats
     from app.core.database import SessionLocal
+    from app.core.websocket_publisher import batched_ws_publisher
     from app.models.leads import Lead
     from app.models.campaigns import CampaignRecipient, RecipientStatusEnum
 
@@ -324,7 +326,9 @@ def send_campaign_email(
             raise ValueError(f"Recipient {recipient_id} not found")
 
         # Generate tracking token
-        tracking_token = email_service._generate_tracking_token(campaign_id, lead_id)
+        tracking_token = email_service._generate_tracking_token(
+            campaign_id, lead_id, recipient_id=recipient_id
+        )
 
         # Add tracking to HTML body
         if email_service.config.TRACKING_PIXEL_ENABLED:
@@ -344,11 +348,17 @@ def send_campaign_email(
             tracking_token=tracking_token,
         )
 
-        # Update recipient status
+        # Update recipient status and hourly campaign stats
         recipient.status = RecipientStatusEnum.SENT
         recipient.sent_at = datetime.utcnow()
+        rollup = campaign_stats.new_deltas()
+        rollup[(campaign_id, campaign_stats.hour_bucket())]["sent"] += 1
+        campaign_stats.apply_deltas_sync(db, rollup)
         db.commit()
 
+        # Buffered; rolled up per campaign by the batching publisher
+        batched_ws_publisher.campaign_email_sent(campaign_id, recipient_id=recipient_id)
+
         logger.info(f"Campaign email sent successfully to {lead.email}")
 
         return {
@@ -371,6 +381,12 @@ def send_campaign_email(
             if recipient:
                 recipient.status = RecipientStatusEnum.FAILED
                 recipient.retry_count = recipient.retry_count + 1
+                # Only a send that has used up its retries counts as failed;
+                # a later successful retry is counted as sent instead
+                if self.request.retries >= self.max_retries:
+                    rollup = campaign_stats.new_deltas()
+                    rollup[(recipient.campaign_id, campaign_stats.hour_bucket())]["failed"] += 1
+                    campaign_stats.apply_deltas_sync(db, rollup)
                 db.commit()
         except:
             pass
@@ -0,0 +1,89 @@
+"""
+Schedule Tasks
+
+Celery tasks for running scheduled jobs dispatched by the scheduler service.
+The scheduler only decides *when* a schedule fires; the work itself (scrapes,
+exports, cleanups, ...) runs here so it never blocks the scheduler loop.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Coroutine, Dict, Optional
+
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+# One event loop per worker process. Handlers use module-level async resources
+# (the async engine, notification lane sessions, the LLM gateway client) that
+# bind to the loop they were first used on, so every task must run on the same
+# loop rather than a fresh asyncio.run() loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_pid: Optional[int] = None
+
+
+def _run_on_worker_loop(coro: Coroutine) -> Any:
+    """Run a coroutine on this process's persistent event loop."""
+    global _worker_loop, _worker_loop_pid
+    # A forked child must not reuse its parent's loop
+    if _worker_loop is None or _worker_loop.is_closed() or _worker_loop_pid != os.getpid():
+        _worker_loop = asyncio.new_event_loop()
+        _worker_loop_pid = os.getpid()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.schedule_tasks.execute_schedule",
+    max_retries=0,
+)
+def execute_schedule(self, schedule_id: int) -> Dict[str, Any]:
+    """
+    Execute a schedule once.
+
+    Time limits are set per call by the scheduler from the schedule's
+    timeout_minutes. Failures are recorded on the ScheduleExecution row by
+    TaskExecutor, so the task itself is not retried.
+
+    Args:
+        schedule_id: Schedule to execute
+
+    Returns:
+        dict: Execution status and IDs
+    """
+    from app.core.database import SessionLocal
+    from app.models.schedules import Schedule
+    from app.services.scheduler import TaskExecutor
+
+    logger.info(f"Executing schedule {schedule_id} (task {self.request.id})")
+
+    db = SessionLocal()
+    try:
+        schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+        if not schedule:
+            logger.warning(f"Schedule {schedule_id} no longer exists, skipping")
+            return {"status": "skipped", "schedule_id": schedule_id}
+
+        execution = _run_on_worker_loop(
+            asyncio.wait_for(
+                TaskExecutor(db).execute_schedule(schedule),
+                timeout=schedule.timeout_minutes * 60
+            )
+        )
+
+        return {
+            "status": str(execution.status),
+            "schedule_id": schedule_id,
+            "execution_id": execution.id,
+            "duration_seconds": execution.duration_seconds,
+        }
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Schedule {schedule_id} exceeded its time limit")
+        raise
+
+    finally:
+        db.close()
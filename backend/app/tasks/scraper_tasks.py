@@ -48,6 +48,7 @@ def scrape_craigslist(
     """
     from app.scrapers.craigslist_scraper import CraigslistScraper
     from app.core.database import SessionLocal
+    from app.core.websocket_publisher import batched_ws_publisher
     from app.models.leads import Lead
 
     logger.info(f"Starting Craigslist scrape: location={location}, category={category}")
@@ -68,7 +69,7 @@ def scrape_craigslist(
         leads_created = 0
         leads_updated = 0
 
-        for result in results:
+        for index, result in enumerate(results, start=1):
             try:
                 # Check if lead already exists
                 existing_lead = db.query(Lead).filter(
@@ -99,6 +100,15 @@ def scrape_craigslist(
             except Exception as e:
                 logger.error(f"Failed to save lead: {str(e)}")
 
+            # Buffered; only the latest progress per window reaches Redis
+            batched_ws_publisher.scraper_progress(
+                scraper_id=self.request.id,
+                source="craigslist",
+                current=index,
+                total=len(results),
+                leads_found=leads_created + leads_updated,
+            )
+
         db.commit()
 
         logger.info(
@@ -39,6 +39,7 @@ celery_app = Celery(
         "app.tasks.scraper_tasks",
         "app.tasks.ai_tasks",
         "app.tasks.demo_tasks",
+        "app.tasks.schedule_tasks",
     ]
 )
 
@@ -93,6 +94,9 @@ celery_app.conf.update(
         # Demo tasks - low priority, long-running
         "app.tasks.demo_tasks.*": {"queue": "demo"},
 
+        # Scheduled jobs dispatched by the scheduler service
+        "app.tasks.schedule_tasks.*": {"queue": "default"},
+
         # Default queue for everything else
     },
 
@@ -0,0 +1,49 @@
+"""Create hourly campaign stats rollup table
+
+Revision ID: 025_create_campaign_stats_hourly
+Revises: 024_create_campaign_metrics_tables
+Create Date: 2026-10-18
+
+Creates:
+- campaign_stats_hourly: Per-campaign, per-hour counters maintained from
+  the send path and the tracking event stream
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '025_create_campaign_stats_hourly'
+down_revision = '024_create_campaign_metrics_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create campaign_stats_hourly table"""
+    op.create_table(
+        'campaign_stats_hourly',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('campaign_id', sa.Integer(), sa.ForeignKey('campaigns.id', ondelete='CASCADE'), nullable=False, index=True),
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+
+        # Send counters
+        sa.Column('sent', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('bounced', sa.Integer(), nullable=False, server_default='0'),
+
+        # Engagement counters
+        sa.Column('opens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unique_opens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('clicks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unique_clicks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('replies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unsubscribes', sa.Integer(), nullable=False, server_default='0'),
+
+        sa.UniqueConstraint('campaign_id', 'bucket', name='uq_campaign_stats_hourly_campaign_bucket'),
+    )
+
+
+def downgrade():
+    """Drop campaign_stats_hourly table"""
+    op.drop_table('campaign_stats_hourly')
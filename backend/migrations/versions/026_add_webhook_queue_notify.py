@@ -0,0 +1,51 @@
+"""Notify webhook queue workers on new work
+
+Revision ID: 026_add_webhook_queue_notify
+Revises: 025_create_campaign_stats_hourly
+Create Date: 2026-10-18
+
+Creates:
+- notify_webhook_queue(): trigger function sending NOTIFY webhook_queue
+- webhook_queue_notify: fires when a row is inserted or set back to pending
+- idx_webhook_queue_claim: partial index for the processor's claim query
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '026_add_webhook_queue_notify'
+down_revision = '025_create_campaign_stats_hourly'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create notify trigger and claim index on webhook_queue"""
+    # Empty payload: identical notifications within one transaction are
+    # collapsed by Postgres, so a bulk insert wakes workers only once
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_webhook_queue() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('webhook_queue', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER webhook_queue_notify
+        AFTER INSERT OR UPDATE OF status ON webhook_queue
+        FOR EACH ROW WHEN (NEW.status = 'pending')
+        EXECUTE FUNCTION notify_webhook_queue()
+    """)
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_webhook_queue_claim '
+        'ON webhook_queue (priority DESC, created_at) '
+        "WHERE status IN ('pending', 'failed', 'sending')"
+    )
+
+
+def downgrade():
+    """Drop notify trigger and claim index"""
+    op.execute('DROP INDEX IF EXISTS idx_webhook_queue_claim')
+    op.execute('DROP TRIGGER IF EXISTS webhook_queue_notify ON webhook_queue')
+    op.execute('DROP FUNCTION IF EXISTS notify_webhook_queue()')
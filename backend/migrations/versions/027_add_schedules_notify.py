@@ -0,0 +1,46 @@
+"""Notify the scheduler when schedules change
+
+Revision ID: 027_add_schedules_notify
+Revises: 026_add_webhook_queue_notify
+Create Date: 2026-10-18
+
+Creates:
+- notify_schedules(): trigger function sending NOTIFY schedules with the row id
+- schedules_notify: fires on insert, delete, and changes to is_active/next_run_at
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '027_add_schedules_notify'
+down_revision = '026_add_webhook_queue_notify'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create notify trigger on schedules"""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_schedules() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('schedules', OLD.id::text);
+            ELSE
+                PERFORM pg_notify('schedules', NEW.id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER schedules_notify
+        AFTER INSERT OR DELETE OR UPDATE OF is_active, next_run_at ON schedules
+        FOR EACH ROW
+        EXECUTE FUNCTION notify_schedules()
+    """)
+
+
+def downgrade():
+    """Drop notify trigger"""
+    op.execute('DROP TRIGGER IF EXISTS schedules_notify ON schedules')
+    op.execute('DROP FUNCTION IF EXISTS notify_schedules()')
@@ -0,0 +1,37 @@
+"""
+Backfill hourly campaign statistics.
+
+Rebuilds the campaign_stats_hourly rollups from campaign recipients and
+email tracking events. Run once after deploying the rollup table, or for a
+single campaign whose counters drifted.
+
+Run with: python -m scripts.backfill_campaign_stats [--campaign-id ID]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services import campaign_stats
+
+
+async def backfill(campaign_id: int = None):
+    """Rebuild rollups for one campaign, or all campaigns."""
+    async with AsyncSessionLocal() as session:
+        rows = await campaign_stats.rebuild(session, campaign_id=campaign_id)
+
+    target = f"campaign {campaign_id}" if campaign_id is not None else "all campaigns"
+    print(f"✓ Rebuilt {rows} hourly stats rows for {target}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild hourly campaign statistics")
+    parser.add_argument("--campaign-id", type=int, default=None, help="Only rebuild this campaign")
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.campaign_id))
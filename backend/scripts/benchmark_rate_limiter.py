@@ -0,0 +1,129 @@
+"""
+Benchmark rate limiter request overhead.
+
+Compares the previous sorted-set limiter (sync redis client, pipeline plus a
+second ZRANGE on rejection, called from the event loop) with the GCRA Lua
+limiter, with and without local token leases. Requests are issued
+concurrently from one event loop, the way FastAPI handlers call the limiter,
+so time spent blocking the loop shows up in the latency of every request.
+
+Requires a reachable Redis (REDIS_URL). Keys are written under
+rate_limit:benchmark:* and expire on their own.
+
+Run with: python -m scripts.benchmark_rate_limiter [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.rate_limiter import RateLimiter
+
+
+class SortedSetRateLimiter:
+    """The previous implementation, kept here as the baseline."""
+
+    def __init__(self, client: redis.Redis):
+        self.redis_client = client
+
+    def check_rate_limit(self, identifier: str, endpoint: str, limit: int, window: int) -> tuple[bool, dict]:
+        key = f"rate_limit:{endpoint}:{identifier}"
+        current_time = int(datetime.utcnow().timestamp())
+        window_start = current_time - window
+
+        pipe = self.redis_client.pipeline()
+        pipe.zremrangebyscore(key, 0, window_start)
+        pipe.zcard(key)
+        pipe.zadd(key, {f"{current_time}:{id(current_time)}": current_time})
+        pipe.expire(key, window + 1)
+        request_count = pipe.execute()[1]
+
+        if request_count >= limit:
+            oldest_request = self.redis_client.zrange(key, 0, 0, withscores=True)
+            retry_after = window - (current_time - int(oldest_request[0][1])) if oldest_request else window
+            return False, {"limit": limit, "remaining": 0, "retry_after": max(1, retry_after)}
+
+        return True, {"limit": limit, "remaining": limit - request_count - 1}
+
+
+async def run(name: str, check, requests: int, concurrency: int, identifiers: int, limit: int, window: int):
+    """Issue `requests` checks from `concurrency` tasks and print latency stats."""
+    endpoint = f"benchmark:{name}:{uuid.uuid4().hex[:8]}"
+    latencies = []
+    allowed = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal allowed
+        for index in counter:
+            started = time.perf_counter()
+            is_allowed, _ = await check(f"client-{index % identifiers}", endpoint, limit, window)
+            latencies.append((time.perf_counter() - started) * 1000)
+            allowed += is_allowed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<22} {requests / elapsed:>10.0f} req/s   "
+        f"mean {statistics.mean(latencies):7.3f} ms   "
+        f"p50 {statistics.median(latencies):7.3f} ms   "
+        f"p99 {p99:7.3f} ms   "
+        f"allowed {allowed}/{requests}"
+    )
+
+
+async def benchmark(requests: int, concurrency: int, identifiers: int, limit: int, window: int, lease: int):
+    """Run every limiter against the same workload."""
+    if not settings.REDIS_URL:
+        print("✗ REDIS_URL is not set")
+        return
+
+    legacy = SortedSetRateLimiter(redis.from_url(settings.REDIS_URL))
+
+    async def legacy_check(*args):
+        # Called inline, exactly as the old middleware did
+        return legacy.check_rate_limit(*args)
+
+    client = aioredis.from_url(settings.REDIS_URL)
+    gcra = RateLimiter(client)
+    leased = RateLimiter(client, local_tokens=lease)
+
+    print(
+        f"{requests} requests, concurrency {concurrency}, {identifiers} identifiers, "
+        f"limit {limit}/{window}s, lease {lease}\n"
+    )
+    await run("sorted-set (sync)", legacy_check, requests, concurrency, identifiers, limit, window)
+    await run("gcra lua (async)", gcra.check_rate_limit, requests, concurrency, identifiers, limit, window)
+    await run(f"gcra + lease {lease}", leased.check_rate_limit, requests, concurrency, identifiers, limit, window)
+    print(f"\nlease stats: {leased.stats}")
+
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter overhead")
+    parser.add_argument("--requests", type=int, default=10000, help="Total checks per limiter")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent callers")
+    parser.add_argument("--identifiers", type=int, default=20, help="Distinct clients")
+    parser.add_argument("--limit", type=int, default=1000, help="Requests allowed per window")
+    parser.add_argument("--window", type=int, default=60, help="Window in seconds")
+    parser.add_argument("--lease", type=int, default=10, help="Tokens leased per Redis trip")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.requests, args.concurrency, args.identifiers, args.limit, args.window, args.lease))
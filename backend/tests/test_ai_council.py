@@ -0,0 +1,268 @@
+"""
+AI Council Test Suite
+
+Tests parallel council completions, hedged requests, validated caching and
+publishing of streamed partials.
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.services.ai_mvp import ai_council as ai_council_module
+from app.core.event_batching import AI_EVENTS_CHANNEL
+from app.services.ai_mvp.ai_council import AICouncil, AICouncilConfig, AICouncilResponse, Message
+from app.services.ai_mvp.response_cache import DiskCacheBackend, ResponseCache
+from app.services.ai_mvp.semantic_router import TaskType
+
+
+class FakeGymTracker:
+    """Records AI-GYM calls instead of writing rows."""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.started = {}
+        self.completed = []
+        self.ended = {}
+
+    async def start_request(self, task_type, model_name, lead_id=None, metadata=None):
+        request_id = next(self.ids)
+        self.started[request_id] = model_name
+        return request_id
+
+    async def complete_request(self, request_id, **kwargs):
+        self.completed.append(request_id)
+
+    def end_request(self, request_id, status, error=None):
+        self.ended[request_id] = status
+
+
+def _council(gym_tracker=None, response_cache=None) -> AICouncil:
+    return AICouncil(
+        AICouncilConfig(openrouter_api_key="test", cache_enabled=False),
+        gym_tracker=gym_tracker,
+        response_cache=response_cache
+    )
+
+
+def _with_delays(council: AICouncil, delays):
+    """Replace council.complete with one answering after a per-model delay."""
+    async def complete(task_type, messages, force_model=None, **kwargs):
+        delay = delays[force_model]
+        await asyncio.sleep(abs(delay))
+        if delay < 0:
+            raise RuntimeError(f"{force_model} failed")
+        return AICouncilResponse(
+            content=f"answer from {force_model}",
+            model_used=force_model,
+            model_tier="cheap",
+            prompt_tokens=10,
+            completion_tokens=5,
+            total_cost=0.0,
+            route_decision=council.router.route_model(task_type, force_model)
+        )
+
+    council.complete = complete
+
+
+MESSAGES = [Message(role="user", content="Write a subject line")]
+
+
+class TestCompleteCouncil:
+    """Test quorum, quality cut-off and timeout handling."""
+
+    def test_first_answer_wins(self):
+        """Test that the default quorum returns the fastest model and cancels the rest."""
+        council = _council()
+        _with_delays(council, {"fast": 0.01, "slow": 5})
+
+        result = asyncio.run(council.complete_council(TaskType.EMAIL_SUBJECT, MESSAGES, ["fast", "slow"]))
+
+        assert result.response.model_used == "fast"
+        assert result.decided_by == "quorum"
+        assert result.cancelled_models == ["slow"]
+
+    def test_quorum_waits_for_enough_answers(self):
+        """Test that quorum=2 collects two answers and skips failed models."""
+        council = _council()
+        _with_delays(council, {"a": 0.01, "broken": -0.01, "b": 0.05, "c": 5})
+
+        result = asyncio.run(council.complete_council(
+            TaskType.EMAIL_SUBJECT, MESSAGES, ["a", "broken", "b", "c"], quorum=2
+        ))
+
+        assert [r.model_used for r in result.responses] == ["a", "b"]
+        assert result.failed_models == ["broken"]
+        assert result.cancelled_models == ["c"]
+        assert result.decided_by == "quorum"
+
+    def test_quality_threshold_picks_good_answer(self):
+        """Test that the first answer over the threshold is selected."""
+        council = _council()
+        _with_delays(council, {"weak": 0.01, "strong": 0.03, "slow": 5})
+        scores = {"weak": 0.2, "strong": 0.9, "slow": 1.0}
+
+        result = asyncio.run(council.complete_council(
+            TaskType.EMAIL_SUBJECT, MESSAGES, ["weak", "strong", "slow"],
+            quality_threshold=0.8, quality_fn=lambda r: scores[r.model_used]
+        ))
+
+        assert result.response.model_used == "strong"
+        assert result.decided_by == "quality_threshold"
+        assert result.cancelled_models == ["slow"]
+
+    def test_timeout_settles_for_answers_so_far(self):
+        """Test that a timeout returns what arrived before it."""
+        council = _council()
+        _with_delays(council, {"fast": 0.01, "slow": 5})
+
+        result = asyncio.run(council.complete_council(
+            TaskType.EMAIL_SUBJECT, MESSAGES, ["fast", "slow"], quorum=2, timeout=0.2
+        ))
+
+        assert result.response.model_used == "fast"
+        assert result.decided_by == "timeout"
+        assert result.cancelled_models == ["slow"]
+
+    def test_timeout_without_answers_raises(self):
+        """Test that a timeout with no answers raises."""
+        council = _council()
+        _with_delays(council, {"slow": 5})
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(council.complete_council(TaskType.EMAIL_SUBJECT, MESSAGES, ["slow"], timeout=0.05))
+
+    def test_quality_threshold_requires_quality_fn(self):
+        """Test that a threshold without a scorer is rejected."""
+        council = _council()
+
+        with pytest.raises(ValueError):
+            asyncio.run(council.complete_council(
+                TaskType.EMAIL_SUBJECT, MESSAGES, ["a", "b"], quality_threshold=0.8
+            ))
+
+
+class FakeGateway:
+    """Streams a fixed answer per model after a per-model delay."""
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    async def chat_completion_stream(self, messages, model, **kwargs):
+        await asyncio.sleep(self.delays[model])
+        for part in ("Hello ", model):
+            yield {"choices": [{"delta": {"content": part}}]}
+        yield {"choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 2}}
+
+
+class TestCompleteHedged:
+    """Test hedging a slow primary with a backup model."""
+
+    def test_backup_wins_and_loser_is_cancelled(self, monkeypatch):
+        """Test that the slow primary's AI-GYM row is closed as cancelled."""
+        monkeypatch.setattr(ai_council_module, "llm_gateway", FakeGateway({"primary": 5, "backup": 0}))
+        tracker = FakeGymTracker()
+        council = _council(tracker)
+
+        response = asyncio.run(council.complete_hedged(
+            TaskType.EMAIL_SUBJECT, MESSAGES,
+            force_model="primary", backup_model="backup", hedge_after=0.05
+        ))
+
+        assert response.model_used == "backup"
+        assert response.content == "Hello backup"
+        rows = {model: request_id for request_id, model in tracker.started.items()}
+        assert tracker.completed == [rows["backup"]]
+        assert tracker.ended == {rows["primary"]: "cancelled"}
+
+    def test_fast_primary_is_not_hedged(self, monkeypatch):
+        """Test that no backup is started when the primary streams in time."""
+        monkeypatch.setattr(ai_council_module, "llm_gateway", FakeGateway({"primary": 0, "backup": 0}))
+        tracker = FakeGymTracker()
+        council = _council(tracker)
+
+        response = asyncio.run(council.complete_hedged(
+            TaskType.EMAIL_SUBJECT, MESSAGES,
+            force_model="primary", backup_model="backup", hedge_after=1
+        ))
+
+        assert response.model_used == "primary"
+        assert list(tracker.started.values()) == ["primary"]
+        assert tracker.ended == {}
+
+
+class TestCacheValidator:
+    """Test that only validated completions are cached."""
+
+    def _run(self, tmp_path, cache_validator):
+        async def scenario():
+            cache = ResponseCache(DiskCacheBackend(str(tmp_path)))
+            council = _council(response_cache=cache)
+            for _ in range(2):
+                await council.complete_hedged(
+                    TaskType.CATEGORY_CLASSIFICATION, MESSAGES,
+                    force_model="primary", backup_model="backup", hedge_after=1,
+                    temperature=0.2, cache_validator=cache_validator
+                )
+            return cache
+
+        return asyncio.run(scenario())
+
+    def test_rejected_completion_is_not_stored(self, tmp_path, monkeypatch):
+        """Test that a completion the validator rejects is generated again."""
+        monkeypatch.setattr(ai_council_module, "llm_gateway", FakeGateway({"primary": 0}))
+
+        cache = self._run(tmp_path, lambda content: False)
+
+        assert cache.stats["misses"] == 2
+        assert cache.stats["hits"] == 0
+
+    def test_accepted_completion_is_stored(self, tmp_path, monkeypatch):
+        """Test that a validated completion is served from the cache next time."""
+        monkeypatch.setattr(ai_council_module, "llm_gateway", FakeGateway({"primary": 0}))
+
+        cache = self._run(tmp_path, lambda content: content == "Hello primary")
+
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 1
+
+
+class RecordingPublisher:
+    """Collects published events instead of buffering them for Redis."""
+
+    def __init__(self):
+        self.events = []
+
+    def publish(self, channel, message):
+        self.events.append((channel, message))
+
+
+class TestPublishPartials:
+    """Test streaming partial replies to a websocket room."""
+
+    def test_partials_carry_text_so_far_and_token_deltas(self, monkeypatch):
+        """Test that each event has the full text and the tokens it added."""
+        monkeypatch.setattr(ai_council_module, "llm_gateway", FakeGateway({"a-rather-long-model-name": 0}))
+        publisher = RecordingPublisher()
+        monkeypatch.setattr(ai_council_module, "async_event_publisher", publisher)
+        council = _council()
+
+        async def scenario():
+            stream = council.complete_stream(
+                TaskType.CONVERSATION_RESPONSE, MESSAGES, force_model="a-rather-long-model-name"
+            )
+            return await stream.publish_partials("conversation:7", "task-1", conversation_id=7)
+
+        response = asyncio.run(scenario())
+
+        assert response.content == "Hello a-rather-long-model-name"
+        assert [channel for channel, _ in publisher.events] == [AI_EVENTS_CHANNEL] * 2
+        first, last = (message for _, message in publisher.events)
+        assert first["content"] == "Hello "
+        assert last["content"] == response.content
+        assert last["room"] == "conversation:7"
+        assert last["task_id"] == "task-1"
+        assert last["conversation_id"] == 7
+        assert [first["tokens"], last["tokens"]] == [1, 6]
+        assert first["tokens"] + last["tokens"] == len(response.content) // 4
@@ -0,0 +1,66 @@
+"""
+Campaign Recipients Test Suite
+
+Tests bulk recipient insertion by lead IDs and by lead filter.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.campaigns import CampaignStatusEnum, RecipientLeadFilter
+from app.services.campaign_service import CampaignService
+
+
+def _service() -> CampaignService:
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(
+        one=MagicMock(return_value=SimpleNamespace(matched=3, without_email=1, added=1, bumped=1))
+    ))
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+
+    service = CampaignService(db)
+    service.get_campaign = AsyncMock(return_value=SimpleNamespace(
+        campaign_id="camp-1", status=CampaignStatusEnum.DRAFT
+    ))
+    return service
+
+
+class TestAddRecipientsBulk:
+    """Test add_recipients_bulk statement building and validation."""
+
+    def test_lead_ids_are_bound_as_one_array(self):
+        """Test that a large import stays far below asyncpg's parameter limit."""
+        service = _service()
+        lead_ids = list(range(1, 40_001))
+
+        counts = asyncio.run(service.add_recipients_bulk(1, lead_ids=lead_ids))
+
+        stmt = service.db.execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert compiled.params["lead_ids"] == lead_ids
+        assert len(compiled.params) < 10
+        assert counts["invalid"] == 1 + len(lead_ids) - 3
+
+    def test_empty_filter_is_rejected(self):
+        """Test that a filter without criteria does not add every lead."""
+        service = _service()
+
+        with pytest.raises(ValueError):
+            asyncio.run(service.add_recipients_bulk(1, lead_filter=RecipientLeadFilter()))
+
+        service.db.execute.assert_not_awaited()
+
+    def test_filter_with_criteria_is_applied(self):
+        """Test that filter fields become conditions on the candidate query."""
+        service = _service()
+
+        asyncio.run(service.add_recipients_bulk(1, lead_filter=RecipientLeadFilter(source="craigslist")))
+
+        stmt = service.db.execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "craigslist" in compiled.params.values()
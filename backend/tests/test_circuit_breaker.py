@@ -0,0 +1,62 @@
+"""
+Circuit Breaker Test Suite
+
+Tests state transitions of the consecutive-failure circuit breaker.
+"""
+
+from app.core import circuit_breaker
+from app.core.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test closed/open/half-open transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens only after the threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()  # resets the count
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow() is True
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow() is False
+        assert 0 < breaker.retry_after <= 30
+
+    def test_half_open_allows_single_trial(self, monkeypatch):
+        """Test that one trial goes through after the reset timeout."""
+        now = [1000.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+        breaker.record_failure()
+        assert breaker.allow() is False
+
+        now[0] += 11
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # trial already in flight
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow() is True
+
+    def test_failed_trial_reopens(self, monkeypatch):
+        """Test that a failed trial keeps the circuit open for another timeout."""
+        now = [1000.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        now[0] += 11
+        assert breaker.allow() is True
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.retry_after == 10
+        assert breaker.stats["opened"] == 2
@@ -19,7 +19,7 @@ from app.services.conversation_ai import (
     Sentiment,
     Intent
 )
-from app.services.ai_mvp.ai_council import AICouncil, AICouncilResponse, Message
+from app.services.ai_mvp.ai_council import AICouncil, AICouncilResponse, AICouncilStream, Message
 from app.services.ai_mvp.semantic_router import RouteDecision, ModelTier, TaskComplexity
 from app.services.vector_store import VectorStore
 
@@ -351,6 +351,73 @@ Sarah""",
         assert reply.call_to_action is not None
         assert len(reply.content.split()) < 300  # Check length
 
+    @pytest.mark.asyncio
+    async def test_generate_reply_streams_partials(self, conversation_ai, mock_ai_council, mock_vector_store):
+        """Test streamed reply generation publishes partial and final events."""
+        mock_vector_store.find_similar_conversations.return_value = []
+
+        final = AICouncilResponse(
+            content="Hi John, yes we integrate with HubSpot. Can we talk Tuesday?",
+            model_used="anthropic/claude-3.5-sonnet",
+            model_tier="premium",
+            prompt_tokens=500,
+            completion_tokens=20,
+            total_cost=0.005,
+            route_decision=RouteDecision(
+                model_name="anthropic/claude-3.5-sonnet",
+                model_tier=ModelTier.PREMIUM,
+                task_complexity=TaskComplexity.CRITICAL,
+                reasoning="Critical customer-facing task",
+                estimated_cost=0.005
+            )
+        )
+
+        class FakeStream:
+            response = None
+            time_to_first_token = 0.1
+            publish_partials = AICouncilStream.publish_partials
+
+            async def __aiter__(self):
+                for delta in ("Hi John, ", "yes we integrate with HubSpot. ", "Can we talk Tuesday?"):
+                    yield delta
+                self.response = final
+
+        mock_ai_council.complete_stream = Mock(return_value=FakeStream())
+
+        analysis = ReplyAnalysis(
+            sentiment="positive",
+            sentiment_confidence=0.9,
+            intent="question",
+            intent_confidence=0.95,
+            engagement_score=0.85,
+            key_topics=["HubSpot integration"],
+            questions_asked=["Does it integrate with HubSpot?"],
+            urgency_level="high",
+            summary="Asks about HubSpot"
+        )
+
+        with patch("app.services.conversation_ai.async_event_publisher") as publisher, \
+                patch("app.services.ai_mvp.ai_council.async_event_publisher", publisher):
+            reply = await conversation_ai.generate_reply(
+                incoming_reply="Does this integrate with HubSpot?",
+                reply_analysis=analysis,
+                conversation_history=[],
+                lead_context={},
+                stream_conversation_id=42
+            )
+
+        mock_ai_council.complete.assert_not_called()
+        assert reply.content == final.content
+
+        events = [call.args[1] for call in publisher.publish.call_args_list]
+        partials = [e for e in events if e["type"] == "ai:response_partial"]
+        assert [e["content"] for e in partials][-1] == final.content
+        assert len(partials) == 3
+        assert sum(e["tokens"] for e in partials) == len(final.content) // 4
+        assert all(e["room"] == "conversation:42" for e in events)
+        assert events[-1]["type"] == "ai:response_ready"
+        assert events[-1]["tokens_used"] == 520
+
     @pytest.mark.asyncio
     async def test_suggest_improvements_too_long(self, conversation_ai, mock_ai_council):
         """Test improvement suggestions for overly long draft."""
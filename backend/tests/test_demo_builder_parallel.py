@@ -0,0 +1,192 @@
+"""
+Demo Site Builder Parallel Generation Test Suite
+
+Tests per-file generation, per-file retries and partial failures.
+"""
+
+from typing import Dict
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.demo_builder.builder import (
+    BuildStatus,
+    DemoSiteBuilder,
+    Framework,
+    ImprovementPlan,
+    OriginalSite,
+)
+from app.services.ai_mvp.ai_council import AICouncil, AICouncilResponse
+from app.services.ai_mvp.semantic_router import ModelTier, RouteDecision, TaskComplexity
+
+
+@pytest.fixture
+def mock_ai_council():
+    """Create mock AI Council."""
+    council = Mock(spec=AICouncil)
+    council.complete = AsyncMock()
+    return council
+
+
+@pytest.fixture
+def sample_original_site() -> OriginalSite:
+    """Sample original website data."""
+    return OriginalSite(
+        url="https://example.com",
+        html_content="<!DOCTYPE html><html><head><title>Example Site</title></head>"
+                     "<body><h1>Welcome</h1></body></html>",
+        title="Example Site",
+        meta_description="An example website"
+    )
+
+
+@pytest.fixture
+def sample_improvement_plan() -> ImprovementPlan:
+    """Sample improvement plan."""
+    return ImprovementPlan(
+        overall_strategy="Modernize design and improve performance",
+        improvements=[
+            {
+                "title": "Improve Hero Section",
+                "description": "Add compelling headline and CTA",
+                "category": "Design",
+                "priority": "high"
+            },
+            {
+                "title": "Add Mobile Responsiveness",
+                "description": "Implement responsive CSS",
+                "category": "Technical",
+                "priority": "high"
+            }
+        ],
+        priority_order=["Design", "Technical"],
+        estimated_impact="High"
+    )
+
+
+@pytest.fixture
+def mock_ai_response() -> AICouncilResponse:
+    """Mock AI response (content is replaced per file)."""
+    return AICouncilResponse(
+        content="",
+        model_used="anthropic/claude-3-haiku",
+        model_tier="cheap",
+        prompt_tokens=1000,
+        completion_tokens=500,
+        total_cost=0.002,
+        request_id=123,
+        route_decision=RouteDecision(
+            model_name="anthropic/claude-3-haiku",
+            model_tier=ModelTier.CHEAP,
+            task_complexity=TaskComplexity.COMPLEX,
+            reasoning="Test routing",
+            estimated_cost=0.002
+        )
+    )
+
+
+class TestParallelGeneration:
+    """Test per-file parallel generation mode."""
+
+    @staticmethod
+    def _file_responder(mock_ai_response, broken: Dict[str, int] = None):
+        """Answer each per-file prompt with a code block for that file."""
+        import re
+
+        calls: Dict[str, int] = {}
+
+        async def complete(**kwargs):
+            path = re.search(r"Generate ONLY the file `([^`]+)`", kwargs["messages"][-1].content).group(1)
+            calls[path] = calls.get(path, 0) + 1
+            if calls[path] <= (broken or {}).get(path, 0):
+                raise RuntimeError("provider error")
+            content = f"```tsx\n// FILE: {path}\nexport default function Component() {{ return null; }}\n```"
+            return mock_ai_response.model_copy(update={"content": content})
+
+        return complete, calls
+
+    @pytest.mark.asyncio
+    async def test_each_planned_file_is_generated(
+        self,
+        mock_ai_council,
+        sample_original_site,
+        sample_improvement_plan,
+        mock_ai_response
+    ):
+        """Test that every non-static planned file gets its own AI task."""
+        complete, calls = self._file_responder(mock_ai_response)
+        mock_ai_council.complete.side_effect = complete
+
+        builder = DemoSiteBuilder(mock_ai_council)
+        build = await builder.build_demo_site(
+            original_site=sample_original_site,
+            improvement_plan=sample_improvement_plan,
+            framework=Framework.REACT,
+            parallel=True
+        )
+
+        assert "src/components/Hero.tsx" in build.files
+        assert calls["src/App.tsx"] == 1
+        # Config files and README are not generated by AI
+        assert "package.json" not in calls
+        assert "README.md" not in calls
+        assert build.validation_results["is_valid"]
+
+    @pytest.mark.asyncio
+    async def test_failed_file_is_retried(
+        self,
+        mock_ai_council,
+        sample_original_site,
+        sample_improvement_plan,
+        mock_ai_response
+    ):
+        """Test that one failing file is retried on its own."""
+        complete, calls = self._file_responder(mock_ai_response, broken={"src/App.tsx": 1})
+        app_cache_flags = []
+
+        async def tracking_complete(**kwargs):
+            if "`src/App.tsx`" in kwargs["messages"][-1].content:
+                app_cache_flags.append(kwargs["use_cache"])
+            return await complete(**kwargs)
+
+        mock_ai_council.complete.side_effect = tracking_complete
+
+        builder = DemoSiteBuilder(mock_ai_council)
+        build = await builder.build_demo_site(
+            original_site=sample_original_site,
+            improvement_plan=sample_improvement_plan,
+            framework=Framework.REACT,
+            parallel=True
+        )
+
+        assert calls["src/App.tsx"] == 2
+        assert calls["src/components/Hero.tsx"] == 1
+        assert "src/App.tsx" in build.files
+        # The retry must not be served the cached answer that just failed
+        assert app_cache_flags == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_file_that_keeps_failing_does_not_fail_build(
+        self,
+        mock_ai_council,
+        sample_original_site,
+        sample_improvement_plan,
+        mock_ai_response
+    ):
+        """Test that a file failing every attempt is reported, not raised."""
+        complete, _ = self._file_responder(mock_ai_response, broken={"src/components/CTA.tsx": 99})
+        mock_ai_council.complete.side_effect = complete
+
+        builder = DemoSiteBuilder(mock_ai_council, max_file_attempts=2)
+        build = await builder.build_demo_site(
+            original_site=sample_original_site,
+            improvement_plan=sample_improvement_plan,
+            framework=Framework.REACT,
+            parallel=True
+        )
+
+        assert build.status == BuildStatus.COMPLETED
+        assert "src/components/CTA.tsx" not in build.files
+        assert "src/components/Hero.tsx" in build.files
+        assert not build.validation_results["is_valid"]
+        assert "src/components/CTA.tsx: Generation failed" in build.validation_results["errors"]
@@ -0,0 +1,34 @@
+"""
+DNS Cache Test Suite
+
+Tests the hostname resolution cache used by URL validation.
+"""
+
+from app.core import url_validator
+
+
+class TestResolveHostname:
+    """Test caching and eviction of hostname lookups."""
+
+    def test_lookups_are_cached(self, monkeypatch):
+        """Test that a hostname is resolved once within the TTL."""
+        lookups = []
+        monkeypatch.setattr(url_validator, "_dns_cache", url_validator.OrderedDict())
+        monkeypatch.setattr(url_validator.socket, "gethostbyname", lambda host: lookups.append(host) or "93.184.216.34")
+
+        assert url_validator.resolve_hostname("example.com") == "93.184.216.34"
+        assert url_validator.resolve_hostname("example.com") == "93.184.216.34"
+        assert lookups == ["example.com"]
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used hostname is evicted at the cap."""
+        monkeypatch.setattr(url_validator, "_dns_cache", url_validator.OrderedDict())
+        monkeypatch.setattr(url_validator, "DNS_CACHE_MAX_ENTRIES", 3)
+        monkeypatch.setattr(url_validator.socket, "gethostbyname", lambda host: "93.184.216.34")
+
+        for host in ("a.example", "b.example", "c.example"):
+            url_validator.resolve_hostname(host)
+        url_validator.resolve_hostname("a.example")  # now most recently used
+        url_validator.resolve_hostname("d.example")
+
+        assert list(url_validator._dns_cache) == ["c.example", "a.example", "d.example"]
@@ -0,0 +1,73 @@
+"""
+Realtime Event Batching Test Suite
+
+Tests rolling up of progress events before they are published.
+"""
+
+from app.core.event_batching import EventBatch
+
+
+class TestEventBatch:
+    """Test the publisher-side event buffer."""
+
+    def test_progress_rolls_up_to_latest(self):
+        """Test that progress for one job collapses to its latest values."""
+        batch = EventBatch()
+        for current in range(1, 51):
+            batch.add("fliptechpro:scrapers", {
+                "type": "scraper:progress",
+                "scraper_id": "s1",
+                "current": current,
+                "room": "scraper:s1",
+            })
+
+        events = batch.drain()
+        assert len(events) == 1
+        channel, message = events[0]
+        assert channel == "fliptechpro:scrapers"
+        assert message["current"] == 50
+        assert message["rolled_up"] == 50
+
+    def test_counts_are_summed_per_campaign(self):
+        """Test that email-sent counts add up per campaign room."""
+        batch = EventBatch()
+        for campaign_id in [1, 2, 1, 1]:
+            batch.add("fliptechpro:campaigns", {
+                "type": "campaign:email_sent",
+                "campaign_id": campaign_id,
+                "count": 1,
+                "room": f"campaign:{campaign_id}",
+            })
+
+        counts = {message["campaign_id"]: message["count"] for _, message in batch.drain()}
+        assert counts == {1: 3, 2: 1}
+
+    def test_partials_roll_up_per_task_in_shared_room(self):
+        """Test that interleaved files of one demo build keep separate partials."""
+        batch = EventBatch()
+        for path, content in [("a.tsx", "A1"), ("b.tsx", "B1"), ("a.tsx", "A1A2")]:
+            batch.add("fliptechpro:ai", {
+                "type": "ai:response_partial",
+                "task_id": f"demo-1:{path}",
+                "content": content,
+                "tokens": 1,
+                "room": "demo:demo-1",
+            })
+
+        partials = {message["task_id"]: message for _, message in batch.drain()}
+        assert set(partials) == {"demo-1:a.tsx", "demo-1:b.tsx"}
+        assert partials["demo-1:a.tsx"]["content"] == "A1A2"
+        assert partials["demo-1:a.tsx"]["tokens"] == 2
+        assert partials["demo-1:b.tsx"]["tokens"] == 1
+
+    def test_other_events_pass_through_in_order(self):
+        """Test that ordinary events are neither merged nor reordered."""
+        batch = EventBatch()
+        batch.add("fliptechpro:scrapers", {"type": "scraper:progress", "current": 1, "room": "scraper:s1"})
+        batch.add("fliptechpro:leads", {"type": "lead:created", "lead_id": 1})
+        batch.add("fliptechpro:leads", {"type": "lead:created", "lead_id": 2})
+        batch.add("fliptechpro:scrapers", {"type": "scraper:progress", "current": 2, "room": "scraper:s1"})
+
+        types = [message.get("lead_id", message["type"]) for _, message in batch.drain()]
+        assert types == ["scraper:progress", 1, 2]
+        assert len(batch) == 0
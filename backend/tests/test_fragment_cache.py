@@ -0,0 +1,110 @@
+"""
+Fragment Cache Test Suite
+
+Tests variant generation, single-flight filling and lead token substitution.
+"""
+
+import asyncio
+
+from app.services.ai_mvp.response_cache import DiskCacheBackend
+from app.services.demo_builder.fragment_cache import FragmentCache, substitute_lead_tokens
+
+
+class TestFragmentCache:
+    """Test fragment reuse across leads."""
+
+    def test_batch_of_leads_is_served_from_cache(self, tmp_path):
+        """Test that concurrent leads only generate `variants_per_key` fragments."""
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {"headline": f"Variant {len(calls)} for [COMPANY]"}
+
+        async def scenario():
+            cache = FragmentCache(DiskCacheBackend(str(tmp_path)), variants_per_key=2)
+            return cache, await asyncio.gather(*[
+                cache.get_or_generate("landing", "Dental", "hero", "professional", generate, f"lead-{i}")
+                for i in range(20)
+            ])
+
+        cache, fragments = asyncio.run(scenario())
+
+        assert len(calls) == 2
+        assert all(fragment for fragment in fragments)
+        assert cache.get_stats()["hits"] == 18
+
+    def test_lead_keeps_its_variant_while_slots_fill(self, tmp_path):
+        """Test that a lead gets the same variant before and after the key is full."""
+        async def scenario():
+            cache = FragmentCache(DiskCacheBackend(str(tmp_path)), variants_per_key=3)
+            counter = iter(range(100))
+
+            async def generate():
+                return {"headline": f"Variant {next(counter)}"}
+
+            async def serve_all():
+                return [
+                    await cache.get_or_generate("landing", "Dental", "hero", "casual", generate, f"lead-{i}")
+                    for i in range(12)
+                ]
+
+            return cache, await serve_all(), await serve_all()
+
+        cache, first, again = asyncio.run(scenario())
+
+        assert first == again
+        assert cache.stats["generated"] == 3
+        assert cache._locks == {}
+
+    def test_concurrent_slots_do_not_overwrite_each_other(self, tmp_path):
+        """Test that two slots generated at once are both stored."""
+        async def scenario():
+            cache = FragmentCache(DiskCacheBackend(str(tmp_path)), variants_per_key=2)
+            seeds = {}
+            for i in range(20):
+                seeds.setdefault(cache._slot(f"lead-{i}"), f"lead-{i}")
+
+            def generator(name):
+                async def generate():
+                    await asyncio.sleep(0.01)
+                    return {"headline": name}
+                return generate
+
+            await asyncio.gather(*[
+                cache.get_or_generate("landing", "Dental", "hero", "casual", generator(seed), seed)
+                for seed in seeds.values()
+            ])
+            key = FragmentCache.key("landing", "Dental", "hero", "casual")
+            return seeds, await cache._variants(key)
+
+        seeds, variants = asyncio.run(scenario())
+
+        assert variants == [{"headline": seeds[0]}, {"headline": seeds[1]}]
+
+    def test_key_ignores_case_and_spacing(self):
+        """Test that equivalent slots share a key."""
+        assert FragmentCache.key("Landing", " dental  clinic", "hero", "Professional") == \
+            FragmentCache.key("landing", "Dental Clinic", "hero", "professional")
+        assert FragmentCache.key("landing", "dental", "hero", "casual") != \
+            FragmentCache.key("landing", "dental", "hero", "professional")
+
+
+class TestSubstituteLeadTokens:
+    """Test per-lead substitution."""
+
+    def test_nested_values_are_substituted(self):
+        """Test that tokens in nested dicts and lists are replaced."""
+        fragment = {
+            "headline": "[COMPANY] in [LOCATION]",
+            "features": [{"title": "Built for [INDUSTRY]", "rank": 1}],
+        }
+        result = substitute_lead_tokens(
+            fragment, {"company": "Acme", "industry": "dentistry", "location": None}
+        )
+
+        assert result == {
+            "headline": "Acme in ",
+            "features": [{"title": "Built for dentistry", "rank": 1}],
+        }
@@ -0,0 +1,161 @@
+"""
+Metric Sink Test Suite
+
+Tests batch ordering, spooling and replay, shutdown draining and ID
+reservation while the database is down.
+"""
+
+import asyncio
+
+from app.services import metric_sink as metric_sink_module
+from app.services.metric_sink import MetricSink
+
+
+class RecordingSink(MetricSink):
+    """Sink that records batches instead of writing them; the first `failures` writes raise."""
+
+    def __init__(self, failures: int = 0, persist_delay: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.persist_delay = persist_delay
+        self.written = []
+
+    async def _persist(self, batch):
+        await asyncio.sleep(self.persist_delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.written.extend((operation["op"], operation["id"]) for operation in batch)
+
+
+class TestFlushOrdering:
+    """Test that concurrent flushes write batches in queue order."""
+
+    def test_flush_all_does_not_overtake_background_flush(self, tmp_path):
+        """Test that an update is never written before its row's insert."""
+        async def scenario():
+            sink = RecordingSink(
+                batch_size=1, flush_interval=0.01, persist_delay=0.02,
+                spool_path=str(tmp_path / "spool.jsonl")
+            )
+            sink.insert("ai_gym_performance", 1, {"task_type": "email_body"})
+            sink.update("ai_gym_performance", 1, {"cost": 0.01})
+            sink.insert("ai_gym_performance", 2, {"task_type": "email_body"})
+
+            # Let the background loop take the first batch, then flush from the request path
+            await asyncio.sleep(0.02)
+            await sink.flush_all()
+            await sink.stop()
+            return sink
+
+        sink = asyncio.run(scenario())
+
+        assert sink.written == [("insert", 1), ("update", 1), ("insert", 2)]
+
+
+class TestSpool:
+    """Test the spool fallback."""
+
+    def test_failed_batch_is_spooled_and_replayed_first(self, tmp_path):
+        """Test that spooled operations are replayed before newer ones."""
+        spool_path = tmp_path / "spool.jsonl"
+
+        async def scenario():
+            sink = RecordingSink(failures=1, spool_path=str(spool_path))
+            sink.insert("ai_gym_performance", 1, {"task_type": "email_body"})
+            assert await sink.flush() == 0
+            assert spool_path.exists()
+            assert not sink.is_pending("ai_gym_performance", 1)
+
+            sink.update("ai_gym_performance", 1, {"cost": 0.01})
+            assert await sink.flush() == 1
+            await sink.stop()
+            return sink
+
+        sink = asyncio.run(scenario())
+
+        assert sink.written == [("insert", 1), ("update", 1)]
+        assert sink.stats["spooled"] == 1
+        assert sink.stats["replayed"] == 1
+        assert not spool_path.exists()
+
+
+class TestStop:
+    """Test shutdown draining."""
+
+    def test_stop_persists_batch_held_by_loop(self, tmp_path):
+        """Test that operations taken off the queue are written, not dropped."""
+        async def scenario():
+            sink = RecordingSink(
+                batch_size=2, flush_interval=0.01, persist_delay=0.05,
+                spool_path=str(tmp_path / "spool.jsonl")
+            )
+            for row_id in (1, 2, 3):
+                sink.insert("ai_gym_performance", row_id, {"task_type": "email_body"})
+
+            # The loop is now persisting the first batch
+            await asyncio.sleep(0.02)
+            await sink.stop()
+            return sink
+
+        sink = asyncio.run(scenario())
+
+        assert sink.written == [("insert", 1), ("insert", 2), ("insert", 3)]
+        assert sink.get_stats()["buffered"] == 0
+
+    def test_stop_spools_when_database_is_down(self, tmp_path):
+        """Test that draining on shutdown spools what cannot be written."""
+        spool_path = tmp_path / "spool.jsonl"
+
+        async def scenario():
+            sink = RecordingSink(failures=99, flush_interval=0.01, spool_path=str(spool_path))
+            for row_id in (1, 2, 3):
+                sink.insert("ai_gym_performance", row_id, {"task_type": "email_body"})
+            await sink.stop()
+            return sink
+
+        sink = asyncio.run(scenario())
+
+        assert sink.written == []
+        assert len(spool_path.read_text().splitlines()) == 3
+
+
+class FailingSession:
+    """AsyncSessionLocal stand-in for an unreachable database."""
+
+    calls = 0
+
+    async def __aenter__(self):
+        FailingSession.calls += 1
+        raise ConnectionRefusedError("database unavailable")
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestNextId:
+    """Test ID reservation."""
+
+    def test_database_down_skips_tracking(self, tmp_path, monkeypatch):
+        """Test that next_id returns None and backs off instead of raising."""
+        monkeypatch.setattr(metric_sink_module, "AsyncSessionLocal", FailingSession)
+        FailingSession.calls = 0
+
+        async def scenario():
+            sink = MetricSink(spool_path=str(tmp_path / "spool.jsonl"))
+            return sink, [await sink.next_id("ai_gym_performance") for _ in range(3)]
+
+        sink, ids = asyncio.run(scenario())
+
+        assert ids == [None, None, None]
+        assert FailingSession.calls == 1
+        assert sink.stats["id_errors"] == 1
+
+    def test_ids_are_served_from_the_block(self, tmp_path):
+        """Test that reserved IDs are handed out without a query."""
+        async def scenario():
+            sink = MetricSink(id_block_size=8, spool_path=str(tmp_path / "spool.jsonl"))
+            sink._ids["ai_gym_performance"].extend(range(1, 9))
+            return [await sink.next_id("ai_gym_performance") for _ in range(4)]
+
+        assert asyncio.run(scenario()) == [1, 2, 3, 4]
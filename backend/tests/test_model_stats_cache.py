@@ -0,0 +1,180 @@
+"""
+Model Stats Cache Test Suite
+
+Tests the EWMA updates, warm-up from the database, the fallback while the
+database is unavailable, and invalidation.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ai_gym.models import TaskType
+from app.services.ai_gym.router import ModelRouter
+from app.services.ai_gym.stats_cache import ModelStatsCache
+
+
+def _row(model_id, task_type, avg_quality, avg_cost, avg_latency, sample_count):
+    return SimpleNamespace(
+        model_id=model_id,
+        task_type=task_type,
+        avg_quality=avg_quality,
+        avg_cost=avg_cost,
+        avg_latency=avg_latency,
+        sample_count=sample_count
+    )
+
+
+class FakeSession:
+    """Answers the grouped ModelMetric query with canned rows, or fails."""
+
+    def __init__(self, rows=(), error=None):
+        self.rows = list(rows)
+        self.error = error
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        if self.error:
+            raise self.error
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class TestObserve:
+    """Test the moving-average math."""
+
+    def test_first_observation_is_the_baseline(self):
+        """Test that the first execution sets the averages as-is."""
+        cache = ModelStatsCache(alpha=0.1)
+        cache.observe("m", "email_body", cost_usd=0.02, latency_ms=800, quality_score=90)
+
+        stats = cache.get("m", "email_body")
+        assert (stats.avg_cost, stats.avg_latency, stats.avg_quality) == (0.02, 800, 90)
+        assert stats.sample_count == 1
+
+    def test_later_observations_move_by_alpha(self):
+        """Test avg += alpha * (value - avg) for every field."""
+        cache = ModelStatsCache(alpha=0.1)
+        cache.observe("m", "email_body", cost_usd=0.02, latency_ms=800, quality_score=90)
+        cache.observe("m", "email_body", cost_usd=0.12, latency_ms=1800, quality_score=40)
+
+        stats = cache.get("m", "email_body")
+        assert stats.avg_cost == pytest.approx(0.03)
+        assert stats.avg_latency == pytest.approx(900)
+        assert stats.avg_quality == pytest.approx(85)
+        assert stats.sample_count == 2
+
+    def test_unscored_executions_leave_quality_alone(self):
+        """Test that quality starts with the first score and skips unscored runs."""
+        cache = ModelStatsCache(alpha=0.5)
+        cache.observe("m", "email_body", cost_usd=0.01, latency_ms=100)
+        assert cache.get("m", "email_body").avg_quality is None
+
+        cache.observe("m", "email_body", cost_usd=0.01, latency_ms=100, quality_score=80)
+        cache.observe("m", "email_body", cost_usd=0.01, latency_ms=100)
+
+        assert cache.get("m", "email_body").avg_quality == 80
+
+    def test_pairs_are_independent(self):
+        """Test that models and task types keep separate statistics."""
+        cache = ModelStatsCache()
+        cache.observe("a", "email_body", cost_usd=0.01, latency_ms=100)
+        cache.observe("a", "website_analysis", cost_usd=0.5, latency_ms=900)
+
+        assert cache.get("a", "email_body").avg_cost == 0.01
+        assert cache.get("a", "website_analysis").avg_cost == 0.5
+        assert cache.get("b", "email_body") is None
+
+
+class TestReconcile:
+    """Test warm-up, fallback and invalidation."""
+
+    def test_reconcile_replaces_observations_with_database_baseline(self):
+        """Test that reconciled averages win and later observations adjust them."""
+        cache = ModelStatsCache(alpha=0.1)
+        cache.observe("m", "email_body", cost_usd=9.0, latency_ms=9000)
+        session = FakeSession([_row("m", "email_body", None, 0.02, 800, 40)])
+
+        assert asyncio.run(cache.reconcile(session)) == 1
+        cache.observe("m", "email_body", cost_usd=0.12, latency_ms=800)
+
+        stats = cache.get("m", "email_body")
+        assert cache.loaded and not cache.is_stale
+        assert stats.avg_quality is None
+        assert stats.avg_cost == pytest.approx(0.03)
+        assert stats.sample_count == 41
+
+    def test_reconciles_only_when_stale(self):
+        """Test that maybe_reconcile queries once per interval."""
+        cache = ModelStatsCache(reconcile_interval_seconds=300)
+        session = FakeSession([_row("m", "email_body", 80, 0.02, 800, 10)])
+
+        async def scenario():
+            await cache.maybe_reconcile(session)
+            await cache.maybe_reconcile(session)
+
+        asyncio.run(scenario())
+
+        assert session.queries == 1
+
+    def test_failed_reconcile_backs_off_and_keeps_serving(self):
+        """Test that a database error is not retried on every route."""
+        cache = ModelStatsCache(reconcile_interval_seconds=300)
+        cache.observe("m", "email_body", cost_usd=0.02, latency_ms=800)
+        session = FakeSession(error=ConnectionRefusedError("database unavailable"))
+
+        async def scenario():
+            await cache.maybe_reconcile(session)
+            await cache.maybe_reconcile(session)
+
+        asyncio.run(scenario())
+
+        assert session.queries == 1
+        assert not cache.loaded and not cache.is_stale
+        assert cache.get("m", "email_body").avg_cost == 0.02
+
+    def test_clear_invalidates(self):
+        """Test that clear() drops stats and forces a reload."""
+        cache = ModelStatsCache()
+        asyncio.run(cache.reconcile(FakeSession([_row("m", "email_body", 80, 0.02, 800, 10)])))
+
+        cache.clear()
+
+        assert cache.get("m", "email_body") is None
+        assert not cache.loaded and cache.is_stale
+
+
+class TestRouterWarmUp:
+    """Test how the router uses the cache before and after it is loaded."""
+
+    def test_first_route_loads_stats_then_ranks_from_memory(self):
+        """Test that the first route with a session reconciles and uses the result."""
+        cache = ModelStatsCache()
+        router = ModelRouter(stats_cache=cache)
+        task_type = TaskType.WEBSITE_ANALYSIS
+        default_order = [m.id for m in router.registry.recommend_models_for_task(task_type, "balanced")]
+        # Plenty of samples showing the last-ranked model is the best
+        session = FakeSession([_row(default_order[-1], task_type.value, 100, 0.0, 0, 500)])
+
+        async def scenario():
+            first = await router.route(task_type, "balanced", db=session)
+            second = await router.route(task_type, "balanced", db=session)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first.id == second.id == default_order[-1]
+        assert session.queries == 1
+
+    def test_database_down_falls_back_to_registry_order(self):
+        """Test that routing still works with no statistics loaded."""
+        router = ModelRouter(stats_cache=ModelStatsCache())
+        task_type = TaskType.WEBSITE_ANALYSIS
+        default_order = [m.id for m in router.registry.recommend_models_for_task(task_type, "balanced")]
+        session = FakeSession(error=ConnectionRefusedError("database unavailable"))
+
+        model = asyncio.run(router.route(task_type, "balanced", db=session))
+
+        assert model.id == default_order[0]
+        assert not router.stats_cache.loaded
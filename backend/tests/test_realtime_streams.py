@@ -0,0 +1,130 @@
+"""
+Realtime Streams Test Suite
+
+Tests replay from stream history and detection of trimmed events.
+"""
+
+import asyncio
+import json
+
+from app.core.realtime_streams import RealtimeEventStream, stream_key
+
+
+class FakePipeline:
+    """Answers XRANGE / XINFO STREAM from canned per-stream data."""
+
+    def __init__(self, streams):
+        self.streams = streams
+        self.commands = []
+
+    def xrange(self, key, min, max, count):
+        self.commands.append(("xrange", key))
+
+    def xinfo_stream(self, key):
+        self.commands.append(("xinfo", key))
+
+    async def execute(self, raise_on_error=True):
+        results = []
+        for command, key in self.commands:
+            stream = self.streams.get(key)
+            if command == "xrange":
+                results.append(stream["entries"] if stream else [])
+            else:
+                results.append(stream["info"] if stream else Exception("ERR no such key"))
+        return results
+
+
+class FakeRedis:
+    """Redis client stand-in exposing only pipeline()."""
+
+    def __init__(self, streams):
+        self.pipe = FakePipeline(streams)
+
+    def pipeline(self, transaction=False):
+        return self.pipe
+
+
+def _entry(event_id, event_type="lead:created"):
+    return (event_id, {"data": json.dumps({"type": event_type})})
+
+
+def _read(streams, channels, since="1000-0", maxlen=1000):
+    client = FakeRedis(streams)
+    events, truncated = asyncio.run(
+        RealtimeEventStream(enabled=True, maxlen=maxlen).read_since(client, channels, since)
+    )
+    return client, events, truncated
+
+
+class TestReadSince:
+    """Test replay and truncation detection."""
+
+    def test_new_untrimmed_stream_is_not_truncated(self):
+        """Test that a stream created after `since` is replayed in full."""
+        streams = {stream_key("fliptechpro:leads"): {
+            "entries": [_entry("2000-0"), _entry("2001-0")],
+            "info": {"length": 2, "first-entry": _entry("2000-0"), "max-deleted-entry-id": "0-0"},
+        }}
+
+        _, events, truncated = _read(streams, ["fliptechpro:leads"])
+
+        assert [event_id for event_id, _, _ in events] == ["2000-0", "2001-0"]
+        assert events[0][2]["event_id"] == "2000-0"
+        assert not truncated
+
+    def test_trimmed_after_since_is_truncated(self):
+        """Test that entries deleted after `since` mark the replay truncated."""
+        streams = {stream_key("fliptechpro:leads"): {
+            "entries": [_entry("3000-0")],
+            "info": {"length": 1, "first-entry": _entry("3000-0"), "max-deleted-entry-id": "2500-0"},
+        }}
+
+        _, _, truncated = _read(streams, ["fliptechpro:leads"])
+
+        assert truncated
+
+    def test_trimming_before_since_is_not_truncation(self):
+        """Test that entries trimmed before `since` do not matter."""
+        streams = {stream_key("fliptechpro:leads"): {
+            "entries": [_entry("3000-0")],
+            "info": {"length": 1000, "first-entry": _entry("900-0"), "max-deleted-entry-id": "899-0"},
+        }}
+
+        _, _, truncated = _read(streams, ["fliptechpro:leads"])
+
+        assert not truncated
+
+    def test_only_requested_channels_are_checked(self):
+        """Test that a trimmed stream the client did not ask for is not read."""
+        streams = {
+            stream_key("fliptechpro:leads"): {
+                "entries": [],
+                "info": {"length": 0, "first-entry": None, "max-deleted-entry-id": "0-0"},
+            },
+            stream_key("fliptechpro:scrapers"): {
+                "entries": [_entry("5000-0")],
+                "info": {"length": 1000, "first-entry": _entry("4000-0"), "max-deleted-entry-id": "3999-0"},
+            },
+        }
+
+        client, events, truncated = _read(streams, ["fliptechpro:leads"])
+
+        assert events == []
+        assert not truncated
+        assert {key for _, key in client.pipe.commands} == {stream_key("fliptechpro:leads")}
+
+    def test_missing_stream_is_not_truncated(self):
+        """Test that a channel without history yet is skipped."""
+        _, events, truncated = _read({}, ["fliptechpro:ai"])
+
+        assert events == []
+        assert not truncated
+
+    def test_old_redis_uses_first_entry_at_cap(self):
+        """Test the fallback without max-deleted-entry-id."""
+        info = {"length": 10, "first-entry": _entry("2000-0")}
+        streams = {stream_key("fliptechpro:leads"): {"entries": [_entry("2000-0")], "info": info}}
+
+        # Below the cap nothing was trimmed, however late the first entry is
+        assert not _read(streams, ["fliptechpro:leads"], maxlen=1000)[2]
+        assert _read(streams, ["fliptechpro:leads"], maxlen=10)[2]
@@ -0,0 +1,70 @@
+"""
+Response Cache Test Suite
+
+Tests which completions are cached and exact-match lookups.
+"""
+
+import asyncio
+
+from app.services.ai_mvp.response_cache import CachedCompletion, DiskCacheBackend, ResponseCache
+
+MESSAGES = [{"role": "user", "content": "Classify: Joe's Plumbing"}]
+
+
+def _completion(content="plumber") -> CachedCompletion:
+    return CachedCompletion(
+        content=content,
+        model_used="cheap-model",
+        prompt_tokens=10,
+        completion_tokens=2,
+        total_cost=0.001,
+        latency_seconds=0.4
+    )
+
+
+class TestLookup:
+    """Test caching policy per task type and temperature."""
+
+    def test_deterministic_task_is_cached(self, tmp_path):
+        """Test that a stored completion is served on the next identical lookup."""
+        async def scenario():
+            cache = ResponseCache(DiskCacheBackend(str(tmp_path)))
+            miss = await cache.lookup("category_classification", "cheap-model", MESSAGES, 0.2, 100)
+            await cache.store(miss, _completion())
+            hit = await cache.lookup("category_classification", "cheap-model", MESSAGES, 0.2, 100)
+            return miss, hit, cache
+
+        miss, hit, cache = asyncio.run(scenario())
+
+        assert not miss.hit
+        assert hit.hit and hit.entry.content == "plumber"
+        assert cache.stats["hits"] == 1
+
+    def test_creative_copy_is_not_cached(self, tmp_path):
+        """Test that email and script generation bypass the cache by default."""
+        async def scenario():
+            cache = ResponseCache(DiskCacheBackend(str(tmp_path)))
+            lookups = [
+                await cache.lookup(task_type, "cheap-model", MESSAGES, 0.2, 100)
+                for task_type in ("email_subject", "email_body", "video_script", "custom_strategy")
+            ]
+            return lookups, cache
+
+        lookups, cache = asyncio.run(scenario())
+
+        assert lookups == [None, None, None, None]
+        assert cache.stats["bypassed"] == 4
+
+    def test_high_temperature_is_not_cached(self, tmp_path):
+        """Test that sampling above max_temperature bypasses the cache."""
+        async def scenario():
+            cache = ResponseCache(DiskCacheBackend(str(tmp_path)))
+            return (
+                await cache.lookup("category_classification", "cheap-model", MESSAGES, 0.8, 100),
+                await cache.lookup("category_classification", "cheap-model", MESSAGES, 0.5, 100),
+            )
+
+        hot, cool = asyncio.run(scenario())
+
+        assert hot is None
+        assert cool is not None
@@ -0,0 +1,245 @@
+"""
+Site Cache Test Suite
+
+Tests URL normalization, conditional-GET revalidation, redirect validation,
+derived results, eviction, and reuse of the fetched page by the analyzer.
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import httpx
+
+from app.core.url_validator import URLValidator
+from app.services.ai_mvp.website_analyzer import WebsiteAnalyzer
+from app.services.site_cache import SiteCache, normalize_url
+
+
+def _cache_with_server(tmp_path, handler, **kwargs) -> SiteCache:
+    # Skip DNS resolution; blocked hostnames and metadata endpoints still apply
+    cache = SiteCache(directory=str(tmp_path), url_validator=URLValidator(allow_private_ips=True), **kwargs)
+    cache._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return cache
+
+
+class TestNormalizeUrl:
+    """Test cache key normalization."""
+
+    def test_equivalent_urls_share_a_key(self):
+        """Test that case, default ports, fragments and tracking params are ignored."""
+        assert normalize_url("HTTPS://Example.com:443/About/?utm_source=x&b=2&a=1#top") == \
+            "https://example.com/About?a=1&b=2"
+        assert normalize_url("example.com") == "https://example.com/"
+
+    def test_meaningful_parts_are_kept(self):
+        """Test that non-default ports and other query params are kept."""
+        assert normalize_url("http://example.com:8080/?page=2&fbclid=z") == \
+            "http://example.com:8080/?page=2"
+
+
+class TestSiteCache:
+    """Test revalidation and content-addressed results."""
+
+    def test_unchanged_page_revalidates_with_304(self, tmp_path):
+        """Test that the second fetch is conditional and reuses derived results."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<html>hello</html>", headers={"ETag": '"v1"'})
+
+        async def scenario():
+            cache = _cache_with_server(tmp_path, handler)
+            first = await cache.revalidate("https://example.com/")
+            await cache.put_derived(first.content_hash, "seo", "1", {"score": 80}, depth="quick")
+            second = await cache.revalidate("https://example.com/?utm_campaign=x")
+            derived = await cache.get_derived(second.content_hash, "seo", "1", depth="quick")
+            other_version = await cache.get_derived(second.content_hash, "seo", "2", depth="quick")
+            html = await cache.get_html(second.content_hash)
+            return first, second, derived, other_version, html
+
+        first, second, derived, other_version, html = asyncio.run(scenario())
+
+        assert first.changed and not first.not_modified
+        assert second.not_modified and not second.changed
+        assert second.content_hash == first.content_hash
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert derived == {"score": 80}
+        assert other_version is None
+        assert html == "<html>hello</html>"
+
+    def test_changed_page_gets_new_hash(self, tmp_path):
+        """Test that new content is detected without validators."""
+        bodies = iter(["<html>one</html>", "<html>two</html>"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=next(bodies))
+
+        async def scenario():
+            cache = _cache_with_server(tmp_path, handler)
+            return await cache.revalidate("https://example.com"), await cache.revalidate("https://example.com")
+
+        first, second = asyncio.run(scenario())
+
+        assert second.changed
+        assert second.content_hash != first.content_hash
+
+    def test_unreachable_site_returns_none(self, tmp_path):
+        """Test that fetch errors disable the cache for that call."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("down", request=request)
+
+        cache = _cache_with_server(tmp_path, handler)
+        assert asyncio.run(cache.revalidate("https://example.com")) is None
+
+    def test_fetches_the_url_as_given(self, tmp_path):
+        """Test that normalization only affects the cache key, not the request."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text="<html>hello</html>")
+
+        cache = _cache_with_server(tmp_path, handler)
+        page = asyncio.run(cache.revalidate("http://Example.com/shop/?b=2&a=1"))
+
+        assert str(requests[0].url) == "http://example.com/shop/?b=2&a=1"
+        assert page.url == "http://example.com/shop?a=1&b=2"
+
+    def test_redirects_are_validated(self, tmp_path):
+        """Test that allowed redirects are followed and metadata redirects refused."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(301, headers={"Location": "/new"})
+            if request.url.path == "/new":
+                return httpx.Response(200, text="<html>moved</html>")
+            return httpx.Response(302, headers={"Location": "http://169.254.169.254/latest/meta-data"})
+
+        async def scenario():
+            cache = _cache_with_server(tmp_path, handler)
+            moved = await cache.revalidate("https://example.com/old")
+            html = await cache.get_html(moved.content_hash)
+            return html, await cache.revalidate("https://example.com/evil")
+
+        html, refused = asyncio.run(scenario())
+
+        assert html == "<html>moved</html>"
+        assert refused is None
+
+
+def _age(path, seconds):
+    """Set a file's mtime `seconds` into the past."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+class TestEviction:
+    """Test derived-result expiry and the sweep."""
+
+    def test_derived_results_expire(self, tmp_path):
+        """Test that a derived result older than derived_ttl is a miss."""
+        async def scenario():
+            cache = SiteCache(directory=str(tmp_path), derived_ttl=3600)
+            await cache.put_derived("ab" * 32, "website_analysis", "1", {"summary": "old"})
+            fresh = await cache.get_derived("ab" * 32, "website_analysis", "1")
+            _age(cache._derived_path("ab" * 32, "website_analysis", "1", {}), 7200)
+            stale = await cache.get_derived("ab" * 32, "website_analysis", "1")
+            await cache.close()
+            return fresh, stale, cache
+
+        fresh, stale, cache = asyncio.run(scenario())
+
+        assert fresh == {"summary": "old"}
+        assert stale is None
+        assert cache.stats["derived_expired"] == 1
+
+    def test_sweep_removes_expired_and_unused_files(self, tmp_path):
+        """Test that the sweep applies the derived TTL and max_age."""
+        cache = SiteCache(directory=str(tmp_path), max_age=86400, derived_ttl=3600)
+        cache._store_html("aa" * 32, "<html>old</html>")
+        cache._store_html("bb" * 32, "<html>recent</html>")
+        derived = cache._derived_path("bb" * 32, "seo", "1", {})
+        cache._write_atomic(derived, b"{}")
+        _age(cache._html_path("aa" * 32), 2 * 86400)
+        _age(derived, 7200)
+
+        assert cache.sweep() == 2
+
+        assert not os.path.exists(cache._html_path("aa" * 32))
+        assert os.path.exists(cache._html_path("bb" * 32))
+        assert not os.path.exists(os.path.join(str(tmp_path), "derived"))
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that pages read recently survive a sweep over the size cap."""
+        cache = SiteCache(directory=str(tmp_path))
+        digests = ["aa" * 32, "bb" * 32, "cc" * 32]
+        for age, digest in zip((300, 200, 100), digests):
+            cache._store_html(digest, f"<html>{digest * 20}</html>")
+            _age(cache._html_path(digest), age)
+        # Reading the oldest page makes it the most recently used
+        assert cache._load_html(digests[0])
+
+        cache.max_bytes = os.path.getsize(cache._html_path(digests[0])) * 2
+        cache.sweep()
+
+        assert os.path.exists(cache._html_path(digests[0]))
+        assert not os.path.exists(cache._html_path(digests[1]))
+        assert os.path.exists(cache._html_path(digests[2]))
+
+    def test_writes_start_a_background_sweep(self, tmp_path):
+        """Test that storing results sweeps at most once per interval."""
+        async def scenario():
+            cache = SiteCache(directory=str(tmp_path), sweep_interval=3600)
+            for version in ("1", "2", "3"):
+                await cache.put_derived("ab" * 32, "seo", version, {"score": 1})
+                await asyncio.sleep(0)
+            await cache.close()
+            return cache
+
+        assert asyncio.run(scenario()).stats["sweeps"] == 1
+
+
+class FakeCouncil:
+    """Answers website analysis without calling a model."""
+
+    async def analyze_website(self, url, html_content, lead_id=None, lead_value=None):
+        return SimpleNamespace(
+            content=f"analysis of {html_content}",
+            model_used="cheap-model",
+            total_cost=0.001,
+            request_id=None
+        )
+
+
+class TestAnalyzerReusesFetch:
+    """Test that a cache miss does not load the page a second time."""
+
+    def test_miss_analyzes_the_revalidated_body(self, tmp_path):
+        """Test that the HTML from revalidation is analyzed without the browser."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=(
+                "<html><head><title>Joe's Plumbing</title>"
+                '<meta name="description" content="24/7 plumbers"></head>'
+                "<body><script>track()</script><p>Fast repairs</p></body></html>"
+            ))
+
+        async def browser_fetch(url, timeout=30000):
+            raise AssertionError("page loaded twice")
+
+        async def scenario():
+            cache = _cache_with_server(tmp_path, handler)
+            analyzer = WebsiteAnalyzer(FakeCouncil(), site_cache=cache)
+            analyzer.fetch_website = browser_fetch
+            return await analyzer.analyze_website("https://example.com")
+
+        result = asyncio.run(scenario())
+
+        assert result["title"] == "Joe's Plumbing"
+        assert result["meta_description"] == "24/7 plumbers"
+        assert result["ai_analysis"] == "analysis of Joe's Plumbing Fast repairs"
+        assert result["status_code"] == 200
@@ -0,0 +1,88 @@
+"""
+Tracking Event Recorder Test Suite
+
+Tests that failed flushes and shutdown do not lose events.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.tracking_recorder import TrackingEventRecorder
+
+
+class FlakyRecorder(TrackingEventRecorder):
+    """Recorder whose first `failures` writes raise."""
+
+    def __init__(self, failures: int, persist_delay: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.persist_delay = persist_delay
+        self.written = []
+
+    async def _persist(self, batch):
+        await asyncio.sleep(self.persist_delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.written.extend(batch)
+
+
+class TestFlushRetries:
+    """Test requeueing of failed batches."""
+
+    def test_failed_batch_is_written_on_next_flush(self):
+        """Test that events survive a failing _persist."""
+        async def scenario():
+            recorder = FlakyRecorder(failures=1)
+            recorder.record("open", campaign_id=1, lead_id=10, recipient_id=100)
+            recorder.record("click", campaign_id=1, lead_id=11, recipient_id=101)
+
+            with pytest.raises(RuntimeError):
+                await recorder.flush()
+            flushed = await recorder.flush()
+            return recorder, flushed
+
+        recorder, flushed = asyncio.run(scenario())
+
+        assert flushed == 2
+        assert [event["lead_id"] for event in recorder.written] == [10, 11]
+        assert recorder.stats["requeued"] == 2
+        assert recorder.get_stats()["buffered"] == 0
+
+    def test_events_are_abandoned_after_max_attempts(self):
+        """Test that a permanently failing write does not retry forever."""
+        async def scenario():
+            recorder = FlakyRecorder(failures=99, max_flush_attempts=2)
+            recorder.record("open", campaign_id=1, lead_id=10, recipient_id=100)
+            await recorder.stop()
+            return recorder
+
+        recorder = asyncio.run(scenario())
+
+        assert recorder.written == []
+        assert recorder.stats["flush_errors"] == 2
+        assert recorder.stats["abandoned"] == 1
+        assert recorder.get_stats()["buffered"] == 0
+
+
+class TestStop:
+    """Test shutdown draining."""
+
+    def test_stop_persists_events_held_by_running_flush(self):
+        """Test that a batch the aggregator is writing and queued events are all persisted."""
+        async def scenario():
+            recorder = FlakyRecorder(failures=0, persist_delay=0.05, batch_size=2, flush_interval=0.01)
+            await recorder.start()
+            for lead_id in (10, 11, 12):
+                recorder.record("open", campaign_id=1, lead_id=lead_id, recipient_id=100 + lead_id)
+
+            # The aggregator is now writing the first batch
+            await asyncio.sleep(0.02)
+            await recorder.stop()
+            return recorder
+
+        recorder = asyncio.run(scenario())
+
+        assert [event["lead_id"] for event in recorder.written] == [10, 11, 12]
+        assert recorder.get_stats()["buffered"] == 0
@@ -0,0 +1,124 @@
+"""
+Signed Tracking Token Test Suite
+
+Tests signing, verification, key rotation and expiry of email tracking tokens.
+"""
+
+import pytest
+
+from app.core.tracking_tokens import (
+    TrackingTokenSigner,
+    TrackingTokenError,
+    parse_key_ring,
+)
+
+
+class TestTrackingTokenSigner:
+    """Test HMAC-signed tracking tokens."""
+
+    def test_round_trip(self):
+        """Test that a signed token verifies to the same claims."""
+        signer = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+
+        token = signer.sign(42, 7, recipient_id=99, issued_at=1_700_000_000)
+        claims = signer.verify(token)
+
+        assert claims.campaign_id == 42
+        assert claims.lead_id == 7
+        assert claims.recipient_id == 99
+        assert claims.issued_at == 1_700_000_000
+
+    def test_token_is_compact_and_url_safe(self):
+        """Test that tokens fit comfortably in a URL path segment."""
+        signer = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+        token = signer.sign(2**31, 2**31, recipient_id=2**31)
+
+        assert len(token) <= 48
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    def test_rejects_tampered_token(self):
+        """Test that flipping payload bytes breaks the signature."""
+        signer = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+        token = signer.sign(42, 7, recipient_id=99)
+        forged = ("A" if token[4] != "A" else "B").join([token[:4], token[5:]])
+
+        with pytest.raises(TrackingTokenError):
+            signer.verify(forged)
+
+    def test_rejects_token_signed_with_other_secret(self):
+        """Test that a token from another deployment is rejected."""
+        ours = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+        theirs = TrackingTokenSigner(keys={1: "other"}, active_key_id=1)
+
+        with pytest.raises(TrackingTokenError):
+            ours.verify(theirs.sign(42, 7))
+
+    def test_key_rotation(self):
+        """Test that tokens signed with a retired key still verify."""
+        old = TrackingTokenSigner(keys={1: "old"}, active_key_id=1)
+        rotated = TrackingTokenSigner(keys={2: "new", 1: "old"}, active_key_id=2)
+        dropped = TrackingTokenSigner(keys={2: "new"}, active_key_id=2)
+
+        token = old.sign(42, 7)
+
+        assert rotated.verify(token).campaign_id == 42
+        with pytest.raises(TrackingTokenError):
+            dropped.verify(token)
+
+    def test_expiry(self):
+        """Test that tokens older than max age are rejected."""
+        signer = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1, max_age_seconds=60)
+        token = signer.sign(42, 7, issued_at=1000)
+
+        assert signer.verify(token, now=1059).lead_id == 7
+        with pytest.raises(TrackingTokenError):
+            signer.verify(token, now=1061)
+
+    def test_legacy_tokens(self):
+        """Test that unsigned legacy tokens are only accepted when enabled."""
+        strict = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+        lenient = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1, accept_legacy=True)
+
+        with pytest.raises(TrackingTokenError):
+            strict.verify("42:7:deadbeef")
+
+        claims = lenient.verify("42:7:deadbeef")
+        assert (claims.campaign_id, claims.lead_id, claims.recipient_id) == (42, 7, None)
+
+    def test_legacy_tokens_cutoff(self):
+        """Test that legacy tokens stop being accepted at the cutoff."""
+        signer = TrackingTokenSigner(
+            keys={1: "secret"}, active_key_id=1, accept_legacy=True, legacy_until=1000
+        )
+
+        assert signer.verify("42:7:deadbeef", now=999).lead_id == 7
+        with pytest.raises(TrackingTokenError):
+            signer.verify("42:7:deadbeef", now=1000)
+
+    def test_rejects_garbage(self):
+        """Test that malformed tokens raise TrackingTokenError (a ValueError)."""
+        signer = TrackingTokenSigner(keys={1: "secret"}, active_key_id=1)
+
+        for token in ["", "abc", "!!!!", "A" * 200]:
+            with pytest.raises(ValueError):
+                signer.verify(token)
+
+
+class TestKeyRing:
+    """Test key ring parsing."""
+
+    def test_parse_preserves_order(self):
+        """Test that the first key in the ring is listed first."""
+        keys = parse_key_ring("3:new, 2:old")
+        assert list(keys) == [3, 2]
+        assert keys[3] == "new"
+
+    def test_secret_may_contain_colons(self):
+        """Test that only the first colon separates id and secret."""
+        assert parse_key_ring("1:a:b:c") == {1: "a:b:c"}
+
+    def test_rejects_invalid_entries(self):
+        """Test that malformed entries raise ValueError."""
+        for spec in ["nosecret", "1:", "256:secret"]:
+            with pytest.raises(ValueError):
+                parse_key_ring(spec)
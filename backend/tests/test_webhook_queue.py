@@ -0,0 +1,212 @@
+"""
+Webhook Queue Test Suite
+
+Tests batch claiming, reclaiming of interrupted deliveries, refilling of
+delivery slots and bulk outcome recording.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.webhook_config import webhook_config
+from app.models.webhook_queue import WebhookStatus
+from app.services import webhook_queue as webhook_queue_module
+from app.services.webhook_queue import WebhookQueue
+
+
+class FakeSession:
+    """Async session that records statements and returns canned results."""
+
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.executed = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return self.results.pop(0) if self.results else MagicMock(rowcount=0)
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _row(id, priority, created_at):
+    return SimpleNamespace(_mapping={"id": id, "priority": priority, "created_at": created_at})
+
+
+def _webhook(id, retry_count=0, max_retries=3):
+    return {
+        "id": id,
+        "webhook_url": "https://n8n.example.com/webhook/test",
+        "payload": {"id": id},
+        "headers": None,
+        "event_type": "lead_scraped",
+        "entity_type": "lead",
+        "entity_id": id,
+        "priority": 0,
+        "retry_count": retry_count,
+        "max_retries": max_retries,
+        "signature": None,
+        "queue_metadata": None,
+    }
+
+
+def _outcome(webhook, success, error=None, deferred_for=None):
+    return {
+        "webhook": webhook,
+        "success": success,
+        "error": error,
+        "deferred_for": deferred_for,
+        "duration_ms": 12,
+        "attempted_at": datetime(2024, 1, 1, 12, 0, 0),
+    }
+
+
+class TestClaimBatch:
+    """Test atomic claiming and reclaiming."""
+
+    def test_claims_due_rows_with_skip_locked(self, monkeypatch):
+        """Test that due rows are locked, flipped to sending and sorted by priority."""
+        session = FakeSession([
+            MagicMock(rowcount=0),
+            [_row(1, 0, datetime(2024, 1, 1)), _row(2, 5, datetime(2024, 1, 2))],
+        ])
+        monkeypatch.setattr(webhook_queue_module, "AsyncSessionLocal", lambda: session)
+
+        claimed = asyncio.run(WebhookQueue()._claim_batch())
+
+        assert [webhook["id"] for webhook in claimed] == [2, 1]
+        assert session.committed
+        claim_sql = _sql(session.executed[1][0])
+        assert "FOR UPDATE SKIP LOCKED" in claim_sql
+        assert "RETURNING" in claim_sql
+
+    def test_interrupted_delivery_counts_as_attempt(self, monkeypatch):
+        """Test that stale sending rows use up a retry before being claimed again."""
+        session = FakeSession([MagicMock(rowcount=1), []])
+        monkeypatch.setattr(webhook_queue_module, "AsyncSessionLocal", lambda: session)
+
+        asyncio.run(WebhookQueue()._claim_batch())
+
+        reclaim, claim = session.executed[0][0], session.executed[1][0]
+        reclaim_params = reclaim.compile(dialect=postgresql.dialect()).params
+        assert "retry_count=(webhook_queue.retry_count + " in _sql(reclaim)
+        assert WebhookStatus.SENDING.value in reclaim_params.values()
+        assert reclaim_params["status"] == WebhookStatus.FAILED.value
+
+        # Only the reclaim looks at sending rows; the claim respects max_retries
+        claim_params = claim.compile(dialect=postgresql.dialect()).params
+        assert WebhookStatus.SENDING.value not in [
+            value for key, value in claim_params.items() if key != "status"
+        ]
+        assert "webhook_queue.retry_count < webhook_queue.max_retries" in _sql(claim)
+
+
+class TestRecordOutcomes:
+    """Test bulk outcome recording."""
+
+    def test_outcomes_are_written_in_one_transaction(self, monkeypatch):
+        """Test status, retry scheduling, history and logs for each outcome."""
+        session = FakeSession()
+        monkeypatch.setattr(webhook_queue_module, "AsyncSessionLocal", lambda: session)
+
+        asyncio.run(WebhookQueue()._record_outcomes([
+            _outcome(_webhook(1), success=True),
+            _outcome(_webhook(2), success=False, error="HTTP 502"),
+            _outcome(_webhook(3, retry_count=2), success=False, error="HTTP 502"),
+            _outcome(_webhook(4), success=False, error="circuit open", deferred_for=30),
+        ]))
+
+        assert session.committed
+        updates = {values["id"]: values for values in session.executed[0][1]}
+        history = session.executed[1][1]
+        logs = session.executed[2][1]
+
+        assert updates[1]["status"] == WebhookStatus.SENT.value
+        assert updates[1]["sent_at"] is not None
+
+        assert updates[2]["status"] == WebhookStatus.FAILED.value
+        assert updates[2]["retry_count"] == 1
+        assert updates[2]["next_retry_at"] is not None
+        assert updates[2]["failed_at"] is None
+
+        assert updates[3]["retry_count"] == 3
+        assert updates[3]["next_retry_at"] is None
+        assert updates[3]["failed_at"] is not None
+
+        # A deferred delivery was never attempted
+        assert updates[4]["retry_count"] == 0
+        assert updates[4]["next_retry_at"] is not None
+        assert [entry["webhook_queue_id"] for entry in history] == [1, 2, 3]
+        assert [entry["attempt_number"] for entry in history] == [1, 1, 3]
+        assert len(logs) == 3
+
+
+class SlotQueue(WebhookQueue):
+    """Queue with in-memory claims, per-webhook delivery delays and recorded outcomes."""
+
+    def __init__(self, delays, max_in_flight):
+        super().__init__()
+        self.config = webhook_config.model_copy(deep=True)
+        self.config.queue.max_in_flight = max_in_flight
+        self.config.queue.processing_interval = 1
+        self.pending = [webhook_id for webhook_id, _ in delays]
+        self.delays = dict(delays)
+        self.recorded = []
+
+    async def _start_listener(self):
+        return None
+
+    async def _claim_batch(self, limit=None):
+        claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return [{"id": webhook_id} for webhook_id in claimed]
+
+    async def _deliver(self, webhook):
+        await asyncio.sleep(self.delays[webhook["id"]])
+        return {"webhook": webhook, "success": True}
+
+    async def _record_outcomes(self, outcomes):
+        self.recorded.extend(outcome["webhook"]["id"] for outcome in outcomes)
+        if not self.pending and len(self.recorded) == len(self.delays) - 1:
+            # Everything but the slow delivery is done
+            self._processing = False
+
+
+class TestProcessQueue:
+    """Test that deliveries do not wait for each other."""
+
+    def test_slow_delivery_does_not_block_refills(self):
+        """Test that freed slots are refilled while a slow delivery is still running."""
+        async def scenario():
+            queue = SlotQueue(
+                [("slow", 0.5), ("a", 0.01), ("b", 0.01), ("c", 0.01), ("d", 0.01)],
+                max_in_flight=2
+            )
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.wait_for(queue.process_queue(), timeout=5)
+            return queue, loop.time() - started
+
+        queue, elapsed = asyncio.run(scenario())
+
+        # a-d went through the second slot one after another, before the slow
+        # one finished; it was then recorded on shutdown
+        assert queue.recorded == ["a", "b", "c", "d", "slow"]
+        assert elapsed < 1
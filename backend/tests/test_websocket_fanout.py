@@ -0,0 +1,137 @@
+"""
+WebSocket Fan-out Test Suite
+
+Tests per-connection outboxes: ordering, coalescing, dropping and isolation
+of slow clients.
+"""
+
+import asyncio
+import json
+
+from app.core.websocket_fanout import ConnectionOutbox, coalesce_key, serialize_message
+
+
+class FakeSocket:
+    """Collects sent frames, optionally blocking until released."""
+
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def send_text(self, text: str):
+        await self.release.wait()
+        self.sent.append(json.loads(text))
+
+
+class TestCoalesceKey:
+    """Test coalescing key selection."""
+
+    def test_progress_events_are_scoped_by_job(self):
+        """Test that progress events coalesce per job."""
+        a = coalesce_key({"type": "scraper:progress", "scraper_id": "a"})
+        b = coalesce_key({"type": "scraper:progress", "scraper_id": "b"})
+        assert a != b
+        assert a == coalesce_key({"type": "scraper:progress", "scraper_id": "a", "current": 9})
+
+    def test_other_events_never_coalesce(self):
+        """Test that ordinary events always get delivered."""
+        assert coalesce_key({"type": "lead_created", "lead_id": 1}) is None
+
+
+class TestConnectionOutbox:
+    """Test the per-connection outbox."""
+
+    def test_delivers_in_order(self):
+        """Test that messages are sent in enqueue order."""
+        async def scenario():
+            socket = FakeSocket()
+            outbox = ConnectionOutbox(socket.send_text)
+            outbox.start()
+            for i in range(5):
+                outbox.enqueue(serialize_message({"type": "n", "i": i}))
+            await asyncio.sleep(0.01)
+            await outbox.close()
+            return socket.sent, outbox.get_stats()
+
+        sent, stats = asyncio.run(scenario())
+        assert [m["i"] for m in sent] == [0, 1, 2, 3, 4]
+        assert stats["sent"] == 5
+
+    def test_coalesces_pending_progress(self):
+        """Test that a lagging client only gets the latest progress update."""
+        async def scenario():
+            socket = FakeSocket(blocked=True)
+            outbox = ConnectionOutbox(socket.send_text)
+            outbox.start()
+            await asyncio.sleep(0)
+
+            # First message is in flight; the rest queue up behind it
+            outbox.enqueue(serialize_message({"type": "hello"}))
+            await asyncio.sleep(0)
+            for current in range(10):
+                message = {"type": "scraper:progress", "scraper_id": "s1", "current": current}
+                outbox.enqueue(serialize_message(message), coalesce_key(message))
+            outbox.enqueue(serialize_message({"type": "scraper:completed", "scraper_id": "s1"}))
+
+            socket.release.set()
+            await asyncio.sleep(0.01)
+            await outbox.close()
+            return socket.sent, outbox.get_stats()
+
+        sent, stats = asyncio.run(scenario())
+        assert [m["type"] for m in sent] == ["hello", "scraper:progress", "scraper:completed"]
+        assert sent[1]["current"] == 9
+        assert stats["coalesced"] == 9
+
+    def test_drops_oldest_when_full(self):
+        """Test that a full outbox drops the oldest pending message."""
+        async def scenario():
+            socket = FakeSocket(blocked=True)
+            outbox = ConnectionOutbox(socket.send_text, max_size=3)
+            for i in range(5):
+                outbox.enqueue(serialize_message({"type": "n", "i": i}))
+            stats = outbox.get_stats()
+            outbox.start()
+            socket.release.set()
+            await asyncio.sleep(0.01)
+            await outbox.close()
+            return socket.sent, stats
+
+        sent, stats = asyncio.run(scenario())
+        assert [m["i"] for m in sent] == [2, 3, 4]
+        assert stats["dropped"] == 2
+        assert stats["depth"] == 3
+
+    def test_stalled_client_does_not_block_others(self):
+        """Test that a stalled client times out without delaying a fast one."""
+        async def scenario():
+            failures = []
+
+            async def on_error(outbox, error):
+                failures.append(outbox.label)
+
+            stalled = FakeSocket(blocked=True)
+            fast = FakeSocket()
+            slow_outbox = ConnectionOutbox(stalled.send_text, label="slow", send_timeout=0.05, on_error=on_error)
+            fast_outbox = ConnectionOutbox(fast.send_text, label="fast")
+            slow_outbox.start()
+            fast_outbox.start()
+
+            text = serialize_message({"type": "lead_created", "lead_id": 1})
+            slow_outbox.enqueue(text)
+            fast_outbox.enqueue(text)
+
+            await asyncio.sleep(0.01)
+            delivered_quickly = len(fast.sent)
+            await asyncio.sleep(0.1)
+
+            await fast_outbox.close()
+            await slow_outbox.close()
+            return delivered_quickly, failures, slow_outbox.closed
+
+        delivered_quickly, failures, closed = asyncio.run(scenario())
+        assert delivered_quickly == 1
+        assert failures == ["slow"]
+        assert closed